@@ -2,13 +2,20 @@ import json
 from pathlib import Path
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
 from app.services.engine_runner import run_engine
+from app.services.report_store import ReportStore
 
 router = APIRouter()
 ROOT_DIR = Path(__file__).resolve().parents[3]
 
+_ANGULAR_REPORT_FILES = {
+    "json":   ".evua_report.json",
+    "md":     ".evua_report.md",
+    "sqlite": ".evua_report.sqlite",
+}
+
 
 def _resolve_angular_report_path(project_name: str, fmt: str) -> Path:
-    report_file = ".evua_report.json" if fmt == "json" else ".evua_report.md"
+    report_file = _ANGULAR_REPORT_FILES[fmt]
     reports_root = ROOT_DIR / "engine" / "angularjs" / "reports"
 
     direct = reports_root / project_name / report_file
@@ -121,3 +128,84 @@ async def get_report(
         "path": str(report_path.relative_to(ROOT_DIR)),
         "content": report_path.read_text(encoding="utf-8", errors="replace"),
     }
+
+
+
+# ── Queryable report (SQLite) ─────────────────────────────────────────────────
+# Paginated, filtered views over the indexed report each engine writes next to
+# its JSON report. Use these instead of /report?format=json for large runs.
+
+def _report_store(engine: str, project_name: str) -> ReportStore:
+    engine_key = engine.lower()
+    if engine_key in {"angular", "angularjs"}:
+        store_path = _resolve_angular_report_path(project_name, "sqlite")
+    elif engine_key == "php":
+        store_path = ROOT_DIR / ".evua" / "analyze-report.sqlite"
+    else:
+        raise HTTPException(status_code=400, detail="Unsupported engine")
+
+    if not store_path.exists():
+        raise HTTPException(
+            status_code=404,
+            detail=f"Report store not found at {store_path} — re-run the migration to generate it",
+        )
+    return ReportStore(store_path)
+
+
+@router.get("/report/summary")
+async def get_report_summary(
+    engine: str = Query(..., description="angular or php"),
+    project_name: str = Query(..., description="Project name used for migration"),
+):
+    return _report_store(engine, project_name).summary()
+
+
+@router.get("/report/changes")
+async def get_report_changes(
+    engine: str = Query(..., description="angular or php"),
+    project_name: str = Query(..., description="Project name used for migration"),
+    risk: str | None = Query(None, description="Comma-separated levels: SAFE,RISKY,MANUAL"),
+    file: str | None = Query(None, description="Source file path or file name"),
+    name: str | None = Query(None, description="Entity name (controller, service, ...)"),
+    search: str | None = Query(None, description="Substring of the change or risk reason"),
+    sort: str = Query("order", description="order, risk or file"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    return _report_store(engine, project_name).changes(
+        risk=risk, file=file, name=name, search=search, sort=sort, limit=limit, offset=offset,
+    )
+
+
+@router.get("/report/files")
+async def get_report_files(
+    engine: str = Query(..., description="angular or php"),
+    project_name: str = Query(..., description="Project name used for migration"),
+    risk: str | None = Query(None, description="Only files whose worst change has this level"),
+    sort: str = Query("risk", description="risk, changes or path"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    return _report_store(engine, project_name).files(risk=risk, sort=sort, limit=limit, offset=offset)
+
+
+@router.get("/report/ai-items")
+async def get_report_ai_items(
+    engine: str = Query(..., description="angular or php"),
+    project_name: str = Query(..., description="Project name used for migration"),
+    file: str | None = Query(None, description="Source file path or file name"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    return _report_store(engine, project_name).ai_items(file=file, limit=limit, offset=offset)
+
+
+@router.get("/report/validation-errors")
+async def get_report_validation_errors(
+    engine: str = Query(..., description="angular or php"),
+    project_name: str = Query(..., description="Project name used for migration"),
+    source: str | None = Query(None, description="tsc or validation"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+):
+    return _report_store(engine, project_name).validation_errors(source=source, limit=limit, offset=offset)
@@ -1,5 +1,7 @@
 import os
 import sys
+import json
+import socket
 import shutil
 import zipfile
 import subprocess
@@ -20,6 +22,12 @@ _ROOT        = _BACKEND.parent                   # project root
 _ENGINE_ROOT = _ROOT / "engine"
 
 
+# Optional warm Angular engine: `python engine/angularjs/cli.py serve --socket PATH`.
+# When EVUA_ANGULAR_SOCKET points at a live daemon, Angular runs are sent to it
+# instead of starting a fresh interpreter; otherwise the CLI subprocess is used.
+_ANGULAR_DAEMON_SOCKET = os.environ.get("EVUA_ANGULAR_SOCKET")
+
+
 def _cli_path(engine: str) -> Path:
     engine_key = engine.lower()
     if engine_key == "angular":
@@ -48,6 +56,39 @@ def _find_project_root(extract_dir: Path, engine: str) -> Path:
     return extract_dir          # fallback: trust what was given
 
 
+def _run_via_angular_daemon(socket_path: str, params: dict):
+    """
+    Send one run request to the warm engine daemon and collect its progress
+    lines. Returns (log_lines, return_code), or None if no daemon is listening.
+    """
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    except OSError:
+        return None
+
+    lines: list[str] = []
+    return_code = 1
+    with sock, sock.makefile("rw", encoding="utf-8", errors="replace") as f:
+        f.write(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "run", "params": params}) + "\n")
+        f.flush()
+        for raw in f:
+            msg = json.loads(raw)
+            if msg.get("method") == "progress":
+                line = msg["params"]["line"].rstrip()
+                lines.append(line)
+                print(f"[EVUA]  {line}")
+                continue
+            if "error" in msg:
+                line = f"[serve] error: {msg['error'].get('message')}"
+                lines.append(line)
+                print(f"[EVUA]  {line}")
+            else:
+                return_code = 0 if msg["result"].get("ok") else 1
+            break
+    return lines, return_code
+
+
 # ── Public dispatcher ─────────────────────────────────────────────────────────
 
 async def run_engine(
@@ -126,10 +167,20 @@ async def run_angular_engine(
         str(project_folder),
         "--skip-tsc",
     ]
+    # The daemon may run from any directory; results must land where the
+    # subprocess run (cwd=engine dir) puts them and routes/migration.py reads them
+    daemon_params = {
+        "repo":        str(project_folder),
+        "skip_tsc":    True,
+        "out_root":    str(cli_path.parent / "out"),
+        "reports_dir": str(cli_path.parent / "reports"),
+    }
     if strategy.lower() in ("dry-run", "dry_run", "preview"):
         cmd.append("--dry-run")
+        daemon_params["dry_run"] = True
     elif strategy.lower() == "diff":
         cmd.append("--diff")
+        daemon_params["diff"] = True
 
     # ── 3. Run subprocess ─────────────────────────────────────────────────────
     log_lines: list[str] = []
@@ -147,6 +198,10 @@ async def run_angular_engine(
 
         def _run_subprocess():
             """Blocking subprocess call — runs inside a thread executor."""
+            if _ANGULAR_DAEMON_SOCKET:
+                via_daemon = _run_via_angular_daemon(_ANGULAR_DAEMON_SOCKET, daemon_params)
+                if via_daemon is not None:
+                    return via_daemon
             proc = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
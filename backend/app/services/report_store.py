@@ -0,0 +1,146 @@
+import json
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+# ── Read-only queries over an engine's SQLite report ───────────────────────────
+# Both engines write <report>.sqlite next to their JSON report with the same
+# tables (see engine/angularjs/pipeline/reporting/sqlite_store.py):
+#   meta, files, changes, risk, ai_items, validation_errors
+# Every list query is paginated (limit/offset) and returns the total match
+# count, so the UI never has to download the whole report.
+
+MAX_LIMIT = 500
+
+_CHANGE_SORTS = {
+    "risk":  "r.score DESC, c.id",
+    "file":  "f.path, c.line, c.id",
+    "order": "c.id",
+}
+_FILE_SORTS = {
+    "risk":    "f.risk_score DESC, f.manual_count DESC, f.path",
+    "changes": "f.change_count DESC, f.path",
+    "path":    "f.path",
+}
+
+
+class ReportStore:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        db.row_factory = sqlite3.Row
+        return db
+
+    def _page(self, base_sql: str, params: list, order_by: str, limit: int, offset: int) -> dict:
+        limit = max(1, min(int(limit), MAX_LIMIT))
+        offset = max(0, int(offset))
+        db = self._connect()
+        try:
+            total = db.execute(f"SELECT COUNT(*) FROM ({base_sql})", params).fetchone()[0]
+            rows = db.execute(
+                f"{base_sql} ORDER BY {order_by} LIMIT ? OFFSET ?",
+                [*params, limit, offset],
+            ).fetchall()
+        finally:
+            db.close()
+        return {
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "items": [dict(r) for r in rows],
+        }
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def summary(self) -> dict:
+        db = self._connect()
+        try:
+            meta = {r["key"]: r["value"] for r in db.execute("SELECT key, value FROM meta")}
+            by_level = {
+                r["level"]: r["n"]
+                for r in db.execute("SELECT level, COUNT(*) AS n FROM risk GROUP BY level")
+            }
+            counts = {
+                table: db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("files", "changes", "ai_items", "validation_errors")
+            }
+        finally:
+            db.close()
+        try:
+            meta["summary"] = json.loads(meta.get("summary") or "{}")
+        except ValueError:
+            pass
+        return {"meta": meta, "risk_by_level": by_level, "counts": counts}
+
+    def changes(
+        self,
+        risk: Optional[str] = None,
+        file: Optional[str] = None,
+        name: Optional[str] = None,
+        search: Optional[str] = None,
+        sort: str = "order",
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict:
+        sql = (
+            "SELECT c.id, c.change_id, c.name, c.kind, c.line, c.before_id, c.after_id, "
+            "c.reason, c.generated_file, c.automatable, f.path AS file, "
+            "r.level AS risk, r.score AS risk_score, r.reason AS risk_reason, r.rule AS risk_rule "
+            "FROM changes c JOIN risk r ON r.change_id = c.id "
+            "LEFT JOIN files f ON f.id = c.file_id WHERE 1=1"
+        )
+        params: list = []
+        if risk:
+            levels = [lvl.strip().upper() for lvl in risk.split(",") if lvl.strip()]
+            sql += f" AND r.level IN ({', '.join('?' for _ in levels)})"
+            params += levels
+        if file:
+            # Exact path or path suffix ("controllers.js" matches ".../app/controllers.js")
+            sql += " AND (f.path = ? OR f.path LIKE ?)"
+            params += [file, f"%/{file}"]
+        if name:
+            sql += " AND c.name = ?"
+            params.append(name)
+        if search:
+            sql += " AND (c.reason LIKE ? OR r.reason LIKE ?)"
+            params += [f"%{search}%", f"%{search}%"]
+        return self._page(sql, params, _CHANGE_SORTS.get(sort, _CHANGE_SORTS["order"]), limit, offset)
+
+    def files(self, risk: Optional[str] = None, sort: str = "risk", limit: int = 50, offset: int = 0) -> dict:
+        sql = (
+            "SELECT f.id, f.path, f.risk_level, f.risk_score, f.change_count, "
+            "f.manual_count, f.risky_count FROM files f WHERE 1=1"
+        )
+        params: list = []
+        if risk:
+            sql += " AND f.risk_level = ?"
+            params.append(risk.upper())
+        return self._page(sql, params, _FILE_SORTS.get(sort, _FILE_SORTS["risk"]), limit, offset)
+
+    def ai_items(self, file: Optional[str] = None, limit: int = 50, offset: int = 0) -> dict:
+        sql = (
+            "SELECT a.id, a.item_id, f.path AS file, a.description, a.concern, "
+            "a.code_snippet, a.response FROM ai_items a LEFT JOIN files f ON f.id = a.file_id WHERE 1=1"
+        )
+        params: list = []
+        if file:
+            sql += " AND (f.path = ? OR f.path LIKE ?)"
+            params += [file, f"%/{file}"]
+        page = self._page(sql, params, "a.id", limit, offset)
+        for item in page["items"]:
+            if item.get("response"):
+                try:
+                    item["response"] = json.loads(item["response"])
+                except ValueError:
+                    pass
+        return page
+
+    def validation_errors(self, source: Optional[str] = None, limit: int = 50, offset: int = 0) -> dict:
+        sql = "SELECT id, source, file, line, col, code, message FROM validation_errors WHERE 1=1"
+        params: list = []
+        if source:
+            sql += " AND source = ?"
+            params.append(source)
+        return self._page(sql, params, "id", limit, offset)
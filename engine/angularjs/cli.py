@@ -7,88 +7,23 @@ if hasattr(sys.stderr, "reconfigure"):
     sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
 
-class _FilteredWriter:
-    """
-    Wraps stdout and drops lines that match known internal debug prefixes.
-    Keeps all user-facing output, removes implementation noise.
-    """
-    _SUPPRESS = (
-        "[js.py]",
-        "[js.py CHAIN]",
-        "[js.py DEBUG]",
-        "[js.py .component()]",
-        "[svc DEBUG]",
-        "[TRANSFORM]",
-        "[Scaffold]",
-        "[helpers]",
-        "========== ",
-        "[ControllerToComponent DEBUG]",
-        "[ControllerToComponent] DI for",
-        "[ControllerToComponent] Template for",
-        "[ControllerToComponent] Template written:",
-        "[ControllerToComponent] Declared then-body",
-        "[ControllerToComponent] Emitting sanitized",
-        "[ControllerToComponent] Skipping HTTP-inferred",
-        "[ServiceToInjectable] DI for",
-        "[ServiceToInjectable] Methods for",
-        "[ServiceToInjectable] Detected $resource",
-        "[RouteMigrator] Router type",
-        "[RouteMigrator] Routes detected",
-        "[RouteMigrator]   ngRoute",
-        "[HttpToHttpClient] HttpClientModule added",
-        "[SimpleWatchToRxjs]  No shallow",
-        "[ComponentInteraction] No template",
-        "[ComponentInteraction] Relationships",
-        "[DirectiveToComponent] No directives",
-        "[DirectiveToPipe] Filters detected",
-        "[ConstantsAndRun] Constants detected",
-        "[ConstantsAndRun] Run blocks detected",
-        "[AppModuleUpdater] Found:",
-        "[AppModuleUpdater] FormsModule needed",
-        "[AppModuleUpdater] HttpClientModule needed",
-        "[AppModuleUpdater] Built-in pipes",
-        "[AppModuleUpdater]",
-    )
-
-    def __init__(self, wrapped):
-        self._wrapped = wrapped
-        self._buf = ""
-
-    def write(self, text):
-        # Buffer until newline so we can check complete lines
-        self._buf += text
-        while "\n" in self._buf:
-            line, self._buf = self._buf.split("\n", 1)
-            if not any(line.lstrip().startswith(p) for p in self._SUPPRESS):
-                self._wrapped.write(line + "\n")
+from pipeline.log import configure as configure_logging
 
-    def flush(self):
-        if self._buf:
-            if not any(self._buf.lstrip().startswith(p) for p in self._SUPPRESS):
-                self._wrapped.write(self._buf)
-            self._buf = ""
-        self._wrapped.flush()
-
-    def __getattr__(self, name):
-        return getattr(self._wrapped, name)
-
-
-# Install filtered writer — keeps all user output, drops internal debug noise
-sys.stdout = _FilteredWriter(sys.stdout)
+# Console logging: INFO and above by default; --verbose / EVUA_DEBUG add debug
+configure_logging()
 
 
 from pathlib import Path
 import argparse
-import json
-import re
-import difflib
-import tempfile
+import importlib
 import shutil
+import sqlite3
 
 from pipeline.ingestion.scanner import FileScanner
 from pipeline.ingestion.classifier import FileClassifier, FileType
 from pipeline.analysis.dispatcher import AnalyzerDispatcher
 from pipeline.analysis.result import AnalysisResult
+from pipeline.analysis.snapshot_cache import AnalysisSnapshotCache, fingerprint as snapshot_fingerprint
 
 from pipeline.patterns.detectors.angularjs.controller_detector import ControllerDetector
 from pipeline.patterns.detectors.angularjs.http_detector import HttpDetector
@@ -97,37 +32,52 @@ from pipeline.patterns.detectors.angularjs.service_detector import ServiceDetect
 from pipeline.patterns.detectors.angularjs.directive_detector import DirectiveDetector
 from pipeline.patterns.result import PatternResult
 
-from pipeline.transformation.rules.angularjs.controller_to_component import ControllerToComponentRule
-from pipeline.transformation.rules.angularjs.http_to_httpclient import HttpToHttpClientRule
-from pipeline.transformation.rules.angularjs.simple_watch_to_rxjs import SimpleWatchToRxjsRule
-from pipeline.transformation.rules.angularjs.service_to_injectable import ServiceToInjectableRule
-from pipeline.transformation.rules.angularjs.route_migrator import RouteMigratorRule
-from pipeline.transformation.rules.angularjs.app_module_updater import AppModuleUpdaterRule
-from pipeline.transformation.rules.angularjs.component_interaction import ComponentInteractionRule
 from pipeline.transformation.applier import RuleApplier
+from pipeline.transformation.artifact_manifest import ArtifactManifest
+from pipeline.transformation.project_index import ProjectIndex
 from pipeline.transformation.result import TransformationResult
-from pipeline.transformation.rules.angularjs.directive_to_component import DirectiveToComponentRule
-from pipeline.transformation.rules.angularjs.directive_to_pipe import DirectiveToPipeRule
-from pipeline.transformation.rules.angularjs.constants_and_run import ConstantsAndRunRule
 
 from pipeline.risk.rules.angularjs.watcher_risk import WatcherRiskRule
 from pipeline.risk.rules.angularjs.template_binding_risk import TemplateBindingRiskRule
 from pipeline.risk.rules.angularjs.directive_risk import DirectiveRiskRule
 from pipeline.risk.rules.service_risk import ServiceRiskRule
-from pipeline.risk.result import RiskResult
-from pipeline.risk.levels import RiskLevel
+from pipeline.risk.engine import RiskEngine
 
+from pipeline.reporting.change_index import ChangeIndex
+from pipeline.reporting.json_stream import write_json_report, write_ndjson
 from pipeline.reporting.reporters.json_reporter import JSONReporter
+from pipeline.reporting.sqlite_store import write_report_store
 from pipeline.reporting.reporters.markdown_reporter import MarkdownReporter
 
-from pipeline.validation.runners.tests import TestRunner
-from pipeline.validation.comparators.snapshot import SnapshotComparator
-from pipeline.validation.analyzers.coverage import CoverageAnalyzer
-
+from orchestration.checkpoint import CheckpointError, RunCheckpoint
 from orchestration.pipeline_runner import PipelineRunner
-from pipeline.ai.client import AIClient
-from pipeline.ai.stage import AIAssistStage
-from pipeline.validation.runners.tsc import TscValidator
+
+
+# Stage-specific modules (rules, validation runners, tsc, AI, diff, serve /
+# batch) are imported where they are used, so short runs — --dry-run,
+# --only routing, --help — do not pay for code they never execute.
+# evaluation/import_budget.py checks the startup import cost.
+
+# --only key → rule class, in execution order. RouteMigratorRule runs FIRST —
+# it owns app-routing.module.ts entirely; ControllerToComponentRule no longer
+# touches routing.
+RULES = {
+    "routing":              ("pipeline.transformation.rules.angularjs.route_migrator",         "RouteMigratorRule"),
+    "controllers":          ("pipeline.transformation.rules.angularjs.controller_to_component", "ControllerToComponentRule"),
+    "services":             ("pipeline.transformation.rules.angularjs.service_to_injectable",   "ServiceToInjectableRule"),
+    "http":                 ("pipeline.transformation.rules.angularjs.http_to_httpclient",      "HttpToHttpClientRule"),
+    "watch":                ("pipeline.transformation.rules.angularjs.simple_watch_to_rxjs",    "SimpleWatchToRxjsRule"),
+    "interaction":          ("pipeline.transformation.rules.angularjs.component_interaction",   "ComponentInteractionRule"),
+    "directives_component": ("pipeline.transformation.rules.angularjs.directive_to_component",  "DirectiveToComponentRule"),
+    "directives_pipe":      ("pipeline.transformation.rules.angularjs.directive_to_pipe",       "DirectiveToPipeRule"),
+    "constants":            ("pipeline.transformation.rules.angularjs.constants_and_run",       "ConstantsAndRunRule"),
+    "module":               ("pipeline.transformation.rules.angularjs.app_module_updater",      "AppModuleUpdaterRule"),
+}
+
+
+def _load_rule(key: str):
+    module_name, class_name = RULES[key]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 # ---------------------------------------------------------------------------
@@ -146,163 +96,124 @@ def _find_snapshots(repo_path: Path):
     return repo_path / "snapshots" / "before.json", repo_path / "snapshots" / "after.json"
 
 
-def _build_id_to_name(analysis) -> dict:
-    m = {}
-    for module in analysis.modules:
-        for cls in module.classes:
-            m[cls.id] = cls.name
-    return m
-
-
-def _build_directive_id_to_name(analysis) -> dict:
-    m = {}
-    for d in getattr(analysis, "directives", []) or []:
-        m[d.id] = d.name
-    return m
-
-
-def _resolve_name(change, id_to_name: dict, directive_id_to_name: dict, analysis) -> str:
-    name = id_to_name.get(change.before_id)
-    if name:
-        return name
-    name = directive_id_to_name.get(change.before_id)
-    if name:
-        return name
-    for call in getattr(analysis, "http_calls", []):
-        if getattr(call, "id", None) == change.before_id:
-            owner = getattr(call, "owner_controller", None)
-            if owner:
-                return owner
-    return "unknown"
-
-
-def _extract_generated_file(reason: str) -> str | None:
-    if not reason:
-        return None
-    raw = None
-    for marker in ("written to ", "migrated into "):
-        if marker in reason:
-            raw = reason.split(marker, 1)[-1].strip()
-            break
-    if not raw:
-        return None
-    raw = re.sub(r'\s*\(.*\)\s*$', '', raw).strip()
-    fname = Path(raw).name
-    if re.match(r'^[\w.-]+\.(ts|html|js|css|json)$', fname):
-        return fname
-    return None
-
-
-def _unified_diff(before_text: str, after_text: str, filename: str) -> str:
-    """Return a unified diff string between before and after content."""
-    before_lines = before_text.splitlines(keepends=True)
-    after_lines  = after_text.splitlines(keepends=True)
-    diff = difflib.unified_diff(
-        before_lines,
-        after_lines,
-        fromfile=f"a/{filename}",
-        tofile=f"b/{filename}",
-        lineterm="",
-    )
-    return "".join(diff)
-
-
-def _collect_diffs(out_dir: Path, shadow_dir: Path) -> list[dict]:
-    """
-    Compare every file in shadow_dir (what would be written) against
-    the current state in out_dir (what exists or empty string).
-    Returns list of {file, diff, is_new} dicts.
-    """
-    diffs = []
-    for shadow_file in sorted(shadow_dir.rglob("*")):
-        if not shadow_file.is_file():
-            continue
-        rel = shadow_file.relative_to(shadow_dir)
-        real_file = out_dir / rel
-
-        after_text  = shadow_file.read_text(encoding="utf-8", errors="replace")
-        before_text = real_file.read_text(encoding="utf-8", errors="replace") if real_file.exists() else ""
-
-        if before_text == after_text:
-            continue  # no change
-
-        diff = _unified_diff(before_text, after_text, str(rel))
-        diffs.append({
-            "file":   str(rel),
-            "diff":   diff,
-            "is_new": not real_file.exists(),
-        })
-    return diffs
-
-
 # ---------------------------------------------------------------------------
 # Helpers (continued)
 # ---------------------------------------------------------------------------
 
-def _rewrite_md_report(repo_path, analysis, patterns, transformation, risk,
-                       validation_summary, tsc_result=None):
-    """Re-render the markdown report, optionally with tsc section appended."""
-    md = MarkdownReporter().render(analysis, patterns, transformation, risk, validation_summary)
-    if tsc_result is not None:
-        md += "\n\n## TypeScript Compilation\n"
-        if tsc_result.passed:
-            md += "\n✓ **Compilation passed** — 0 errors\n"
-        elif not tsc_result.tsc_found:
-            md += "\n⚠ **tsc not found** — install Node.js and TypeScript\n"
-            md += "\n```bash\nnpm install -g typescript\n```\n"
-        elif not tsc_result.tsconfig:
-            md += "\n⚠ **tsconfig.json not found** in generated project\n"
-        else:
-            md += f"\n✗ **{tsc_result.error_count} error(s)**\n\n"
-            for cat, errs in sorted(tsc_result.errors_by_category.items()):
-                md += f"### {cat.replace('_', ' ').title()} ({len(errs)})\n"
-                for e in errs[:5]:
-                    fname = Path(e.file).name
-                    md += f"- `{fname}:{e.line}` — {e.code}: {e.message}\n"
-                if len(errs) > 5:
-                    md += f"- *...{len(errs)-5} more*\n"
-    reports_root = Path("reports") / repo_path.name
-    reports_root.mkdir(parents=True, exist_ok=True)
-    md_path = reports_root / ".evua_report.md"
-    md_path.write_text(md, encoding="utf-8", errors="replace")
+def _tsc_markdown(tsc_result) -> str:
+    """The TypeScript Compilation section appended to the markdown report."""
+    md = "\n\n## TypeScript Compilation\n"
+    if tsc_result.passed:
+        md += "\n✓ **Compilation passed** — 0 errors\n"
+    elif not tsc_result.tsc_found:
+        md += "\n⚠ **tsc not found** — install Node.js and TypeScript\n"
+        md += "\n```bash\nnpm install -g typescript\n```\n"
+    elif not tsc_result.tsconfig:
+        md += "\n⚠ **tsconfig.json not found** in generated project\n"
+    else:
+        md += f"\n✗ **{tsc_result.error_count} error(s)**\n\n"
+        for cat, errs in sorted(tsc_result.errors_by_category.items()):
+            md += f"### {cat.replace('_', ' ').title()} ({len(errs)})\n"
+            for e in errs[:5]:
+                fname = Path(e.file).name
+                md += f"- `{fname}:{e.line}` — {e.code}: {e.message}\n"
+            if len(errs) > 5:
+                md += f"- *...{len(errs)-5} more*\n"
+    return md
+
+
+def _compare_snapshots(repo_path: Path) -> tuple[bool, list[str]]:
+    from pipeline.validation.comparators.snapshot import SnapshotComparator
+
+    before_snapshot, after_snapshot = _find_snapshots(repo_path)
+    if before_snapshot.exists() and after_snapshot.exists():
+        return SnapshotComparator().compare(str(before_snapshot), str(after_snapshot))
+    missing = [str(p) for p in [before_snapshot, after_snapshot] if not p.exists()]
+    return False, [f"Snapshot file(s) missing: {', '.join(missing)}"]
 
 
 # ---------------------------------------------------------------------------
 # Pipeline
 # ---------------------------------------------------------------------------
 
+VALIDATION_DEADLINE = 240   # seconds for all validation checks together
+
+
 def _run_validation(
     repo_path,
     real_out_dir,
     dry_run: bool,
     show_diff: bool,
-) -> dict:
-
-    from pipeline.validation.runners.tests      import TestRunner
-    from pipeline.validation.analyzers.coverage  import CoverageAnalyzer
-    from pipeline.validation.comparators.snapshot import SnapshotComparator
+    skip_tsc: bool = True,
+    lint: bool = False,
+    deadline: float = VALIDATION_DEADLINE,
+    index: ProjectIndex | None = None,
+    committed_root: Path | None = None,
+    cache_root: Path | None = None,
+) -> tuple[dict, object]:
+    """
+    Tests, snapshot comparison, coverage, tsc and (with lint=True) ESLint run
+    concurrently under one deadline (pipeline/validation/scheduler.py).
+    Lint and tests are scoped to the files that differ from committed_root,
+    the previously committed output (pipeline/validation/change_scope.py).
+    cache_root: toolchain / tsc cache directory shared across out/ directories.
+    Returns the validation summary and the TscResult (None when tsc did not run).
+    """
+    from pipeline.validation.runners.tests       import TestRunner, TestResult
+    from pipeline.validation.analyzers.coverage  import CoverageAnalyzer, CoverageResult
+    from pipeline.validation.change_scope        import ChangeScope
+    from pipeline.validation.scheduler           import ValidationScheduler
 
     print("\n  [validation] Starting validation phase...")
 
     failures: list[str] = []
+    preview = dry_run or show_diff
+
+    scope = None
+    if not preview:
+        scope = ChangeScope.compute(real_out_dir, index, committed_root)
+        print(f"  [validation] {scope.summary(lint=lint)}")
+    specs      = scope.spec_selection() if scope is not None else None
+    lint_files = scope.lint_selection() if scope is not None else None
+
+    scheduler = ValidationScheduler(deadline=deadline)
+    if not preview:
+        scheduler.add("tests",    lambda: TestRunner(real_out_dir, cache_root).run(str(repo_path), specs=specs))
+        scheduler.add("snapshot", lambda: _compare_snapshots(repo_path))
+        scheduler.add("coverage", lambda: CoverageAnalyzer(real_out_dir, index=index).analyze())
+        if not skip_tsc:
+            from pipeline.validation.runners.tsc import TscValidator
+            scheduler.add("tsc", lambda: TscValidator(real_out_dir, cache_root=cache_root).run())
+        if lint:
+            from pipeline.validation.runners.lint import LintRunner
+            scheduler.add("lint", lambda: LintRunner(real_out_dir, cache_root).run(files=lint_files))
+        print(f"  [validation] Running {', '.join(scheduler.names)} concurrently "
+              f"(deadline {deadline:g}s)...")
+    outcomes = scheduler.run()
+
+    def result_of(name: str):
+        outcome = outcomes.get(name)
+        return outcome.result if outcome is not None else None
+
+    def reason_of(name: str) -> str:
+        return outcomes[name].reason if name in outcomes else "Skipped in dry-run / diff mode"
+
+    timed_out = [name for name, o in outcomes.items() if o.timed_out]
+    if outcomes:
+        print("  [validation] " + ", ".join(
+            f"{name} {'timed out' if o.timed_out else f'{o.seconds:.2f}s'}"
+            for name, o in outcomes.items()
+        ))
+    print("  [validation] Completed.\n")
 
     # ── 1. Tests ─────────────────────────────────────────────────────────
-    print("  [validation] Running tests...", end="", flush=True)
-
-    if dry_run or show_diff:
-        from pipeline.validation.runners.tests import TestResult
-        test_result = TestResult(
-            passed=False,
-            output="Skipped in dry-run / diff mode",
-        )
-        tests_passed = False
-    else:
-        test_result  = TestRunner().run(str(repo_path))
-        tests_passed = test_result.passed
-
-    print(" done")
+    test_result = result_of("tests")
+    if test_result is None:
+        test_result = TestResult(passed=False, output=reason_of("tests"),
+                                 timed_out="tests" in timed_out)
+    tests_passed = test_result.passed
 
-    if not tests_passed and not (dry_run or show_diff):
+    if not tests_passed and not preview:
         if test_result.runner_missing:
             failures.append("Tests: runner not found (ng / npm)")
         elif test_result.timed_out:
@@ -315,41 +226,19 @@ def _run_validation(
             )
 
     # ── 2. Snapshot comparison ────────────────────────────────────────────
-    print("  [validation] Comparing snapshots...", end="", flush=True)
-
-    if dry_run or show_diff:
-        snapshot_passed   = False
-        snapshot_failures = ["Skipped in dry-run / diff mode"]
-    else:
-        before_snapshot, after_snapshot = _find_snapshots(repo_path)
-        snapshot_passed   = False
-        snapshot_failures = []
-        if before_snapshot.exists() and after_snapshot.exists():
-            snapshot_passed, snapshot_failures = SnapshotComparator().compare(
-                str(before_snapshot), str(after_snapshot)
-            )
-        else:
-            missing = [str(p) for p in [before_snapshot, after_snapshot] if not p.exists()]
-            snapshot_failures = [f"Snapshot file(s) missing: {', '.join(missing)}"]
-
-    print(" done")
-
+    snapshot = result_of("snapshot")
+    if snapshot is None:
+        snapshot = (False, [reason_of("snapshot") if preview
+                            else f"Snapshot comparison {reason_of('snapshot')}"])
+    snapshot_passed, snapshot_failures = snapshot
     failures.extend(snapshot_failures)
 
-    # ── 4. Coverage ───────────────────────────────────────────────────────
-    print("  [validation] Calculating coverage...", end="", flush=True)
-
-    if dry_run or show_diff:
-        from pipeline.validation.analyzers.coverage import CoverageResult
+    # ── 3. Coverage ───────────────────────────────────────────────────────
+    coverage_result = result_of("coverage")
+    if coverage_result is None:
         coverage_result = CoverageResult(
             covered=0, stub=0, uncovered=0, total=0, by_type={}
         )
-    else:
-        coverage_result = CoverageAnalyzer(real_out_dir).analyze()
-
-    print(" done")
-
-    print("  [validation] Completed.\n")
 
     print(
         f"  Validate  : tests={tests_passed}, "
@@ -357,7 +246,7 @@ def _run_validation(
         f"coverage={coverage_result.percent}%"
     )
 
-    return {
+    validation_summary = {
         "tests_passed":    tests_passed,
         "snapshot_passed": snapshot_passed,
         "tsc_passed":      None,
@@ -369,6 +258,62 @@ def _run_validation(
         "coverage_report": coverage_result.to_dict(),
     }
 
+    # ── 4. TypeScript compilation ─────────────────────────────────────────
+    tsc_result = None
+    if "tsc" in outcomes:
+        from pipeline.validation.runners.tsc import TscResult
+
+        tsc_result = result_of("tsc")
+        if tsc_result is None:
+            print(f"  [tsc] {reason_of('tsc')}")
+            tsc_result = TscResult(passed=False, tsc_found=True, tsconfig=None,
+                                   raw_output=reason_of("tsc"))
+        validation_summary["tsc_passed"]  = tsc_result.passed
+        validation_summary["tsc_errors"]  = [e.to_dict() for e in tsc_result.errors[:50]]
+        validation_summary["tsc_summary"] = tsc_result.error_summary
+        validation_summary["tsc_found"]   = tsc_result.tsc_found
+        if not tsc_result.passed and tsc_result.error_count > 0:
+            failures.append(f"TypeScript: {tsc_result.error_count} error(s)")
+        if tsc_result.passed:
+            print(f"  Validate  : tsc ✓  (0 errors)")
+        elif not tsc_result.tsc_found:
+            print(f"  Validate  : tsc ✗  (tsc not found — install Node.js + TypeScript)")
+        else:
+            print(f"  Validate  : tsc ✗  ({tsc_result.error_count} errors)")
+            for e in tsc_result.errors[:5]:
+                fname = Path(e.file).name if hasattr(e, 'file') else '?'
+                line  = getattr(e, 'line', '?')
+                msg   = getattr(e, 'message', str(e))[:80]
+                print(f"    {fname}:{line}  {msg}")
+    elif skip_tsc and not preview:
+        print("  [tsc] Skipped (--skip-tsc)")
+
+    # ── 5. Lint (opt-in) ──────────────────────────────────────────────────
+    lint_clean = False
+    if "lint" in outcomes:
+        lint_result = result_of("lint")
+        if lint_result is None:
+            from pipeline.validation.runners.lint import LintResult
+            lint_result = LintResult(passed=True, raw_output=reason_of("lint"))
+        validation_summary["lint_passed"]  = lint_result.passed
+        validation_summary["lint_summary"] = lint_result.summary
+        validation_summary["lint"]         = lint_result.to_dict()
+        if not lint_result.passed:
+            failures.append(lint_result.summary)
+        print(f"  Validate  : {lint_result.summary}")
+        # A missing / timed-out linter also "passes"; only a real run (or a
+        # scoped run with nothing to lint) counts for the next scope
+        lint_clean = lint_result.passed and (bool(lint_result.command_used) or lint_files == [])
+
+    if timed_out:
+        validation_summary["timed_out"] = timed_out
+    if scope is not None and (specs is not None or (lint and lint_files is not None)):
+        validation_summary["change_scope"] = scope.to_dict()
+    if scope is not None:
+        ChangeScope.record(real_out_dir, index, {"tests": tests_passed, "lint": lint_clean})
+
+    return validation_summary, tsc_result
+
 
 def run_pipeline(
     repo_path: str,
@@ -379,6 +324,15 @@ def run_pipeline(
     batch: bool = False,
     ai_assist: bool = False,
     skip_tsc: bool = False,
+    lint: bool = False,
+    validation_deadline: float = VALIDATION_DEADLINE,
+    ndjson: bool = False,
+    diff_base: Path | str | None = None,
+    patch_file: Path | str | None = None,
+    analysis_cache: AnalysisSnapshotCache | None = None,
+    reports_dir: Path | str = "reports",
+    checkpoint: RunCheckpoint | None = None,
+    cache_root: Path | str | None = None,
 ) -> bool:
     repo_path = Path(repo_path).resolve()
     out_root = Path(out_root).resolve()
@@ -394,6 +348,10 @@ def run_pipeline(
         print(f"  FILTER: only={only}")
     if skip_tsc:
         print("  MODE: --skip-tsc — TypeScript validation disabled")
+    if lint:
+        print("  MODE: --lint — ESLint runs with the validation checks")
+    if checkpoint is not None and checkpoint.last_stage:
+        print(f"  RESUME: run {checkpoint.run_id} — continuing after stage '{checkpoint.last_stage}'")
     print(f"{'='*60}")
 
     # In diff mode we write to a temp shadow directory, then compare
@@ -401,314 +359,480 @@ def run_pipeline(
     effective_out_dir = real_out_dir
 
     if show_diff or dry_run:
+        import tempfile
         shadow_dir = Path(tempfile.mkdtemp(prefix="evua_shadow_"))
         effective_out_dir = shadow_dir / "angular-app"
 
-    scanner    = FileScanner()
-    files      = scanner.scan(str(repo_path))
-    classifier = FileClassifier()
-
-    files_by_type = {
-        FileType.JS:   [p for p in files if classifier.classify(p) == FileType.JS],
-        FileType.HTML: [p for p in files if classifier.classify(p) == FileType.HTML],
-        FileType.PY:   [p for p in files if classifier.classify(p) == FileType.PY],
-        FileType.JAVA: [p for p in files if classifier.classify(p) == FileType.JAVA],
-    }
-    n_js = len(files_by_type[FileType.JS])
-    print(f"  Ingestion : {len(files)} files  ({n_js} JS)")
-
-    dispatcher = AnalyzerDispatcher()
-    analysis: AnalysisResult = dispatcher.dispatch(files_by_type)
-    n_classes    = sum(len(m.classes) for m in analysis.modules)
-    n_http       = len(analysis.http_calls)
-    n_directives = len(getattr(analysis, "directives", []) or [])
-    n_routes     = len(getattr(analysis, "routes", []) or [])
-    print(f"  Analysis  : {n_classes} classes, {n_http} http calls, {n_directives} directives, {n_routes} routes")
-
-    id_to_name           = _build_id_to_name(analysis)
-    directive_id_to_name = _build_directive_id_to_name(analysis)
-
-    roles:      dict = {}
-    confidence: dict = {}
-
-    for detector in [
-        ControllerDetector(),
-        HttpDetector(),
-        SimpleWatchDetector(),
-        ServiceDetector(),
-        DirectiveDetector(),
-    ]:
-        r, c = detector.detect(analysis)
-        for k, v in r.items():
-            roles.setdefault(k, []).extend(v)
-        confidence.update(c)
-
-    patterns = PatternResult(roles_by_node=roles, confidence_by_node=confidence)
-    print(f"  Patterns  : {len(roles)} nodes matched")
-
-    # Build rule list — respect --only filter
-    # RouteMigratorRule runs FIRST — it owns app-routing.module.ts entirely.
-    # ControllerToComponentRule no longer touches routing.
-    _all_rules = {
-        "routing":      RouteMigratorRule(out_dir=effective_out_dir, dry_run=dry_run),
-        "controllers":  ControllerToComponentRule(out_dir=effective_out_dir, dry_run=dry_run),
-        "services":     ServiceToInjectableRule(out_dir=effective_out_dir, dry_run=dry_run),
-        "http":         HttpToHttpClientRule(out_dir=effective_out_dir, dry_run=dry_run),
-        "watch":        SimpleWatchToRxjsRule(out_dir=effective_out_dir, dry_run=dry_run),
-        "interaction":  ComponentInteractionRule(out_dir=effective_out_dir, dry_run=dry_run),
-        "directives_component": DirectiveToComponentRule(out_dir=effective_out_dir, dry_run=dry_run),
-        "directives_pipe": DirectiveToPipeRule(out_dir=effective_out_dir, dry_run=dry_run),
-        "constants":    ConstantsAndRunRule(out_dir=effective_out_dir, dry_run=dry_run),
-        "module":       AppModuleUpdaterRule(out_dir=effective_out_dir, dry_run=dry_run),
-    }
-
-    if only:
-        # Normalise: --only controllers,services
-        requested = {o.strip().lower() for o in only}
-        rules = [r for k, r in _all_rules.items() if k in requested]
-        print(f"  Rules active: {[k for k in _all_rules if k in requested]}")
-    else:
-        rules = list(_all_rules.values())
-
-    applier        = RuleApplier(rules)
-    changes        = applier.apply_all(analysis, patterns)
-    transformation = TransformationResult(changes=changes)
-    print(f"  Transform : {len(changes)} changes proposed")
-
-    # ── Risk assessment ────────────────────────────────────────────────────
-    risk_by_change_id:   dict = {}
-    reason_by_change_id: dict = {}
-
-    for risk_rule in [
-        ServiceRiskRule(),
-        TemplateBindingRiskRule(),
-        WatcherRiskRule(),
-        DirectiveRiskRule(out_dir=effective_out_dir),
-    ]:
-        rb, rr = risk_rule.assess(analysis, patterns, transformation)
-        risk_by_change_id.update(rb)
-        reason_by_change_id.update(rr)
-
-    changes = transformation.changes
-
-    for change in changes:
-        if change.id not in risk_by_change_id:
-            risk_by_change_id[change.id]   = RiskLevel.SAFE
-            reason_by_change_id[change.id] = "No specific risk pattern detected"
+    try:
+        scanner    = FileScanner()
+        files      = scanner.scan(str(repo_path))
+        classifier = FileClassifier()
+
+        files_by_type = {
+            FileType.JS:   [p for p in files if classifier.classify(p) == FileType.JS],
+            FileType.HTML: [p for p in files if classifier.classify(p) == FileType.HTML],
+            FileType.PY:   [p for p in files if classifier.classify(p) == FileType.PY],
+            FileType.JAVA: [p for p in files if classifier.classify(p) == FileType.JAVA],
+        }
+        n_js = len(files_by_type[FileType.JS])
+        print(f"  Ingestion : {len(files)} files  ({n_js} JS)")
+
+        # Resumed runs continue from the stage state saved in their checkpoint
+        # (orchestration/checkpoint.py); a changed repo is not resumed.
+        if checkpoint is not None:
+            checkpoint.check_fingerprint(snapshot_fingerprint(files))
+
+        def resumed(stage: str) -> bool:
+            return checkpoint is not None and checkpoint.done(stage)
+
+        # Long-lived processes (serve) reuse the analysis of an unchanged repo
+        analysis: AnalysisResult | None = None
+        source = ""
+        if resumed("patterns"):
+            analysis = checkpoint.get("analysis")
+            source   = "  (checkpoint)"
+        elif analysis_cache is not None:
+            snapshot_fp = snapshot_fingerprint(files)
+            analysis    = analysis_cache.get(repo_path, snapshot_fp)
+            if analysis is not None:
+                source = "  (cached snapshot)"
+        if analysis is None:
+            dispatcher = AnalyzerDispatcher()
+            analysis   = dispatcher.dispatch(files_by_type)
+            if analysis_cache is not None:
+                analysis_cache.put(repo_path, snapshot_fp, analysis)
+        n_classes    = sum(len(m.classes) for m in analysis.modules)
+        n_http       = len(analysis.http_calls)
+        n_directives = len(getattr(analysis, "directives", []) or [])
+        n_routes     = len(getattr(analysis, "routes", []) or [])
+        print(f"  Analysis  : {n_classes} classes, {n_http} http calls, {n_directives} directives, {n_routes} routes"
+              + source)
+
+        if resumed("patterns"):
+            patterns = checkpoint.get("patterns")
+        else:
+            roles:      dict = {}
+            confidence: dict = {}
+
+            for detector in [
+                ControllerDetector(),
+                HttpDetector(),
+                SimpleWatchDetector(),
+                ServiceDetector(),
+                DirectiveDetector(),
+            ]:
+                r, c = detector.detect(analysis)
+                for k, v in r.items():
+                    roles.setdefault(k, []).extend(v)
+                confidence.update(c)
+
+            patterns = PatternResult(roles_by_node=roles, confidence_by_node=confidence)
+            if checkpoint is not None:
+                checkpoint.save("patterns", analysis=analysis, patterns=patterns)
+        print(f"  Patterns  : {len(patterns.roles_by_node)} nodes matched")
+
+        # Build rule list — respect --only filter (see RULES for the order)
+        if only:
+            # Normalise: --only controllers,services
+            requested = {o.strip().lower() for o in only}
+            rule_keys = [k for k in RULES if k in requested]
+            print(f"  Rules active: {rule_keys}")
+        else:
+            rule_keys = list(RULES)
 
-    risk = RiskResult(
-        risk_by_change_id=risk_by_change_id,
-        reason_by_change_id=reason_by_change_id,
-    )
+        # One index of the generated project for every later stage: writers
+        # record into it, coverage / AI-assist / PipelineRunner query it
+        # (pipeline/transformation/project_index.py). Empty for a fresh
+        # workspace; a resumed one is indexed as found.
+        project_index = ProjectIndex.build(effective_out_dir)
 
-    # ── Risk summary — grouped by level, deduplicated ─────────────────────
-    risk_groups: dict[str, list[str]] = {"MANUAL": [], "RISKY": [], "SAFE": []}
-    seen_risk_names: set = set()
-    for change in changes:
-        level = risk_by_change_id.get(change.id, RiskLevel.SAFE)
-        name  = _resolve_name(change, id_to_name, directive_id_to_name, analysis)
-        if name == "unknown" or name in seen_risk_names:
-            continue
-        seen_risk_names.add(name)
-        risk_groups[level.value.upper()].append(name)
-
-    n_manual = len(risk_groups["MANUAL"])
-    n_risky  = len(risk_groups["RISKY"])
-    n_safe   = len(risk_groups["SAFE"])
-
-    print(f"  Risk      : {n_safe} safe, {n_risky} risky, {n_manual} manual")
-    if risk_groups["MANUAL"]:
-        for name in risk_groups["MANUAL"]:
-            reason = next(
-                (reason_by_change_id[c.id] for c in changes
-                 if _resolve_name(c, id_to_name, directive_id_to_name, analysis) == name
-                 and c.id in reason_by_change_id),
-                ""
+        if resumed("transformation"):
+            changes = checkpoint.get("changes")         # generated files are in the workspace
+        else:
+            rules = [_load_rule(k)(out_dir=effective_out_dir, dry_run=dry_run) for k in rule_keys]
+            if shadow_dir is not None:
+                # The artifact cache sits two levels above the project, which
+                # for the shadow tree is the temp directory, not out/
+                for rule in rules:
+                    if getattr(rule, "cache", None) is not None:
+                        rule.cache.enabled = False
+
+            # Rules record what they emit into an in-process manifest for
+            # AppModuleUpdaterRule; it only lives for this transformation pass.
+            app_dir = Path(effective_out_dir) / "src" / "app"
+            ArtifactManifest.discard(app_dir)
+            applier        = RuleApplier(rules)
+            changes        = applier.apply_all(analysis, patterns)
+            ArtifactManifest.discard(app_dir)
+            if checkpoint is not None:
+                checkpoint.save("transformation", changes=changes)
+        transformation = TransformationResult(changes=changes)
+        print(f"  Transform : {len(changes)} changes proposed")
+
+        # ── Risk assessment ────────────────────────────────────────────────────
+        # One pass over the changes; the highest-precedence rule with a verdict
+        # wins (see pipeline/risk/engine.py).
+        if resumed("risk"):
+            risk         = checkpoint.get("risk")
+            risk_summary = checkpoint.get("risk_summary")
+        else:
+            risk_engine = RiskEngine([
+                ServiceRiskRule(),
+                TemplateBindingRiskRule(),
+                WatcherRiskRule(),
+                DirectiveRiskRule(out_dir=effective_out_dir),
+            ])
+            risk         = risk_engine.assess(analysis, patterns, transformation)
+            risk_summary = risk_engine.summary()
+            if checkpoint is not None:
+                checkpoint.save("risk", risk=risk, risk_summary=risk_summary)
+        print(f"  Risk rules: {risk_summary}  (verdicts/evaluated)")
+
+        changes = transformation.changes
+        # Name / file / verdict joins for the summary and both reports, built once
+        index = ChangeIndex(analysis, changes, risk)
+
+        # ── Risk summary — grouped by level, deduplicated ─────────────────────
+        risk_groups = index.names_by_level()
+
+        n_manual = len(risk_groups["MANUAL"])
+        n_risky  = len(risk_groups["RISKY"])
+        n_safe   = len(risk_groups["SAFE"])
+
+        print(f"  Risk      : {n_safe} safe, {n_risky} risky, {n_manual} manual")
+        if risk_groups["MANUAL"]:
+            for name in risk_groups["MANUAL"]:
+                reason = index.first_reason(name)
+                print(f"    ⚠ MANUAL  {name} — {reason[:80]}")
+        if risk_groups["RISKY"]:
+            for name in risk_groups["RISKY"]:
+                reason = index.first_reason(name)
+                print(f"    ! RISKY   {name} — {reason[:80]}")
+
+        # ── AI-assist post-processing ──────────────────────────────────────────
+        if resumed("ai"):
+            print("  [ai] Completed before the checkpoint — skipped")
+        elif not dry_run and not show_diff:
+            from pipeline.ai.client import AIClient
+            from pipeline.ai.stage import AIAssistStage
+
+            client = AIClient()
+            ai_app_dir = real_out_dir / "src" / "app"
+            stage = AIAssistStage(app_dir=ai_app_dir, analysis=analysis, client=client,
+                                  index=project_index)
+            stage.run()
+            if checkpoint is not None:
+                checkpoint.save("ai")
+        elif dry_run or show_diff:
+            pass  # AI-assist not run in preview modes
+
+        # ── Validation (skip in dry-run / diff — files not written to real location) ──
+        # Runs after AI-assist so every check, tsc included, sees the final output
+        if resumed("validation"):
+            validation_summary = checkpoint.get("validation_summary")
+            tsc_result         = checkpoint.get("tsc_result")
+            print(f"\n  Validate  : tests={validation_summary['tests_passed']}, "
+                  f"snapshot={validation_summary['snapshot_passed']}  (checkpoint)")
+        else:
+            validation_summary, tsc_result = _run_validation(
+                repo_path=repo_path,
+                real_out_dir=real_out_dir,
+                dry_run=dry_run,
+                show_diff=show_diff,
+                skip_tsc=skip_tsc,
+                lint=lint,
+                deadline=validation_deadline,
+                index=project_index,
+                committed_root=Path(diff_base) if diff_base else None,
+                cache_root=Path(cache_root) if cache_root else None,
             )
-            print(f"    ⚠ MANUAL  {name} — {reason[:80]}")
-    if risk_groups["RISKY"]:
-        for name in risk_groups["RISKY"]:
-            reason = next(
-                (reason_by_change_id[c.id] for c in changes
-                 if _resolve_name(c, id_to_name, directive_id_to_name, analysis) == name
-                 and c.id in reason_by_change_id),
-                ""
+            if checkpoint is not None:
+                checkpoint.save("validation", validation_summary=validation_summary,
+                                tsc_result=tsc_result)
+
+        # ── Diff output ────────────────────────────────────────────────────────
+        if show_diff and shadow_dir:
+            from pipeline.reporting.diff_collector import collect_diffs, write_patch
+
+            # Compare against the committed output, not this run's workspace
+            base_dir   = Path(diff_base).resolve() if diff_base else real_out_dir
+            shadow_app = shadow_dir / "angular-app"
+            diffs = collect_diffs(base_dir, shadow_app)
+
+            if not diffs:
+                print("\n  [DIFF] No changes — output is already up to date.")
+            elif patch_file:
+                patch_path = write_patch(Path(patch_file).resolve(), diffs)
+                print(f"\n  [DIFF] {len(diffs)} file(s) would change — patch written to {patch_path}")
+            else:
+                print(f"\n  [DIFF] {len(diffs)} file(s) would change:\n")
+                for d in diffs:
+                    status = "NEW" if d.is_new else "MODIFIED"
+                    print(f"  [{status}] {d.file}")
+                    print("  " + "-" * 60)
+                    # Print diff with indentation, limit to 80 lines
+                    diff_lines = d.diff.splitlines()
+                    for line in diff_lines[:80]:
+                        print("  " + line)
+                    if len(diff_lines) > 80:
+                        print(f"  ... ({len(diff_lines) - 80} more lines)")
+                    print()
+
+        # ── Build report collections ───────────────────────────────────────────
+        collections     = index.report_collections()
+        risk_by_level   = collections["risk_by_level"]
+        generated_files = collections["generated_files"]
+        auto_modernized = collections["auto_modernized"]
+        manual_required = collections["manual_required"]
+
+        transformation = TransformationResult(changes=changes)
+
+        # Report sections are assembled in order and streamed to disk; "changes"
+        # is rendered row by row from the ChangeIndex (pipeline/reporting/json_stream.py)
+        json_reporter = JSONReporter()
+        try:
+            report_sections = json_reporter.sections(analysis, patterns, transformation, risk,
+                                                     validation_summary, index=index)
+        except Exception:
+            report_sections = {}
+
+        report_sections["validation"] = validation_summary
+
+        md_report = MarkdownReporter().render(analysis, patterns, transformation, risk, validation_summary,
+                                             index=index)
+
+        report_sections["risk"] = {"by_level": risk_by_level, "rules": risk.rule_stats}
+        report_sections["transformation"] = {
+            "generated_files": generated_files,
+            "auto_modernized": auto_modernized,
+            "manual_required": manual_required,
+        }
+        if dry_run:
+            report_sections["dry_run"] = True
+        if "changes" not in report_sections:
+            report_sections["changes"] = []
+        if tsc_result is not None:
+            report_sections["test_run"]       = validation_summary.get("test_run", {})
+            report_sections["tsc_validation"] = tsc_result.to_dict()
+            md_report += _tsc_markdown(tsc_result)
+
+        reports_root = Path(reports_dir) / repo_path.name
+        reports_root.mkdir(parents=True, exist_ok=True)
+
+        report_path = reports_root / ".evua_report.json"
+        md_path     = reports_root / ".evua_report.md"
+
+        write_json_report(report_path, report_sections)
+        md_path.write_text(md_report, encoding="utf-8", errors="replace")
+
+        # Indexed copy for paginated queries from the backend (/api/report/changes, ...)
+        store_path = reports_root / ".evua_report.sqlite"
+        try:
+            write_report_store(
+                store_path, index,
+                project=repo_path.name,
+                summary={
+                    "risk":           {level: len(names) for level, names in risk_by_level.items()},
+                    "changes":        len(changes),
+                    "generated_files": len(generated_files),
+                    "dry_run":        dry_run,
+                },
+                validation=validation_summary,
             )
-            print(f"    ! RISKY   {name} — {reason[:80]}")
-
-    # ── Validation (skip in dry-run / diff — files not written to real location) ──
-    validation_summary = _run_validation(
-        repo_path=repo_path,
-        real_out_dir=real_out_dir,
-        dry_run=dry_run,
-        show_diff=show_diff,
-    )
-
-    # ── Diff output ────────────────────────────────────────────────────────
-    if show_diff and shadow_dir:
-        real_out_dir = out_root / "angular-app"
-        shadow_app   = shadow_dir / "angular-app"
-        diffs = _collect_diffs(real_out_dir, shadow_app)
+        except (sqlite3.Error, OSError) as e:
+            print(f"  [report] SQLite store not written: {e}")
+
+        print(f"  Reports   : {report_path}")
+        if ndjson:
+            ndjson_path = reports_root / ".evua_report.ndjson"
+            n_rows = write_ndjson(ndjson_path, report_sections["changes"])
+            print(f"  Reports   : {ndjson_path}  ({n_rows} change(s))")
+
+        # ── Clean summary box ──────────────────────────────────────────────────
+        n_components = len([c for c in changes if "component" in (getattr(c, "reason", "") or "").lower() and "written" in (getattr(c, "reason", "") or "").lower()])
+        n_services   = len([c for c in changes if "injectable" in (getattr(c, "reason", "") or "").lower()])
+        n_pipes      = len([c for c in changes if "pipe" in (getattr(c, "after_id", "") or "").lower()])
+        n_gen        = len(generated_files)
+
+        print(f"\n  {'─'*56}")
+        print(f"  {'EVUA Migration Summary':^56}")
+        print(f"  {'─'*56}")
+        print(f"  {'Project':<20} {repo_path.name}")
+        print(f"  {'Files scanned':<20} {len(files)} ({n_js} JS)")
+        print(f"  {'Classes found':<20} {n_classes}")
+        print(f"  {'Routes migrated':<20} {n_routes}")
+        print(f"  {'Changes proposed':<20} {len(changes)}")
+        print(f"  {'Generated files':<20} {n_gen}")
+        print(f"  {'Risk: safe/risky/manual':<20} {n_safe}/{n_risky}/{n_manual}")
+        if n_manual > 0:
+            print(f"  {'Needs manual review':<20} {', '.join(risk_groups['MANUAL'])}")
+        print(f"  {'─'*56}")
+        print(f"  Next steps:")
+        print(f"    cd out/angular-app && npm install && ng serve")
+        print(f"  {'─'*56}\n")
+
+        return True
+    finally:
+        if shadow_dir is not None:
+            # The preview workspace is ours, not PipelineRunner's: drop its
+            # index (registered above) and the directory itself
+            ProjectIndex.discard(effective_out_dir)
+            shutil.rmtree(shadow_dir, ignore_errors=True)
+
+
+def run_job(
+    repo: str,
+    dry_run: bool = False,
+    diff: bool = False,
+    patch: str | None = None,
+    only: list[str] | None = None,
+    batch: bool = False,
+    ai_assist: bool = False,
+    skip_tsc: bool = False,
+    lint: bool = False,
+    validation_deadline: float = VALIDATION_DEADLINE,
+    ndjson: bool = False,
+    analysis_cache: AnalysisSnapshotCache | None = None,
+    out_root: Path | str = "out",
+    reports_dir: Path | str = "reports",
+    resume: str | None = None,
+    cache_root: Path | str | None = None,
+) -> bool:
+    """
+    One pipeline run through PipelineRunner — used by the CLI, `serve` and `batch`.
+    resume: run id of an interrupted run; it continues with the options it was
+            started with (see orchestration/checkpoint.py)
+    cache_root: node_modules / tool / tsc caches shared by several out_root
+            directories (batch); by default they live in out_root
+    """
+    if resume:
+        try:
+            manifest = RunCheckpoint.load(Path(out_root), resume).manifest
+        except CheckpointError as e:
+            print(f"  [error] {e}")
+            for m in RunCheckpoint.list_runs(Path(out_root)):
+                print(f"    resumable: {m['run_id']}  {m['repo']}  after '{(m['stages'] or ['-'])[-1]}'")
+            return False
+        if repo and Path(repo).resolve() != Path(manifest["repo"]):
+            print(f"  [error] Run '{resume}' migrates {manifest['repo']}, not {Path(repo).resolve()}")
+            return False
+        repo = manifest["repo"]
+        opts = manifest["options"]
+        only, batch, ai_assist, skip_tsc, ndjson = (
+            opts.get("only"), opts.get("batch", False), opts.get("ai_assist", False),
+            opts.get("skip_tsc", False), opts.get("ndjson", False),
+        )
+        lint                = opts.get("lint", False)
+        validation_deadline = opts.get("validation_deadline", VALIDATION_DEADLINE)
 
-        if not diffs:
-            print("\n  [DIFF] No changes — output is already up to date.")
-        else:
-            print(f"\n  [DIFF] {len(diffs)} file(s) would change:\n")
-            for d in diffs:
-                status = "NEW" if d["is_new"] else "MODIFIED"
-                print(f"  [{status}] {d['file']}")
-                print("  " + "-" * 60)
-                # Print diff with indentation, limit to 80 lines
-                diff_lines = d["diff"].splitlines()
-                for line in diff_lines[:80]:
-                    print("  " + line)
-                if len(diff_lines) > 80:
-                    print(f"  ... ({len(diff_lines) - 80} more lines)")
-                print()
-
-        # Clean up shadow dir
-        shutil.rmtree(shadow_dir, ignore_errors=True)
-
-    # ── Build report collections ───────────────────────────────────────────
-    risk_by_level   = {"SAFE": [], "RISKY": [], "MANUAL": []}
-    generated_files = []
-    auto_modernized = []
-    manual_required = []
-    seen_names_per_level = {"SAFE": set(), "RISKY": set(), "MANUAL": set()}
-
-    for change in changes:
-        reason = getattr(change, "reason", "") or ""
-        level  = risk_by_change_id.get(change.id, RiskLevel.SAFE)
-        key    = level.value.upper()
-
-        fname = _extract_generated_file(reason)
-        if fname and fname not in generated_files:
-            generated_files.append(fname)
-
-        name = _resolve_name(change, id_to_name, directive_id_to_name, analysis)
-
-        is_synthetic = (
-            name == "unknown"
-            or name.endswith("_html")
-            or name == "routing_module"
+    def _run(out_root, checkpoint=None):
+        return run_pipeline(
+            repo_path=repo,
+            out_root=out_root,
+            dry_run=dry_run,
+            show_diff=diff or bool(patch),
+            only=only,
+            batch=batch,
+            ai_assist=ai_assist,
+            skip_tsc=skip_tsc,
+            lint=lint,
+            validation_deadline=validation_deadline,
+            ndjson=ndjson,
+            diff_base=runner.final_root / "angular-app",
+            patch_file=patch,
+            analysis_cache=analysis_cache,
+            reports_dir=reports_dir,
+            checkpoint=checkpoint,
+            cache_root=cache_root,
         )
-        if is_synthetic:
-            continue
 
-        if name not in seen_names_per_level[key]:
-            seen_names_per_level[key].add(name)
-            risk_by_level[key].append(name)
+    # Preview modes must leave the committed output untouched
+    preview = dry_run or diff or patch
+    if resume and preview:
+        print("  [error] --resume cannot be combined with --dry-run / --diff / --patch")
+        return False
+    runner = PipelineRunner(
+        _run, out_root=out_root, commit=not preview,
+        checkpoint={
+            "repo":    repo,
+            "options": {"only": only, "batch": batch, "ai_assist": ai_assist,
+                        "skip_tsc": skip_tsc, "lint": lint,
+                        "validation_deadline": validation_deadline, "ndjson": ndjson},
+        },
+    )
+    try:
+        return runner.run(resume=resume)
+    except CheckpointError as e:
+        print(f"  [error] {e}")
+        return False
 
-        if level == RiskLevel.MANUAL:
-            if name not in manual_required:
-                manual_required.append(name)
-        else:
-            if name not in auto_modernized:
-                auto_modernized.append(name)
 
-    transformation = TransformationResult(changes=changes)
+def serve(argv: list[str]) -> int:
+    """`python cli.py serve` — keep the engine loaded and serve run requests."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py serve",
+        description="Serve migration runs over JSON-RPC (see orchestration/daemon.py)",
+    )
+    parser.add_argument("--socket", type=str, default=None, metavar="PATH",
+                        help="Listen on a Unix socket instead of stdin/stdout")
+    args = parser.parse_args(argv)
 
-    try:
-        json_report = JSONReporter().render(analysis, patterns, transformation, risk, validation_summary)
-        report_dict = json.loads(json_report)
-    except Exception:
-        report_dict = {}
+    from orchestration.daemon import EngineDaemon
+    from pipeline.validation.runners.tsc_worker import enable_pool
 
-    report_dict["validation"] = validation_summary
+    enable_pool()           # every run's tsc check goes to one warm checker
+    daemon = EngineDaemon(run_job)
+    if args.socket:
+        daemon.serve_unix(args.socket)
+    else:
+        daemon.serve_stdio()
+    return 0
 
-    md_report = MarkdownReporter().render(analysis, patterns, transformation, risk, validation_summary)
 
-    report_dict["risk"] = {"by_level": risk_by_level}
-    report_dict["transformation"] = {
-        "generated_files": generated_files,
-        "auto_modernized": auto_modernized,
-        "manual_required": manual_required,
-    }
-    if dry_run:
-        report_dict["dry_run"] = True
-    if "changes" not in report_dict:
-        report_dict["changes"] = []
-
-    reports_root = Path("reports") / repo_path.name
-    reports_root.mkdir(parents=True, exist_ok=True)
-
-    report_path = reports_root / ".evua_report.json"
-    md_path     = reports_root / ".evua_report.md"
-
-    report_json = json.dumps(report_dict, indent=2, ensure_ascii=False)
-    report_path.write_text(report_json, encoding="utf-8", errors="replace")
-    md_path.write_text(md_report, encoding="utf-8", errors="replace")
-
-    print(f"  Reports   : {report_path}")
-
-    # ── Clean summary box ──────────────────────────────────────────────────
-    n_components = len([c for c in changes if "component" in (getattr(c, "reason", "") or "").lower() and "written" in (getattr(c, "reason", "") or "").lower()])
-    n_services   = len([c for c in changes if "injectable" in (getattr(c, "reason", "") or "").lower()])
-    n_pipes      = len([c for c in changes if "pipe" in (getattr(c, "after_id", "") or "").lower()])
-    n_gen        = len(generated_files)
-
-    print(f"\n  {'─'*56}")
-    print(f"  {'EVUA Migration Summary':^56}")
-    print(f"  {'─'*56}")
-    print(f"  {'Project':<20} {repo_path.name}")
-    print(f"  {'Files scanned':<20} {len(files)} ({n_js} JS)")
-    print(f"  {'Classes found':<20} {n_classes}")
-    print(f"  {'Routes migrated':<20} {n_routes}")
-    print(f"  {'Changes proposed':<20} {len(changes)}")
-    print(f"  {'Generated files':<20} {n_gen}")
-    print(f"  {'Risk: safe/risky/manual':<20} {n_safe}/{n_risky}/{n_manual}")
-    if n_manual > 0:
-        print(f"  {'Needs manual review':<20} {', '.join(risk_groups['MANUAL'])}")
-    print(f"  {'─'*56}")
-    print(f"  Next steps:")
-    print(f"    cd out/angular-app && npm install && ng serve")
-    print(f"  {'─'*56}\n")
-
-    # ── AI-assist post-processing ──────────────────────────────────────────
-    if not dry_run and not show_diff:
-        client = AIClient()
-        ai_app_dir = real_out_dir / "src" / "app"
-        stage = AIAssistStage(app_dir=ai_app_dir, analysis=analysis, client=client)
-        stage.run()
-    elif dry_run or show_diff:
-        pass  # AI-assist not run in preview modes
-
-    # ── TypeScript compilation validation ──────────────────────────────────
-    if not dry_run and not show_diff and not skip_tsc:
-        tsc_project_root = real_out_dir  # scaffold root = out/.tmp/angular-app
-        print(f"\n  [tsc] Validating TypeScript compilation...")
-        tsc_result = TscValidator(tsc_project_root).run()
-        validation_summary["tsc_passed"] = tsc_result.passed
-        validation_summary["tsc_errors"] = [e.to_dict() for e in tsc_result.errors[:50]]
-        validation_summary["tsc_summary"] = tsc_result.error_summary
-        validation_summary["tsc_found"]  = tsc_result.tsc_found
-        if not tsc_result.passed and tsc_result.error_count > 0:
-            validation_summary["failures"].append(
-                f"TypeScript: {tsc_result.error_count} error(s)"
-            )
-        report_dict["validation"]       = validation_summary
-        report_dict["test_run"]         = validation_summary.get("test_run",        {})
-
-        report_dict["tsc_validation"] = tsc_result.to_dict()
-        report_json = json.dumps(report_dict, indent=2, ensure_ascii=False)
-        report_path.write_text(report_json, encoding="utf-8", errors="replace")
-        _rewrite_md_report(repo_path, analysis, patterns, transformation, risk,
-                           validation_summary, tsc_result)
-        if tsc_result.passed:
-            print(f"  Validate  : tsc ✓  (0 errors)")
-        elif not tsc_result.tsc_found:
-            print(f"  Validate  : tsc ✗  (tsc not found — install Node.js + TypeScript)")
-        else:
-            print(f"  Validate  : tsc ✗  ({tsc_result.error_count} errors)")
-            for e in tsc_result.errors[:5]:
-                fname = Path(e.file).name if hasattr(e, 'file') else '?'
-                line  = getattr(e, 'line', '?')
-                msg   = getattr(e, 'message', str(e))[:80]
-                print(f"    {fname}:{line}  {msg}")
-    elif skip_tsc:
-        print("  [tsc] Skipped (--skip-tsc)")
+def batch(argv: list[str]) -> int:
+    """`python cli.py batch` — migrate many repositories in a process pool."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py batch",
+        description="Run the migration on many repositories concurrently (see orchestration/batch_runner.py)",
+    )
+    parser.add_argument("repos", nargs="*", help="Repository paths")
+    parser.add_argument("--from-file", type=str, default=None, metavar="FILE",
+                        help="Read repository paths from FILE, one per line")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--out", type=str, default="batch", metavar="DIR",
+                        help="Batch root: one isolated out/ + reports/ per repo (default: batch)")
+    parser.add_argument("--only", type=str, default=None,
+                        help="Comma-separated subset of rules, as for a single run")
+    parser.add_argument("--with-tsc", action="store_true",
+                        help="Run the TypeScript check for every repo (skipped by default)")
+    args = parser.parse_args(argv)
+
+    repos = list(args.repos)
+    if args.from_file:
+        repos += [
+            line.strip() for line in Path(args.from_file).read_text(encoding="utf-8").splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+    if not repos:
+        parser.print_help()
+        return 1
 
-    return True
+    from orchestration.batch_runner import SUMMARY_FILE, run_many
+
+    summary = run_many(
+        repos,
+        jobs=args.jobs,
+        batch_root=args.out,
+        skip_tsc=not args.with_tsc,
+        only=[s.strip() for s in args.only.split(",")] if args.only else None,
+        batch=True,
+    )
+    print(f"\n  Batch     : {summary['succeeded']}/{summary['repos']} succeeded, "
+          f"{summary['changes']} changes  ({summary['wall_seconds']}s wall, "
+          f"{summary['cpu_seconds']}s total run time)")
+    print(f"  Summary   : {Path(args.out) / SUMMARY_FILE}")
+    return 0 if summary["failed"] == 0 else 1
 
 
 # ---------------------------------------------------------------------------
@@ -716,6 +840,11 @@ def run_pipeline(
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["serve"]:
+        sys.exit(serve(sys.argv[2:]))
+    if sys.argv[1:2] == ["batch"]:
+        sys.exit(batch(sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         description="EVUA — AngularJS → Angular migration engine",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -724,10 +853,18 @@ Examples:
   python cli.py src/my-app               # full migration
   python cli.py src/my-app --dry-run     # preview — no files written
   python cli.py src/my-app --diff        # show unified diffs
+  python cli.py src/my-app --patch migration.patch   # write diffs to one patch file
   python cli.py src/my-app --only controllers,services
   python cli.py src/my-app --batch       # CI/harness mode (always exit 0)
   python cli.py src/my-app --skip-tsc    # skip TypeScript compilation check
+  python cli.py src/my-app --lint        # also run ESLint on the generated app
+  python cli.py src/my-app --ndjson      # also write changes as NDJSON
+  python cli.py src/my-app --verbose     # include internal debug output
   python cli.py src/my-app --ai-assist   # AI-complete stubs (needs GEMINI_API_KEY)
+  python cli.py --resume 3f9c2a1b        # continue an interrupted run after its last stage
+  python cli.py serve                    # warm daemon: JSON-RPC over stdin/stdout
+  python cli.py serve --socket /tmp/evua.sock
+  python cli.py batch apps/* -j 8 --out batch   # many repos, one process pool
 """,
     )
     parser.add_argument("repo",    nargs="?", help="Path to AngularJS repo")
@@ -737,6 +874,8 @@ Examples:
                         help="Analyse and plan migration but write nothing")
     parser.add_argument("--diff",  action="store_true",
                         help="Show unified diffs of what would change")
+    parser.add_argument("--patch", type=str, default=None, metavar="FILE",
+                        help="Write the diffs to FILE as one patch instead of printing them (implies --diff)")
     parser.add_argument("--only",  type=str, default=None,
                         help="Comma-separated subset of rules: controllers,services,http,watch")
     parser.add_argument(
@@ -745,28 +884,53 @@ Examples:
     parser.add_argument(
                         "--skip-tsc", action="store_true",
                         help="Skip TypeScript compilation check (faster runs, CI mode)")
+    parser.add_argument(
+                        "--lint", action="store_true",
+                        help="Also run ESLint on the generated project during validation")
+    parser.add_argument(
+                        "--validation-deadline", type=float, default=VALIDATION_DEADLINE, metavar="SECONDS",
+                        help=f"Overall time limit for the concurrent validation checks "
+                             f"(default: {VALIDATION_DEADLINE}s); stragglers are cancelled")
+    parser.add_argument(
+                        "--ndjson", action="store_true",
+                        help="Also write the changes as .evua_report.ndjson (one change per line)")
+    parser.add_argument(
+                        "--verbose", "-v", action="store_true",
+                        help="Show internal debug output from every pipeline stage")
+    parser.add_argument(
+                        "--resume", type=str, default=None, metavar="RUN_ID",
+                        help="Continue an interrupted run from its last completed stage, "
+                             "with the options it was started with")
     args = parser.parse_args()
 
+    if args.verbose:
+        configure_logging(verbose=True)
+
+    if args.resume:
+        if args.dry_run or args.diff or args.patch:
+            parser.error("--resume cannot be combined with --dry-run / --diff / --patch")
+        ok = run_job(args.repo, resume=args.resume)
+        sys.exit(0 if ok or args.batch else 1)
+
     if not args.repo:
         parser.print_help()
         sys.exit(1)
 
     only_list = [s.strip() for s in args.only.split(",")] if args.only else None
 
-    def _run(out_root):
-        return run_pipeline(
-            repo_path=args.repo,
-            out_root=out_root,
-            dry_run=args.dry_run,
-            show_diff=args.diff,
-            only=only_list,
-            batch=args.batch,
-            ai_assist=args.ai_assist,
-            skip_tsc=args.skip_tsc,
-        )
-
-    runner = PipelineRunner(_run)
-    ok = runner.run()
+    ok = run_job(
+        args.repo,
+        dry_run=args.dry_run,
+        diff=args.diff,
+        patch=args.patch,
+        only=only_list,
+        batch=args.batch,
+        ai_assist=args.ai_assist,
+        skip_tsc=args.skip_tsc,
+        lint=args.lint,
+        validation_deadline=args.validation_deadline,
+        ndjson=args.ndjson,
+    )
 
     if args.batch:
         sys.exit(0)
@@ -0,0 +1,77 @@
+"""
+evaluation/bench_pipeline.py
+
+End-to-end wall-clock benchmark for the migration CLI.
+
+Runs cli.py on one benchmark repo several times in fresh subprocesses and
+reports min / median / max wall time. Console output is discarded, but it is
+still produced and written — the cost of logging is part of what is measured.
+
+    python -m evaluation.bench_pipeline                       # bench-100, 5 runs
+    python -m evaluation.bench_pipeline taskflow -n 10
+    python -m evaluation.bench_pipeline --verbose             # with debug output
+    python -m evaluation.bench_pipeline --cli /path/to/other/cli.py   # compare trees
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from evaluation.config import BENCHMARKS_ROOT
+
+ENGINE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def time_run(cli_path: Path, repo_path: Path, extra_args: list[str]) -> float:
+    cmd = [sys.executable, str(cli_path), str(repo_path), "--batch", *extra_args]
+    start = time.perf_counter()
+    subprocess.run(
+        cmd,
+        cwd=cli_path.parent,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Time end-to-end migration runs")
+    parser.add_argument("benchmark", nargs="?", default="bench-100-full-migration",
+                        help="Benchmark name under benchmarks/angularjs (default: bench-100-full-migration)")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="Timed runs (default: 5)")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warm-up runs (default: 1)")
+    parser.add_argument("--cli", type=Path, default=ENGINE_ROOT / "cli.py",
+                        help="cli.py to benchmark (default: this tree)")
+    parser.add_argument("--with-tsc", action="store_true",
+                        help="Include the TypeScript check (skipped by default)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Pass --verbose to the CLI (debug output enabled)")
+    args = parser.parse_args(argv)
+
+    cli_path = args.cli.resolve()
+    repo_path = (cli_path.parent / BENCHMARKS_ROOT / args.benchmark).resolve()
+    if not repo_path.is_dir():
+        print(f"Benchmark not found: {repo_path}")
+        return 1
+
+    extra = [] if args.with_tsc else ["--skip-tsc"]
+    if args.verbose:
+        extra.append("--verbose")
+
+    for _ in range(args.warmup):
+        time_run(cli_path, repo_path, extra)
+    times = [time_run(cli_path, repo_path, extra) for _ in range(args.runs)]
+
+    print(f"{args.benchmark} ({cli_path})  runs={len(times)}  args={' '.join(extra) or '-'}")
+    print(f"  min    {min(times):.3f}s")
+    print(f"  median {statistics.median(times):.3f}s")
+    print(f"  max    {max(times):.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
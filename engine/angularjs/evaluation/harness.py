@@ -4,7 +4,7 @@ import pprint
 
 from evaluation.config import BENCHMARKS_ROOT, REPORTS_ROOT
 from evaluation.schemas import load_expected
-from evaluation.runners import run_pipeline_on_repo
+from evaluation.runners import run_pipelines_on_repos
 from evaluation.metrics import compute_metrics
 from evaluation.reporters import write_json_report, write_markdown_report
 
@@ -148,54 +148,45 @@ def run_all_benchmarks():
         print(f"No benchmark directories found under {BENCHMARKS_ROOT}")
         return summary
 
+    runnable = []
     for bench_dir in bench_dirs:
         name = bench_dir.name
         repo_path = bench_dir / "repo"
 
-        print(f"\n{'='*55}")
-        print(f"  Benchmark: {name}")
-        print(f"{'='*55}")
-
         # Check if repo directory exists
         if not repo_path.exists():
-            print(f"   ERROR: repo path does not exist: {repo_path}")
+            print(f"   ERROR [{name}]: repo path does not exist: {repo_path}")
             continue
 
         try:
             expected = load_expected(bench_dir)
             print(f"   Loaded expected data for {name}")
         except Exception as e:
-            print(f"   ERROR loading expected files: {e}")
+            print(f"   ERROR loading expected files for {name}: {e}")
             continue
+        runnable.append((name, repo_path, expected))
+
+    # All pipelines run up front, concurrently, each in an isolated out/ + reports/
+    results = run_pipelines_on_repos(
+        [repo_path for _, repo_path, _ in runnable],
+        batch_root=REPORTS_ROOT / "runs",
+    )
+
+    for name, repo_path, expected in runnable:
+        print(f"\n{'='*55}")
+        print(f"  Benchmark: {name}")
+        print(f"{'='*55}")
 
-        print(f"   Running pipeline on: {repo_path}")
-        result = run_pipeline_on_repo(repo_path)
-        print(f"   Pipeline completed with return code: {result['returncode']}")
+        result = results.get(repo_path.resolve(), {})
+        print(f"   Pipeline completed: ok={result.get('ok')} in {result.get('seconds')}s")
 
-        report_path = repo_path / ".evua_report.json"
+        report_path = Path(result["report"]) if result.get("report") else None
         print(f"   Looking for report at: {report_path}")
 
         # Check if report exists
-        if not report_path.exists():
-            print(f"   ERROR: EVUA report not written at {report_path}")
-            
-            # Check parent directory for stale reports
-            alt = bench_dir / ".evua_report.json"
-            if alt.exists():
-                print(f"    Found stale report at {alt}")
-                print(f"   Stale report size: {alt.stat().st_size} bytes")
-                # Show first few lines of stale report
-                try:
-                    stale_content = alt.read_text(encoding="utf-8")[:500]
-                    print(f"   Stale report preview: {stale_content}")
-                except:
-                    pass
-            
-            print(f"   STDOUT (last 2000 chars):")
-            print(result["stdout"][-2000:])
-            print(f"   STDERR (last 1000 chars):")
-            print(result["stderr"][-1000:])
-            
+        if report_path is None or not report_path.exists():
+            print(f"   ERROR: EVUA report not written — see {result.get('workdir')}/run.log")
+            print(f"   Error: {result.get('error')}")
             summary.append({"benchmark": name, "error": "no report written"})
             continue
 
@@ -242,7 +233,7 @@ def run_all_benchmarks():
             "benchmark": name,
             "metrics": metrics,
             "validation_passed": actual["validation_passed"],
-            "raw_returncode": result["returncode"],
+            "raw_returncode": 0 if result.get("ok") else 1,
         }
 
         # Write reports
@@ -0,0 +1,116 @@
+"""
+evaluation/import_budget.py
+
+Startup import budget for cli.py.
+
+Imports cli in fresh interpreters under `python -X importtime` and checks:
+
+  1. Engine import time — cumulative time of `import cli` minus the esprima
+     parser (third-party; it builds its Unicode tables at import and every
+     run needs it before the first file is parsed). Best of N runs must stay
+     within --budget-ms.
+  2. Deferred modules — stage-specific code (transformation rules, validation
+     runners, tsc, AI client, diff collector, serve/batch) must not be
+     imported at startup; cli.py loads it where it is used.
+
+    python -m evaluation.import_budget                 # exit 1 on regression
+    python -m evaluation.import_budget --budget-ms 150 --runs 10
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ENGINE_ROOT = Path(__file__).resolve().parents[1]
+
+DEFAULT_BUDGET_MS = 200
+
+# Module prefixes that must not be loaded by `import cli`
+DEFERRED = (
+    "pipeline.transformation.rules",
+    "pipeline.validation",
+    "pipeline.ai",
+    "pipeline.reporting.diff_collector",
+    "orchestration.daemon",
+    "orchestration.batch_runner",
+    "urllib.request",
+    "socketserver",
+    "concurrent.futures.process",
+)
+
+EXCLUDED = ("esprima",)
+
+
+def _importtime() -> dict[str, tuple[int, int]]:
+    """module → (self µs, cumulative µs) for one fresh `import cli`."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import cli"],
+        cwd=ENGINE_ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            self_us, cum_us, name = (p.strip() for p in line[len("import time:"):].split("|"))
+            times[name] = (int(self_us), int(cum_us))
+        except ValueError:
+            continue                        # header line
+    return times
+
+
+def _engine_ms(times: dict) -> float:
+    excluded = sum(times[name][1] for name in EXCLUDED if name in times)
+    return (times["cli"][1] - excluded) / 1000
+
+
+def _loaded_modules() -> list[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", "import cli, json, sys; print(json.dumps(sorted(sys.modules)))"],
+        cwd=ENGINE_ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check the cli.py startup import budget")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Max engine import time in ms, esprima excluded (default: {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to sample (default: 5)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list (default: 10)")
+    args = parser.parse_args(argv)
+
+    samples = [_importtime() for _ in range(args.runs)]
+    best = min(samples, key=_engine_ms)
+    engine_ms = _engine_ms(best)
+    esprima_ms = best.get("esprima", (0, 0))[1] / 1000
+
+    print(f"import cli: {best['cli'][1] / 1000:.1f} ms  "
+          f"(engine {engine_ms:.1f} ms + esprima {esprima_ms:.1f} ms, best of {args.runs})")
+    print(f"Slowest modules by self time:")
+    ranked = sorted(
+        ((name, t) for name, t in best.items() if not name.startswith(EXCLUDED)),
+        key=lambda item: item[1][0], reverse=True,
+    )
+    for name, (self_us, cum_us) in ranked[:args.top]:
+        print(f"  {self_us / 1000:7.1f} ms  {name}  (cumulative {cum_us / 1000:.1f} ms)")
+
+    ok = True
+    if engine_ms > args.budget_ms:
+        print(f"FAIL: engine import time {engine_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        ok = False
+
+    early = [m for m in _loaded_modules() if m.startswith(DEFERRED)]
+    if early:
+        print(f"FAIL: deferred modules imported at startup: {', '.join(early)}")
+        ok = False
+
+    if ok:
+        print(f"OK: within the {args.budget_ms:.0f} ms budget, no deferred modules loaded")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
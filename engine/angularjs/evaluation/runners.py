@@ -59,4 +59,20 @@ def run_pipeline_on_repo(repo_path: Path):
         "stdout": result.stdout,
         "stderr": result.stderr,
         "returncode": result.returncode,
-    }
\ No newline at end of file
+    }
+
+def run_pipelines_on_repos(repo_paths, jobs=None, batch_root=None, skip_tsc=False):
+    """
+    Runs the pipeline on many repos concurrently in one process pool
+    (orchestration/batch_runner.py). Each repo gets its own out/ and
+    reports/ under batch_root; skip_tsc=True skips the TypeScript check
+    as --skip-tsc does. Returns {repo_path: result dict}.
+    """
+    sys.path.insert(0, str(ENGINE_ROOT))
+    from orchestration.batch_runner import run_many
+
+    batch_root = Path(batch_root) if batch_root else ENGINE_ROOT / "reports" / "batch"
+    summary = run_many(repo_paths, jobs=jobs, batch_root=batch_root, batch=True, skip_tsc=skip_tsc)
+    print(f"[HARNESS DEBUG] Batch: {summary['succeeded']}/{summary['repos']} succeeded "
+          f"in {summary['wall_seconds']}s")
+    return {Path(r["repo"]): r for r in summary["results"]}
@@ -0,0 +1,174 @@
+"""
+orchestration/batch_runner.py
+
+Run the migration pipeline over many repositories in a process pool.
+
+    results = run_many(["apps/billing", "apps/crm", ...], jobs=8, batch_root="batch")
+
+Each worker process imports the engine once and then runs repositories
+back to back (cli.run_job), type-checking them through one warm TypeScript
+checker (pipeline/validation/runners/tsc_worker.py). Every repository is
+isolated under the batch root, so concurrent runs never share an output or
+report directory. Only the toolchain caches are shared, so npm install runs
+once per package.json for the whole batch:
+
+    batch/
+      .cache/                      node_modules, tool discovery and tsc build info
+      billing/
+        out/angular-app/...        PipelineRunner output (+ artifact cache)
+        reports/billing/...        .evua_report.json / .md / .sqlite
+        run.log                    everything the run printed
+      crm/
+        ...
+      batch_summary.json           aggregated per-repo results and totals
+
+A failing repository is recorded in the summary and does not stop the
+batch. Per-repo risk counts are read back from the SQLite report store.
+"""
+
+import contextlib
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+SUMMARY_FILE = "batch_summary.json"
+CACHE_DIR    = ".cache"
+
+
+@dataclass
+class RepoResult:
+    repo:     str
+    name:     str
+    ok:       bool = False
+    seconds:  float = 0.0
+    error:    Optional[str] = None
+    workdir:  str = ""
+    report:   Optional[str] = None          # .evua_report.json, if written
+    changes:  int = 0
+    risk:     dict = field(default_factory=dict)   # level → change count
+
+
+def _unique_names(repos: list[Path]) -> list[str]:
+    """Directory name per repo, suffixed where two repos share a basename."""
+    seen: dict[str, int] = {}
+    names = []
+    for repo in repos:
+        n = seen.get(repo.name, 0)
+        seen[repo.name] = n + 1
+        names.append(repo.name if n == 0 else f"{repo.name}-{n + 1}")
+    return names
+
+
+def _read_store(store: Path) -> tuple[int, dict]:
+    db = sqlite3.connect(f"file:{store}?mode=ro", uri=True)
+    try:
+        changes = db.execute("SELECT COUNT(*) FROM changes").fetchone()[0]
+        risk = dict(db.execute("SELECT level, COUNT(*) FROM risk GROUP BY level").fetchall())
+    finally:
+        db.close()
+    return changes, risk
+
+
+def _run_one(repo: str, name: str, workdir: str, cache_root: str, options: dict) -> RepoResult:
+    """Worker: one isolated pipeline run. Never raises."""
+    from cli import run_job          # engine imported once per worker process
+    from pipeline.validation.runners.tsc_worker import enable_pool
+
+    enable_pool()                    # one warm tsc checker per worker process
+
+    result = RepoResult(repo=repo, name=name, workdir=workdir)
+    work = Path(workdir)
+    work.mkdir(parents=True, exist_ok=True)
+    reports_dir = work / "reports"
+
+    start = time.perf_counter()
+    with open(work / "run.log", "w", encoding="utf-8", errors="replace") as log_fp, \
+            contextlib.redirect_stdout(log_fp), contextlib.redirect_stderr(log_fp):
+        try:
+            result.ok = bool(run_job(repo, out_root=work / "out", reports_dir=reports_dir,
+                                     cache_root=cache_root, **options))
+        except Exception as exc:
+            result.error = f"{type(exc).__name__}: {exc}"
+    result.seconds = round(time.perf_counter() - start, 3)
+
+    report_root = reports_dir / Path(repo).name
+    if (report_root / ".evua_report.json").exists():
+        result.report = str(report_root / ".evua_report.json")
+    store = report_root / ".evua_report.sqlite"
+    if store.exists():
+        try:
+            result.changes, result.risk = _read_store(store)
+        except sqlite3.Error:
+            pass
+    if not result.ok and result.error is None:
+        result.error = "pipeline failed — see run.log"
+    return result
+
+
+def summarize(results: list[RepoResult], wall_seconds: float) -> dict:
+    risk_totals: dict[str, int] = {}
+    for r in results:
+        for level, n in r.risk.items():
+            risk_totals[level] = risk_totals.get(level, 0) + n
+    return {
+        "repos":        len(results),
+        "succeeded":    sum(r.ok for r in results),
+        "failed":       sum(not r.ok for r in results),
+        "changes":      sum(r.changes for r in results),
+        "risk":         risk_totals,
+        "wall_seconds": round(wall_seconds, 3),
+        "cpu_seconds":  round(sum(r.seconds for r in results), 3),
+        "results":      [asdict(r) for r in results],
+    }
+
+
+def run_many(
+    repos: Iterable[str | Path],
+    jobs: Optional[int] = None,
+    batch_root: str | Path = "batch",
+    verbose: bool = True,
+    **options,
+) -> dict:
+    """
+    Run the pipeline on every repo with up to `jobs` worker processes.
+    `options` are passed to cli.run_job (skip_tsc, only, dry_run, ...).
+    Returns the aggregated summary (also written to batch_root/batch_summary.json).
+    """
+    repo_paths = [Path(r).resolve() for r in repos]
+    batch_root = Path(batch_root).resolve()
+    batch_root.mkdir(parents=True, exist_ok=True)
+    names = _unique_names(repo_paths)
+    jobs  = max(1, min(jobs or os.cpu_count() or 1, len(repo_paths) or 1))
+
+    start   = time.perf_counter()
+    results: list[RepoResult] = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(_run_one, str(repo), name, str(batch_root / name),
+                        str(batch_root / CACHE_DIR), options): (repo, name)
+            for repo, name in zip(repo_paths, names)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            repo, name = futures[future]
+            try:
+                r = future.result()
+            except Exception as exc:        # worker process died
+                r = RepoResult(repo=str(repo), name=name, workdir=str(batch_root / name),
+                               error=f"{type(exc).__name__}: {exc}")
+            results.append(r)
+            if verbose:
+                status = "ok  " if r.ok else "FAIL"
+                print(f"  [{done}/{len(futures)}] {status} {name:<32} {r.seconds:6.2f}s  "
+                      f"{r.changes} changes" + (f"  — {r.error}" if r.error else ""))
+
+    order = {name: i for i, name in enumerate(names)}
+    results.sort(key=lambda r: order[r.name])
+    summary = summarize(results, time.perf_counter() - start)
+    (batch_root / SUMMARY_FILE).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    return summary
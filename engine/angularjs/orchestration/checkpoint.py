@@ -0,0 +1,153 @@
+"""
+orchestration/checkpoint.py
+
+Stage checkpoints for resumable runs.
+
+A committing run works in out/.tmp_<run_id> (see PipelineRunner). After
+each completed stage the pipeline state needed by the later stages is
+saved next to it:
+
+    out/.evua_runs/<run_id>/
+      manifest.json     repo, run options, repo fingerprint, completed stages
+      state.pkl         analysis, patterns, changes, risk, validation summary
+
+The generated files themselves are the workspace, which stays on disk. If
+the run crashes or is interrupted (validation, AI, tsc), PipelineRunner
+keeps both and prints the run id:
+
+    python cli.py --resume <run_id>
+
+continues after the last completed stage with the options recorded in the
+manifest. A repo whose files changed since the checkpoint is not resumed —
+the saved analysis would no longer describe it. A successful run removes
+its checkpoint.
+
+Checkpoint names are the stage names from orchestration/stage_controller.py.
+"""
+
+import json
+import os
+import pickle
+import shutil
+from pathlib import Path
+from typing import Any, Optional
+
+from orchestration.stage_controller import STAGES
+
+
+RUNS_DIR = ".evua_runs"
+
+
+class CheckpointError(Exception):
+    """Raised when a run cannot be resumed from its checkpoint."""
+
+
+class RunCheckpoint:
+    def __init__(self, run_dir: Path, manifest: dict):
+        self.run_dir  = Path(run_dir)
+        self.manifest = manifest
+        self._state: Optional[dict] = None      # loaded on first use
+
+    # ── Creation / loading ────────────────────────────────────────────────
+
+    @classmethod
+    def create(cls, out_root: Path, run_id: str, repo: str, options: dict) -> "RunCheckpoint":
+        run_dir = Path(out_root) / RUNS_DIR / run_id
+        run_dir.mkdir(parents=True, exist_ok=True)
+        ckpt = cls(run_dir, {
+            "run_id":      run_id,
+            "repo":        str(Path(repo).resolve()),
+            "options":     options,
+            "fingerprint": None,
+            "stages":      [],
+        })
+        ckpt._state = {}
+        ckpt._write_manifest()
+        return ckpt
+
+    @classmethod
+    def load(cls, out_root: Path, run_id: str) -> "RunCheckpoint":
+        run_dir = Path(out_root) / RUNS_DIR / run_id
+        try:
+            manifest = json.loads((run_dir / "manifest.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            raise CheckpointError(f"No checkpoint for run '{run_id}' in {run_dir.parent}")
+        return cls(run_dir, manifest)
+
+    def _load_state(self) -> dict:
+        if self._state is None:
+            self._state = {}
+            if self.manifest["stages"]:
+                try:
+                    with open(self.run_dir / "state.pkl", "rb") as fp:
+                        self._state = pickle.load(fp)
+                except Exception as e:      # missing, truncated or from older engine code
+                    raise CheckpointError(f"Checkpoint state for run '{self.run_id}' is unreadable: {e}")
+        return self._state
+
+    @staticmethod
+    def list_runs(out_root: Path) -> list[dict]:
+        """Manifests of every resumable run under out_root, oldest first."""
+        runs = []
+        for manifest in sorted((Path(out_root) / RUNS_DIR).glob("*/manifest.json"),
+                               key=lambda p: p.stat().st_mtime):
+            try:
+                runs.append(json.loads(manifest.read_text(encoding="utf-8")))
+            except (OSError, ValueError):
+                continue
+        return runs
+
+    # ── Stage bookkeeping ─────────────────────────────────────────────────
+
+    @property
+    def run_id(self) -> str:
+        return self.manifest["run_id"]
+
+    @property
+    def last_stage(self) -> Optional[str]:
+        stages = self.manifest["stages"]
+        return stages[-1] if stages else None
+
+    def done(self, stage: str) -> bool:
+        return stage in self.manifest["stages"]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._load_state().get(key, default)
+
+    def check_fingerprint(self, fp: str) -> None:
+        """Record the repo fingerprint, or verify it on resume."""
+        recorded = self.manifest.get("fingerprint")
+        if recorded is None:
+            self.manifest["fingerprint"] = fp
+            self._write_manifest()
+        elif recorded != fp:
+            raise CheckpointError(
+                f"Repository changed since run '{self.run_id}' was checkpointed — "
+                f"start a new run instead of resuming"
+            )
+
+    def save(self, stage: str, **state) -> None:
+        """Mark `stage` complete, storing `state` for the stages after it."""
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage '{stage}'. Valid: {STAGES}")
+        if state:
+            self._load_state().update(state)
+            tmp = self.run_dir / f"state.pkl.{os.getpid()}.tmp"
+            with open(tmp, "wb") as fp:
+                pickle.dump(self._state, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.run_dir / "state.pkl")
+        if stage not in self.manifest["stages"]:
+            self.manifest["stages"].append(stage)
+        self._write_manifest()
+
+    def discard(self) -> None:
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+        try:
+            self.run_dir.parent.rmdir()     # last run gone → drop out/.evua_runs
+        except OSError:
+            pass
+
+    def _write_manifest(self) -> None:
+        tmp = self.run_dir / f"manifest.json.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(self.manifest, indent=2), encoding="utf-8")
+        os.replace(tmp, self.run_dir / "manifest.json")
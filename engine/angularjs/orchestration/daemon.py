@@ -0,0 +1,262 @@
+"""
+orchestration/daemon.py
+
+Long-lived engine process: `python cli.py serve`.
+
+Every one-shot CLI run pays interpreter start-up and the import of every
+analyzer, rule, validator and AI module (most of a small run's wall time).
+The daemon imports the engine once and then serves run requests, keeping
+module state warm and caching analysis snapshots per repo
+(see pipeline/analysis/snapshot_cache.py).
+
+Protocol — JSON-RPC 2.0, one JSON object per line, over stdin/stdout
+(default) or a Unix socket (--socket PATH):
+
+    → {"jsonrpc": "2.0", "id": 1, "method": "run",
+       "params": {"repo": "/abs/path/to/app", "skip_tsc": true}}
+    ← {"jsonrpc": "2.0", "method": "progress", "params": {"id": 1, "line": "  Ingestion : 42 files  (17 JS)"}}
+    ← ...
+    ← {"jsonrpc": "2.0", "id": 1, "result": {"ok": true, "seconds": 0.41, ...}}
+
+Methods:
+    run       repo (required), dry_run, diff, patch, only, batch, ai_assist,
+              skip_tsc, lint, validation_deadline, ndjson, verbose — same
+              meaning as the CLI flags; out_root / reports_dir — where the
+              output and reports go (default out/ and reports/)
+    ping      liveness check
+    stats     run count and analysis cache hit rate
+    shutdown  finish the current run, then exit
+
+Runs are serialised: the pipeline writes to process-wide stdout and to the
+shared out/ directory, so concurrent clients queue on one lock. Relative
+paths — repo, and out/ and reports/ unless out_root / reports_dir are given —
+are resolved against the daemon's working directory, which need not be the
+engine root: clients that read the results back should pass absolute paths.
+"""
+
+import contextlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from pipeline.analysis.snapshot_cache import AnalysisSnapshotCache
+from pipeline.log import configure as configure_logging
+
+
+# JSON-RPC error codes
+PARSE_ERROR      = -32700
+INVALID_REQUEST  = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS   = -32602
+RUN_FAILED       = -32000
+
+_RUN_OPTIONS = {
+    "dry_run", "diff", "patch", "only", "batch",
+    "ai_assist", "skip_tsc", "lint", "validation_deadline", "ndjson",
+    "out_root", "reports_dir",
+}
+
+
+class _EventWriter:
+    """stdout stand-in that turns each printed line into a progress event."""
+
+    def __init__(self, emit: Callable[[str], None]):
+        self._emit = emit
+        self._buf  = ""
+
+    def write(self, text: str) -> int:
+        self._buf += text
+        while True:
+            cut = min((i for i in (self._buf.find("\n"), self._buf.find("\r")) if i >= 0), default=-1)
+            if cut < 0:
+                break
+            line, self._buf = self._buf[:cut], self._buf[cut + 1:]
+            if line.strip():
+                self._emit(line)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        if self._buf.strip():
+            self._emit(self._buf)
+        self._buf = ""
+
+    def isatty(self) -> bool:
+        return False
+
+
+class EngineDaemon:
+    """
+    run_fn: callable(repo, **options, analysis_cache=...) -> bool
+            — one complete pipeline run (cli.run_job).
+    """
+
+    def __init__(self, run_fn: Callable[..., bool], max_snapshots: int = 8):
+        self.run_fn   = run_fn
+        self.cache    = AnalysisSnapshotCache(max_entries=max_snapshots)
+        self.runs     = 0
+        self.started  = time.time()
+        self._lock    = threading.Lock()
+        self._stopped = threading.Event()
+
+    # ── Request handling ──────────────────────────────────────────────────
+
+    def handle(self, request: Any, send: Callable[[dict], None]) -> Optional[dict]:
+        """Dispatch one request; returns the response (None for notifications)."""
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Invalid request")
+        req_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            return _error(req_id, INVALID_PARAMS, "params must be an object")
+
+        if method == "ping":
+            result = {"pong": True, "pid": os.getpid(), "uptime": round(time.time() - self.started, 1)}
+        elif method == "stats":
+            result = {
+                "runs":           self.runs,
+                "analysis_cache": {"hits": self.cache.hits, "misses": self.cache.misses},
+            }
+        elif method == "shutdown":
+            with self._lock:            # let a running job finish first
+                self._stopped.set()
+            result = {"ok": True}
+        elif method == "run":
+            return self._run(req_id, params, send)
+        else:
+            return _error(req_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+        return None if req_id is None else {"jsonrpc": "2.0", "id": req_id, "result": result}
+
+    def _run(self, req_id, params: dict, send: Callable[[dict], None]) -> Optional[dict]:
+        repo = params.get("repo")
+        if not isinstance(repo, str) or not repo:
+            return _error(req_id, INVALID_PARAMS, "run requires a 'repo' path")
+        unknown = set(params) - _RUN_OPTIONS - {"repo", "verbose"}
+        if unknown:
+            return _error(req_id, INVALID_PARAMS, f"Unknown run options: {sorted(unknown)}")
+        for key in ("out_root", "reports_dir"):
+            if key in params and (not isinstance(params[key], str) or not params[key]):
+                return _error(req_id, INVALID_PARAMS, f"'{key}' must be a path")
+        options = {k: v for k, v in params.items() if k in _RUN_OPTIONS}
+        if isinstance(options.get("only"), str):
+            options["only"] = [s.strip() for s in options["only"].split(",") if s.strip()]
+
+        def emit(line: str) -> None:
+            send({"jsonrpc": "2.0", "method": "progress", "params": {"id": req_id, "line": line}})
+
+        with self._lock:
+            if self._stopped.is_set():
+                return _error(req_id, RUN_FAILED, "Daemon is shutting down")
+            writer = _EventWriter(emit)
+            start  = time.perf_counter()
+            hits   = self.cache.hits
+            try:
+                if params.get("verbose"):
+                    configure_logging(verbose=True)
+                with contextlib.redirect_stdout(writer):
+                    ok = self.run_fn(repo, analysis_cache=self.cache, **options)
+            except Exception as exc:
+                writer.close()
+                return _error(req_id, RUN_FAILED, f"{type(exc).__name__}: {exc}")
+            finally:
+                if params.get("verbose"):
+                    configure_logging()
+            writer.close()
+            self.runs += 1
+
+        result = {
+            "ok":             bool(ok),
+            "seconds":        round(time.perf_counter() - start, 3),
+            "analysis_cache": "hit" if self.cache.hits > hits else "miss",
+        }
+        return None if req_id is None else {"jsonrpc": "2.0", "id": req_id, "result": result}
+
+    def handle_line(self, line: str, send: Callable[[dict], None]) -> None:
+        line = line.strip()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError as exc:
+            send(_error(None, PARSE_ERROR, f"Parse error: {exc}"))
+            return
+        response = self.handle(request, send)
+        if response is not None:
+            send(response)
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    # ── Transports ────────────────────────────────────────────────────────
+
+    def serve_stdio(self, stdin=None, stdout=None) -> None:
+        """Serve requests from stdin; all other console output goes to stderr."""
+        stdin  = stdin or sys.stdin
+        proto  = stdout or sys.stdout
+        send_lock = threading.Lock()
+
+        def send(msg: dict) -> None:
+            with send_lock:
+                proto.write(json.dumps(msg, ensure_ascii=False) + "\n")
+                proto.flush()
+
+        with contextlib.redirect_stdout(sys.stderr):
+            for line in stdin:
+                self.handle_line(line, send)
+                if self.stopped:
+                    break
+
+    def serve_unix(self, path: str) -> None:
+        """Serve requests on a Unix socket until a shutdown request arrives."""
+        path = str(Path(path).resolve())
+        if os.path.exists(path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+            except OSError:
+                os.unlink(path)             # stale socket from a dead daemon
+            else:
+                probe.close()
+                raise RuntimeError(f"A daemon is already listening on {path}")
+
+        daemon = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                send_lock = threading.Lock()
+
+                def send(msg: dict) -> None:
+                    with send_lock:
+                        self.wfile.write((json.dumps(msg, ensure_ascii=False) + "\n").encode("utf-8"))
+                        self.wfile.flush()
+
+                for raw in self.rfile:
+                    daemon.handle_line(raw.decode("utf-8", errors="replace"), send)
+                    if daemon.stopped:
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                        break
+
+        server = socketserver.ThreadingUnixStreamServer(path, _Handler)
+        server.daemon_threads = True
+        print(f"  [serve] Listening on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            if os.path.exists(path):
+                os.unlink(path)
+
+
+def _error(req_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": req_id, "error": {"code": code, "message": message}}
@@ -0,0 +1,213 @@
+"""
+orchestration/output_commit.py
+
+Incremental commit of a run's workspace (out/.tmp_<id>) into the final
+output (out/angular-app).
+
+Instead of deleting the final tree and moving the workspace over it, only
+the differences are applied:
+
+    created / updated   os.replace(workspace/<rel>, final/<rel>) — atomic per file
+    removed             unlinked, directories left empty are pruned
+    unchanged           not touched: same inode, same mtime, so tsc build
+                        info, IDE indexes and the output manifest stay valid
+
+Files are compared by size first, then by sha256. Final-side hashes come from
+the output manifest (orchestration/output_manifest.py); workspace hashes
+come from the run's ProjectIndex where it wrote the file. Symlinks (a linked
+node_modules) are compared by their target and moved as links.
+
+Before anything is changed the plan is written to a journal:
+
+    out/.evua_commit_journal.json
+      {"run_id", "workspace", "final", "dirs", "replace": [rel], "remove": [rel]}
+
+Every step is idempotent — a replace whose source is gone already happened,
+a removed file that no longer exists is skipped — so a commit interrupted
+by a crash is completed by replaying the journal (roll_forward(), called by
+PipelineRunner before its next run). The journal is deleted once the final
+tree is complete; the leftover workspace is removed after that.
+
+    plan = plan_commit(tmp_root, final_root, final_hashes, known)
+    plan.apply(out_root / JOURNAL_NAME, run_id)
+"""
+
+import json
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from orchestration.output_manifest import _hash_files
+
+
+JOURNAL_NAME = ".evua_commit_journal.json"
+
+
+@dataclass
+class CommitPlan:
+    workspace:  Path
+    final_root: Path
+    dirs:       list[str] = field(default_factory=list)     # every directory of the workspace
+    created:    list[str] = field(default_factory=list)
+    updated:    list[str] = field(default_factory=list)
+    removed:    list[str] = field(default_factory=list)
+    unchanged:  int = 0
+
+    def apply(self, journal_path, run_id: str = "") -> None:
+        journal = {
+            "run_id":    run_id,
+            "workspace": os.path.abspath(self.workspace),
+            "final":     os.path.abspath(self.final_root),
+            "dirs":      self.dirs,
+            "replace":   self.created + self.updated,
+            "remove":    self.removed,
+        }
+        _write_journal(Path(journal_path), journal)
+        _replay(journal)
+        Path(journal_path).unlink()
+        shutil.rmtree(self.workspace, ignore_errors=True)
+
+    @property
+    def summary(self) -> str:
+        return (f"{len(self.created)} created, {len(self.updated)} updated, "
+                f"{len(self.removed)} removed, {self.unchanged} unchanged")
+
+
+def plan_commit(workspace, final_root, final_hashes: dict[str, str],
+                known: Optional[Callable[[str, int], Optional[str]]] = None) -> CommitPlan:
+    """
+    Differences between workspace and final_root.
+    final_hashes: sha256 of the final files by relative path (OutputManifest.scan())
+    known(rel, size): workspace hash the caller already has, or None
+    """
+    plan = CommitPlan(Path(workspace), Path(final_root))
+    ours,   plan.dirs = _list_tree(plan.workspace)
+    theirs, _         = _list_tree(plan.final_root)
+
+    to_hash = []
+    for rel, (kind, value) in ours.items():
+        old = theirs.get(rel)
+        if old is None:
+            plan.created.append(rel)
+        elif old[0] != kind or (kind == "link" and old[1] != value):
+            plan.updated.append(rel)
+        elif kind == "link":
+            plan.unchanged += 1
+        elif old[1] != value or rel not in final_hashes:
+            plan.updated.append(rel)
+        else:
+            digest = known(rel, value) if known is not None else None
+            if digest is None:
+                to_hash.append(rel)
+            elif digest == final_hashes[rel]:
+                plan.unchanged += 1
+            else:
+                plan.updated.append(rel)
+
+    digests = _hash_files([plan.workspace / rel for rel in to_hash])
+    for rel, digest in zip(to_hash, digests):
+        if digest is not None and digest == final_hashes[rel]:
+            plan.unchanged += 1
+        else:
+            plan.updated.append(rel)
+
+    plan.removed = sorted(rel for rel in theirs if rel not in ours)
+    plan.created.sort()
+    plan.updated.sort()
+    return plan
+
+
+def roll_forward(journal_path) -> Optional[str]:
+    """
+    Complete a commit interrupted after its journal was written.
+    Returns the run id of the completed commit, None if there was none.
+    """
+    journal_path = Path(journal_path)
+    try:
+        journal = json.loads(journal_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        journal_path.unlink(missing_ok=True)    # torn write: nothing was applied yet
+        return None
+    _replay(journal)
+    journal_path.unlink()
+    shutil.rmtree(journal["workspace"], ignore_errors=True)
+    return journal.get("run_id") or "?"
+
+
+# ── Internals ──────────────────────────────────────────────────────────────
+
+def _list_tree(root: Path) -> tuple[dict[str, tuple[str, object]], list[str]]:
+    """
+    rel → ("file", size) | ("link", target) for everything under root that is
+    not a directory (symlinked directories count as links), and the relative
+    paths of its directories.
+    """
+    entries, dirs = {}, []
+    pending = [(str(root), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            listing = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in listing:
+            rel = prefix + entry.name
+            try:
+                if entry.is_symlink():
+                    entries[rel] = ("link", os.readlink(entry.path))
+                elif entry.is_dir():
+                    dirs.append(rel)
+                    pending.append((entry.path, rel + "/"))
+                elif entry.is_file():
+                    entries[rel] = ("file", entry.stat().st_size)
+            except OSError:                     # removed meanwhile
+                continue
+    return entries, sorted(dirs)
+
+
+def _write_journal(path: Path, journal: dict) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(journal, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _replay(journal: dict) -> None:
+    workspace = Path(journal["workspace"])
+    final     = Path(journal["final"])
+    keep_dirs = set(journal["dirs"])
+
+    # Removals first: a removed file may sit where a directory is created
+    for rel in journal["remove"]:
+        target = final / rel
+        if target.is_symlink() or target.is_file():
+            target.unlink()
+    _prune(final, keep_dirs)
+
+    final.mkdir(parents=True, exist_ok=True)
+    for rel in journal["dirs"]:
+        (final / rel).mkdir(parents=True, exist_ok=True)
+    for rel in journal["replace"]:
+        source = workspace / rel
+        if source.is_symlink() or source.exists():
+            target = final / rel
+            if target.is_dir() and not target.is_symlink():
+                shutil.rmtree(target)           # a directory became a file
+            os.replace(source, target)
+
+
+def _prune(final: Path, keep_dirs: set[str]) -> None:
+    """Remove the directories of final that the workspace does not have, deepest first."""
+    _, dirs = _list_tree(final)
+    for rel in sorted(dirs, key=lambda d: d.count("/"), reverse=True):
+        if rel not in keep_dirs:
+            try:
+                (final / rel).rmdir()
+            except OSError:                     # not empty: a replace target below it
+                pass
@@ -0,0 +1,151 @@
+"""
+orchestration/output_manifest.py
+
+Stat-first hashing of the committed output for PipelineRunner's progress
+diff (created / updated / unchanged / removed).
+
+The manifest remembers, per file under out/angular-app, the size, mtime_ns
+and sha256 seen by the last run:
+
+    out/.evua_output_manifest.json
+      {"root": ..., "stamp": <ns>, "files": {"<rel>": [size, mtime_ns, sha256]}}
+
+A file whose size and mtime_ns still match its entry keeps its hash
+without being read. Only the others are hashed, in a thread pool with one
+thread per CPU (file reads and hashlib release the GIL). Entries modified
+within _RACY_NS of the moment the manifest was taken are not trusted, since
+a write in the same timestamp tick would not change mtime_ns (the "racily
+clean" case git handles the same way). They are hashed again next time.
+
+    manifest = OutputManifest.load(out_root / MANIFEST_NAME, final_root)
+    before   = manifest.scan()                  # rel → sha256
+    ...                                         # run and commit
+    after    = manifest.scan(known=lookup)      # hashes the run already knows
+    manifest.save()
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+
+MANIFEST_NAME = ".evua_output_manifest.json"
+
+_RACY_NS      = 2_000_000_000   # coarse filesystems (FAT) store mtime in 2 s steps
+_PARALLEL_MIN = 16              # fewer files to hash than this: no thread pool
+_MAX_WORKERS  = 8               # hashing threads (one per CPU, at most this many)
+_CHUNK        = 1 << 20         # bytes per read while hashing
+
+
+class OutputManifest:
+    def __init__(self, path, root):
+        self.path  = Path(path)
+        self.root  = Path(root)
+        self._entries: dict[str, tuple[int, int, str]] = {}
+        self._stamp = 0                     # time_ns() when _entries were taken
+
+    @classmethod
+    def load(cls, path, root) -> "OutputManifest":
+        manifest = cls(path, root)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return manifest
+        if not isinstance(data, dict) or data.get("root") != os.path.abspath(root):
+            return manifest
+        for rel, entry in (data.get("files") or {}).items():
+            if isinstance(entry, list) and len(entry) == 3:
+                manifest._entries[rel] = (int(entry[0]), int(entry[1]), str(entry[2]))
+        manifest._stamp = int(data.get("stamp", 0))
+        return manifest
+
+    def scan(self, known: Optional[Callable[[str, int], Optional[str]]] = None) -> dict[str, str]:
+        """
+        sha256 of every file under root, keyed by "/"-separated path relative
+        to root. known(rel, size) may supply a hash the caller already has
+        (None when it does not) for files the manifest cannot vouch for.
+        """
+        stats   = _stat_tree(self.root)
+        trusted = self._stamp - _RACY_NS
+        hashes: dict[str, str] = {}
+        pending = []
+        for rel, (size, mtime_ns) in stats.items():
+            entry = self._entries.get(rel)
+            if entry is not None and entry[:2] == (size, mtime_ns) and mtime_ns < trusted:
+                hashes[rel] = entry[2]
+                continue
+            digest = known(rel, size) if known is not None else None
+            if digest is not None:
+                hashes[rel] = digest
+            else:
+                pending.append(rel)
+
+        for rel, digest in zip(pending, _hash_files([self.root / rel for rel in pending])):
+            if digest is not None:              # vanished since stat()
+                hashes[rel] = digest
+
+        self._entries = {rel: (*stats[rel], digest) for rel, digest in hashes.items()}
+        self._stamp   = time.time_ns()
+        return hashes
+
+    def save(self) -> None:
+        data = {
+            "root":  os.path.abspath(self.root),
+            "stamp": self._stamp,
+            "files": {rel: list(entry) for rel, entry in sorted(self._entries.items())},
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass                                # next run just hashes again
+
+
+def _stat_tree(root: Path) -> dict[str, tuple[int, int]]:
+    """rel → (size, mtime_ns) of the files under root; symlinked directories are not followed."""
+    stats = {}
+    pending = [(str(root), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, prefix + entry.name + "/"))
+                    continue
+                st = entry.stat()
+            except OSError:                     # dangling symlink / removed meanwhile
+                continue
+            if not entry.is_file():
+                continue
+            stats[prefix + entry.name] = (st.st_size, st.st_mtime_ns)
+    return stats
+
+
+def _hash_files(paths: list[Path]) -> list[Optional[str]]:
+    """sha256 of each path (None if unreadable), in a thread pool when it pays off."""
+    workers = min(_MAX_WORKERS, os.cpu_count() or 1)
+    if workers < 2 or len(paths) < _PARALLEL_MIN:
+        return [_sha256(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_sha256, paths))
+
+
+def _sha256(path: Path) -> Optional[str]:
+    try:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(_CHUNK):
+                h.update(chunk)
+        return h.hexdigest()
+    except OSError:
+        return None
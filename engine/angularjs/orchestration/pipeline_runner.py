@@ -1,77 +1,147 @@
-import hashlib
 import shutil
 import uuid
 from pathlib import Path
 
+from orchestration.checkpoint import CheckpointError, RunCheckpoint
+from orchestration.output_commit import JOURNAL_NAME, plan_commit, roll_forward
+from orchestration.output_manifest import MANIFEST_NAME, OutputManifest
 from orchestration.progress_tracker import ProgressTracker
+from pipeline.transformation.project_index import ProjectIndex
 
 
 class PipelineRunner:
-    def __init__(self, pipeline_fn, out_root="out"):
+    def __init__(self, pipeline_fn, out_root="out", commit=True, checkpoint=None):
         """
         pipeline_fn: callable that runs the full pipeline and returns (validation_passed: bool)
                      MUST accept out_root kwarg: pipeline_fn(out_root=Path)
+        commit:      False for preview runs (--dry-run / --diff): the workspace is
+                     always discarded and the final output is left untouched
+        checkpoint:  {"repo": ..., "options": {...}} to make committing runs
+                     resumable (orchestration/checkpoint.py); pipeline_fn then
+                     also receives checkpoint=RunCheckpoint
         """
         self.pipeline_fn = pipeline_fn
+        self.commit = commit
+        self.checkpoint_meta = checkpoint
         self.out_root = Path(out_root)
         self.final_root = self.out_root / "angular-app"
         self.progress = ProgressTracker(self.out_root / "progress.json")
 
-    def _hash(self, path: Path):
-        if not path.exists():
+    @staticmethod
+    def _indexed_hash(index, rel: str, size: int):
+        """Hash of a committed file, from the run's ProjectIndex when it wrote the file."""
+        head, _, rest = rel.partition("/")
+        if index is None or head != "angular-app" or not rest:
             return None
-        h = hashlib.sha256()
-        h.update(path.read_bytes())
-        return h.hexdigest()
+        entry = index.entry(rest)
+        return entry.sha256 if entry is not None and entry.size == size else None
 
-    def run(self):
-        run_id = uuid.uuid4().hex[:8]
-        tmp_root = self.out_root / f".tmp_{run_id}"
-        tmp_root.mkdir(parents=True, exist_ok=True)
+    def run(self, resume=None):
+        """
+        resume: run id of an interrupted run — continue in its workspace
+                after the last checkpointed stage (raises CheckpointError
+                when there is nothing to resume)
+        """
+        # A commit interrupted by a crash is completed before anything else
+        finished = roll_forward(self.out_root / JOURNAL_NAME)
+        if finished:
+            print(f"  [warn] Completed the interrupted commit of run '{finished}'")
 
-        # Snapshot final output state for progress diffing
-        files_before = []
+        checkpoint = None
+        if resume:
+            checkpoint = RunCheckpoint.load(self.out_root, resume)
+            run_id = resume
+            tmp_root = self.out_root / f".tmp_{run_id}"
+            if not tmp_root.is_dir():
+                raise CheckpointError(f"Workspace of run '{run_id}' no longer exists: {tmp_root}")
+        else:
+            run_id = uuid.uuid4().hex[:8]
+            tmp_root = self.out_root / f".tmp_{run_id}"
+            tmp_root.mkdir(parents=True, exist_ok=True)
+            if self.commit and self.checkpoint_meta is not None:
+                checkpoint = RunCheckpoint.create(self.out_root, run_id, **self.checkpoint_meta)
+
+        # Snapshot final output state for progress diffing — only files whose
+        # size / mtime changed since the last run are read (output_manifest.py)
+        manifest = None
         before_hashes = {}
-        if self.final_root.exists():
-            files_before = sorted([p for p in self.final_root.rglob("*") if p.is_file()])
-            before_hashes = {str(p): self._hash(p) for p in files_before}
+        if self.commit:
+            manifest = OutputManifest.load(self.out_root / MANIFEST_NAME, self.final_root)
+            before_hashes = manifest.scan()
 
         validation_passed = False
+        committed = False       # final_root now holds this run's output
         try:
-            validation_passed = self.pipeline_fn(out_root=tmp_root)
+            if checkpoint is not None:
+                validation_passed = self.pipeline_fn(out_root=tmp_root, checkpoint=checkpoint)
+            else:
+                validation_passed = self.pipeline_fn(out_root=tmp_root)
+        except CheckpointError as e:
+            # Resume refused — leave the workspace and checkpoint as they are
+            print(f"  [error] {e}")
+            return False
+        except KeyboardInterrupt:
+            if checkpoint is not None and checkpoint.last_stage:
+                print(f"\n  [warn] Interrupted after stage '{checkpoint.last_stage}' — "
+                      f"resume with: python cli.py --resume {run_id}")
+            raise
         except Exception as e:
             print(f"  [error] Pipeline failed: {e}")
             validation_passed = False
+        finally:
+            # The pipeline generates into <workspace>/angular-app and indexes
+            # what it writes there (pipeline/transformation/project_index.py)
+            index = ProjectIndex.lookup(tmp_root / "angular-app")
+            ProjectIndex.discard(tmp_root / "angular-app")
+
+        if not self.commit:
+            shutil.rmtree(tmp_root, ignore_errors=True)
+            return validation_passed
 
         if validation_passed:
             if self.final_root.exists():
-                shutil.rmtree(self.final_root)
-            shutil.move(str(tmp_root), str(self.final_root))
-            print("  Committed output atomically")
+                # Apply only what changed, journaled (orchestration/output_commit.py)
+                plan = plan_commit(
+                    tmp_root, self.final_root, manifest.scan(),
+                    known=lambda rel, size: self._indexed_hash(index, rel, size),
+                )
+                plan.apply(self.out_root / JOURNAL_NAME, run_id)
+                print(f"  Committed output ({plan.summary})")
+            else:
+                shutil.move(str(tmp_root), str(self.final_root))
+                print("  Committed output atomically")
+            committed = True
+            if checkpoint is not None:
+                checkpoint.discard()
+        elif checkpoint is not None and checkpoint.last_stage:
+            print(f"  [warn] Pipeline failed after stage '{checkpoint.last_stage}' — workspace kept; "
+                  f"resume with: python cli.py --resume {run_id}")
         else:
             shutil.rmtree(tmp_root, ignore_errors=True)
             print("  [warn] Validation failed — temporary workspace discarded")
+            if checkpoint is not None:
+                checkpoint.discard()
 
         # Progress tracking (only on final output)
-        if self.final_root.exists():
-            files_after = sorted([p for p in self.final_root.rglob("*") if p.is_file()])
-        else:
-            files_after = []
+        after_hashes = manifest.scan(
+            known=lambda rel, size: self._indexed_hash(index if committed else None, rel, size)
+        )
+        manifest.save()
 
-        for p in files_after:
-            old_hash = before_hashes.get(str(p))
-            new_hash = self._hash(p)
+        for rel in sorted(after_hashes, key=lambda r: tuple(r.split("/"))):
+            p        = self.final_root / rel
+            old_hash = before_hashes.get(rel)
 
             if old_hash is None:
                 self.progress.record(p, "created")
-            elif old_hash == new_hash:
+            elif old_hash == after_hashes[rel]:
                 self.progress.record(p, "unchanged")
             else:
                 self.progress.record(p, "updated")
 
-        removed = set(before_hashes.keys()) - set(str(p) for p in files_after)
-        for p in removed:
-            self.progress.record(p, "removed")
+        removed = set(before_hashes) - set(after_hashes)
+        for rel in removed:
+            self.progress.record(self.final_root / rel, "removed")
 
         self.progress.save()
         return validation_passed
\ No newline at end of file
@@ -1,11 +1,86 @@
+"""
+orchestration/rollback_manager.py
+
+File snapshots a run can roll back to, kept in a content-addressed store:
+
+    out/.backup/
+      objects/<2 hex>/<62 hex>        one blob per distinct content (sha256)
+      snapshots/<run_id>.json         {"run_id", "taken", "last_used",
+                                       "files": {<abs path>: {sha256, size, mtime_ns, mode}}}
+
+snapshot(path) records which blob holds the file's current content. Content
+already in the store is not stored again. A file whose size and mtime_ns
+match its entry in the previous snapshot keeps that entry's hash without
+being read, so snapshotting unchanged files costs a stat() each.
+
+rollback() restores only the files that differ from the snapshot. Each one
+is written next to its target and renamed into place, with its mode and
+mtime as snapshotted.
+
+With hardlink=True, blobs are hard links to the snapshotted files (and
+restored files to the blobs) instead of copies, falling back to copying
+across filesystems. This is only safe for files that are replaced by rename
+and never rewritten in place, like PipelineRunner's committed output. An
+in-place write would change the blob too.
+
+Until save(), a run's snapshots are appended to snapshots/<run_id>.pending,
+one JSON line per file, written before the blob is relied on. gc() (run
+by another manager's save()) treats those blobs as referenced, so it never
+deletes the content of a run that has not saved yet. A .pending file left
+by a crashed process is dropped after _PENDING_TTL.
+
+save() writes the run's snapshot manifest and garbage-collects: the
+least-recently-used snapshots are dropped until the blobs still referenced
+fit in max_bytes (the current run's snapshot is always kept), and then
+unreferenced blobs are deleted.
+
+rollback() raises RollbackError, before restoring anything, when a blob it
+needs is missing from the store.
+
+    rollback = RollbackManager(run_id=run_id)
+    rollback.snapshot(path)             # before changing path
+    rollback.save()
+    ...
+    rollback.rollback()                 # on failure
+"""
+
+import hashlib
+import json
+import os
 import shutil
+import time
+import uuid
 from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024   # blob bytes kept across snapshots
+
+_RACY_NS      = 2_000_000_000           # see orchestration/output_manifest.py
+_CHUNK        = 1 << 20
+_PENDING_TTL  = 24 * 3600               # seconds before an unsaved run counts as abandoned
+
+
+class RollbackError(Exception):
+    """Raised when a snapshot cannot be restored."""
+
 
 class RollbackManager:
-    def __init__(self, backup_root="out/.backup"):
-        self.backup_root = Path(backup_root).resolve()
-        self.backup_root.mkdir(parents=True, exist_ok=True)
-        self.snapshots = {}  # original_path -> backup_path
+    def __init__(self, backup_root="out/.backup", run_id: Optional[str] = None,
+                 hardlink: bool = False, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.backup_root   = Path(backup_root).resolve()
+        self.objects_dir   = self.backup_root / "objects"
+        self.snapshots_dir = self.backup_root / "snapshots"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        self.run_id    = run_id or uuid.uuid4().hex[:8]
+        self.hardlink  = hardlink
+        self.max_bytes = max_bytes
+        self.snapshots = {}  # original_path -> backup_path (blob)
+        self._entries: dict[str, dict] = {}
+        self._pending_digests: set[str] = set()  # blobs this run relies on before save()
+        self._taken    = time.time_ns()
+        self._previous = self._latest_entries()
 
     def _is_in_backup_dir(self, path: Path) -> bool:
         try:
@@ -14,44 +89,256 @@ class RollbackManager:
         except Exception:
             return False
 
-    def _safe_relpath(self, path: Path):
-        """
-        Returns a safe relative path for backup storage.
-        """
-        path = Path(path).resolve()
-        try:
-            return path.relative_to(Path.cwd().resolve())
-        except Exception:
-            parts = [p.replace(":", "") for p in path.parts if p not in ("/", "\\")]
-            return Path("external") / Path(*parts[-4:])
+    # ── Snapshot / rollback ───────────────────────────────────────────────
 
     def snapshot(self, path: Path):
         path = Path(path)
-        if not path.exists():
+        if not path.is_file():
             return
 
         # Do not snapshot backup directory contents (prevents infinite nesting)
         if self._is_in_backup_dir(path):
             return
 
-        rel = self._safe_relpath(path)
-        backup_path = self.backup_root / rel
+        key = str(path.resolve())
+        st  = path.stat()
+        entry = {
+            "sha256":   None,
+            "size":     st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "mode":     st.st_mode & 0o7777,
+        }
+
+        def note(digest: str) -> None:
+            # recorded as pending before the blob is relied on (see gc())
+            entry["sha256"] = digest
+            self._note_pending(key, entry)
 
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(path, backup_path)
+        previous = self._previous.get(key)
+        if (previous is not None and previous["size"] == st.st_size
+                and previous["mtime_ns"] == st.st_mtime_ns):
+            note(previous["sha256"])            # unchanged since the last snapshot
+            if not self._blob(previous["sha256"]).exists():
+                self._store(path, note)
+        else:
+            self._store(path, note)
 
-        self.snapshots[str(path.resolve())] = str(backup_path.resolve())
+        self._entries[key] = entry
+        self.snapshots[key] = str(self._blob(entry["sha256"]))
 
-    def rollback(self):
-        for orig, backup in self.snapshots.items():
-            orig_path = Path(orig)
-            backup_path = Path(backup)
+    def rollback(self) -> int:
+        """
+        Restore the snapshotted files that changed since; returns how many.
+        Raises RollbackError (with nothing restored) if a needed blob is missing.
+        """
+        changed = [(Path(orig), entry) for orig, entry in self._entries.items()
+                   if not self._unchanged(Path(orig), entry)]
+        missing = [str(p) for p, entry in changed if not self._blob(entry["sha256"]).exists()]
+        if missing:
+            raise RollbackError(
+                f"{len(missing)} snapshotted file(s) missing from {self.objects_dir}, "
+                f"e.g. {missing[0]} — nothing was restored"
+            )
 
+        restored = 0
+        for orig_path, entry in changed:
+            blob = self._blob(entry["sha256"])
             orig_path.parent.mkdir(parents=True, exist_ok=True)
-            if backup_path.exists():
-                shutil.copy2(backup_path, orig_path)
+            tmp = orig_path.with_name(f".{orig_path.name}.{os.getpid()}.restore")
+            self._materialize(blob, tmp)
+            os.chmod(tmp, entry["mode"])
+            os.utime(tmp, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+            os.replace(tmp, orig_path)
+            restored += 1
+        if self._manifest_path().exists():
+            self._touch()                       # only a saved snapshot has a last use
+        return restored
+
+    def save(self):
+        """Write this run's snapshot manifest, then garbage-collect the store."""
+        self._touch()
+        self._pending_path().unlink(missing_ok=True)
+        self.gc()
 
     def clear(self):
         if self.backup_root.exists():
             shutil.rmtree(self.backup_root, ignore_errors=True)
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
         self.snapshots.clear()
+        self._entries.clear()
+        self._pending_digests.clear()
+        self._previous = {}
+
+    # ── Garbage collection ────────────────────────────────────────────────
+
+    def gc(self) -> int:
+        """
+        Drop least-recently-used snapshots until the blobs they reference fit
+        in max_bytes, then delete unreferenced blobs. Blobs of runs that have
+        not saved yet are always kept. Returns bytes freed.
+        """
+        manifests = sorted(self._manifests(), key=lambda m: m.get("last_used", 0), reverse=True)
+        kept_blobs: dict[str, int] = self._pending_blobs()
+        total = 0
+        full  = False                           # everything older than this goes
+        for manifest in manifests:
+            files = manifest.get("files", {})
+            extra = {e["sha256"]: e["size"] for e in files.values() if e["sha256"] not in kept_blobs}
+            size  = sum(extra.values())
+            if manifest.get("run_id") != self.run_id:
+                full = full or total + size > self.max_bytes
+                if full:
+                    (self.snapshots_dir / f"{manifest.get('run_id')}.json").unlink(missing_ok=True)
+                    continue
+            kept_blobs.update(extra)
+            total += size
+
+        freed = 0
+        for blob in self.objects_dir.glob("*/*"):
+            digest = blob.parent.name + blob.name
+            if digest in kept_blobs or digest in self._pending_digests:
+                continue
+            try:
+                freed += blob.stat().st_size
+                blob.unlink()
+            except OSError:
+                pass
+        for fanout in self.objects_dir.iterdir():
+            try:
+                fanout.rmdir()                  # only succeeds when empty
+            except OSError:
+                pass
+        return freed
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    def _blob(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _store(self, path: Path, note) -> str:
+        """
+        Put path's content into the store (if new) and return its sha256.
+        note(digest) is called once the hash is known, before the blob is published.
+        """
+        fanout_tmp = self.objects_dir / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.tmp"
+        if self.hardlink:
+            digest = _sha256(path)
+            note(digest)
+            blob   = self._blob(digest)
+            if not blob.exists():
+                blob.parent.mkdir(exist_ok=True)
+                try:
+                    os.link(path, fanout_tmp)
+                except OSError:                 # other filesystem / no link support
+                    shutil.copyfile(path, fanout_tmp)
+                os.replace(fanout_tmp, blob)
+            return digest
+
+        # Copy and hash in one read; the copy is kept only if the content is new
+        h = hashlib.sha256()
+        with open(path, "rb") as src, open(fanout_tmp, "wb") as dst:
+            while chunk := src.read(_CHUNK):
+                h.update(chunk)
+                dst.write(chunk)
+        digest = h.hexdigest()
+        note(digest)
+        blob   = self._blob(digest)
+        if blob.exists():
+            fanout_tmp.unlink()
+        else:
+            blob.parent.mkdir(exist_ok=True)
+            os.replace(fanout_tmp, blob)
+        return digest
+
+    def _materialize(self, blob: Path, target: Path) -> None:
+        if self.hardlink:
+            try:
+                os.link(blob, target)
+                return
+            except OSError:
+                pass
+        shutil.copyfile(blob, target)
+
+    def _unchanged(self, path: Path, entry: dict) -> bool:
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        if st.st_size != entry["size"]:
+            return False
+        if st.st_mtime_ns == entry["mtime_ns"] and st.st_mtime_ns < self._taken - _RACY_NS:
+            return True
+        return _sha256(path) == entry["sha256"]
+
+    def _manifests(self) -> list[dict]:
+        manifests = []
+        for path in self.snapshots_dir.glob("*.json"):
+            try:
+                manifest = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if isinstance(manifest, dict):
+                manifests.append(manifest)
+        return manifests
+
+    def _latest_entries(self) -> dict[str, dict]:
+        """Entries of the most recently used snapshot, for stat-first hashing."""
+        manifests = self._manifests()
+        if not manifests:
+            return {}
+        latest = max(manifests, key=lambda m: m.get("last_used", 0))
+        taken  = latest.get("taken", 0)
+        # entries modified right before that snapshot was taken may be racy
+        return {k: e for k, e in latest.get("files", {}).items()
+                if e.get("mtime_ns", 0) < taken - _RACY_NS}
+
+    def _manifest_path(self) -> Path:
+        return self.snapshots_dir / f"{self.run_id}.json"
+
+    def _pending_path(self) -> Path:
+        return self.snapshots_dir / f"{self.run_id}.pending"
+
+    def _note_pending(self, key: str, entry: dict) -> None:
+        self._pending_digests.add(entry["sha256"])
+        with open(self._pending_path(), "a", encoding="utf-8") as f:
+            f.write(json.dumps({"path": key, **entry}) + "\n")
+
+    def _pending_blobs(self) -> dict[str, int]:
+        """sha256 → size of the blobs referenced by runs that have not saved yet."""
+        blobs = {}
+        for path in self.snapshots_dir.glob("*.pending"):
+            try:
+                if time.time() - path.stat().st_mtime > _PENDING_TTL:
+                    path.unlink()               # left behind by a crashed process
+                    continue
+                lines = path.read_text(encoding="utf-8").splitlines()
+            except OSError:
+                continue
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                    blobs[entry["sha256"]] = entry["size"]
+                except (ValueError, KeyError, TypeError):
+                    continue                    # torn last line
+        return blobs
+
+    def _touch(self) -> None:
+        manifest = {
+            "run_id":    self.run_id,
+            "taken":     self._taken,
+            "last_used": time.time_ns(),
+            "files":     self._entries,
+        }
+        path = self._manifest_path()
+        tmp  = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
@@ -34,9 +34,10 @@ No conversation history is maintained.
 import os
 import json
 import time
-import urllib.request
-import urllib.error
 from typing import Optional
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -68,6 +69,9 @@ def _gemini_complete(prompt: str, api_key: str) -> Optional[str]:
     Call Gemini generateContent endpoint.
     Returns the text response or None on failure.
     """
+    import urllib.error
+    import urllib.request   # only needed once a key is configured
+
     url     = f"{GEMINI_URL}?key={api_key}"
     payload = json.dumps({
         "contents": [{"parts": [{"text": prompt}]}],
@@ -96,18 +100,18 @@ def _gemini_complete(prompt: str, api_key: str) -> Optional[str]:
             if e.code == 429:
                 if "quota" in body.lower() and "exceeded" in body.lower():
                     # Hard quota exhausted — no point retrying
-                    print(f"[AI/Gemini] Quota exceeded (not a rate limit).")
-                    print(f"[AI/Gemini] Fix: use an AI Studio key from aistudio.google.com")
-                    print(f"[AI/Gemini] NOT a Google Cloud console key — those require billing.")
+                    log.info("[AI/Gemini] Quota exceeded (not a rate limit).")
+                    log.info("[AI/Gemini] Fix: use an AI Studio key from aistudio.google.com")
+                    log.info("[AI/Gemini] NOT a Google Cloud console key — those require billing.")
                     return None
                 if attempt < MAX_RETRIES:
-                    print(f"[AI/Gemini] Rate limited — retrying in {RETRY_DELAY}s...")
+                    log.info("[AI/Gemini] Rate limited — retrying in %ss...", RETRY_DELAY)
                     time.sleep(RETRY_DELAY)
                     continue
-            print(f"[AI/Gemini] HTTP {e.code}: {body[:200]}")
+            log.warning("[AI/Gemini] HTTP %s: %s", e.code, body[:200])
             return None
         except Exception as e:
-            print(f"[AI/Gemini] Error: {e}")
+            log.warning("[AI/Gemini] Error: %s", e)
             return None
 
     return None
@@ -118,6 +122,9 @@ def _groq_complete(prompt: str, api_key: str) -> Optional[str]:
     Call Groq chat completions endpoint (OpenAI-compatible).
     Returns the text response or None on failure.
     """
+    import urllib.error
+    import urllib.request   # only needed once a key is configured
+
     payload = json.dumps({
         "model": GROQ_MODEL,
         "messages": [{"role": "user", "content": prompt}],
@@ -143,13 +150,13 @@ def _groq_complete(prompt: str, api_key: str) -> Optional[str]:
         except urllib.error.HTTPError as e:
             body = e.read().decode("utf-8", errors="replace")
             if e.code == 429 and attempt < MAX_RETRIES:
-                print(f"[AI/Groq] Rate limited — retrying in {RETRY_DELAY}s...")
+                log.info("[AI/Groq] Rate limited — retrying in %ss...", RETRY_DELAY)
                 time.sleep(RETRY_DELAY)
                 continue
-            print(f"[AI/Groq] HTTP {e.code}: {body[:200]}")
+            log.warning("[AI/Groq] HTTP %s: %s", e.code, body[:200])
             return None
         except Exception as e:
-            print(f"[AI/Groq] Error: {e}")
+            log.warning("[AI/Groq] Error: %s", e)
             return None
 
     return None
@@ -183,12 +190,12 @@ class AIClient:
             self._provider = None
 
         if self._provider:
-            print(f"[AIClient] Provider: {self._provider.upper()}")
+            log.info("[AIClient] Provider: %s", self._provider.upper())
         else:
-            print("[AIClient] No API key found. AI-assist will be skipped.")
-            print("[AIClient] For a FREE key:")
-            print("[AIClient]   Gemini: https://aistudio.google.com/app/apikey  (set GEMINI_API_KEY)")
-            print("[AIClient]   Groq:   https://console.groq.com/keys           (set GROQ_API_KEY)")
+            log.info("[AIClient] No API key found. AI-assist will be skipped.")
+            log.info("[AIClient] For a FREE key:")
+            log.info("[AIClient]   Gemini: https://aistudio.google.com/app/apikey  (set GEMINI_API_KEY)")
+            log.info("[AIClient]   Groq:   https://console.groq.com/keys           (set GROQ_API_KEY)")
 
     @property
     def available(self) -> bool:
@@ -222,7 +229,7 @@ class AIClient:
                 return result
             # Gemini failed — try Groq as fallback
             if self._groq_key:
-                print("[AIClient] Gemini failed — falling back to Groq...")
+                log.info("[AIClient] Gemini failed — falling back to Groq...")
                 return _groq_complete(prompt, self._groq_key)
 
         elif self._provider == "groq" and self._groq_key:
@@ -76,6 +76,7 @@ def stub_template_prompt(
     component_ts: str,
     scope_properties: list[str],
     scope_methods: list[str],
+    controller_html: str = "",
 ) -> str:
     """
     Prompt for generating a real Angular template for a component that
@@ -89,6 +90,7 @@ def stub_template_prompt(
     component_ts     : The generated Angular component TypeScript
     scope_properties : List of $scope property names from analysis
     scope_methods    : List of $scope method names from analysis
+    controller_html  : Original ng-controller markup, if any (from the TemplateIndex)
     """
     props_str   = ", ".join(scope_properties) if scope_properties else "none detected"
     methods_str = ", ".join(scope_methods)    if scope_methods    else "none detected"
@@ -97,6 +99,15 @@ def stub_template_prompt(
     if len(controller_js) > 1500:
         controller_js = controller_js[:1500] + "\n... (truncated)"
 
+    html_section = ""
+    if controller_html.strip():
+        if len(controller_html) > 1500:
+            controller_html = controller_html[:1500] + "\n... (truncated)"
+        html_section = f"""
+Original AngularJS markup for this controller:
+{controller_html}
+"""
+
     return f"""You are migrating an AngularJS controller to an Angular component template.
 
 Original AngularJS controller: {controller_name}
@@ -107,7 +118,7 @@ Component methods (from $scope): {methods_str}
 
 Original AngularJS controller source:
 {controller_js}
-
+{html_section}
 Generated Angular component TypeScript:
 {component_ts}
 
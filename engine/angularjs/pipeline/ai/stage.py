@@ -44,12 +44,17 @@ from pathlib import Path
 from typing import Optional
 
 from pipeline.ai.client import AIClient
+from pipeline.analysis.template_index import TemplateIndex
+from pipeline.transformation.project_index import STUB_MARKERS, ProjectIndex, record_file
 from pipeline.ai.prompts import (
     pipe_transform_prompt,
     stub_template_prompt,
     link_function_prompt,
     clean_response,
 )
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -83,13 +88,13 @@ class AIAssistResult:
 # ─────────────────────────────────────────────────────────────────────────────
 
 # Marker that indicates a pipe transform() body is a stub
-_PIPE_STUB_MARKER   = "return value;"
+_PIPE_STUB_MARKER   = STUB_MARKERS["pipe_body"]
 
 # Marker that indicates a component template is a stub (from controller_to_component.py)
-_TEMPLATE_STUB_MARKER = "TODO: no AngularJS template found"
+_TEMPLATE_STUB_MARKER = STUB_MARKERS["template"]
 
 # Marker that indicates a link() function needs migrating
-_LINK_STUB_MARKER   = "port DOM logic to ngAfterViewInit"
+_LINK_STUB_MARKER   = STUB_MARKERS["link"]
 
 
 def _extract_pipe_filter_body(ts_content: str) -> Optional[str]:
@@ -190,26 +195,33 @@ class AIAssistStage:
     app_dir  : Path to the generated src/app directory
     analysis : AnalysisResult from the engine (used to look up original source)
     client   : AIClient instance (handles provider selection + API calls)
+    index    : ProjectIndex of the generated project — lists the files and
+               says which carry a stub marker, so complete files are not read
     """
 
-    def __init__(self, app_dir: Path, analysis, client: AIClient):
-        self.app_dir  = Path(app_dir)
-        self.analysis = analysis
-        self.client   = client
+    def __init__(self, app_dir: Path, analysis, client: AIClient,
+                 index: Optional[ProjectIndex] = None):
+        self.app_dir   = Path(app_dir)
+        self.analysis  = analysis
+        self.client    = client
+        self.index     = index
+        self.templates = getattr(analysis, "template_index", None) or TemplateIndex(
+            getattr(analysis, "raw_templates", []) or []
+        )
 
     def run(self) -> AIAssistResult:
         result = AIAssistResult()
 
-        print("\n========== AIAssistStage.run() ==========")
+        log.debug("\n========== AIAssistStage.run() ==========")
 
         if not self.client.available:
-            print("[AIAssist] No API key — skipping all AI tasks.")
-            print("========== AIAssistStage DONE ==========\n")
+            log.info("[AIAssist] No API key — skipping all AI tasks.")
+            log.debug("========== AIAssistStage DONE ==========\n")
             return result
 
         if not self.app_dir.exists():
-            print(f"[AIAssist] Output dir not found: {self.app_dir}")
-            print("========== AIAssistStage DONE ==========\n")
+            log.info("[AIAssist] Output dir not found: %s", self.app_dir)
+            log.debug("========== AIAssistStage DONE ==========\n")
             return result
 
         self._run_pipe_completion(result)
@@ -218,34 +230,62 @@ class AIAssistStage:
         self._run_q_defer_migration(result)
         self._run_type_inference(result)
 
-        print(f"\n[AIAssist] Summary:")
-        print(f"  Pipes:     {result.pipes_completed} completed, "
-              f"{result.pipes_skipped} skipped, {result.pipes_failed} failed")
-        print(f"  Templates: {result.templates_completed} completed, "
-              f"{result.templates_skipped} skipped, {result.templates_failed} failed")
-        print(f"  Links:     {result.links_completed} completed, "
-              f"{result.links_skipped} skipped, {result.links_failed} failed")
-        print(f"  Total completed: {result.total_completed}")
-        print("========== AIAssistStage DONE ==========\n")
+        log.info("\n[AIAssist] Summary:")
+        log.info(
+            "  Pipes:     %s completed, %s skipped, %s failed",
+            result.pipes_completed, result.pipes_skipped, result.pipes_failed,
+        )
+        log.info(
+            "  Templates: %s completed, %s skipped, %s failed",
+            result.templates_completed, result.templates_skipped, result.templates_failed,
+        )
+        log.info(
+            "  Links:     %s completed, %s skipped, %s failed",
+            result.links_completed, result.links_skipped, result.links_failed,
+        )
+        log.info("  Total completed: %s", result.total_completed)
+        log.debug("========== AIAssistStage DONE ==========\n")
 
         return result
 
+    # ── Output files ──────────────────────────────────────────────────────
+
+    def _app_files(self, pattern: str) -> list[Path]:
+        """Files in app_dir matching pattern, from the ProjectIndex when there is one."""
+        if self.index is None:
+            return sorted(self.app_dir.glob(pattern))
+        return [self.index.path_of(f) for f in self.index.files(self.app_dir, pattern)]
+
+    def _read_if_stub(self, path: Path, stub: str) -> str:
+        """
+        Content of path, or "" when the index already says it has no such
+        stub (STUB_MARKERS) — complete files are not read at all.
+        """
+        entry = self.index.entry(path) if self.index is not None else None
+        if entry is not None and stub not in entry.stubs:
+            return ""
+        return path.read_text(encoding="utf-8")
+
+    def _write(self, path: Path, content: str) -> None:
+        path.write_text(content, encoding="utf-8")
+        record_file(path, content)
+
     # ── Task 1: Pipe body completion ──────────────────────────────────────
 
     def _run_pipe_completion(self, result: AIAssistResult):
-        print("\n[AIAssist] Task 1: Pipe transform() completion")
-        pipe_files = sorted(self.app_dir.glob("*.pipe.ts"))
+        log.info("\n[AIAssist] Task 1: Pipe transform() completion")
+        pipe_files = self._app_files("*.pipe.ts")
 
         if not pipe_files:
-            print("[AIAssist]   No pipe files found — skipping")
+            log.info("[AIAssist]   No pipe files found — skipping")
             return
 
         for pipe_file in pipe_files:
-            content = pipe_file.read_text(encoding="utf-8")
+            content = self._read_if_stub(pipe_file, "pipe_body")
 
             # Skip if already completed (no stub marker)
             if _PIPE_STUB_MARKER not in content:
-                print(f"[AIAssist]   SKIPPED (already complete): {pipe_file.name}")
+                log.info("[AIAssist]   SKIPPED (already complete): %s", pipe_file.name)
                 result.pipes_skipped += 1
                 continue
 
@@ -255,61 +295,61 @@ class AIAssistStage:
             js_body     = _extract_pipe_filter_body(content)
 
             if not js_body:
-                print(f"[AIAssist]   SKIPPED (no JS body to port): {pipe_file.name}")
+                log.info("[AIAssist]   SKIPPED (no JS body to port): %s", pipe_file.name)
                 result.pipes_skipped += 1
                 continue
 
-            print(f"[AIAssist]   Completing: {pipe_file.name}  (filter: {filter_name})")
+            log.info("[AIAssist]   Completing: %s  (filter: %s)", pipe_file.name, filter_name)
 
             prompt   = pipe_transform_prompt(pipe_name, filter_name, js_body, content)
             response = self.client.complete(prompt)
 
             if response is None:
-                print(f"[AIAssist]   FAILED: {pipe_file.name}")
+                log.info("[AIAssist]   FAILED: %s", pipe_file.name)
                 result.pipes_failed += 1
                 result.errors.append(f"pipe:{pipe_file.name}:api_failed")
                 continue
 
             cleaned = clean_response(response, "code")
             if not cleaned.strip():
-                print(f"[AIAssist]   FAILED (empty response): {pipe_file.name}")
+                log.info("[AIAssist]   FAILED (empty response): %s", pipe_file.name)
                 result.pipes_failed += 1
                 continue
 
             # Safety check: response must still look like a pipe
             if "@Pipe" not in cleaned or "transform(" not in cleaned:
-                print(f"[AIAssist]   FAILED (response lost @Pipe structure): {pipe_file.name}")
+                log.info("[AIAssist]   FAILED (response lost @Pipe structure): %s", pipe_file.name)
                 result.pipes_failed += 1
                 result.errors.append(f"pipe:{pipe_file.name}:bad_response")
                 continue
 
-            pipe_file.write_text(cleaned, encoding="utf-8")
-            print(f"[AIAssist]   COMPLETED: {pipe_file.name}")
+            self._write(pipe_file, cleaned)
+            log.info("[AIAssist]   COMPLETED: %s", pipe_file.name)
             result.pipes_completed += 1
 
     # ── Task 2: Stub template completion ─────────────────────────────────
 
     def _run_template_completion(self, result: AIAssistResult):
-        print("\n[AIAssist] Task 2: Stub template completion")
-        html_files = sorted(self.app_dir.glob("*.component.html"))
+        log.info("\n[AIAssist] Task 2: Stub template completion")
+        html_files = self._app_files("*.component.html")
 
         if not html_files:
-            print("[AIAssist]   No component HTML files found — skipping")
+            log.info("[AIAssist]   No component HTML files found — skipping")
             return
 
         for html_file in html_files:
-            content = html_file.read_text(encoding="utf-8")
+            content = self._read_if_stub(html_file, "template")
 
             # Skip if already completed (no stub marker)
             if _TEMPLATE_STUB_MARKER not in content:
-                print(f"[AIAssist]   SKIPPED (has real content): {html_file.name}")
+                log.info("[AIAssist]   SKIPPED (has real content): %s", html_file.name)
                 result.templates_skipped += 1
                 continue
 
             # Find the matching .component.ts
             ts_file = html_file.with_suffix(".ts")
             if not ts_file.exists():
-                print(f"[AIAssist]   SKIPPED (no .ts file): {html_file.name}")
+                log.info("[AIAssist]   SKIPPED (no .ts file): %s", html_file.name)
                 result.templates_skipped += 1
                 continue
 
@@ -327,31 +367,35 @@ class AIAssistStage:
             scope_props   = list(dict.fromkeys(_extract_name(x) for x in _raw_props   if _extract_name(x)))
             scope_methods = list(dict.fromkeys(_extract_name(x) for x in _raw_methods if _extract_name(x)))
             controller_js   = _extract_controller_js(self.analysis, controller_name)
+            controller_html = self._controller_html(controller_name)
 
-            print(f"[AIAssist]   Completing: {html_file.name}  "
-                  f"(controller: {controller_name}, props: {scope_props[:4]}...)")
+            log.info(
+                "[AIAssist]   Completing: %s  (controller: %s, props: %s...)",
+                html_file.name, controller_name, scope_props[:4],
+            )
 
             prompt   = stub_template_prompt(
                 component_name, controller_name, controller_js,
-                ts_content, scope_props, scope_methods
+                ts_content, scope_props, scope_methods,
+                controller_html=controller_html,
             )
             response = self.client.complete(prompt)
 
             if response is None:
-                print(f"[AIAssist]   FAILED: {html_file.name}")
+                log.info("[AIAssist]   FAILED: %s", html_file.name)
                 result.templates_failed += 1
                 result.errors.append(f"template:{html_file.name}:api_failed")
                 continue
 
             cleaned = clean_response(response, "html")
             if not cleaned.strip():
-                print(f"[AIAssist]   FAILED (empty response): {html_file.name}")
+                log.info("[AIAssist]   FAILED (empty response): %s", html_file.name)
                 result.templates_failed += 1
                 continue
 
             # Safety check: must be HTML-like (contains < character)
             if "<" not in cleaned:
-                print(f"[AIAssist]   FAILED (response not HTML): {html_file.name}")
+                log.info("[AIAssist]   FAILED (response not HTML): %s", html_file.name)
                 result.templates_failed += 1
                 result.errors.append(f"template:{html_file.name}:bad_response")
                 continue
@@ -362,22 +406,30 @@ class AIAssistStage:
                 f"<!-- Review carefully before production use -->\n"
                 f"{cleaned}\n"
             )
-            html_file.write_text(final, encoding="utf-8")
-            print(f"[AIAssist]   COMPLETED: {html_file.name}")
+            self._write(html_file, final)
+            log.info("[AIAssist]   COMPLETED: %s", html_file.name)
             result.templates_completed += 1
 
+    def _controller_html(self, controller_name: str) -> str:
+        """Original ng-controller fragment (or whole source file) for a controller."""
+        ref = self.templates.fragment_ref(controller_name)
+        if ref is not None and ref.fragment:
+            return ref.fragment.strip()
+        source = self.templates.source_for(controller_name)
+        return (getattr(source, "raw_html", "") or "") if source is not None else ""
+
     # ── Task 3: Link function migration ───────────────────────────────────
 
     def _run_link_migration(self, result: AIAssistResult):
-        print("\n[AIAssist] Task 3: Link function → ngAfterViewInit() migration")
-        ts_files = sorted(self.app_dir.glob("*.component.ts"))
+        log.info("\n[AIAssist] Task 3: Link function → ngAfterViewInit() migration")
+        ts_files = self._app_files("*.component.ts")
 
         if not ts_files:
-            print("[AIAssist]   No component TS files found — skipping")
+            log.info("[AIAssist]   No component TS files found — skipping")
             return
 
         for ts_file in ts_files:
-            content = ts_file.read_text(encoding="utf-8")
+            content = self._read_if_stub(ts_file, "link")
 
             # Only process files with the link warning comment
             if _LINK_STUB_MARKER not in content:
@@ -386,7 +438,7 @@ class AIAssistStage:
 
             # Skip if already migrated (implements AfterViewInit already present)
             if "AfterViewInit" in content and "ngAfterViewInit" in content and "TODO" not in content:
-                print(f"[AIAssist]   SKIPPED (already migrated): {ts_file.name}")
+                log.info("[AIAssist]   SKIPPED (already migrated): %s", ts_file.name)
                 result.links_skipped += 1
                 continue
 
@@ -396,46 +448,46 @@ class AIAssistStage:
             directive_name = _find_directive_name(stem, self.analysis)
             link_source    = _extract_link_source(directive_name, self.analysis)
 
-            print(f"[AIAssist]   Migrating link(): {ts_file.name}  (directive: {directive_name})")
+            log.info("[AIAssist]   Migrating link(): %s  (directive: %s)", ts_file.name, directive_name)
 
             prompt   = link_function_prompt(directive_name, component_name, link_source, content)
             response = self.client.complete(prompt)
 
             if response is None:
-                print(f"[AIAssist]   FAILED: {ts_file.name}")
+                log.info("[AIAssist]   FAILED: %s", ts_file.name)
                 result.links_failed += 1
                 result.errors.append(f"link:{ts_file.name}:api_failed")
                 continue
 
             cleaned = clean_response(response, "code")
             if not cleaned.strip():
-                print(f"[AIAssist]   FAILED (empty response): {ts_file.name}")
+                log.info("[AIAssist]   FAILED (empty response): %s", ts_file.name)
                 result.links_failed += 1
                 continue
 
             # Safety check: must still look like an Angular component
             if "@Component" not in cleaned or "export class" not in cleaned:
-                print(f"[AIAssist]   FAILED (lost @Component): {ts_file.name}")
+                log.info("[AIAssist]   FAILED (lost @Component): %s", ts_file.name)
                 result.links_failed += 1
                 result.errors.append(f"link:{ts_file.name}:bad_response")
                 continue
 
-            ts_file.write_text(cleaned, encoding="utf-8")
-            print(f"[AIAssist]   COMPLETED: {ts_file.name}")
+            self._write(ts_file, cleaned)
+            log.info("[AIAssist]   COMPLETED: %s", ts_file.name)
             result.links_completed += 1
 
     def _run_q_defer_migration(self, result: AIAssistResult):
-        print("\n[AIAssist] Task 4: $q.defer() → Observable migration")
+        log.info("\n[AIAssist] Task 4: $q.defer() → Observable migration")
 
-        ts_files = sorted(self.app_dir.glob("*.ts"))
+        ts_files = self._app_files("*.ts")
 
         for ts_file in ts_files:
-            content = ts_file.read_text(encoding="utf-8")
+            content = self._read_if_stub(ts_file, "q_defer")
 
             if "$q.defer" not in content:
                 continue
 
-            print(f"[AIAssist]   Migrating $q.defer: {ts_file.name}")
+            log.info("[AIAssist]   Migrating $q.defer: %s", ts_file.name)
 
             prompt = f"""
     Rewrite this Angular TypeScript code to replace AngularJS $q.defer() patterns
@@ -460,21 +512,21 @@ class AIAssistStage:
             if "Observable" not in cleaned:
                 continue
 
-            ts_file.write_text(cleaned, encoding="utf-8")
-            print(f"[AIAssist]   COMPLETED: {ts_file.name}")
+            self._write(ts_file, cleaned)
+            log.info("[AIAssist]   COMPLETED: %s", ts_file.name)
 
     def _run_type_inference(self, result: AIAssistResult):
-        print("\n[AIAssist] Task 5: Type inference for component properties")
+        log.info("\n[AIAssist] Task 5: Type inference for component properties")
 
-        ts_files = sorted(self.app_dir.glob("*.component.ts"))
+        ts_files = self._app_files("*.component.ts")
 
         for ts_file in ts_files:
-            content = ts_file.read_text(encoding="utf-8")
+            content = self._read_if_stub(ts_file, "any_field")
 
             if "!: any;" not in content:
                 continue
 
-            print(f"[AIAssist]   Inferring types: {ts_file.name}")
+            log.info("[AIAssist]   Inferring types: %s", ts_file.name)
 
             prompt = f"""
     Improve the TypeScript types in this Angular component.
@@ -497,21 +549,21 @@ class AIAssistStage:
                 cleaned = clean_response(response)
 
                 if "export class" in cleaned:
-                    ts_file.write_text(cleaned, encoding="utf-8")
-                    print(f"[AIAssist]   COMPLETED: {ts_file.name}")
+                    self._write(ts_file, cleaned)
+                    log.info("[AIAssist]   COMPLETED: %s", ts_file.name)
                     return
 
             # ---- fallback if AI unavailable ----
 
-            print(f"[AIAssist]   fallback inference: {ts_file.name}")
+            log.info("[AIAssist]   fallback inference: %s", ts_file.name)
 
             cleaned = content
 
             cleaned = cleaned.replace("!: any;", "!: unknown;")
             cleaned = cleaned.replace(": any;", ": unknown;")
 
-            ts_file.write_text(cleaned, encoding="utf-8")
-            print(f"[AIAssist]   COMPLETED: {ts_file.name}")
+            self._write(ts_file, cleaned)
+            log.info("[AIAssist]   COMPLETED: %s", ts_file.name)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
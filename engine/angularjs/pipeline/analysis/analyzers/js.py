@@ -2,7 +2,11 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from .base import Analyzer
 import esprima
+import logging
 import uuid
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 class RawController:
@@ -430,7 +434,7 @@ def _collect_module_aliases(ast, aliases: dict, reopened: list = None):
                     # angular.module('x') → re-open
                     if mod_name not in reopened:
                         reopened.append(mod_name)
-                    print(f"[js.py] Re-opened module detected: '{mod_name}' (var {var_name})")
+                    log.debug("[js.py] Re-opened module detected: '%s' (var %s)", mod_name, var_name)
 
         # x = angular.module(...)  (bare assignment)
         if getattr(node, "type", None) == "AssignmentExpression":
@@ -445,7 +449,7 @@ def _collect_module_aliases(ast, aliases: dict, reopened: list = None):
                 elif reopened is not None:
                     if mod_name not in reopened:
                         reopened.append(mod_name)
-                    print(f"[js.py] Re-opened module detected: '{mod_name}' (assignment)")
+                    log.debug("[js.py] Re-opened module detected: '%s' (assignment)", mod_name)
 
         for key in vars(node):
             val = getattr(node, key, None)
@@ -551,11 +555,9 @@ class JSAnalyzer(Analyzer):
                         obj_type == "CallExpression"
                         and _is_angular_module_chain(callee.object)
                     )
-                    print(
-                        f"[js.py CHAIN] prop={prop!r} obj_type={obj_type!r}"
-                        f" obj_name={obj_name!r} _is_alias={_is_module_alias_call}"
-                        f" _is_chained={_is_chained_module_component}"
-                        f" -> will_detect_component={prop == 'component' and (_is_module_alias_call or _is_chained_module_component)}"
+                    log.debug(
+                        "[js.py CHAIN] prop=%r obj_type=%r obj_name=%r _is_alias=%s _is_chained=%s -> will_detect_component=%s",
+                        prop, obj_type, obj_name, _is_module_alias_call, _is_chained_module_component, prop == 'component' and (_is_module_alias_call or _is_chained_module_component),
                     )
 
                     if prop in ("controller", "service", "factory") and len(args) >= 2:
@@ -576,11 +578,9 @@ class JSAnalyzer(Analyzer):
                         ):
                         name_node = args[0]
                         cfg_node  = args[1] if getattr(args[1], "type", None) == "ObjectExpression" else None
-                        print(
-                            f"[js.py .component()] Entering detection: name_node.type={getattr(name_node, 'type', None)!r}"
-                            f" name_node.value={getattr(name_node, 'value', None)!r}"
-                            f" cfg_node={'present' if cfg_node else 'MISSING (not ObjectExpression)'}"
-                            f" args[1].type={getattr(args[1], 'type', None)!r}"
+                        log.debug(
+                            "[js.py .component()] Entering detection: name_node.type=%r name_node.value=%r cfg_node=%s args[1].type=%r",
+                            getattr(name_node, 'type', None), getattr(name_node, 'value', None), 'present' if cfg_node else 'MISSING (not ObjectExpression)', getattr(args[1], 'type', None),
                         )
 
                         if getattr(name_node, "type", None) == "Literal" and cfg_node is not None:
@@ -609,15 +609,18 @@ class JSAnalyzer(Analyzer):
                                         fn_node = last
                             # If no inline function, synthesise a minimal fn_node placeholder
                             # We still create a controller entry so the component is detected
-                            print(
-                                f"[js.py .component()] '{comp_name}': ctrl_prop.type={getattr(ctrl_prop, 'type', None)!r}"
-                                f" fn_node={'found (type=' + getattr(fn_node, 'type', 'None') + ')' if fn_node else 'NOT FOUND'}"
+                            log.debug(
+                                "[js.py .component()] '%s': ctrl_prop.type=%r fn_node=%s",
+                                comp_name, getattr(ctrl_prop, 'type', None), 'found (type=' + getattr(fn_node, 'type', 'None') + ')' if fn_node else 'NOT FOUND',
                             )
                             if fn_node is None and ctrl_prop is not None:
                                 # Named controller reference — record with empty body
                                 ctrl_name_ref = getattr(ctrl_prop, "name", None)
                                 if ctrl_name_ref:
-                                    print(f"[js.py] .component('{comp_name}') references named ctrl {ctrl_name_ref}")
+                                    log.debug(
+                                        "[js.py] .component('%s') references named ctrl %s",
+                                        comp_name, ctrl_name_ref,
+                                    )
                             
                             template = None
                             template_prop = _extract_object_prop(cfg_node, "template")
@@ -628,7 +631,10 @@ class JSAnalyzer(Analyzer):
                                 ctrl_obj = _handle_controller(comp_name, ctrl_prop, fn_node, file_path, source, is_component=True)
                                 if ctrl_obj and template:
                                     ctrl_obj.template = template
-                                print(f"[js.py] .component('{comp_name}') controller detected -> RawController appended (is_component=True)")                   
+                                log.debug(
+                                    "[js.py] .component('%s') controller detected -> RawController appended (is_component=True)",
+                                    comp_name,
+                                )                   
                             elif cfg_node is not None:
                                 # No controller function found — register component with empty body
                                 ctrl = RawController(
@@ -640,7 +646,10 @@ class JSAnalyzer(Analyzer):
                                 ctrl.kind = "component"
                                 raw_modules.append(ctrl)
                                 return ctrl
-                                print(f"[js.py] .component('{comp_name}') registered (no inline controller)")
+                                log.debug(
+                                    "[js.py] .component('%s') registered (no inline controller)",
+                                    comp_name,
+                                )
                             for child in iter_children(node):
                                 recurse(child, file_path, source, current_owner, module_aliases)
                             return
@@ -682,7 +691,7 @@ class JSAnalyzer(Analyzer):
                             raw_run_blocks.append(RawRunBlock(
                                 di=di_run, body_src=body_src, file=file_path
                             ))
-                            print(f"[js.py] .run() block detected in {file_path} di={di_run}")
+                            log.debug("[js.py] .run() block detected in %s di=%s", file_path, di_run)
 
                     elif prop in ("constant", "value") and len(args) >= 2:
                         # .constant('KEY', value) or .value('KEY', value)
@@ -697,7 +706,7 @@ class JSAnalyzer(Analyzer):
                                 name=const_name, raw_value=raw_val,
                                 kind=prop, file=file_path
                             ))
-                            print(f"[js.py] .{prop}('{const_name}', {raw_val[:40]}) detected")
+                            log.debug("[js.py] .%s('%s', %s) detected", prop, const_name, raw_val[:40])
 
                     if obj_name == "$http" and prop in ("get", "post", "put", "delete"):
                         url = None
@@ -748,7 +757,7 @@ class JSAnalyzer(Analyzer):
                 Because esprima doesn't attach parent pointers, we do a single
                 pre-pass to build a child→parent map restricted to fn_body.
                 """
-                print("[js.py DEBUG] _scan_method_http called: ctrl=" + repr(ctrl_name) + " method=" + repr(method_name))
+                log.debug("[js.py DEBUG] _scan_method_http called: ctrl=%r method=%r", ctrl_name, method_name)
 
                 # ── Build child→parent map inside fn_body ──────────────
                 parent_of: Dict[int, object] = {}   # id(node) → parent node
@@ -902,7 +911,7 @@ class JSAnalyzer(Analyzer):
                         # common AngularJS controller aliases
                         if alias in ("self", "vm", "ctrl", "that") or True:
                             self_aliases.add(alias)
-                            print(f"[js.py] {name}: self alias '{alias}' = this")
+                            log.debug("[js.py] %s: self alias '%s' = this", name, alias)
                 if node is None or not hasattr(node, "type"):
                     return
 
@@ -957,7 +966,10 @@ class JSAnalyzer(Analyzer):
                                     if not any(m["name"] == _sname for m in scope_methods):
                                         scope_methods.append({"name": _sname, "params": _sparams, "is_this_method": True})
                                     _sfn_body = getattr(_sr, "body", None)
-                                    print("[js.py DEBUG] this.method block: " + repr(_sname) + " sfn_body=" + repr(_sfn_body is not None))
+                                    log.debug(
+                                        "[js.py DEBUG] this.method block: %r sfn_body=%r",
+                                        _sname, _sfn_body is not None,
+                                    )
                                     if _sfn_body:
                                         # Tag HTTP calls with owner_method via _scan_method_http
                                         _scan_method_http(_sfn_body, _sname, name, file_path)
@@ -969,7 +981,7 @@ class JSAnalyzer(Analyzer):
                                             scan_fn(_sc, _current_method)
                                     for _sc in iter_children(_sl):
                                         scan_fn(_sc, _current_method)
-                                    print("[js.py DEBUG] this.method returning early for " + repr(_sname))
+                                    log.debug("[js.py DEBUG] this.method returning early for %r", _sname)
                                     return
 
                 if getattr(node, "type", None) == "CallExpression":
@@ -1049,7 +1061,10 @@ class JSAnalyzer(Analyzer):
                             url_dbg = None
                             if callargs and getattr(callargs[0], "type", None) == "Literal":
                                 url_dbg = callargs[0].value
-                            print("[js.py DEBUG] $http." + pname + "(" + str(url_dbg) + ") in " + name + " _current_method=" + repr(_current_method) + (" -> SKIPPED" if _current_method else " -> ADDED"))
+                            log.debug(
+                                "[js.py DEBUG] $http.%s(%s) in %s _current_method=%r%s",
+                                pname, url_dbg, name, _current_method, " -> SKIPPED" if _current_method else " -> ADDED",
+                            )
                             if _current_method is None:
                                 raw_http_calls.append(
                                     RawHttpCall(file_path, pname, url_dbg,
@@ -1057,7 +1072,10 @@ class JSAnalyzer(Analyzer):
                                 )
 
                         if obj_name == "$q" and pname in ("defer", "all"):
-                            print("[js.py DEBUG] $q." + pname + "() in " + name + " _current_method=" + repr(_current_method))
+                            log.debug(
+                                "[js.py DEBUG] $q.%s() in %s _current_method=%r",
+                                pname, name, _current_method,
+                            )
                             if _current_method is None:
                                 raw_http_calls.append(
                                     RawHttpCall(file_path, f"q_{pname}", None,
@@ -1109,12 +1127,22 @@ class JSAnalyzer(Analyzer):
             if body:
                 scan_fn(body)
 
-            _owned   = [c for c in raw_http_calls if getattr(c, "owner_method", None) and getattr(c, "owner_controller", None) == name]
-            _unowned = [c for c in raw_http_calls if not getattr(c, "owner_method", None) and getattr(c, "owner_controller", None) == name]
-            print("[js.py DEBUG] Controller " + repr(name) + ": " + str(len(_owned)) + " method-owned, " + str(len(_unowned)) + " top-level, scope_methods=" + str([m["name"] for m in scope_methods]) + ", init_calls_raw=" + str(init_calls))
-            print("[js.py DEBUG]   owned calls: " + str([(getattr(c,"owner_method",None), c.method, c.url) for c in _owned]))
-            print("[js.py DEBUG]   unowned calls: " + str([(c.method, c.url) for c in _unowned]))
-            print("[js.py DEBUG]   this_methods: " + str([m["name"] for m in scope_methods if m.get("is_this_method")]))
+            if log.isEnabledFor(logging.DEBUG):
+                _owned   = [c for c in raw_http_calls if getattr(c, "owner_method", None) and getattr(c, "owner_controller", None) == name]
+                _unowned = [c for c in raw_http_calls if not getattr(c, "owner_method", None) and getattr(c, "owner_controller", None) == name]
+                log.debug(
+                    "[js.py DEBUG] Controller %r: %s method-owned, %s top-level, scope_methods=%s, init_calls_raw=%s",
+                    name, len(_owned), len(_unowned), [m["name"] for m in scope_methods], init_calls,
+                )
+                log.debug(
+                    "[js.py DEBUG]   owned calls: %s",
+                    [(getattr(c,"owner_method",None), c.method, c.url) for c in _owned],
+                )
+                log.debug("[js.py DEBUG]   unowned calls: %s", [(c.method, c.url) for c in _unowned])
+                log.debug(
+                    "[js.py DEBUG]   this_methods: %s",
+                    [m["name"] for m in scope_methods if m.get("is_this_method")],
+                )
             method_names_set = {m["name"] for m in scope_methods}
             # Keep calls that reference a known method (scope or this)
             filtered_init_calls = [c for c in init_calls if c in method_names_set]
@@ -1207,9 +1235,9 @@ class JSAnalyzer(Analyzer):
             # Builds a map of {identifier_name: angular_module_name} for this file
             module_aliases: Dict[str, str] = {}
             _collect_module_aliases(ast, module_aliases, reopened_modules)
-            print(f"[js.py] {path.name}: module aliases = {module_aliases}")
+            log.debug("[js.py] %s: module aliases = %s", path.name, module_aliases)
             if reopened_modules:
-                print(f"[js.py] {path.name}: re-opened modules = {reopened_modules}")
+                log.debug("[js.py] %s: re-opened modules = %s", path.name, reopened_modules)
 
             recurse(ast, str(path), source=text, current_owner=None,
                     module_aliases=module_aliases)
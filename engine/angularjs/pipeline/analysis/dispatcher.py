@@ -5,6 +5,7 @@ from .analyzers.java import JavaAnalyzer
 from ..ingestion.classifier import FileType
 from .builder import IRBuilder
 from .result import AnalysisResult
+from .template_index import TemplateIndex
 
 
 class AnalyzerDispatcher:
@@ -105,6 +106,7 @@ class AnalyzerDispatcher:
             raw_templates=preserved_raw_templates,
             routes=raw_routes,
             filters=raw_filters,
+            template_index=TemplateIndex(preserved_raw_templates),
         )
         # Attach extra fields not in the original dataclass — rules access via getattr
         result.raw_constants    = raw_constants
@@ -16,4 +16,5 @@ class AnalysisResult:
     directives:    List[Any] = field(default_factory=list)   # RawDirective objects
     raw_templates: List[Any] = field(default_factory=list)   # RawTemplate objects (with raw_html)
     routes:        List[Any] = field(default_factory=list)   # RawRoute objects
-    filters:       List[Any] = field(default_factory=list)   # RawFilter dicts [{name, fn_body}]
\ No newline at end of file
+    filters:       List[Any] = field(default_factory=list)   # RawFilter dicts [{name, fn_body}]
+    template_index: Any = None                                # TemplateIndex over raw_templates
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+pipeline/analysis/snapshot_cache.py
+
+In-memory cache of AnalysisResult snapshots for long-lived engine
+processes (`python cli.py serve`).
+
+A snapshot is keyed by the repo root and a fingerprint of the scanned
+files — path, size and mtime of every file. Re-running on an unchanged
+repo skips parsing and analysis entirely; touching any source file
+changes the fingerprint and the repo is analysed again.
+
+Later pipeline stages annotate the analysis objects they are given, so the
+cache stores its own copy and hands out a fresh deep copy on every hit.
+
+One-shot CLI runs do not use it: there is nothing to reuse within a
+single process.
+"""
+
+import copy
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .result import AnalysisResult
+
+
+def fingerprint(paths: Iterable[Path]) -> str:
+    h = hashlib.sha1()
+    for p in sorted(str(p) for p in paths):
+        try:
+            st = Path(p).stat()
+        except OSError:
+            continue
+        h.update(f"{p}\0{st.st_size}\0{st.st_mtime_ns}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+class AnalysisSnapshotCache:
+    """LRU of analysis snapshots, one per repo root."""
+
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[str, AnalysisResult]]" = OrderedDict()
+        self.hits   = 0
+        self.misses = 0
+
+    def get(self, repo_root: Path, fp: str) -> Optional[AnalysisResult]:
+        key = str(repo_root)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != fp:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, repo_root: Path, fp: str, analysis: AnalysisResult) -> None:
+        key = str(repo_root)
+        self._entries[key] = (fp, copy.deepcopy(analysis))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def summary(self) -> str:
+        return f"{self.hits} hit(s), {self.misses} miss(es)"
@@ -0,0 +1,201 @@
+"""
+pipeline/analysis/template_index.py
+
+Controller → template index, built once per run by AnalyzerDispatcher and
+attached to AnalysisResult.template_index.
+
+Every ng-controller element found in the scanned HTML is recorded as a
+TemplateRef holding the owning RawTemplate (the "handle"), the controllerAs
+alias, the enclosing controller for nested ng-controller blocks, and the
+character offsets of the element's inner HTML. Consumers slice the fragment
+out of raw_html directly instead of re-running regex scans and tag walks per
+controller:
+
+  ControllerToComponentRule  — template source + fragment per controller
+  ComponentInteractionRule   — nested ng-controller parent → child pairs
+  AIAssistStage              — original markup as prompt context
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+# ng-controller="Name" / ng-controller="Name as alias" (attribute value only)
+NG_CONTROLLER_ATTR_RE = re.compile(r'\bng-controller\s*=\s*["\'](\w+)')
+
+# Full opening tag carrying an ng-controller attribute
+_NG_CONTROLLER_TAG_RE = re.compile(
+    r'<(\w+)[^>]*\bng-controller\s*=\s*["\'](\w+)(?:\s+as\s+(\w+))?["\'][^>]*>',
+    re.IGNORECASE,
+)
+
+
+def find_element_end(html: str, tag_name: str, inner_start: int) -> Optional[int]:
+    """
+    Walk forward from inner_start tracking nested <tag_name> open/close tags
+    and return the offset of the matching closing tag, or None if the HTML is
+    malformed.
+    """
+    depth    = 1
+    pos      = inner_start
+    open_re  = re.compile(rf'<{tag_name}(?:\s|>)', re.IGNORECASE)
+    close_re = re.compile(rf'</{tag_name}\s*>', re.IGNORECASE)
+
+    while pos < len(html) and depth > 0:
+        next_open  = open_re.search(html, pos)
+        next_close = close_re.search(html, pos)
+
+        if next_close is None:
+            return None
+
+        if next_open and next_open.start() < next_close.start():
+            depth += 1
+            pos = next_open.end()
+        else:
+            depth -= 1
+            if depth == 0:
+                return next_close.start()
+            pos = next_close.end()
+
+    return None
+
+
+@dataclass
+class TemplateRef:
+    template:    Any              # RawTemplate the element lives in
+    controller:  str
+    alias:       Optional[str]    # controllerAs alias ("vm" in "Ctrl as vm")
+    tag:         str
+    tag_start:   int              # offset of the opening tag
+    inner_start: int              # offset just past the opening tag
+    inner_end:   Optional[int]    # offset of the closing tag (None = malformed)
+    parent:      Optional[str] = None   # enclosing ng-controller, if nested
+
+    @property
+    def fragment(self) -> Optional[str]:
+        """Raw (unmigrated) inner HTML of the ng-controller element."""
+        if self.inner_end is None:
+            return None
+        html = getattr(self.template, "raw_html", "") or ""
+        return html[self.inner_start:self.inner_end]
+
+
+class TemplateIndex:
+    def __init__(self, raw_templates: list):
+        self.templates = list(raw_templates or [])
+
+        self._refs_by_template: dict[int, list[TemplateRef]] = {}
+        self._names_by_template: dict[int, list[str]] = {}
+        self._refs_by_controller: dict[str, list[TemplateRef]] = {}
+        self._source_by_controller: dict[str, Any] = {}
+        self._owner_by_controller: dict[str, Any] = {}
+
+        for t in self.templates:
+            ctrl = getattr(t, "controller", None)
+            if ctrl is not None and ctrl not in self._owner_by_controller:
+                self._owner_by_controller[ctrl] = t
+            if ctrl and (getattr(t, "raw_html", "") or "").strip():
+                self._source_by_controller[ctrl] = t
+
+        for t in self.templates:
+            html = getattr(t, "raw_html", "") or ""
+            if not html.strip():
+                continue
+            names = NG_CONTROLLER_ATTR_RE.findall(html)
+            self._names_by_template[id(t)] = names
+            for name in names:
+                self._source_by_controller.setdefault(name, t)
+
+            refs = self._scan(t, html)
+            self._refs_by_template[id(t)] = refs
+            for ref in refs:
+                self._refs_by_controller.setdefault(ref.controller, []).append(ref)
+
+    def __reduce__(self):
+        # Per-template maps are keyed by id(); deepcopy and pickle (analysis
+        # snapshots, run checkpoints) rebuild them over the copied templates,
+        # which stay shared with AnalysisResult.raw_templates.
+        return (TemplateIndex, (self.templates,))
+
+    @staticmethod
+    def _scan(template, html: str) -> list[TemplateRef]:
+        refs: list[TemplateRef] = []
+        open_refs: list[TemplateRef] = []   # enclosing elements, innermost last
+
+        for m in _NG_CONTROLLER_TAG_RE.finditer(html):
+            tag, name, alias = m.group(1), m.group(2), m.group(3)
+            inner_end = find_element_end(html, tag, m.end())
+
+            while open_refs and not (
+                open_refs[-1].inner_end is not None
+                and m.start() < open_refs[-1].inner_end
+            ):
+                open_refs.pop()
+
+            ref = TemplateRef(
+                template=template,
+                controller=name,
+                alias=alias,
+                tag=tag,
+                tag_start=m.start(),
+                inner_start=m.end(),
+                inner_end=inner_end,
+                parent=open_refs[-1].controller if open_refs else None,
+            )
+            refs.append(ref)
+            open_refs.append(ref)
+
+        return refs
+
+    # ── Lookups ───────────────────────────────────────────────────────────
+
+    def controllers(self) -> list[str]:
+        """Every controller name with a template source, in discovery order."""
+        return list(self._source_by_controller)
+
+    def source_for(self, controller: str):
+        """
+        RawTemplate whose HTML should be used for this controller: the file
+        the HTMLAnalyzer attributed to it, else the first file containing an
+        ng-controller for it (nested blocks and controllerAs included).
+        """
+        return self._source_by_controller.get(controller)
+
+    def owner_template(self, controller: str):
+        """First RawTemplate whose primary controller is this controller."""
+        return self._owner_by_controller.get(controller)
+
+    def controllers_in(self, template) -> list[str]:
+        """ng-controller names declared in a template, in document order."""
+        html = getattr(template, "raw_html", "") or ""
+        if id(template) in self._names_by_template:
+            return list(self._names_by_template[id(template)])
+        return NG_CONTROLLER_ATTR_RE.findall(html)
+
+    def refs(self, controller: str) -> list[TemplateRef]:
+        return list(self._refs_by_controller.get(controller, []))
+
+    def fragment_ref(self, controller: str, template=None) -> Optional[TemplateRef]:
+        """
+        First ng-controller element for this controller (case-insensitive,
+        like the template migrator), optionally restricted to one template.
+        """
+        if template is not None:
+            candidates = self._refs_by_template.get(id(template), [])
+        else:
+            candidates = [r for refs in self._refs_by_template.values() for r in refs]
+        wanted = controller.lower()
+        for ref in candidates:
+            if ref.controller.lower() == wanted:
+                return ref
+        return None
+
+    def nested_pairs(self) -> list[tuple[str, str]]:
+        """(parent_controller, child_controller) for nested ng-controller blocks."""
+        pairs: list[tuple[str, str]] = []
+        for refs in self._refs_by_template.values():
+            for ref in refs:
+                if ref.parent and (ref.parent, ref.controller) not in pairs:
+                    pairs.append((ref.parent, ref.controller))
+        return pairs
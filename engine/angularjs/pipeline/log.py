@@ -0,0 +1,69 @@
+"""
+pipeline/log.py
+
+Leveled logging for the pipeline.
+
+Every module logs through a child of the "evua" logger, named after the
+module's subsystem:
+
+    log = get_logger(__name__)
+    # pipeline.analysis.analyzers.js                      → evua.analysis.analyzers.js
+    # pipeline.transformation.rules.angularjs.route_migrator → evua.transformation.rules...
+
+Messages use logging's lazy %-formatting, so a debug line costs one level
+check unless debug output is enabled:
+
+    log.debug("[js.py] %s: self alias %r = this", name, alias)
+
+configure() installs a single console handler that prints the bare message
+to stdout — INFO and above by default, which is the console output users
+see. Debug output is enabled for everything with --verbose, or per
+subsystem with EVUA_DEBUG:
+
+    EVUA_DEBUG=analysis,transformation.rules.angularjs.route_migrator python cli.py ...
+"""
+
+import logging
+import os
+import sys
+
+
+ROOT = "evua"
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """Writes to whatever sys.stdout is at emit time, interleaved with print()."""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    def emit(self, record):
+        self.stream = sys.stdout
+        super().emit(record)
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    name = module_name
+    if name.startswith("pipeline."):
+        name = name[len("pipeline."):]
+    return logging.getLogger(f"{ROOT}.{name}")
+
+
+def configure(verbose: bool = False, debug_subsystems: str | None = None) -> logging.Logger:
+    """(Re)configure console logging. Safe to call more than once."""
+    root = logging.getLogger(ROOT)
+    for h in list(root.handlers):
+        if isinstance(h, _ConsoleHandler):
+            root.removeHandler(h)
+
+    handler = _ConsoleHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    root.addHandler(handler)
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    root.propagate = False
+
+    if debug_subsystems is None:
+        debug_subsystems = os.environ.get("EVUA_DEBUG", "")
+    for subsystem in filter(None, (s.strip() for s in debug_subsystems.split(","))):
+        logging.getLogger(f"{ROOT}.{subsystem}").setLevel(logging.DEBUG)
+    return root
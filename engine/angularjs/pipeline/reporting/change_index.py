@@ -0,0 +1,217 @@
+"""
+pipeline/reporting/change_index.py
+
+ChangeIndex — every per-change join the reports need, computed once per run.
+
+cli.run_pipeline builds one index after risk assessment and hands it to the
+risk summary, the report collections, JSONReporter and MarkdownReporter, so
+none of them re-scan the change list, the class list or analysis.http_calls
+per change. Everything here is a single pass over the changes plus dict
+lookups.
+
+Per change (ChangeEntry):
+  name            resolved entity: owning class, directive, or http call owner
+  class_name      owning class only ("unknown" otherwise) — the reporters' join
+  source_file     file of the owning class's module
+  risk / reason   verdict from the RiskResult (SAFE / default reason if absent)
+  rule            winning risk rule, when the RiskEngine recorded one
+  generated_file  bare file name parsed from the change reason, if any
+"""
+
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from pipeline.risk.levels import RiskLevel
+from pipeline.risk.result import RiskResult
+
+
+_GENERATED_FILE_RE = re.compile(r'^[\w.-]+\.(ts|html|js|css|json)$')
+
+
+def extract_generated_file(reason: str) -> Optional[str]:
+    if not reason:
+        return None
+    raw = None
+    for marker in ("written to ", "migrated into "):
+        if marker in reason:
+            raw = reason.split(marker, 1)[-1].strip()
+            break
+    if not raw:
+        return None
+    raw = re.sub(r'\s*\(.*\)\s*$', '', raw).strip()
+    fname = Path(raw).name
+    if _GENERATED_FILE_RE.match(fname):
+        return fname
+    return None
+
+
+@dataclass
+class ChangeEntry:
+    change:         Any
+    name:           str
+    class_name:     str
+    source_file:    str
+    risk:           Any             # RiskLevel (or whatever a legacy caller passed)
+    reason:         str
+    rule:           Optional[str]
+    generated_file: Optional[str]
+
+    @property
+    def id(self) -> str:
+        return self.change.id
+
+    @property
+    def is_synthetic(self) -> bool:
+        """Entries the summary lists skip: unresolved, template and routing changes."""
+        return (
+            self.name == "unknown"
+            or self.name.endswith("_html")
+            or self.name == "routing_module"
+        )
+
+
+class ChangeIndex:
+    def __init__(self, analysis, changes: list, risk=None):
+        # ── Entity lookups (built once) ───────────────────────────────────
+        self.class_name_by_id: dict[str, str] = {}
+        self.file_by_id:       dict[str, str] = {}
+        for m in getattr(analysis, "modules", []) or []:
+            for c in m.classes:
+                self.class_name_by_id[c.id] = c.name
+                self.file_by_id[c.id]       = m.name   # Module.name holds the file path
+
+        directive_name_by_id = {
+            d.id: d.name for d in getattr(analysis, "directives", []) or []
+        }
+
+        http_owner_by_id: dict[str, str] = {}
+        for call in getattr(analysis, "http_calls", []) or []:
+            cid   = getattr(call, "id", None)
+            owner = getattr(call, "owner_controller", None)
+            if cid is not None and owner and cid not in http_owner_by_id:
+                http_owner_by_id[cid] = owner
+
+        # ── Risk verdicts ─────────────────────────────────────────────────
+        if isinstance(risk, RiskResult):
+            risk_by_change   = risk.risk_by_change_id
+            reason_by_change = risk.reason_by_change_id
+            rule_by_change   = risk.rule_by_change_id
+        elif risk:
+            # Legacy (risk_by_change, reason_by_change) tuple
+            risk_by_change, reason_by_change = risk
+            rule_by_change = {}
+        else:
+            risk_by_change, reason_by_change, rule_by_change = {}, {}, {}
+        self.has_risk = risk is not None
+
+        # ── One pass over the changes ─────────────────────────────────────
+        self.entries: list[ChangeEntry] = []
+        self.by_id:   dict[str, ChangeEntry] = {}
+        self._first_reason_by_name: dict[str, str] = {}
+
+        for change in changes:
+            bid = change.before_id
+            name = (
+                self.class_name_by_id.get(bid)
+                or directive_name_by_id.get(bid)
+                or http_owner_by_id.get(bid)
+                or "unknown"
+            )
+            entry = ChangeEntry(
+                change=change,
+                name=name,
+                class_name=self.class_name_by_id.get(bid, "unknown"),
+                source_file=self.file_by_id.get(bid, "unknown"),
+                risk=risk_by_change.get(change.id, RiskLevel.SAFE),
+                reason=reason_by_change.get(change.id, ""),
+                rule=rule_by_change.get(change.id),
+                generated_file=extract_generated_file(getattr(change, "reason", "") or ""),
+            )
+            self.entries.append(entry)
+            self.by_id[change.id] = entry
+            if change.id in reason_by_change:
+                self._first_reason_by_name.setdefault(name, entry.reason)
+
+        self._raw_risk = risk_by_change
+        self._raw_reason = reason_by_change
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # ── Lookups ───────────────────────────────────────────────────────────
+
+    def risk_of(self, change_id: str, default: Any = "unknown") -> Any:
+        """Recorded verdict only — `default` when the risk stage gave none."""
+        return self._raw_risk.get(change_id, default)
+
+    def reason_of(self, change_id: str) -> str:
+        return self._raw_reason.get(change_id, "")
+
+    def first_reason(self, name: str) -> str:
+        """Risk reason of the first change resolving to this entity name."""
+        return self._first_reason_by_name.get(name, "")
+
+    # ── Aggregates ────────────────────────────────────────────────────────
+
+    def names_by_level(self) -> dict[str, list[str]]:
+        """
+        Entity names grouped by the level of their FIRST change, each name
+        listed once across all levels (the console risk summary).
+        """
+        groups: dict[str, list[str]] = {"MANUAL": [], "RISKY": [], "SAFE": []}
+        seen: set = set()
+        for e in self.entries:
+            if e.name == "unknown" or e.name in seen:
+                continue
+            seen.add(e.name)
+            groups[e.risk.value.upper()].append(e.name)
+        return groups
+
+    def report_collections(self) -> dict:
+        """
+        risk.by_level (a name may appear under several levels),
+        generated_files, auto_modernized and manual_required for the JSON report.
+        """
+        risk_by_level   = {"SAFE": [], "RISKY": [], "MANUAL": []}
+        seen_per_level  = {"SAFE": set(), "RISKY": set(), "MANUAL": set()}
+        generated_files: list[str] = []
+        seen_files:      set = set()
+        auto_modernized: list[str] = []
+        seen_auto:       set = set()
+        manual_required: list[str] = []
+        seen_manual:     set = set()
+
+        for e in self.entries:
+            key = e.risk.value.upper()
+
+            if e.generated_file and e.generated_file not in seen_files:
+                seen_files.add(e.generated_file)
+                generated_files.append(e.generated_file)
+
+            if e.is_synthetic:
+                continue
+
+            if e.name not in seen_per_level[key]:
+                seen_per_level[key].add(e.name)
+                risk_by_level[key].append(e.name)
+
+            if e.risk == RiskLevel.MANUAL:
+                if e.name not in seen_manual:
+                    seen_manual.add(e.name)
+                    manual_required.append(e.name)
+            else:
+                if e.name not in seen_auto:
+                    seen_auto.add(e.name)
+                    auto_modernized.append(e.name)
+
+        return {
+            "risk_by_level":   risk_by_level,
+            "generated_files": generated_files,
+            "auto_modernized": auto_modernized,
+            "manual_required": manual_required,
+        }
@@ -0,0 +1,146 @@
+"""
+pipeline/reporting/diff_collector.py
+
+Unified diffs between a shadow output tree (what --diff would write) and
+the committed output (what exists now).
+
+Most files in a re-run are identical to the committed ones, so files are
+compared cheaply first — size, then a streamed content hash — and only
+files that actually changed are read as text and diffed. Diffing is CPU
+bound, so large change sets are diffed in a process pool; small ones stay
+serial, where pool start-up would cost more than it saves.
+
+Files above max_bytes are not diffed at all: their entry carries a one-line
+"diff omitted" marker instead, so one huge bundle cannot stall the run or
+flood the console.
+
+    diffs = collect_diffs(out_dir, shadow_dir)
+    write_patch(Path("changes.patch"), diffs)   # git apply / patch -p1 compatible
+"""
+
+import difflib
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+
+DIFF_SIZE_CAP      = 1_000_000   # bytes — larger files get a marker, not a diff
+PARALLEL_MIN_BYTES = 1_000_000   # below this much changed text, diff serially
+_CHUNK             = 1 << 16
+
+
+@dataclass
+class FileDiff:
+    file:      str            # path relative to the output root
+    diff:      str            # unified diff text (or the omitted marker)
+    is_new:    bool
+    truncated: bool = False   # True when the file exceeded the size cap
+
+
+# ── Fast path ──────────────────────────────────────────────────────────────
+
+def _digest(path: Path) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def _unchanged(shadow_file: Path, real_file: Path, shadow_size: int) -> bool:
+    try:
+        if real_file.stat().st_size != shadow_size:
+            return False
+    except OSError:
+        return False                      # missing → new file
+    return _digest(shadow_file) == _digest(real_file)
+
+
+# ── Diffing (runs in worker processes) ─────────────────────────────────────
+
+def _unified_diff(before_text: str, after_text: str, rel: str, is_new: bool) -> str:
+    out = []
+    for line in difflib.unified_diff(
+        before_text.splitlines(keepends=True),
+        after_text.splitlines(keepends=True),
+        fromfile="/dev/null" if is_new else f"a/{rel}",
+        tofile=f"b/{rel}",
+    ):
+        out.append(line)
+        if not line.endswith("\n"):
+            out.append("\n\\ No newline at end of file\n")
+    return "".join(out)
+
+
+def _diff_one(job: tuple) -> FileDiff | None:
+    shadow_path, real_path, rel, max_bytes = job
+    shadow_file, real_file = Path(shadow_path), Path(real_path)
+    is_new = not real_file.exists()
+
+    size = max(shadow_file.stat().st_size, 0 if is_new else real_file.stat().st_size)
+    if size > max_bytes:
+        return FileDiff(
+            file=rel,
+            diff=f"# {rel}: diff omitted ({size} bytes exceeds the {max_bytes} byte limit)\n",
+            is_new=is_new,
+            truncated=True,
+        )
+
+    after_text  = shadow_file.read_text(encoding="utf-8", errors="replace")
+    before_text = "" if is_new else real_file.read_text(encoding="utf-8", errors="replace")
+    if before_text == after_text:
+        return None
+    return FileDiff(file=rel, diff=_unified_diff(before_text, after_text, rel, is_new), is_new=is_new)
+
+
+# ── Public API ─────────────────────────────────────────────────────────────
+
+def collect_diffs(
+    out_dir: Path,
+    shadow_dir: Path,
+    max_bytes: int = DIFF_SIZE_CAP,
+    workers: int | None = None,
+) -> list[FileDiff]:
+    """
+    Diff every file under shadow_dir against its counterpart under out_dir.
+    Unchanged files are skipped; results are sorted by path.
+    """
+    out_dir, shadow_dir = Path(out_dir), Path(shadow_dir)
+    jobs, job_bytes = [], 0
+    for shadow_file in sorted(shadow_dir.rglob("*")):
+        if not shadow_file.is_file():
+            continue
+        rel       = shadow_file.relative_to(shadow_dir)
+        real_file = out_dir / rel
+        size      = shadow_file.stat().st_size
+        if _unchanged(shadow_file, real_file, size):
+            continue
+        jobs.append((str(shadow_file), str(real_file), rel.as_posix(), max_bytes))
+        job_bytes += min(size, max_bytes)
+
+    workers = workers or min(len(jobs), os.cpu_count() or 1)
+    results = None
+    if workers > 1 and job_bytes >= PARALLEL_MIN_BYTES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_diff_one, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+        except (OSError, BrokenProcessPool):
+            results = None                # no usable pool here → serial
+    if results is None:
+        results = [_diff_one(job) for job in jobs]
+    return [d for d in results if d is not None]
+
+
+def write_patch(path: Path, diffs: list[FileDiff]) -> Path:
+    """Write all diffs as one patch file (moved into place when complete)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8", newline="\n") as fp:
+        for d in diffs:
+            fp.write(d.diff)
+    os.replace(tmp, path)
+    return path
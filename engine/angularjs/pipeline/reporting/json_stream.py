@@ -0,0 +1,123 @@
+"""
+pipeline/reporting/json_stream.py
+
+Incremental writers for the JSON run report.
+
+The report is a flat top-level object whose only large member is the
+"changes" list. Instead of assembling the whole report as nested dicts,
+dumping it to one string and writing that, the writer emits the object
+section by section straight to the file: small sections are dumped as they
+come, and a StreamedList section is written one element at a time, so the
+full change list never exists as JSON-ready data in memory.
+
+Output is byte-for-byte what json.dumps(report, indent=2, ensure_ascii=False)
+would have produced for the same sections.
+
+    sections = {"angular_workspace": "...", "changes": StreamedList(make_rows)}
+    write_json_report(path, sections)            # .evua_report.json
+    write_ndjson(path, StreamedList(make_rows))  # one change per line
+
+Files are written to a temp sibling and moved into place, so a failure
+mid-stream never leaves a truncated report behind.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+
+class StreamedList:
+    """
+    A report list produced lazily. `factory` is called on every iteration,
+    so the same section can be streamed more than once (--ndjson writes the
+    change list again after .evua_report.json).
+    """
+
+    def __init__(self, factory: Callable[[], Iterable[Any]]):
+        self._factory = factory
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._factory())
+
+
+def _dump(value: Any, indent: int, level: int) -> str:
+    text = json.dumps(value, indent=indent, ensure_ascii=False)
+    if level and "\n" in text:
+        text = text.replace("\n", "\n" + " " * (indent * level))
+    return text
+
+
+class JSONObjectWriter:
+    """Writes one top-level JSON object member by member."""
+
+    def __init__(self, fp: TextIO, indent: int = 2):
+        self.fp      = fp
+        self.indent  = indent
+        self._count  = 0
+        self._closed = False
+
+    def _key(self, key: str) -> None:
+        pad = " " * self.indent
+        self.fp.write(("{\n" if self._count == 0 else ",\n") + pad)
+        self.fp.write(json.dumps(key, ensure_ascii=False) + ": ")
+        self._count += 1
+
+    def write(self, key: str, value: Any) -> None:
+        if isinstance(value, StreamedList):
+            self.write_stream(key, value)
+            return
+        self._key(key)
+        self.fp.write(_dump(value, self.indent, 1))
+
+    def write_stream(self, key: str, items: Iterable[Any]) -> None:
+        self._key(key)
+        outer = " " * self.indent
+        inner = " " * (self.indent * 2)
+        n = 0
+        for item in items:
+            self.fp.write(("[\n" if n == 0 else ",\n") + inner)
+            self.fp.write(_dump(item, self.indent, 2))
+            n += 1
+        self.fp.write("[]" if n == 0 else "\n" + outer + "]")
+
+    def close(self) -> None:
+        if not self._closed:
+            self.fp.write("{}" if self._count == 0 else "\n}")
+            self._closed = True
+
+
+def _atomic_write(path: Path, write: Callable[[TextIO], None]) -> None:
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8", errors="replace") as fp:
+            write(fp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def write_json_report(path: Path, sections: dict) -> None:
+    """Stream `sections` (in insertion order) as one JSON object to path."""
+    def _write(fp):
+        writer = JSONObjectWriter(fp)
+        for key, value in sections.items():
+            writer.write(key, value)
+        writer.close()
+    _atomic_write(path, _write)
+
+
+def write_ndjson(path: Path, rows: Iterable[Any]) -> int:
+    """One compact JSON document per line. Returns the number of rows."""
+    count = 0
+
+    def _write(fp):
+        nonlocal count
+        for row in rows:
+            fp.write(json.dumps(row, ensure_ascii=False))
+            fp.write("\n")
+            count += 1
+    _atomic_write(path, _write)
+    return count
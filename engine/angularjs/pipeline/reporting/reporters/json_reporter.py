@@ -1,5 +1,21 @@
-import json
-from pipeline.risk.result import RiskResult
+import io
+
+from pipeline.reporting.change_index import ChangeIndex
+from pipeline.reporting.json_stream import JSONObjectWriter, StreamedList
+
+
+def _extract_output_path(reason: str):
+    if not reason:
+        return None
+    if "Written:" in reason:
+        return reason.split("Written:", 1)[-1].strip()
+    if "Migrating:" in reason:
+        return reason.split("Migrating:", 1)[-1].strip()
+    if "wired into Angular app at " in reason:
+        return reason.split("wired into Angular app at ")[-1]
+    if "files:" in reason:
+        return reason.split("files:")[-1].strip()
+    return None
 
 
 class JSONReporter:
@@ -16,69 +32,68 @@ class JSONReporter:
             return {k: self._to_json_safe(v) for k, v in obj.__dict__.items()}
         return str(obj)
 
-    def render(self, analysis, patterns, transformation, risk, validation=None):
-        # risk is a RiskResult dataclass — not a tuple
-        if isinstance(risk, RiskResult):
-            risk_by_change    = risk.risk_by_change_id
-            reason_by_change  = risk.reason_by_change_id
-        else:
-            # Graceful fallback for legacy callers passing (dict, dict) tuple
-            risk_by_change, reason_by_change = risk
+    def render(self, analysis, patterns, transformation, risk, validation=None, index=None):
+        """The whole report as one JSON string (small runs, tests)."""
+        buf = io.StringIO()
+        writer = JSONObjectWriter(buf)
+        for key, value in self.sections(analysis, patterns, transformation, risk,
+                                         validation, index).items():
+            writer.write(key, value)
+        writer.close()
+        return buf.getvalue()
 
-        id_to_name = {}
-        id_to_file = {}
-        for m in analysis.modules:
-            for c in m.classes:
-                id_to_name[c.id] = c.name
-                id_to_file[c.id] = m.name   # Module.name holds the file path
+    def sections(self, analysis, patterns, transformation, risk, validation=None, index=None):
+        """
+        Top-level report sections in output order. "changes" is a StreamedList,
+        rendered row by row when the report is written; everything else is
+        already JSON-safe.
+        """
+        # Per-change names, files and risk verdicts come from the run's
+        # ChangeIndex; build one for callers that don't pass it.
+        if index is None:
+            index = ChangeIndex(analysis, transformation.changes, risk)
 
-        def extract_output_path(reason: str):
-            if not reason:
-                return None
-            if "Written:" in reason:
-                return reason.split("Written:", 1)[-1].strip()
-            if "Migrating:" in reason:
-                return reason.split("Migrating:", 1)[-1].strip()
-            if "wired into Angular app at " in reason:
-                return reason.split("wired into Angular app at ")[-1]
-            if "files:" in reason:
-                return reason.split("files:")[-1].strip()
-            return None
+        # Rows carry the validation flags as of this call, even if the caller
+        # keeps updating its validation dict before the rows are streamed
+        row_validation = {
+            k: validation.get(k) for k in ("tests_passed", "snapshot_passed", "tsc_passed")
+        } if validation else None
 
-        report = {
+        return {
             "angular_workspace": "out/angular-app",
             "controllers": [
                 {
                     "id": cid,
-                    "name": id_to_name.get(cid, "unknown"),
-                    "file": id_to_file.get(cid, "unknown"),
+                    "name": index.class_name_by_id.get(cid, "unknown"),
+                    "file": index.file_by_id.get(cid, "unknown"),
                 }
                 for cid in patterns.roles_by_node.keys()
             ],
-            "changes": [
-                {
-                    "before_id":      c.before_id,
-                    "before_name":    id_to_name.get(c.before_id, "unknown"),
-                    "source_file":    id_to_file.get(c.before_id, "unknown"),
-                    "after_id":       c.after_id,
-                    "reason":         c.reason,
-                    "output_path":    extract_output_path(c.reason),
-                    "risk":           str(risk_by_change.get(c.id, "unknown")),
-                    "risk_reason":    reason_by_change.get(c.id, ""),
-                    "build_passed":   validation.get("tests_passed")    if validation else None,
-                    "snapshot_passed":validation.get("snapshot_passed") if validation else None,
-                    "tsc_passed":     validation.get("tsc_passed")      if validation else None,
-                }
-                for c in transformation.changes
-            ],
-            "validation": validation or {},
-            "tsc_validation": {
+            "changes": StreamedList(lambda: self.change_rows(index, row_validation)),
+            "validation": self._to_json_safe(validation or {}),
+            "tsc_validation": self._to_json_safe({
                 "passed":        (validation or {}).get("tsc_passed"),
                 "error_count":   len((validation or {}).get("tsc_errors", [])),
                 "error_summary": (validation or {}).get("tsc_summary", "not run"),
                 "tsc_found":     (validation or {}).get("tsc_found"),
                 "errors":        (validation or {}).get("tsc_errors", [])[:20],
-            },
+            }),
         }
 
-        return json.dumps(self._to_json_safe(report), indent=2, ensure_ascii=False)
\ No newline at end of file
+    def change_rows(self, index, validation=None):
+        """One JSON-safe dict per change, generated on demand."""
+        for e in index:
+            yield self._to_json_safe({
+                "before_id":      e.change.before_id,
+                "before_name":    e.class_name,
+                "source_file":    e.source_file,
+                "after_id":       e.change.after_id,
+                "reason":         e.change.reason,
+                "output_path":    _extract_output_path(e.change.reason),
+                "risk":           str(index.risk_of(e.id, "unknown")),
+                "risk_reason":    index.reason_of(e.id),
+                "risk_rule":      e.rule,
+                "build_passed":   validation.get("tests_passed")    if validation else None,
+                "snapshot_passed":validation.get("snapshot_passed") if validation else None,
+                "tsc_passed":     validation.get("tsc_passed")      if validation else None,
+            })
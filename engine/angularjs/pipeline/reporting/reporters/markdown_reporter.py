@@ -1,22 +1,11 @@
-from pipeline.risk.result import RiskResult
+from pipeline.reporting.change_index import ChangeIndex
 
 
 class MarkdownReporter:
-    def render(self, analysis, patterns, transformation, risk, validation=None):
-        # risk is a RiskResult dataclass — not a tuple
-        if isinstance(risk, RiskResult):
-            risk_by_change   = risk.risk_by_change_id
-            reason_by_change = risk.reason_by_change_id
-        else:
-            # Graceful fallback for legacy callers passing (dict, dict) tuple
-            risk_by_change, reason_by_change = risk
-
-        id_to_name = {}
-        id_to_file = {}
-        for m in analysis.modules:
-            for c in m.classes:
-                id_to_name[c.id] = c.name
-                id_to_file[c.id] = m.name   # Module.name holds the file path
+    def render(self, analysis, patterns, transformation, risk, validation=None, index=None):
+        # Joins come from the run's ChangeIndex (built here if not passed)
+        if index is None:
+            index = ChangeIndex(analysis, transformation.changes, risk)
 
         def extract_output_path(reason: str):
             if not reason:
@@ -33,17 +22,17 @@ class MarkdownReporter:
 
         lines.append("## Controllers Detected")
         for cid in patterns.roles_by_node.keys():
-            name = id_to_name.get(cid, "unknown")
-            file = id_to_file.get(cid, "unknown")
+            name = index.class_name_by_id.get(cid, "unknown")
+            file = index.file_by_id.get(cid, "unknown")
             lines.append(f"- **{name}** (`{file}`)")
 
         lines.append("\n## Proposed Changes")
-        for c in transformation.changes:
-            name       = id_to_name.get(c.before_id, "unknown")
-            file       = id_to_file.get(c.before_id, "unknown")
-            risk_level = risk_by_change.get(c.id, "unknown")
-            reason     = reason_by_change.get(c.id, "")
-            out_path   = extract_output_path(c.reason)
+        for e in index:
+            name       = e.class_name
+            file       = e.source_file
+            risk_level = index.risk_of(e.id, "unknown")
+            reason     = index.reason_of(e.id)
+            out_path   = extract_output_path(e.change.reason)
 
             build    = validation.get("tests_passed")    if validation else None
             snapshot = validation.get("snapshot_passed") if validation else None
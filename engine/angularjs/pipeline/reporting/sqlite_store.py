@@ -0,0 +1,207 @@
+"""
+pipeline/reporting/sqlite_store.py
+
+Indexed SQLite copy of the run report (reports/<project>/.evua_report.sqlite).
+
+The JSON report is the full record of a run; this store holds the same
+per-change data in tables so the backend can answer paginated, filtered
+queries ("MANUAL changes in file X", "top 50 riskiest files") without
+loading or shipping the whole report.
+
+Tables (shared with engine/php/report_store.py — keep SCHEMA in sync):
+
+    meta               key / value (engine, project, schema version, summary JSON)
+    files              one row per source file, with aggregated risk
+    changes            one row per proposed change
+    risk               verdict per change (level, score, reason, rule)
+    ai_items           AI hand-off items (not produced by this engine)
+    validation_errors  tsc errors and validation failures
+
+Rows are inserted straight from the ChangeIndex; the store is built in a
+temp file and moved into place, so readers never see a half-written db.
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pipeline.reporting.change_index import ChangeIndex
+
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE files (
+    id           INTEGER PRIMARY KEY,
+    path         TEXT NOT NULL UNIQUE,
+    risk_level   TEXT,
+    risk_score   REAL,
+    change_count INTEGER DEFAULT 0,
+    manual_count INTEGER DEFAULT 0,
+    risky_count  INTEGER DEFAULT 0
+);
+CREATE TABLE changes (
+    id             INTEGER PRIMARY KEY,
+    change_id      TEXT,
+    file_id        INTEGER REFERENCES files(id),
+    name           TEXT,
+    kind           TEXT,
+    line           INTEGER,
+    before_id      TEXT,
+    after_id       TEXT,
+    reason         TEXT,
+    generated_file TEXT,
+    automatable    INTEGER
+);
+CREATE TABLE risk (
+    change_id INTEGER PRIMARY KEY REFERENCES changes(id),
+    level     TEXT NOT NULL,
+    score     REAL,
+    reason    TEXT,
+    rule      TEXT
+);
+CREATE TABLE ai_items (
+    id           INTEGER PRIMARY KEY,
+    item_id      TEXT,
+    file_id      INTEGER REFERENCES files(id),
+    description  TEXT,
+    concern      TEXT,
+    code_snippet TEXT,
+    response     TEXT
+);
+CREATE TABLE validation_errors (
+    id      INTEGER PRIMARY KEY,
+    source  TEXT,
+    file    TEXT,
+    line    INTEGER,
+    col     INTEGER,
+    code    TEXT,
+    message TEXT
+);
+CREATE INDEX idx_changes_file  ON changes(file_id);
+CREATE INDEX idx_changes_name  ON changes(name);
+CREATE INDEX idx_risk_level    ON risk(level);
+CREATE INDEX idx_files_risk    ON files(risk_score DESC);
+CREATE INDEX idx_ai_items_file ON ai_items(file_id);
+CREATE INDEX idx_verr_source   ON validation_errors(source);
+"""
+
+# Level → sortable score, used for per-file aggregation and "riskiest" queries
+LEVEL_SCORE = {"SAFE": 0.0, "RISKY": 0.5, "MANUAL": 1.0}
+
+
+def _level(risk) -> str:
+    value = getattr(risk, "value", risk)
+    return str(value).upper()
+
+
+def _kind(generated_file) -> str | None:
+    """Artifact kind from the generated file name: users.component.ts → component."""
+    if not generated_file:
+        return None
+    parts = generated_file.split(".")
+    return parts[-2] if len(parts) > 2 else parts[-1]
+
+
+def _insert_validation_errors(db, validation: dict) -> None:
+    db.execute("DELETE FROM validation_errors")
+    rows = [
+        ("tsc", e.get("file"), e.get("line"), e.get("col"), e.get("code"), e.get("message"))
+        for e in validation.get("tsc_errors", []) or []
+        if isinstance(e, dict)
+    ]
+    rows += [
+        ("validation", None, None, None, None, str(f))
+        for f in validation.get("failures", []) or []
+    ]
+    db.executemany(
+        "INSERT INTO validation_errors (source, file, line, col, code, message) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        rows,
+    )
+
+
+def write_report_store(
+    path: Path,
+    index: ChangeIndex,
+    project: str,
+    summary: dict,
+    validation: dict | None = None,
+) -> Path:
+    """Build the store for one run from its ChangeIndex. Returns the db path."""
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+
+    db = sqlite3.connect(tmp)
+    try:
+        db.executescript(SCHEMA)
+
+        # ── Files: aggregate per source file in one pass ───────────────────
+        file_ids: dict[str, int] = {}
+        stats:    dict[str, list] = {}     # path → [worst score, count, manual, risky]
+        for e in index:
+            if e.source_file == "unknown":
+                continue
+            level = _level(e.risk)
+            s = stats.setdefault(e.source_file, [0.0, 0, 0, 0])
+            s[0] = max(s[0], LEVEL_SCORE.get(level, 0.0))
+            s[1] += 1
+            s[2] += level == "MANUAL"
+            s[3] += level == "RISKY"
+        score_level = {v: k for k, v in LEVEL_SCORE.items()}
+        for file_path, (score, count, manual, risky) in stats.items():
+            cur = db.execute(
+                "INSERT INTO files (path, risk_level, risk_score, change_count, manual_count, risky_count) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (file_path, score_level.get(score, "SAFE"), score, count, manual, risky),
+            )
+            file_ids[file_path] = cur.lastrowid
+
+        # ── Changes + risk ────────────────────────────────────────────────
+        for e in index:
+            level = _level(e.risk)
+            cur = db.execute(
+                "INSERT INTO changes (change_id, file_id, name, kind, line, before_id, "
+                "after_id, reason, generated_file, automatable) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    e.id,
+                    file_ids.get(e.source_file),
+                    e.name,
+                    _kind(e.generated_file),
+                    None,
+                    e.change.before_id,
+                    e.change.after_id,
+                    e.change.reason,
+                    e.generated_file,
+                    int(level != "MANUAL"),
+                ),
+            )
+            db.execute(
+                "INSERT INTO risk (change_id, level, score, reason, rule) VALUES (?, ?, ?, ?, ?)",
+                (cur.lastrowid, level, LEVEL_SCORE.get(level), e.reason, e.rule),
+            )
+
+        _insert_validation_errors(db, validation or {})
+
+        meta = {
+            "engine":         "angularjs",
+            "project":        project,
+            "schema_version": str(SCHEMA_VERSION),
+            "created_at":     datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            "summary":        json.dumps(summary, ensure_ascii=False, default=str),
+        }
+        db.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", meta.items())
+        db.commit()
+    finally:
+        db.close()
+
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,154 @@
+"""
+pipeline/risk/engine.py
+
+Single-pass risk evaluation.
+
+Risk rules are registered with an explicit precedence instead of relying on
+"last rule to write a change id wins". For every change the engine asks the
+rules in precedence order (highest first, registration order on ties) and
+the first rule that returns a verdict decides the change's level and reason.
+Lower-precedence rules are not evaluated for that change.
+
+Per-change rules implement
+
+    evaluate(change, ctx) -> (RiskLevel, reason) | None
+
+Change-emitting rules (DirectiveRiskRule) implement
+
+    emit(ctx) -> [(Change, RiskLevel, reason), ...]
+
+and run after the per-change pass; the changes they emit are appended to
+the transformation and take the verdict they were emitted with.
+
+Shared indexes (class by id, roles by node) are built once per assessment
+in RiskContext and handed to every rule.
+
+Precedence of the built-in rules (mirrors the old sequential order, where
+each later rule overwrote the earlier ones):
+
+    WatcherRiskRule          30
+    TemplateBindingRiskRule  20
+    ServiceRiskRule          10
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from .levels import RiskLevel
+from .result import RiskResult
+
+
+DEFAULT_REASON = "No specific risk pattern detected"
+
+
+@dataclass
+class RiskContext:
+    analysis:       Any
+    patterns:       Any
+    transformation: Any
+    class_by_id:    dict = field(default_factory=dict)
+    roles_by_node:  dict = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, analysis, patterns, transformation) -> "RiskContext":
+        class_by_id = {
+            c.id: c
+            for m in getattr(analysis, "modules", []) or []
+            for c in m.classes
+        }
+        return cls(
+            analysis=analysis,
+            patterns=patterns,
+            transformation=transformation,
+            class_by_id=class_by_id,
+            roles_by_node=getattr(patterns, "roles_by_node", {}) or {},
+        )
+
+
+@dataclass
+class RuleStats:
+    evaluated: int = 0
+    matched:   int = 0     # returned a verdict (always the winning one)
+
+
+class RiskEngine:
+    def __init__(self, rules: list):
+        # Stable sort: equal precedence keeps registration order
+        self.rules = sorted(rules, key=lambda r: -getattr(r, "precedence", 0))
+        self.change_rules = [r for r in self.rules if hasattr(r, "evaluate")]
+        self.emit_rules   = [r for r in self.rules if hasattr(r, "emit")]
+        self.stats: dict[str, RuleStats] = {
+            type(r).__name__: RuleStats() for r in self.rules
+        }
+
+    def assess(self, analysis, patterns, transformation) -> RiskResult:
+        ctx = RiskContext.build(analysis, patterns, transformation)
+
+        risk_by_change:   dict = {}
+        reason_by_change: dict = {}
+        rule_by_change:   dict = {}
+
+        for change in transformation.changes:
+            for rule in self.change_rules:
+                name = type(rule).__name__
+                self.stats[name].evaluated += 1
+                verdict = rule.evaluate(change, ctx)
+                if verdict is None:
+                    continue
+                self.stats[name].matched += 1
+                risk_by_change[change.id], reason_by_change[change.id] = verdict
+                rule_by_change[change.id] = name
+                break
+
+        for rule in self.emit_rules:
+            name = type(rule).__name__
+            for change, level, reason in rule.emit(ctx):
+                self.stats[name].evaluated += 1
+                self.stats[name].matched += 1
+                transformation.changes.append(change)
+                risk_by_change[change.id]   = level
+                reason_by_change[change.id] = reason
+                rule_by_change[change.id]   = name
+
+        for change in transformation.changes:
+            if change.id not in risk_by_change:
+                risk_by_change[change.id]   = RiskLevel.SAFE
+                reason_by_change[change.id] = DEFAULT_REASON
+                rule_by_change[change.id]   = "default"
+
+        return RiskResult(
+            risk_by_change_id=risk_by_change,
+            reason_by_change_id=reason_by_change,
+            rule_by_change_id=rule_by_change,
+            rule_stats={
+                name: {"evaluated": s.evaluated, "matched": s.matched}
+                for name, s in self.stats.items()
+            },
+        )
+
+    def summary(self) -> str:
+        return ", ".join(
+            f"{name} {s.matched}/{s.evaluated}" for name, s in self.stats.items()
+        )
+
+
+def assess_with(rule, analysis, patterns, transformation, ctx: Optional[RiskContext] = None):
+    """
+    Legacy assess() for a single rule: (risk_by_change_id, reason_by_change_id)
+    covering just the verdicts this rule would give on its own.
+    """
+    ctx = ctx or RiskContext.build(analysis, patterns, transformation)
+    risk_by_change:   dict = {}
+    reason_by_change: dict = {}
+    if hasattr(rule, "evaluate"):
+        for change in transformation.changes:
+            verdict = rule.evaluate(change, ctx)
+            if verdict is not None:
+                risk_by_change[change.id], reason_by_change[change.id] = verdict
+    if hasattr(rule, "emit"):
+        for change, level, reason in rule.emit(ctx):
+            if hasattr(transformation, "changes"):
+                transformation.changes.append(change)
+            risk_by_change[change.id]   = level
+            reason_by_change[change.id] = reason
+    return risk_by_change, reason_by_change
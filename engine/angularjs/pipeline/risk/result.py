@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict
 from .levels import RiskLevel
 
@@ -6,3 +6,5 @@ from .levels import RiskLevel
 class RiskResult:
     risk_by_change_id: Dict[str, RiskLevel]        # Change.id → RiskLevel
     reason_by_change_id: Dict[str, str]            # Change.id → explanation
+    rule_by_change_id: Dict[str, str] = field(default_factory=dict)   # Change.id → winning rule
+    rule_stats: Dict[str, dict] = field(default_factory=dict)         # rule → {evaluated, matched}
@@ -1,6 +1,8 @@
 from pipeline.risk.levels import RiskLevel
+from pipeline.risk.engine import assess_with
 from pipeline.patterns.roles import SemanticRole
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.project_index import record_file
 from pipeline.transformation.result import TransformationResult
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
@@ -21,21 +23,21 @@ class DirectiveRiskRule:
       - manual_required list in the report
       - generated_files (a stub .directive-stub.ts per directive)
 
-    It runs ALONGSIDE the risk rules (assess() interface), but also
-    writes stub files so the harness sees the directive was acknowledged.
+    It runs in the RiskEngine as a change-emitting rule (emit() interface)
+    after the per-change pass, and also writes stub files so the harness
+    sees the directive was acknowledged.
     """
 
     def __init__(self, out_dir="out/angular-app"):
         self.app_dir = Path(out_dir) / "src" / "app"
 
-    def assess(self, analysis, patterns, transformation):
-        risk_by_change   = {}
-        reason_by_change = {}
+    def emit(self, ctx):
+        emitted = []
 
-        directives = getattr(analysis, "directives", []) or []
+        directives = getattr(ctx.analysis, "directives", []) or []
 
         if not directives:
-            return risk_by_change, reason_by_change
+            return emitted
 
         self.app_dir.mkdir(parents=True, exist_ok=True)
 
@@ -85,6 +87,7 @@ class DirectiveRiskRule:
                     f"}}\n"
                 )
                 stub_path.write_text(stub_content, encoding="utf-8")
+                record_file(stub_path, stub_content)
 
             # Emit a synthetic Change so cli.py captures this directive
             # before_id uses the directive's id so _resolve_name returns the name
@@ -96,11 +99,10 @@ class DirectiveRiskRule:
                 reason=f"AngularJS directive '{name}' requires manual migration written to {stub_path}",
             )
 
-            # Register in transformation so cli.py sees it
-            if hasattr(transformation, "changes"):
-                transformation.changes.append(change)
+            # The RiskEngine registers it in transformation so cli.py sees it
+            emitted.append((change, RiskLevel.MANUAL, reason))
 
-            risk_by_change[change.id]   = RiskLevel.MANUAL
-            reason_by_change[change.id] = reason
+        return emitted
 
-        return risk_by_change, reason_by_change
\ No newline at end of file
+    def assess(self, analysis, patterns, transformation):
+        return assess_with(self, analysis, patterns, transformation)
\ No newline at end of file
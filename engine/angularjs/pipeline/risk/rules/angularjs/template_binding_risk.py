@@ -1,4 +1,5 @@
 from pipeline.risk.levels import RiskLevel
+from pipeline.risk.engine import assess_with
 from pipeline.patterns.roles import SemanticRole
 
 
@@ -11,36 +12,32 @@ class TemplateBindingRiskRule:
     Only complex combinations — where bidirectional event handling is coupled with
     structural bindings — suggest non-trivial template migration.
 
-    Rule priority: this rule runs before WatcherRiskRule.
-    WatcherRiskRule runs last and will override any RISKY set here with its own
-    assessment, so false positives from template bindings don't persist.
+    Rule priority: WatcherRiskRule has higher precedence in the RiskEngine and
+    always gives a verdict, so its assessment wins over any RISKY set here and
+    false positives from template bindings don't persist.
     """
 
+    precedence = 20
+
+    def evaluate(self, change, ctx):
+        roles = ctx.roles_by_node.get(change.before_id, [])
+
+        has_template_binding = SemanticRole.TEMPLATE_BINDING in roles
+        has_event_handler    = SemanticRole.EVENT_HANDLER in roles
+
+        if has_template_binding and has_event_handler:
+            # Bidirectional binding + event handling suggests complex
+            # two-way data flow that may not map cleanly to Angular.
+            # Flag RISKY (not MANUAL — WatcherRiskRule handles hard MANUAL cases).
+            return RiskLevel.RISKY, (
+                "Template has both structural bindings and event handlers "
+                "(verify two-way data flow after migration)"
+            )
+
+        # TEMPLATE_BINDING alone = ng-repeat/ng-if/ng-show etc.
+        # These are safe mechanical migrations — do NOT flag as RISKY.
+        # EVENT_HANDLER alone = (click) bindings — also straightforward.
+        return RiskLevel.SAFE, "Template bindings are safe mechanical migrations"
+
     def assess(self, analysis, patterns, transformation):
-        risk_by_change   = {}
-        reason_by_change = {}
-
-        for change in transformation.changes:
-            roles = patterns.roles_by_node.get(change.before_id, [])
-
-            has_template_binding = SemanticRole.TEMPLATE_BINDING in roles
-            has_event_handler    = SemanticRole.EVENT_HANDLER in roles
-
-            if has_template_binding and has_event_handler:
-                # Bidirectional binding + event handling suggests complex
-                # two-way data flow that may not map cleanly to Angular.
-                # Flag RISKY (not MANUAL — WatcherRiskRule handles hard MANUAL cases).
-                risk_by_change[change.id]   = RiskLevel.RISKY
-                reason_by_change[change.id] = (
-                    "Template has both structural bindings and event handlers "
-                    "(verify two-way data flow after migration)"
-                )
-
-            else:
-                # TEMPLATE_BINDING alone = ng-repeat/ng-if/ng-show etc.
-                # These are safe mechanical migrations — do NOT flag as RISKY.
-                # EVENT_HANDLER alone = (click) bindings — also straightforward.
-                risk_by_change[change.id]   = RiskLevel.SAFE
-                reason_by_change[change.id] = "Template bindings are safe mechanical migrations"
-
-        return risk_by_change, reason_by_change
\ No newline at end of file
+        return assess_with(self, analysis, patterns, transformation)
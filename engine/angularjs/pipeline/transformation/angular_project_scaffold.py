@@ -2,6 +2,12 @@ from pathlib import Path
 import json
 import textwrap
 
+from pipeline.transformation.artifact_manifest import record_artifact
+from pipeline.transformation.project_index import record_file
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
+
 
 class AngularProjectScaffold:
     def __init__(self, root="out/angular-app"):
@@ -11,6 +17,10 @@ class AngularProjectScaffold:
 
     def _write_if_changed(self, path: Path, content: str):
         path.parent.mkdir(parents=True, exist_ok=True)
+        if path.parent == self.app_dir:
+            record_artifact(path, content)
+        else:
+            record_file(path, content)
         if path.exists():
             old = path.read_text(encoding="utf-8")
             if old == content:
@@ -36,10 +46,10 @@ class AngularProjectScaffold:
         all_ok = True
         for p in expected:
             if not p.exists():
-                print(f"[Scaffold] MISSING expected file: {p}")
+                log.debug("[Scaffold] MISSING expected file: %s", p)
                 all_ok = False
         if all_ok:
-            print("[Scaffold] All scaffold files present")
+            log.debug("[Scaffold] All scaffold files present")
         return all_ok
 
     def ensure(self):
@@ -251,7 +261,7 @@ class AngularProjectScaffold:
             self.check_integrity()
             
         except Exception as e:
-            print(f"[Scaffold] ERROR in ensure(): {e}")
+            log.warning("[Scaffold] ERROR in ensure(): %s", e)
             import traceback
             traceback.print_exc()
             raise
\ No newline at end of file
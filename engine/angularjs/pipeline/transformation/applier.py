@@ -31,6 +31,10 @@ Typical rule pipeline:
 The applier simply executes them and aggregates the Change objects.
 """
 
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
+
 
 class RuleApplier:
     def __init__(self, rules):
@@ -57,10 +61,10 @@ class RuleApplier:
             All changes produced by transformation rules.
         """
 
-        print(f"\n[TRANSFORM] RuleApplier.apply_all() -- {len(self.rules)} rules registered")
-        print(f"[TRANSFORM] patterns.roles_by_node size: {len(getattr(patterns, 'roles_by_node', {}))}")
-        print(f"[TRANSFORM] analysis.modules count: {len(getattr(analysis, 'modules', []))}")
-        print(f"[TRANSFORM] analysis.http_calls count: {len(getattr(analysis, 'http_calls', []))}")
+        log.debug("\n[TRANSFORM] RuleApplier.apply_all() -- %s rules registered", len(self.rules))
+        log.debug("[TRANSFORM] patterns.roles_by_node size: %s", len(getattr(patterns, 'roles_by_node', {})))
+        log.debug("[TRANSFORM] analysis.modules count: %s", len(getattr(analysis, 'modules', [])))
+        log.debug("[TRANSFORM] analysis.http_calls count: %s", len(getattr(analysis, 'http_calls', [])))
 
         all_changes = []
 
@@ -71,17 +75,17 @@ class RuleApplier:
                 result = rule.apply(analysis, patterns)
                 count = len(result) if result else 0
 
-                print(f"[TRANSFORM] {rule_name} -> {count} change(s)")
+                log.debug("[TRANSFORM] %s -> %s change(s)", rule_name, count)
 
                 if result:
                     all_changes.extend(result)
 
             except Exception as e:
-                print(f"[TRANSFORM] FAILED {rule_name}: {e}")
+                log.warning("[TRANSFORM] FAILED %s: %s", rule_name, e)
 
                 import traceback
                 traceback.print_exc()
 
-        print(f"[TRANSFORM] Total changes produced: {len(all_changes)}\n")
+        log.debug("[TRANSFORM] Total changes produced: %s\n", len(all_changes))
 
         return all_changes
\ No newline at end of file
@@ -0,0 +1,184 @@
+"""
+pipeline/transformation/artifact_cache.py
+
+Input-fingerprinted skip cache for generated Angular artifacts.
+
+Each emitted artifact (component .ts/.html, service, pipe, routing module)
+is recorded in a per-rule manifest together with a fingerprint of the
+inputs that produced it: the analysed source slice (DI tokens, scope
+members, http calls, template fragment, ...) plus a version hash of the
+generator code. On the next run a rule fingerprints its inputs first and,
+when the fingerprint matches the manifest entry, reuses the stored content
+instead of running the generator.
+
+Every pipeline run writes into a fresh tmp dir (see PipelineRunner), so the
+manifest cannot live next to the output. Like the tsc node_modules cache it
+sits two levels above the Angular project root:
+
+    out/.evua_artifact_cache/<RuleName>.json
+
+    {
+      "code_version": "<sha1 of generator sources>",
+      "artifacts": {
+        "src/app/users.component.ts": {"fingerprint": "...", "content": "..."},
+        ...
+      }
+    }
+
+A code_version mismatch drops the whole manifest, so editing any generator
+module invalidates every artifact it produced.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Optional
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
+
+
+CACHE_DIR_NAME = ".evua_artifact_cache"
+
+
+def _canonical(obj: Any) -> Any:
+    """
+    Reduce an analysis object to plain JSON data for fingerprinting.
+    Analyzer objects carry a random uuid `id` per run; it never reaches the
+    generated code, so it is left out of the fingerprint.
+    """
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(x) for x in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted((_canonical(x) for x in obj), key=repr)
+    if hasattr(obj, "__dict__"):
+        return {
+            k: _canonical(v)
+            for k, v in vars(obj).items()
+            if k != "id" and not k.startswith("_")
+        }
+    return str(obj)
+
+
+def code_version(*module_names: str) -> str:
+    """sha1 over the source files of the given (already imported) modules."""
+    h = hashlib.sha1()
+    for name in module_names:
+        path = getattr(sys.modules.get(name), "__file__", None)
+        h.update(name.encode("utf-8"))
+        if path and os.path.exists(path):
+            h.update(Path(path).read_bytes())
+    return h.hexdigest()
+
+
+class ArtifactCache:
+    """
+    One manifest per rule. Typical use inside a rule:
+
+        fp = self.cache.fingerprint(rel_path, *inputs)
+        code = self.cache.get(rel_path, fp)
+        if code is None:
+            code = generate(...)
+            self.cache.put(rel_path, fp, code)
+        ...
+        self.cache.save()      # once, at the end of apply()
+
+    A disabled cache (dry runs, --diff previews) misses every lookup and
+    never touches disk.
+    """
+
+    def __init__(
+        self,
+        out_dir,
+        namespace: str,
+        code_modules: tuple = (),
+        enabled: bool = True,
+    ):
+        self.namespace    = namespace
+        self.enabled      = enabled
+        self.code_modules = tuple(code_modules)
+        self.path         = Path(out_dir).parent.parent / CACHE_DIR_NAME / f"{namespace}.json"
+        self.hits         = 0
+        self.misses       = 0
+
+        self._code_version: Optional[str] = None
+        self._entries: Optional[dict] = None
+        self._touched: set[str] = set()
+        self._dirty = False
+
+    @property
+    def code_version(self) -> str:
+        if self._code_version is None:
+            self._code_version = code_version(*self.code_modules)
+        return self._code_version
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            self._entries = {}
+            if self.enabled and self.path.exists():
+                try:
+                    data = json.loads(self.path.read_text(encoding="utf-8"))
+                    if data.get("code_version") == self.code_version:
+                        self._entries = data.get("artifacts", {}) or {}
+                except (OSError, ValueError):
+                    self._entries = {}
+        return self._entries
+
+    # ── Lookups ───────────────────────────────────────────────────────────
+
+    def fingerprint(self, *inputs: Any) -> str:
+        payload = json.dumps(_canonical(inputs), sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, fingerprint: str) -> Optional[Any]:
+        """Stored content for key if its fingerprint still matches, else None."""
+        if not self.enabled:
+            return None
+        entry = self._load().get(key)
+        self._touched.add(key)
+        if entry and entry.get("fingerprint") == fingerprint:
+            self.hits += 1
+            return entry.get("content")
+        self.misses += 1
+        return None
+
+    def put(self, key: str, fingerprint: str, content: Any) -> None:
+        if not self.enabled:
+            return
+        self._load()[key] = {"fingerprint": fingerprint, "content": content}
+        self._touched.add(key)
+        self._dirty = True
+
+    def save(self) -> None:
+        """
+        Persist the manifest. Entries not looked up during this run belong to
+        artifacts that no longer exist in the source and are dropped.
+        """
+        if not self.enabled:
+            return
+        entries = self._load()
+        stale = [k for k in entries if k not in self._touched]
+        for k in stale:
+            del entries[k]
+        if not self._dirty and not stale:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(
+                json.dumps({"code_version": self.code_version, "artifacts": entries}),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as e:
+            log.warning("[ArtifactCache] Could not save %s: %s", self.path, e)
+
+    def summary(self) -> str:
+        return f"{self.hits} hit(s), {self.misses} miss(es)"
@@ -0,0 +1,191 @@
+"""
+pipeline/transformation/artifact_manifest.py
+
+In-process manifest of the files emitted into the generated src/app tree.
+
+Every writer of src/app (the scaffold and each transformation rule) records
+the file it just wrote together with what it already knows about it: the
+exported class, the selector, whether the source uses ngModel or HttpClient,
+whether a service self-provides, which built-in pipes a template uses.
+AppModuleUpdaterRule then builds app.module.ts from the manifest instead of
+globbing and re-reading the output directory.
+
+Manifests are keyed by the app directory and live for one transformation
+pass; cli.run_pipeline discards the manifest once the rules have run.
+
+    record_artifact(ts_path, ts_code, class_name="UsersComponent", selector="app-users")
+    manifest = ArtifactManifest.get(app_dir)     # None → nothing recorded, fall back to a scan
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+
+# Built-in Angular pipe usage in templates: "| date", "| currency", ...
+BUILTIN_PIPE_PATTERNS = [
+    (re.compile(r'\|\s*date\b',      re.IGNORECASE), "DatePipe"),
+    (re.compile(r'\|\s*currency\b',  re.IGNORECASE), "CurrencyPipe"),
+    (re.compile(r'\|\s*number\b',    re.IGNORECASE), "DecimalPipe"),
+    (re.compile(r'\|\s*uppercase\b', re.IGNORECASE), "UpperCasePipe"),
+    (re.compile(r'\|\s*lowercase\b', re.IGNORECASE), "LowerCasePipe"),
+    (re.compile(r'\|\s*percent\b',   re.IGNORECASE), "PercentPipe"),
+    (re.compile(r'\|\s*json\b',      re.IGNORECASE), "JsonPipe"),
+    (re.compile(r'\|\s*slice\b',     re.IGNORECASE), "SlicePipe"),
+    (re.compile(r'\|\s*async\b',     re.IGNORECASE), "AsyncPipe"),
+    (re.compile(r'\|\s*keyvalue\b',  re.IGNORECASE), "KeyValuePipe"),
+    (re.compile(r'\|\s*titlecase\b', re.IGNORECASE), "TitleCasePipe"),
+]
+
+_EXPORT_CLASS_RE = re.compile(r'\bexport\s+class\s+(\w+)')
+
+# File-name suffix → artifact kind (checked against the name without ".ts")
+_TS_KINDS = [
+    (".component", "component"),
+    (".directive", "directive"),
+    (".pipe",      "pipe"),
+    (".guard",     "guard"),
+    (".resolver",  "resolver"),
+    (".service",   "service"),
+]
+
+
+def _kind_for(name: str) -> str:
+    if name.endswith(".component.html"):
+        return "template"
+    if not name.endswith(".ts"):
+        return "other"
+    stem = name[:-len(".ts")]
+    for suffix, kind in _TS_KINDS:
+        if stem.endswith(suffix):
+            return kind
+    return "other"
+
+
+@dataclass
+class Artifact:
+    name:             str               # file name inside src/app
+    kind:             str               # component | directive | pipe | guard | resolver |
+                                        # service | template | other
+    class_name:       Optional[str] = None
+    selector:         Optional[str] = None
+    uses_ngmodel:     bool = False
+    uses_http:        bool = False
+    injectable:       bool = False
+    provided_in_root: bool = False
+    builtin_pipes:    set = field(default_factory=set)
+
+    @property
+    def stem(self) -> str:
+        """File name without extension, as used in import paths."""
+        return self.name.rsplit(".", 1)[0]
+
+    @classmethod
+    def from_content(
+        cls,
+        name: str,
+        content: str,
+        class_name: Optional[str] = None,
+        selector: Optional[str] = None,
+    ) -> "Artifact":
+        kind = _kind_for(name)
+        if class_name is None and name.endswith(".ts"):
+            m = _EXPORT_CLASS_RE.search(content)
+            class_name = m.group(1) if m else None
+        pipes = set()
+        if kind == "template":
+            pipes = {pipe for pattern, pipe in BUILTIN_PIPE_PATTERNS if pattern.search(content)}
+        return cls(
+            name=name,
+            kind=kind,
+            class_name=class_name,
+            selector=selector,
+            uses_ngmodel="ngModel" in content,
+            uses_http="HttpClient" in content,
+            injectable="@Injectable" in content,
+            provided_in_root="providedIn" in content,
+            builtin_pipes=pipes,
+        )
+
+
+class ArtifactManifest:
+    _registry: dict[str, "ArtifactManifest"] = {}
+
+    def __init__(self, app_dir):
+        self.app_dir = Path(app_dir)
+        self._artifacts: dict[str, Artifact] = {}
+
+    # ── Registry ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _key(app_dir) -> str:
+        return os.path.abspath(str(app_dir))
+
+    @classmethod
+    def for_app_dir(cls, app_dir) -> "ArtifactManifest":
+        key = cls._key(app_dir)
+        manifest = cls._registry.get(key)
+        if manifest is None:
+            manifest = cls._registry[key] = cls(app_dir)
+        return manifest
+
+    @classmethod
+    def get(cls, app_dir) -> Optional["ArtifactManifest"]:
+        return cls._registry.get(cls._key(app_dir))
+
+    @classmethod
+    def discard(cls, app_dir) -> None:
+        cls._registry.pop(cls._key(app_dir), None)
+
+    # ── Recording ─────────────────────────────────────────────────────────
+
+    def record(
+        self,
+        name: str,
+        content: str,
+        class_name: Optional[str] = None,
+        selector: Optional[str] = None,
+    ) -> Artifact:
+        """
+        Record (or update, after a patch) one file. A class name or selector
+        given by an earlier writer is kept when a patching rule re-records
+        the file without them.
+        """
+        previous = self._artifacts.get(name)
+        if previous is not None:
+            class_name = class_name or previous.class_name
+            selector   = selector or previous.selector
+        artifact = Artifact.from_content(name, content, class_name, selector)
+        self._artifacts[name] = artifact
+        return artifact
+
+    def artifacts(self) -> list[Artifact]:
+        """All recorded files, sorted by name (directory-listing order)."""
+        return [self._artifacts[n] for n in sorted(self._artifacts)]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._artifacts
+
+    def __len__(self) -> int:
+        return len(self._artifacts)
+
+
+def record_artifact(
+    path: Path,
+    content: str,
+    class_name: Optional[str] = None,
+    selector: Optional[str] = None,
+) -> Artifact:
+    """
+    Record a file just written to disk in the manifest of its directory
+    and in the ProjectIndex of its project.
+    """
+    from pipeline.transformation.project_index import record_file
+
+    path = Path(path)
+    record_file(path, content, class_name=class_name)
+    return ArtifactManifest.for_app_dir(path.parent).record(
+        path.name, content, class_name=class_name, selector=selector,
+    )
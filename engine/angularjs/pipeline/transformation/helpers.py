@@ -4,6 +4,9 @@ pipeline/transformation/helpers.py
 
 from typing import Iterator, Any
 from pipeline.patterns.roles import SemanticRole
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 def iter_nodes_with_role(analysis, patterns, role: SemanticRole) -> Iterator[Any]:
@@ -84,14 +87,17 @@ def iter_controllers(analysis, patterns) -> Iterator[Any]:
 
             # Classic Controller/Ctrl suffix
             if c.name.lower().endswith(("controller", "ctrl")):
-                print(f"[helpers] iter_controllers: yielding classic controller '{c.name}'")
+                log.debug("[helpers] iter_controllers: yielding classic controller '%s'", c.name)
                 seen.add(c.id)
                 yield c
                 continue
 
             # AngularJS .component() — is_component=True set by js.py (when preserved by IR)
             if getattr(c, "is_component", False):
-                print(f"[helpers] iter_controllers: yielding .component() entry (is_component) '{c.name}'")
+                log.debug(
+                    "[helpers] iter_controllers: yielding .component() entry (is_component) '%s'",
+                    c.name,
+                )
                 c.is_component = True   # 🔥 FORCE PRESERVE
                 seen.add(c.id)
                 yield c
@@ -101,12 +107,12 @@ def iter_controllers(analysis, patterns) -> Iterator[Any]:
             # use camelCase (e.g. userProfile, phoneList, phoneDetail).
             # This handles cases where the IR conversion drops is_component.
             if _is_angularjs_component_name(c.name):
-                print(f"[helpers] iter_controllers: yielding .component() entry (camelCase) '{c.name}'")
+                log.debug("[helpers] iter_controllers: yielding .component() entry (camelCase) '%s'", c.name)
                 c.is_component = True   # 🔥 CRITICAL FIX
                 seen.add(c.id)
                 yield c
             else:
-                print(f"[helpers] iter_controllers: SKIPPING '{c.name}' (not controller, not component)")
+                log.debug("[helpers] iter_controllers: SKIPPING '%s' (not controller, not component)", c.name)
 
 def iter_services(analysis, patterns) -> Iterator[Any]:
     """
@@ -124,15 +130,21 @@ def iter_services(analysis, patterns) -> Iterator[Any]:
             if c.id in seen:
                 continue
             if getattr(c, "is_component", False):
-                print(f"[helpers] iter_services: SKIPPING '{c.name}' (is_component=True, belongs to iter_controllers)")
+                log.debug(
+                    "[helpers] iter_services: SKIPPING '%s' (is_component=True, belongs to iter_controllers)",
+                    c.name,
+                )
                 continue
             # Also skip camelCase names — those are .component() registrations,
             # even when the IR drops the is_component flag.
             if _is_angularjs_component_name(c.name):
-                print(f"[helpers] iter_services: SKIPPING '{c.name}' (camelCase .component(), belongs to iter_controllers)")
+                log.debug(
+                    "[helpers] iter_services: SKIPPING '%s' (camelCase .component(), belongs to iter_controllers)",
+                    c.name,
+                )
                 continue
             if c.name.lower().endswith(("service", "svc")):
-                print(f"[helpers] iter_services: yielding service '{c.name}'")
+                log.debug("[helpers] iter_services: yielding service '%s'", c.name)
                 seen.add(c.id)
                 yield c
 
@@ -0,0 +1,197 @@
+"""
+pipeline/transformation/js_sanitizer.py
+
+Single-pass AngularJS → TypeScript snippet rewriter.
+
+Every rule that copies JS source (callback bodies, request bodies, dynamic
+URL expressions, $scope method bodies) into generated TypeScript goes
+through one of the sanitizers defined here instead of its own chain of
+re.sub() calls.
+
+A sanitizer is built from an ordered table of (pattern, replacement) rules.
+All patterns are combined into ONE precompiled alternation; each match is
+dispatched to its replacement through a table keyed by the alternation
+group that fired. The input is therefore scanned exactly once, however many
+rules are registered.
+
+Rules that consume an expression whose contents still need rewriting (e.g.
+the argument of $location.path(...)) sanitize that captured text with the
+same engine, so the result matches what the old sequential chain produced.
+
+Available sanitizers:
+
+  CALLBACK_SANITIZER   full controller rewrite ($scope, aliases, DI services,
+                       route params, $location, $timeout/$interval, $log,
+                       function → arrow, .then → .subscribe)
+  URL_SANITIZER        route params + this-aliases only (safe for URL strings)
+  SERVICE_SANITIZER    $scope + res.data unwrapping (service method bodies)
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Union
+
+
+Replacement = Union[str, Callable[..., str]]
+
+
+# ---------------------------------------------------------------------------
+# Replacement handlers
+# ---------------------------------------------------------------------------
+# Handlers receive (sanitize, *groups) where `sanitize` is the owning
+# sanitizer's __call__ and `groups` are the rule's own capture groups.
+
+def _service_to_this(_sanitize, name: str, data: str | None) -> str:
+    # AuthService.login(  →  this.authService.login(
+    camel = f"{name[0].lower()}{name[1:]}"
+    # The trailing `.data` is captured so the res.data/response.data unwrap
+    # still applies when the camelCased name ends in `res`/`response`.
+    if data:
+        if camel.endswith("res"):
+            return f"this.{camel}"
+        if camel.endswith("response"):
+            return f"this.{camel[:-len('response')]}res"
+    return f"this.{camel}{data or ''}"
+
+
+def _route_param(_sanitize, param: str) -> str:
+    return f'this.route.snapshot.params["{param}"]'
+
+
+def _navigate(sanitize, target: str) -> str:
+    return f"this.router.navigate([{sanitize(target)}])"
+
+
+def _navigate_by_url(sanitize, target: str) -> str:
+    return f"this.router.navigateByUrl({sanitize(target)})"
+
+
+def _clear_timer(_sanitize, kind: str, handle: str | None) -> str:
+    # $interval.cancel(h) / clearInterval(h)  →  clearInterval(this.h)
+    # A bare handle refers to the outer controller scope, which is a class
+    # field after migration (TS2304 fix).
+    fn = {"timeout": "Timeout", "interval": "Interval"}.get(kind, kind)
+    if handle is None:
+        return f"clear{fn}("
+    return f"clear{fn}(this.{handle})"
+
+
+def _log_to_console(_sanitize, level: str) -> str:
+    return f"console.{level}("
+
+
+def _function_to_arrow(_sanitize, params_str: str) -> str:
+    # function() { → () => {   and   function(p) { → (p: any) => {
+    # Arrow functions capture 'this' from the enclosing class method (TS2683).
+    params = [p.strip() for p in params_str.split(",") if p.strip()]
+    typed = []
+    for p in params:
+        if ":" in p or p.startswith("..."):
+            typed.append(p)
+        else:
+            typed.append(f"{p}: any")
+    return f"({', '.join(typed)}) => {{"
+
+
+# ---------------------------------------------------------------------------
+# Rule tables
+# ---------------------------------------------------------------------------
+# Order matters only for alternatives that can match at the same position:
+# the first one listed wins. Patterns that end on a member access use a
+# lookahead for the '.' so the following token (e.g. `.then(`) can still
+# be rewritten in the same pass.
+
+_THIS_ALIASES = [
+    (r"\$scope(?=\.)", "this"),
+    (r"\bself(?=\.)", "this"),
+    (r"\bvm(?=\.)", "this"),
+    (r"\bctrl(?=\.)", "this"),
+]
+
+_ROUTE_PARAMS = [
+    (r"\$routeParams\.(\w+)", _route_param),
+    (r"\$stateParams\.(\w+)", _route_param),
+]
+
+_RESPONSE_UNWRAP = [
+    (r"res\.data", "res"),
+    (r"response\.data", "res"),
+]
+
+CALLBACK_RULES = (
+    _THIS_ALIASES
+    + [
+        # Custom service DI: PascalCase.method( → this.camelCase.method(
+        (r"\b([A-Z][a-zA-Z0-9]+)(?=\.(?!prototype))(\.data)?", _service_to_this),
+    ]
+    + _ROUTE_PARAMS
+    + _RESPONSE_UNWRAP
+    + [
+        # $location rewrites — argument forms before the no-arg getters
+        (r"\$location\.path\(('[^']+'|\"[^\"]+\"|[^)]+)\)", _navigate),
+        (r"\$location\.url\(([^)]+)\)", _navigate_by_url),
+        (r"\$location\.search\(\)", "this.route.snapshot.queryParams"),
+        (r"\$location\.absUrl\(\)", "window.location.href"),
+        (r"\$location\.path\(\)", "this.router.url"),
+        # $timeout/$interval — cancel and clear* forms share one handler
+        (
+            r"(?:\$(timeout|interval)\.cancel|clear(Interval|Timeout))"
+            r"\((?:(?!this\.)([a-zA-Z_]\w*)\))?",
+            lambda s, a, b, h: _clear_timer(s, a or b, h),
+        ),
+        (r"\$timeout\(", "setTimeout("),
+        (r"\$interval\(", "setInterval("),
+        (r"\$log\.(info|warn|error|debug|log)\(", _log_to_console),
+        (r"function\(([^)]*)\)\s*\{", _function_to_arrow),
+        # Promise → Observable conversion
+        (r"\.then\s*\(", ".subscribe("),
+    ]
+)
+
+URL_RULES = _ROUTE_PARAMS + _THIS_ALIASES
+
+SERVICE_RULES = [_THIS_ALIASES[0]] + _RESPONSE_UNWRAP
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+class JsSanitizer:
+    """
+    Compiles an ordered rule table into one alternation and applies it in a
+    single re.sub() pass. Results are memoised — the same body is commonly
+    sanitized several times while a component is generated (property scan,
+    return-type probe, body emission).
+    """
+
+    def __init__(self, rules: list[tuple[str, Replacement]], cache_size: int = 2048):
+        parts: list[str] = []
+        self._dispatch: dict[int, tuple[Replacement, int, int]] = {}
+        group = 1
+        for pattern, replacement in rules:
+            n_inner = re.compile(pattern).groups
+            parts.append(f"({pattern})")
+            self._dispatch[group] = (replacement, group + 1, n_inner)
+            group += 1 + n_inner
+        self.pattern = re.compile("|".join(parts))
+        self._cached = lru_cache(maxsize=cache_size)(self._sanitize)
+
+    def _replace(self, m: re.Match) -> str:
+        replacement, first, n_inner = self._dispatch[m.lastindex]
+        if isinstance(replacement, str):
+            return replacement
+        return replacement(self, *m.groups()[first - 1:first - 1 + n_inner])
+
+    def _sanitize(self, src: str) -> str:
+        return self.pattern.sub(self._replace, src)
+
+    def __call__(self, src: str | None) -> str | None:
+        if not src:
+            return src
+        return self._cached(src)
+
+
+CALLBACK_SANITIZER = JsSanitizer(CALLBACK_RULES)
+URL_SANITIZER      = JsSanitizer(URL_RULES)
+SERVICE_SANITIZER  = JsSanitizer(SERVICE_RULES)
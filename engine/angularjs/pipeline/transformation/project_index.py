@@ -0,0 +1,204 @@
+"""
+pipeline/transformation/project_index.py
+
+Index of the generated Angular project, shared by every stage that looks at
+the output tree after (or during) transformation.
+
+Each writer of the generated project records the file it just wrote: the
+scaffold, every transformation rule (through record_artifact) and the
+AI-assist stage. Per file, keyed by its path relative to the project root,
+the index keeps:
+
+    kind        component | directive | pipe | guard | resolver | service |
+                template | spec | other            (from the file name)
+    size        bytes written
+    sha256      of the written content
+    class_name  first exported class (.ts files)
+    stubs       which STUB_MARKERS the content contains
+
+ComponentInteractionRule, AIAssistStage, CoverageAnalyzer and PipelineRunner
+query the index instead of globbing, re-reading and re-hashing the tree.
+
+cli.run_pipeline registers the index of its output directory with
+ProjectIndex.build(), which walks the tree once. A fresh workspace is empty,
+while a resumed one is indexed as found. PipelineRunner discards the index
+of its workspace when the run ends.
+
+    index = ProjectIndex.build(out_dir)                 # before transformation
+    record_file(path, content)                          # writers
+    for f in index.files("src/app", "*.pipe.ts"):       # consumers
+        if "pipe_body" in f.stubs: ...
+"""
+
+import fnmatch
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from pipeline.transformation.artifact_manifest import _EXPORT_CLASS_RE, _kind_for
+
+
+# Markers the generators leave in files that still need work → stub name
+STUB_MARKERS = {
+    "pipe_body": "return value;",                        # DirectiveToPipeRule transform() stub
+    "template":  "TODO: no AngularJS template found",     # ControllerToComponentRule stub template
+    "link":      "port DOM logic to ngAfterViewInit",     # DirectiveToComponentRule link() warning
+    "q_defer":   "$q.defer",                              # un-migrated promise code
+    "any_field": "!: any;",                               # untyped component field
+}
+
+# Text files whose content is inspected for class names and stub markers
+_TEXT_SUFFIXES = (".ts", ".html")
+
+# Directories build() never descends into (installed or built, not generated)
+_SKIP_DIRS = frozenset({"node_modules", "dist", ".angular"})
+
+
+@dataclass(frozen=True)
+class IndexedFile:
+    path:       str                  # relative to the project root, "/"-separated
+    kind:       str
+    size:       int
+    sha256:     str
+    class_name: Optional[str] = None
+    stubs:      frozenset = frozenset()
+
+    @property
+    def name(self) -> str:
+        return self.path.rsplit("/", 1)[-1]
+
+    @classmethod
+    def from_bytes(cls, rel: str, data: bytes, text: Optional[str] = None,
+                   class_name: Optional[str] = None) -> "IndexedFile":
+        name = rel.rsplit("/", 1)[-1]
+        kind = "spec" if name.endswith(".spec.ts") else _kind_for(name)
+        stubs = frozenset()
+        if name.endswith(_TEXT_SUFFIXES):
+            if text is None:
+                text = data.decode("utf-8", errors="replace")
+            if class_name is None and name.endswith(".ts"):
+                m = _EXPORT_CLASS_RE.search(text)
+                class_name = m.group(1) if m else None
+            stubs = frozenset(k for k, marker in STUB_MARKERS.items() if marker in text)
+        return cls(
+            path=rel,
+            kind=kind,
+            size=len(data),
+            sha256=hashlib.sha256(data).hexdigest(),
+            class_name=class_name,
+            stubs=stubs,
+        )
+
+
+class ProjectIndex:
+    _registry: dict[str, "ProjectIndex"] = {}
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._files: dict[str, IndexedFile] = {}
+
+    # ── Registry ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _key(root) -> str:
+        return os.path.abspath(str(root))
+
+    @classmethod
+    def build(cls, root) -> "ProjectIndex":
+        """Index the tree under root with one walk and register the result."""
+        index = cls(root)
+        for dirpath, dirnames, filenames in os.walk(index.root):
+            dirnames[:] = sorted(d for d in dirnames if d not in _SKIP_DIRS)
+            for fname in filenames:
+                path = Path(dirpath) / fname
+                try:
+                    data = path.read_bytes()
+                except OSError:
+                    continue
+                rel = path.relative_to(index.root).as_posix()
+                index._files[rel] = IndexedFile.from_bytes(rel, data)
+        cls._registry[cls._key(root)] = index
+        return index
+
+    @classmethod
+    def lookup(cls, root) -> Optional["ProjectIndex"]:
+        return cls._registry.get(cls._key(root))
+
+    @classmethod
+    def covering(cls, path) -> Optional["ProjectIndex"]:
+        """The registered index whose project contains path."""
+        key = cls._key(path)
+        for root, index in cls._registry.items():
+            if key == root or key.startswith(root + os.sep):
+                return index
+        return None
+
+    @classmethod
+    def discard(cls, root) -> None:
+        cls._registry.pop(cls._key(root), None)
+
+    # ── Recording ─────────────────────────────────────────────────────────
+
+    def _rel(self, path) -> str:
+        path = Path(path)
+        if path.is_absolute():
+            path = Path(os.path.abspath(path)).relative_to(os.path.abspath(self.root))
+        return path.as_posix()
+
+    def record(self, path, content: str, class_name: Optional[str] = None) -> IndexedFile:
+        """Record (or update) a file just written with `content`."""
+        rel = self._rel(path)
+        previous = self._files.get(rel)
+        if class_name is None and previous is not None:
+            class_name = previous.class_name
+        entry = IndexedFile.from_bytes(rel, content.encode("utf-8"), content, class_name)
+        self._files[rel] = entry
+        return entry
+
+    # ── Queries ───────────────────────────────────────────────────────────
+
+    def entry(self, path) -> Optional[IndexedFile]:
+        """The entry for path (absolute, or relative to the project root)."""
+        try:
+            return self._files.get(self._rel(path))
+        except ValueError:          # outside this project
+            return None
+
+    def files(self, under="", pattern: str = "*",
+              recursive: bool = False) -> list[IndexedFile]:
+        """
+        Files directly in the directory `under` (absolute, or relative to the
+        project root; anywhere below it with recursive=True) whose name
+        matches the glob `pattern`, in the order sorted(Path.glob()) /
+        sorted(Path.rglob()) would list them.
+        """
+        under  = self._rel(under)
+        prefix = "" if under == "." else under + "/"
+        found = []
+        for rel, entry in self._files.items():
+            if not rel.startswith(prefix):
+                continue
+            rest = rel[len(prefix):]
+            if not recursive and "/" in rest:
+                continue
+            if fnmatch.fnmatchcase(entry.name, pattern):
+                found.append(entry)
+        return sorted(found, key=lambda e: tuple(e.path.split("/")))
+
+    def path_of(self, entry: IndexedFile) -> Path:
+        return self.root / entry.path
+
+    def __contains__(self, path) -> bool:
+        return self.entry(path) is not None
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+def record_file(path: Path, content: str, class_name: Optional[str] = None) -> Optional[IndexedFile]:
+    """Record a file just written to disk in the index of its project, if any."""
+    path  = Path(os.path.abspath(path))
+    index = ProjectIndex.covering(path)
+    return index.record(path, content, class_name) if index is not None else None
@@ -9,8 +9,9 @@ Run ORDER: must be LAST in the rule list (after controllers, services,
 
 What it does
 ------------
-1. Scans the output src/app/ directory for generated *.component.ts,
-   *.service.ts, and *.pipe.ts files.
+1. Reads the generated *.component.ts, *.service.ts, *.pipe.ts, ... files
+   from the ArtifactManifest the earlier rules recorded into (no file I/O;
+   the src/app/ directory is only scanned when no manifest exists).
 2. Collects guard files (*.guard.ts) for the providers[] array.
 3. Collects resolver files (*.resolver.ts) for providers[].
 4. Rewrites app.module.ts with:
@@ -41,6 +42,11 @@ import re
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import ArtifactManifest, record_artifact
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
+
 
 # Built-in Angular pipes that may be needed based on template usage
 _BUILTIN_PIPE_IMPORTS = {
@@ -75,25 +81,32 @@ def _to_pascal(stem: str) -> str:
     return "".join(p.capitalize() for p in re.split(r'[-_.]', stem))
 
 
-def _extract_class_name(content: str) -> Optional[str]:
+def _scan_app_dir(app_dir: Path) -> ArtifactManifest:
     """
-    Extract the exported class name from TypeScript file content.
-    Matches: export class ProductCardComponent {
-    Returns the class name string, or None if not found.
+    Fallback for callers that ran no manifest-recording rules (e.g. a
+    hand-built pipeline pointed at an existing output tree): read every
+    *.component.html and *.ts in app_dir into a throwaway manifest.
     """
-    m = re.search(r'\bexport\s+class\s+(\w+)', content)
-    return m.group(1) if m else None
+    manifest = ArtifactManifest(app_dir)
+    for path in sorted(app_dir.glob("*.component.html")) + sorted(app_dir.glob("*.ts")):
+        try:
+            content = path.read_text(encoding="utf-8", errors="replace")
+        except Exception:
+            content = ""
+        manifest.record(path.name, content)
+    return manifest
 
 
-def _scan_app_dir(app_dir: Path) -> dict:
+def _collect_artifacts(manifest: ArtifactManifest) -> dict:
     """
-    Walk app_dir and collect all generated files by category.
+    Sort the recorded files into module categories.
     Returns {
         'components': [(ClassName, filename_no_ext), ...],
         'pipes':      [...],
         'guards':     [...],
         'resolvers':  [...],
-        'services':   [...],
+        'services':   [(ClassName, filename_no_ext, filename), ...],
+        'service_flags': {filename_no_ext: Artifact},
         'has_ngmodel': bool,
         'has_httpclient': bool,
     }
@@ -108,73 +121,54 @@ def _scan_app_dir(app_dir: Path) -> dict:
 
     SKIP_FILES = {"app.component.ts", "app.module.ts"}
 
-    # Scan HTML templates for [(ngModel)] and built-in pipe usage
+    artifacts = manifest.artifacts()
+
+    # HTML templates: [(ngModel)] and built-in pipe usage
     builtin_pipes_used: set = set()
-    for html_file in sorted(app_dir.glob("*.component.html")):
-        try:
-            html_content = html_file.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            html_content = ""
-        if "[(ngModel)]" in html_content or "ngModel" in html_content:
-            has_ngmodel = True
-        # Detect built-in Angular pipe usage: "| date", "| currency", etc.
-        for pipe_re, pipe_class in [
-            (r'\|\s*date\b',       "DatePipe"),
-            (r'\|\s*currency\b',   "CurrencyPipe"),
-            (r'\|\s*number\b',     "DecimalPipe"),
-            (r'\|\s*uppercase\b',  "UpperCasePipe"),
-            (r'\|\s*lowercase\b',  "LowerCasePipe"),
-            (r'\|\s*percent\b',    "PercentPipe"),
-            (r'\|\s*json\b',       "JsonPipe"),
-            (r'\|\s*slice\b',      "SlicePipe"),
-            (r'\|\s*async\b',      "AsyncPipe"),
-            (r'\|\s*keyvalue\b',   "KeyValuePipe"),
-            (r'\|\s*titlecase\b',  "TitleCasePipe"),
-        ]:
-            if re.search(pipe_re, html_content, re.IGNORECASE):
-                builtin_pipes_used.add(pipe_class)
-
-    for ts_file in sorted(app_dir.glob("*.ts")):
-        fname = ts_file.name
-        if fname in SKIP_FILES:
+    for art in artifacts:
+        if art.kind != "template":
             continue
+        if art.uses_ngmodel:
+            has_ngmodel = True
+        builtin_pipes_used |= art.builtin_pipes
 
-        stem = ts_file.stem  # e.g. 'userdetail.component'
+    service_flags: dict = {}
+    for art in artifacts:
+        fname = art.name
+        if not fname.endswith(".ts") or fname in SKIP_FILES:
+            continue
 
-        content = ""
-        try:
-            content = ts_file.read_text(encoding="utf-8", errors="replace")
-        except Exception:
-            pass
+        stem = art.stem  # e.g. 'userdetail.component'
 
-        if "ngModel" in content or "[(ngModel)]" in content:
+        if art.uses_ngmodel:
             has_ngmodel = True
-        if "HttpClient" in content:
+        if art.uses_http:
             has_httpclient = True
 
-        if stem.endswith(".component"):
-            cls = _extract_class_name(content) or (_to_pascal(stem[:-len(".component")]) + "Component")
+        if art.kind == "component":
+            cls = art.class_name or (_to_pascal(stem[:-len(".component")]) + "Component")
             components.append((cls, stem))
 
-        elif stem.endswith(".directive"):
-            cls = _extract_class_name(content) or (_to_pascal(stem[:-len(".directive")]) + "Directive")
+        elif art.kind == "directive":
+            cls = art.class_name or (_to_pascal(stem[:-len(".directive")]) + "Directive")
             components.append((cls, stem))  # @Directive goes in declarations[]
 
-        elif stem.endswith(".pipe"):
-            cls = _extract_class_name(content) or (_to_pascal(stem[:-len(".pipe")]) + "Pipe")
+        elif art.kind == "pipe":
+            cls = art.class_name or (_to_pascal(stem[:-len(".pipe")]) + "Pipe")
             pipes.append((cls, stem))
 
-        elif stem.endswith(".guard"):
-            cls = _extract_class_name(content) or (_to_pascal(stem[:-len(".guard")]) + "Guard")
+        elif art.kind == "guard":
+            cls = art.class_name or (_to_pascal(stem[:-len(".guard")]) + "Guard")
             guards.append((cls, stem))
 
-        elif stem.endswith(".resolver"):
-            cls = _extract_class_name(content) or (_to_pascal(stem[:-len(".resolver")]) + "Resolver")
+        elif art.kind == "resolver":
+            cls = art.class_name or (_to_pascal(stem[:-len(".resolver")]) + "Resolver")
             resolvers.append((cls, stem))
 
-        elif stem.endswith(".service"):
-            cls = _extract_class_name(content) or (_to_pascal(stem[:-len(".service")]) + "Service")
+        elif art.kind == "service":
+            cls = art.class_name or (_to_pascal(stem[:-len(".service")]) + "Service")
             services.append((cls, stem, fname))
+            service_flags[stem] = art
 
     # ── Deduplicate services by class name ───────────────────────────────
     # HttpToHttpClientRule emits e.g. stats.service.ts (class StatsService)
@@ -205,9 +199,9 @@ def _scan_app_dir(app_dir: Path) -> dict:
         "guards":           guards,
         "resolvers":        resolvers,
         "services":         services,
+        "service_flags":    service_flags,
         "has_ngmodel":      has_ngmodel,
         "has_httpclient":   has_httpclient,
-        "_app_dir":         app_dir,
         "builtin_pipes":    builtin_pipes_used,  # DatePipe, CurrencyPipe, etc.
     }
 
@@ -252,7 +246,10 @@ def _build_app_module(scanned: dict) -> str:
     for pipe_class in sorted(builtin_pipes):
         mod = _BUILTIN_PIPE_IMPORTS.get(pipe_class, "@angular/common")
         builtin_pipe_entries.append((pipe_class, mod))
-    print(f"[AppModuleUpdater] Built-in pipes detected in templates: {[p for p,_ in builtin_pipe_entries]}")
+    log.debug(
+        "[AppModuleUpdater] Built-in pipes detected in templates: %s",
+        [p for p,_ in builtin_pipe_entries],
+    )
 
     # Built-in Angular pipes — imported from @angular/common
     _seen_bp_modules: dict = {}
@@ -267,17 +264,15 @@ def _build_app_module(scanned: dict) -> str:
     for cls, stem in resolvers:
         import_lines.append(f"import {{ {cls} }} from './{stem}';")
 
+    service_flags = scanned.get("service_flags", {})
+
     for cls, stem, _fname in services:
         # Skip import if the service file has no @Injectable (e.g. app-init.service.ts)
         # — importing a non-existent class name causes TS2305
-        svc_file_check = (scanned.get("_app_dir") or Path(".")) / f"{stem}.ts"
-        try:
-            _svc_check_content = svc_file_check.read_text(encoding="utf-8", errors="replace")
-            if "@Injectable" not in _svc_check_content:
-                print(f"[AppModuleUpdater] {stem}.ts: skipping import — no @Injectable (TS2305 prevention)")
-                continue
-        except Exception:
-            pass
+        svc = service_flags.get(stem)
+        if svc is not None and not svc.injectable:
+            log.debug("[AppModuleUpdater] %s.ts: skipping import — no @Injectable (TS2305 prevention)", stem)
+            continue
         import_lines.append(f"import {{ {cls} }} from './{stem}';")
 
     # ── declarations[] ────────────────────────────────────────────────────
@@ -298,24 +293,20 @@ def _build_app_module(scanned: dict) -> str:
     # Services that declare @Injectable({providedIn: 'root'}) are globally
     # available without listing them in providers[]. Listing them there too
     # causes a double-registration (harmless but wrong and clutters the module).
-    # We check each service file: only add to providers[] if it does NOT use
-    # providedIn:'root'.
+    # Each service artifact records this: only add to providers[] if it does
+    # NOT use providedIn:'root'.
     provider_items: list[str] = []
     for cls, stem, _fname in services:
-        svc_file = (scanned.get("_app_dir") or Path(".")) / f"{stem}.ts"
-        try:
-            svc_content = svc_file.read_text(encoding="utf-8", errors="replace")
-            # Skip from providers[] if:
-            # (a) already self-providing via @Injectable({providedIn:'root'})
-            # (b) not an @Injectable at all (e.g. app-init.service.ts is a plain function)
-            if "providedIn" in svc_content:
-                print(f"[AppModuleUpdater] {stem}.ts: skipping providers[] — has providedIn")
-                continue
-            if "@Injectable" not in svc_content:
-                print(f"[AppModuleUpdater] {stem}.ts: skipping providers[] — no @Injectable")
-                continue
-        except Exception:
-            pass
+        svc = service_flags.get(stem)
+        # Skip from providers[] if:
+        # (a) already self-providing via @Injectable({providedIn:'root'})
+        # (b) not an @Injectable at all (e.g. app-init.service.ts is a plain function)
+        if svc is not None and svc.provided_in_root:
+            log.debug("[AppModuleUpdater] %s.ts: skipping providers[] — has providedIn", stem)
+            continue
+        if svc is not None and not svc.injectable:
+            log.debug("[AppModuleUpdater] %s.ts: skipping providers[] — no @Injectable", stem)
+            continue
         provider_items.append(cls)
     provider_items += [cls for cls, _ in guards]
     provider_items += [cls for cls, _ in resolvers]
@@ -358,40 +349,47 @@ class AppModuleUpdaterRule:
         self.dry_run  = dry_run
 
     def apply(self, analysis, patterns):
-        print("\n========== AppModuleUpdaterRule.apply() ==========")
+        log.debug("\n========== AppModuleUpdaterRule.apply() ==========")
         if self.dry_run:
-            print("[AppModuleUpdater] DRY RUN — no files will be written")
+            log.debug("[AppModuleUpdater] DRY RUN — no files will be written")
 
         changes = []
 
-        if not self.dry_run and not self.app_dir.exists():
-            print("[AppModuleUpdater] app_dir does not exist — skipping")
-            print("========== AppModuleUpdaterRule DONE ==========\n")
-            return changes
+        # Everything the earlier rules emitted is in the in-process manifest;
+        # only fall back to scanning the output tree when nothing was recorded.
+        manifest = ArtifactManifest.get(self.app_dir)
+        if manifest is None:
+            if not self.dry_run and not self.app_dir.exists():
+                log.debug("[AppModuleUpdater] app_dir does not exist — skipping")
+                log.debug("========== AppModuleUpdaterRule DONE ==========\n")
+                return changes
+            log.debug("[AppModuleUpdater] No artifact manifest — scanning output tree")
+            manifest = _scan_app_dir(self.app_dir)
 
-        scanned = _scan_app_dir(self.app_dir)
+        scanned = _collect_artifacts(manifest)
 
         n_comp = len(scanned["components"])
         n_svc  = len(scanned["services"])
         n_g    = len(scanned["guards"])
         n_r    = len(scanned["resolvers"])
         n_p    = len(scanned["pipes"])
-        print(
-            f"[AppModuleUpdater] Found: {n_comp} components, {n_svc} services, "
-            f"{n_g} guards, {n_r} resolvers, {n_p} pipes"
+        log.debug(
+            "[AppModuleUpdater] Found: %s components, %s services, %s guards, %s resolvers, %s pipes",
+            n_comp, n_svc, n_g, n_r, n_p,
         )
-        print(f"[AppModuleUpdater] FormsModule needed: {scanned['has_ngmodel']}")
-        print(f"[AppModuleUpdater] HttpClientModule needed: {scanned['has_httpclient']}")
+        log.debug("[AppModuleUpdater] FormsModule needed: %s", scanned['has_ngmodel'])
+        log.debug("[AppModuleUpdater] HttpClientModule needed: %s", scanned['has_httpclient'])
 
         new_content = _build_app_module(scanned)
 
         if self.dry_run:
-            print(f"[DRY RUN] Would write: {self.mod_path}")
-            print(f"[DRY RUN] Preview:\n{new_content[:600]}")
+            log.info("[DRY RUN] Would write: %s", self.mod_path)
+            log.info("[DRY RUN] Preview:\n%s", new_content[:600])
         else:
             # Always rewrite — it was a static stub before
             self.mod_path.write_text(new_content, encoding="utf-8")
-            print(f"[AppModuleUpdater] Written: {self.mod_path}")
+            record_artifact(self.mod_path, new_content, class_name="AppModule")
+            log.debug("[AppModuleUpdater] Written: %s", self.mod_path)
 
         changes.append(Change(
             before_id="app_module_stub",
@@ -401,5 +399,5 @@ class AppModuleUpdaterRule:
                    f"{n_g} guards, {n_r} resolvers, {n_p} pipes",
         ))
 
-        print("========== AppModuleUpdaterRule DONE ==========\n")
+        log.debug("========== AppModuleUpdaterRule DONE ==========\n")
         return changes
\ No newline at end of file
@@ -15,6 +15,9 @@ Remove (or set enabled=False) once everything is verified.
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.patterns.roles import SemanticRole
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 class CanaryRule:
@@ -30,37 +33,37 @@ class CanaryRule:
         if not self.enabled:
             return []
 
-        print("\n========== CanaryRule (pipeline diagnostic) ==========")
+        log.debug("\n========== CanaryRule (pipeline diagnostic) ==========")
 
         # --- analysis shape ---
         modules = getattr(analysis, "modules", [])
         http_calls = getattr(analysis, "http_calls", [])
         watches = getattr(analysis, "watches", [])
-        print(f"  analysis.modules:    {len(modules)}")
-        print(f"  analysis.http_calls: {len(http_calls)}")
-        print(f"  analysis.watches:    {len(watches)}")
+        log.info("  analysis.modules:    %s", len(modules))
+        log.info("  analysis.http_calls: %s", len(http_calls))
+        log.info("  analysis.watches:    %s", len(watches))
 
         for m in modules:
             classes = getattr(m, "classes", [])
-            print(f"    Module {getattr(m, 'path', '?')} → {len(classes)} class(es)")
+            log.info("    Module %s → %s class(es)", getattr(m, 'path', '?'), len(classes))
             for c in classes:
-                print(f"      Class: {c.name} (id={c.id})")
+                log.info("      Class: %s (id=%s)", c.name, c.id)
 
         # --- patterns shape ---
         roles_by_node = getattr(patterns, "roles_by_node", {})
         matched_patterns = getattr(patterns, "matched_patterns", [])
-        print(f"  patterns.roles_by_node size:    {len(roles_by_node)}")
-        print(f"  patterns.matched_patterns size: {len(matched_patterns)}")
+        log.info("  patterns.roles_by_node size:    %s", len(roles_by_node))
+        log.info("  patterns.matched_patterns size: %s", len(matched_patterns))
 
         role_summary: dict = {}
         for node_id, roles in roles_by_node.items():
             for r in roles:
                 role_summary[r] = role_summary.get(r, 0) + 1
         for role, count in role_summary.items():
-            print(f"    {role}: {count} node(s)")
+            log.info("    %s: %s node(s)", role, count)
 
-        print("  ✅ Canary fired — pipeline wiring OK")
-        print("========== CanaryRule DONE ==========\n")
+        log.info("  ✅ Canary fired — pipeline wiring OK")
+        log.debug("========== CanaryRule DONE ==========\n")
 
         return [
             Change(
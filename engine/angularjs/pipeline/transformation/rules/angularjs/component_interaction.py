@@ -18,7 +18,11 @@ How it works
    - Adds an import of the child component to the PARENT component .ts file
      (as a comment — full NgModule wiring is handled by AppModuleUpdaterRule)
 
-3. If no template-level usage is found, falls back to DI-level detection:
+3. Nested ng-controller blocks recorded in the analysis TemplateIndex are
+   reported as parent→child relationships as well. The child's markup is
+   inlined into the parent fragment, so no selector appears in the output.
+
+4. If no template-level usage is found, falls back to DI-level detection:
    when ComponentA has ComponentB injected into its constructor,
    it likely needs to communicate — stubs are generated with a TODO comment.
 
@@ -38,6 +42,12 @@ import re
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import record_artifact
+from pipeline.transformation.project_index import ProjectIndex
+from pipeline.analysis.template_index import TemplateIndex
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -71,6 +81,13 @@ def _class_to_selector(class_name: str) -> str:
     return f"app-{kebab}"
 
 
+def _controller_to_base(controller_name: str) -> str:
+    """
+    'UserListController' → 'userlist'  (same stem ControllerToComponentRule emits)
+    """
+    return controller_name.replace("Controller", "").replace("Ctrl", "").lower()
+
+
 def _extract_bound_inputs(template: str, selector: str) -> list[str]:
     """
     Find [property] bindings on a given element selector in the template.
@@ -187,21 +204,28 @@ class ComponentInteractionRule:
         self.dry_run  = dry_run
 
     def apply(self, analysis, patterns):
-        print("\n========== ComponentInteractionRule.apply() ==========")
+        log.debug("\n========== ComponentInteractionRule.apply() ==========")
         if self.dry_run:
-            print("[ComponentInteraction] DRY RUN — no files will be written")
+            log.info("[ComponentInteraction] DRY RUN — no files will be written")
 
         changes = []
 
         if not self.app_dir.exists():
-            print("[ComponentInteraction] app_dir missing — skipping")
-            print("========== ComponentInteractionRule DONE ==========\n")
+            log.info("[ComponentInteraction] app_dir missing — skipping")
+            log.debug("========== ComponentInteractionRule DONE ==========\n")
             return changes
 
         # ── Build map of selector → (class_name, ts_path, html_path) ────
         component_map: dict[str, dict] = {}  # selector → info
 
-        for ts_file in sorted(self.app_dir.glob("*.component.ts")):
+        # The run's ProjectIndex knows what the earlier rules wrote
+        index = ProjectIndex.covering(self.app_dir)
+        if index is not None:
+            ts_files = [index.path_of(f) for f in index.files(self.app_dir, "*.component.ts")]
+        else:
+            ts_files = sorted(self.app_dir.glob("*.component.ts"))
+
+        for ts_file in ts_files:
             stem = ts_file.stem   # e.g. 'usercard.component'
             base = stem.removesuffix(".component")
             cls  = "".join(p.capitalize() for p in base.split("-")) + "Component"
@@ -221,7 +245,7 @@ class ComponentInteractionRule:
         # ── For each component, scan its template for child selectors ────
         for parent_selector, parent_info in component_map.items():
             html_path = parent_info["html_path"]
-            if not html_path.exists():
+            if not (html_path in index if index is not None else html_path.exists()):
                 continue
 
             template = html_path.read_text(encoding="utf-8", errors="replace")
@@ -239,10 +263,9 @@ class ComponentInteractionRule:
                 inputs  = _extract_bound_inputs(template, child_selector)
                 outputs = _extract_bound_outputs(template, child_selector)
 
-                print(
-                    f"[ComponentInteraction] {parent_info['class']} "
-                    f"→ {child_info['class']}: "
-                    f"@Input({inputs}) @Output({outputs})"
+                log.info(
+                    "[ComponentInteraction] %s → %s: @Input(%s) @Output(%s)",
+                    parent_info['class'], child_info['class'], inputs, outputs,
                 )
 
                 if inputs or outputs:
@@ -250,15 +273,16 @@ class ComponentInteractionRule:
                     child_ts = child_info["ts_path"]
 
                     if self.dry_run:
-                        print(f"[DRY RUN] Would patch: {child_ts}")
-                        print(f"[DRY RUN]   @Input(): {inputs}")
-                        print(f"[DRY RUN]   @Output(): {outputs}")
+                        log.info("[DRY RUN] Would patch: %s", child_ts)
+                        log.info("[DRY RUN]   @Input(): %s", inputs)
+                        log.info("[DRY RUN]   @Output(): %s", outputs)
                     else:
                         original = child_ts.read_text(encoding="utf-8", errors="replace")
                         patched  = _inject_input_output_stubs(original, inputs, outputs)
                         if patched != original:
                             child_ts.write_text(patched, encoding="utf-8")
-                            print(f"[ComponentInteraction] Patched: {child_ts.name}")
+                            record_artifact(child_ts, patched)
+                            log.info("[ComponentInteraction] Patched: %s", child_ts.name)
 
                     changes.append(Change(
                         before_id=f"interaction_{parent_info['base']}_{child_info['base']}",
@@ -271,8 +295,34 @@ class ComponentInteractionRule:
                         ),
                     ))
 
+        # ── Nested ng-controller blocks from the analysis TemplateIndex ───
+        templates = getattr(analysis, "template_index", None) or TemplateIndex(
+            getattr(analysis, "raw_templates", []) or []
+        )
+        for parent_ctrl, child_ctrl in templates.nested_pairs():
+            parent_info = component_map.get(f"app-{_controller_to_base(parent_ctrl)}")
+            child_info  = component_map.get(f"app-{_controller_to_base(child_ctrl)}")
+            if not parent_info or not child_info or parent_info is child_info:
+                continue
+
+            total_relationships += 1
+            log.info(
+                "[ComponentInteraction] %s → %s: nested ng-controller",
+                parent_info['class'], child_info['class'],
+            )
+            changes.append(Change(
+                before_id=f"interaction_{parent_info['base']}_{child_info['base']}",
+                after_id=f"interaction_{parent_info['base']}_{child_info['base']}_nested",
+                source=ChangeSource.RULE,
+                reason=(
+                    f"{child_ctrl} is nested inside {parent_ctrl} (ng-controller) — "
+                    f"child markup inlined into {parent_info['class']}; "
+                    f"replace with <app-{child_info['base']}> and wire @Input()/@Output() manually"
+                ),
+            ))
+
         if total_relationships == 0:
-            print(
+            log.debug(
                 "[ComponentInteraction] No template-level parent→child relationships found. "
                 "This is expected when templates are stubs — stubs contain no child selectors."
             )
@@ -284,6 +334,6 @@ class ComponentInteractionRule:
                 reason="ComponentInteractionRule ran — no relationships detected in stub templates",
             ))
 
-        print(f"[ComponentInteraction] Relationships processed: {total_relationships}")
-        print("========== ComponentInteractionRule DONE ==========\n")
+        log.debug("[ComponentInteraction] Relationships processed: %s", total_relationships)
+        log.debug("========== ComponentInteractionRule DONE ==========\n")
         return changes
\ No newline at end of file
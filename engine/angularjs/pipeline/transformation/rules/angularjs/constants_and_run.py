@@ -20,6 +20,10 @@ from pathlib import Path
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import record_artifact
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 def _build_constants_ts(constants: list) -> str:
@@ -99,7 +103,7 @@ class ConstantsAndRunRule:
         self.dry_run  = dry_run
 
     def apply(self, analysis, patterns):
-        print("\n========== ConstantsAndRunRule.apply() ==========")
+        log.debug("\n========== ConstantsAndRunRule.apply() ==========")
         changes = []
 
         if not self.dry_run:
@@ -111,20 +115,21 @@ class ConstantsAndRunRule:
         raw_constants  = getattr(analysis, "raw_constants",  []) or []
         raw_run_blocks = getattr(analysis, "raw_run_blocks", []) or []
 
-        print(f"[ConstantsAndRun] Constants detected: {len(raw_constants)}")
-        print(f"[ConstantsAndRun] Run blocks detected: {len(raw_run_blocks)}")
+        log.debug("[ConstantsAndRun] Constants detected: %s", len(raw_constants))
+        log.debug("[ConstantsAndRun] Run blocks detected: %s", len(raw_run_blocks))
 
         # ── Generate app-constants.ts ──────────────────────────────────────
         if raw_constants:
             ts_code   = _build_constants_ts(raw_constants)
             ts_path   = self.app_dir / "app-constants.ts"
             if self.dry_run:
-                print(f"[DRY RUN] Would write: {ts_path}")
-                print(f"[DRY RUN] Preview:\n{ts_code[:300]}")
+                log.info("[DRY RUN] Would write: %s", ts_path)
+                log.info("[DRY RUN] Preview:\n%s", ts_code[:300])
             else:
                 ts_path.parent.mkdir(parents=True, exist_ok=True)
                 ts_path.write_text(ts_code, encoding="utf-8")
-                print(f"[ConstantsAndRun] Written: {ts_path}")
+                record_artifact(ts_path, ts_code)
+                log.info("[ConstantsAndRun] Written: %s", ts_path)
             changes.append(Change(
                 before_id="constants_stub",
                 after_id="app_constants_ts",
@@ -137,12 +142,13 @@ class ConstantsAndRunRule:
             ts_code = _build_run_block_ts(raw_run_blocks)
             ts_path = self.app_dir / "app-init.service.ts"
             if self.dry_run:
-                print(f"[DRY RUN] Would write: {ts_path}")
-                print(f"[DRY RUN] Preview:\n{ts_code[:300]}")
+                log.info("[DRY RUN] Would write: %s", ts_path)
+                log.info("[DRY RUN] Preview:\n%s", ts_code[:300])
             else:
                 ts_path.parent.mkdir(parents=True, exist_ok=True)
                 ts_path.write_text(ts_code, encoding="utf-8")
-                print(f"[ConstantsAndRun] Written: {ts_path}")
+                record_artifact(ts_path, ts_code)
+                log.info("[ConstantsAndRun] Written: %s", ts_path)
             changes.append(Change(
                 before_id="run_block_stub",
                 after_id="app_init_service_ts",
@@ -150,5 +156,5 @@ class ConstantsAndRunRule:
                 reason=f"Generated app-init.service.ts from {len(raw_run_blocks)} .run() block(s)",
             ))
 
-        print("========== ConstantsAndRunRule DONE ==========\n")
+        log.debug("========== ConstantsAndRunRule DONE ==========\n")
         return changes
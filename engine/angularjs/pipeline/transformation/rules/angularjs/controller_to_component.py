@@ -3,14 +3,30 @@ from pathlib import Path
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import record_artifact
 from orchestration.simple_progress import SimpleProgress
 from pipeline.transformation.helpers import iter_controllers
+from pipeline.analysis.template_index import TemplateIndex
 from pipeline.transformation.template_migrator import (
-    extract_controller_template,
     migrate_template,
     migrate_template_from_raw,
 )
 from pipeline.transformation.di_mapper import resolve_di_tokens
+from pipeline.transformation.js_sanitizer import CALLBACK_SANITIZER, URL_SANITIZER
+from pipeline.transformation.artifact_cache import ArtifactCache
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
+
+
+# Modules whose code shapes the generated component; any edit invalidates
+# the artifact cache.
+_GENERATOR_MODULES = (
+    __name__,
+    "pipeline.transformation.template_migrator",
+    "pipeline.transformation.di_mapper",
+    "pipeline.transformation.js_sanitizer",
+)
 
 
 def _to_camel(name: str) -> str:
@@ -30,118 +46,6 @@ def _infer_prop_name(url: str | None) -> str:
     return parts[0] + "".join(p.capitalize() for p in parts[1:])
 
 
-def _sanitize_angularjs_callback(src: str) -> str:
-    """
-    Rewrite AngularJS callback/body text to valid Angular TypeScript.
-
-    Transformations applied (in order):
-      $scope.x        →  this.x
-      self./vm./ctrl. →  this.
-      ServiceName.fn  →  this.serviceName.fn  (PascalCase DI service calls)
-      $routeParams.x  →  this.route.snapshot.params["x"]
-      $stateParams.x  →  this.route.snapshot.params["x"]
-      res.data        →  res
-      $location.*     →  this.router.*/this.router.url
-      $timeout(       →  setTimeout(
-      $interval(      →  setInterval(
-      $timeout.cancel/clear → clearTimeout/clearInterval(this.handle)
-      $log.*          →  console.*
-      function() {    →  () => {        (no-param: fixes TS2683 'this' binding)
-      function(p) {   →  (p: any) => {  (with-param: fixes TS2683 + TS7006)
-    """
-    if not src:
-        return src
-
-    src = src.replace("$scope.", "this.")
-    # self/vm/ctrl aliases
-    src = re.sub(r'\bself\.', 'this.', src)
-    src = re.sub(r'\bvm\.', 'this.', src)
-    src = re.sub(r'\bctrl\.', 'this.', src)
-
-    # Custom service DI: PascalCase.method( → this.camelCase.method(
-    # e.g. AuthService.login( → this.authService.login(
-    def _svc_to_this(m):
-        name = m.group(1)
-        camel = name[0].lower() + name[1:]
-        return f'this.{camel}.'
-    src = re.sub(r'\b([A-Z][a-zA-Z0-9]+)\.(?!prototype)', _svc_to_this, src)
-
-    # Route params
-    src = re.sub(r'\$routeParams\.(\w+)', r'this.route.snapshot.params["\1"]', src)
-    src = re.sub(r'\$stateParams\.(\w+)', r'this.route.snapshot.params["\1"]', src)
-
-    src = src.replace("res.data", "res")
-    src = src.replace("response.data", "res")
-
-    # $location rewrites
-    src = re.sub(
-        r"\$location\.path\(('[^']+'|\"[^\"]+\")\)",
-        lambda m: f'this.router.navigate([{m.group(1)}])',
-        src
-    )
-    src = re.sub(
-        r'\$location\.path\(([^)]+)\)',
-        lambda m: f'this.router.navigate([{m.group(1)}])',
-        src
-    )
-    src = re.sub(
-        r'\$location\.url\(([^)]+)\)',
-        lambda m: f'this.router.navigateByUrl({m.group(1)})',
-        src
-    )
-    src = src.replace('$location.search()', 'this.route.snapshot.queryParams')
-    src = src.replace('$location.absUrl()', 'window.location.href')
-    src = src.replace('$location.path()', 'this.router.url')
-
-    # $timeout/$interval — cancel FIRST, then general calls
-    src = src.replace('$timeout.cancel(', 'clearTimeout(')
-    src = src.replace('$interval.cancel(', 'clearInterval(')
-    src = src.replace('$timeout(', 'setTimeout(')
-    src = src.replace('$interval(', 'setInterval(')
-
-    # clearInterval/clearTimeout with bare variable name (from outer controller scope)
-    # → prefix with this. so TypeScript can resolve it as a class field (TS2304 fix)
-    src = re.sub(
-        r'clear(Interval|Timeout)\((?!this\.)([a-zA-Z_]\w*)\)',
-        lambda m: f'clear{m.group(1)}(this.{m.group(2)})',
-        src
-    )
-
-    # $log rewrites
-    src = src.replace('$log.info(',  'console.info(')
-    src = src.replace('$log.warn(',  'console.warn(')
-    src = src.replace('$log.error(', 'console.error(')
-    src = src.replace('$log.debug(', 'console.debug(')
-    src = src.replace('$log.log(',   'console.log(')
-
-    # Convert function callbacks to arrow functions to fix TS2683
-    # ('this' implicitly has type 'any' inside regular function() callbacks).
-    # Arrow functions capture 'this' from the enclosing class method.
-
-    # Step 1: no-param function() { → () => {
-    src = re.sub(r'function\(\)\s*\{', '() => {', src)
-    
-
-    # Step 2: function(params) { → (params: any) => {
-    # Annotates untyped params and converts to arrow syntax.
-    def _fn_to_arrow(m):
-        params_str = m.group(1)
-        params = [p.strip() for p in params_str.split(",") if p.strip()]
-        typed = []
-        for p in params:
-            if ":" in p or p.startswith("...") or not p:
-                typed.append(p)
-            else:
-                typed.append(f"{p}: any")
-        return f"({', '.join(typed)}) => {{"
-
-    src = re.sub(r'function\(([^)]*)\)\s*\{', _fn_to_arrow, src)
-
-    # Promise → Observable conversion
-    src = re.sub(r'\.then\s*\(', '.subscribe(', src)
-
-    return src
-
 def _js_concat_to_template_literal(url_src: str) -> str:
     """
     Convert a JS string-concat URL expression to a TypeScript template literal.
@@ -180,26 +84,6 @@ def _js_concat_to_template_literal(url_src: str) -> str:
     return f"`{result}`"
 
 
-def _sanitize_url_src(url_src: str) -> str:
-    """
-    Sanitize AngularJS tokens from a dynamic URL source expression.
-    Only replaces AngularJS-specific route params — avoids corrupting URL strings.
-      $routeParams.x  ->  this.route.snapshot.params["x"]
-      $stateParams.x  ->  this.route.snapshot.params["x"]
-      \bself.x         ->  this.x
-      \bvm.x           ->  this.x
-    """
-    if not url_src:
-        return url_src
-    url_src = re.sub(r'\$routeParams\.(\w+)', r'this.route.snapshot.params["\1"]', url_src)
-    url_src = re.sub(r'\$stateParams\.(\w+)', r'this.route.snapshot.params["\1"]', url_src)
-    url_src = re.sub(r'\bself\.', 'this.', url_src)
-    url_src = re.sub(r'\bvm\.', 'this.', url_src)
-    url_src = re.sub(r'\bctrl\.', 'this.', url_src)
-    url_src = url_src.replace('$scope.', 'this.')
-    return url_src
-
-
 def _build_inline_http_call(call, known_props: set | None = None) -> list[str]:
     """
     Render a single RawHttpCall as inline TypeScript statements suitable
@@ -235,9 +119,9 @@ def _build_inline_http_call(call, known_props: set | None = None) -> list[str]:
     method   = getattr(call, "method", "get")
     url      = getattr(call, "url", None)
     has_catch   = getattr(call, "has_catch", False)
-    then_src    = _sanitize_angularjs_callback(getattr(call, "then_body_src", None))
-    catch_src   = _sanitize_angularjs_callback(getattr(call, "catch_body_src", None))
-    req_body    = _sanitize_angularjs_callback(getattr(call, "request_body_src", None))
+    then_src    = CALLBACK_SANITIZER(getattr(call, "then_body_src", None))
+    catch_src   = CALLBACK_SANITIZER(getattr(call, "catch_body_src", None))
+    req_body    = CALLBACK_SANITIZER(getattr(call, "request_body_src", None))
 
     # url_src is set by js.py for dynamic URLs (e.g. "'/api/users/' + id").
     # When present, sanitize AngularJS tokens ($routeParams, self., etc.) first,
@@ -247,7 +131,7 @@ def _build_inline_http_call(call, known_props: set | None = None) -> list[str]:
     if url:
         url_lit = f"'{url}'"
     elif url_src:
-        url_src = _sanitize_url_src(url_src)
+        url_src = URL_SANITIZER(url_src)
         url_lit = _js_concat_to_template_literal(url_src)
     else:
         url_lit = "'/'"  # unknown dynamic URL
@@ -329,6 +213,23 @@ def _build_inline_http_call(call, known_props: set | None = None) -> list[str]:
     return lines
 
 
+_TIMER_HANDLE_RE = re.compile(r'clear(?:Interval|Timeout)\(this\.(\w+)\)')
+
+
+def _add_timer_fields(scope_properties: list[str], scope_methods: list[dict] | None) -> None:
+    """
+    Scan method bodies for clearInterval/clearTimeout(this.X) and add X as a
+    class field (in place — the list is the controller's scope_writes).
+    """
+    for _m in (scope_methods or []):
+        _raw = _m.get("body_src", "") or ""
+        if _raw.strip():
+            _san = CALLBACK_SANITIZER(_raw)
+            for _h in _TIMER_HANDLE_RE.findall(_san):
+                if _h not in scope_properties:
+                    scope_properties.append(_h)
+
+
 def _build_component_ts(
     base: str,
     class_name: str,
@@ -344,15 +245,7 @@ def _build_component_ts(
 ) -> str:
     resolution = resolve_di_tokens(di_tokens)
     scope_properties    = scope_properties    or []
-    # Scan body_src for clearInterval/clearTimeout(this.X) → add X as class field
-    _timer_re = re.compile(r'clear(?:Interval|Timeout)\(this\.(\w+)\)')
-    for _m in (scope_methods or []):
-        _raw = _m.get("body_src", "") or ""
-        if _raw.strip():
-            _san = _sanitize_angularjs_callback(_raw)
-            for _h in _timer_re.findall(_san):
-                if _h not in scope_properties:
-                    scope_properties.append(_h)
+    _add_timer_fields(scope_properties, scope_methods)
     scope_methods       = scope_methods       or []
     init_calls          = init_calls          or []
     http_calls_by_method = http_calls_by_method or {}
@@ -449,9 +342,9 @@ def _build_component_ts(
                 seen_props.add(prop)
                 prop_lines.append(f"  {prop}: any = null;")
             elif prop and prop in method_names:
-                print(
-                    f"[ControllerToComponent] Skipping HTTP-inferred prop {prop!r}"
-                    f" — collides with method name (would cause TS2300 duplicate identifier)"
+                log.debug(
+                    "[ControllerToComponent] Skipping HTTP-inferred prop %r — collides with method name (would cause TS2300 duplicate identifier)",
+                    prop,
                 )
 
     # Also declare properties that appear in then_body_src callbacks
@@ -461,15 +354,15 @@ def _build_component_ts(
         for call in calls:
             _tbs = getattr(call, "then_body_src", None)
             if _tbs:
-                _sanitized_tbs = _sanitize_angularjs_callback(_tbs)
+                _sanitized_tbs = CALLBACK_SANITIZER(_tbs)
                 for _m in re.finditer(r'\bthis\.(\w+)\s*=', _sanitized_tbs):
                     _cbprop = _m.group(1)
                     if _cbprop not in seen_props and _cbprop not in method_names:
                         seen_props.add(_cbprop)
                         prop_lines.append(f"  {_cbprop}: any = null;")
-                        print(
-                            f"[ControllerToComponent] Declared then-body prop {_cbprop!r}"
-                            f" (found in callback: 'this.{_cbprop} = ...')"
+                        log.debug(
+                            "[ControllerToComponent] Declared then-body prop %r (found in callback: 'this.%s = ...')",
+                            _cbprop, _cbprop,
                         )
 
     # ── Class methods — HTTP calls inlined directly ───────────────────────
@@ -484,7 +377,7 @@ def _build_component_ts(
         params = ", ".join(f"{p}: any" for p in m["params"])
         # If the body_src contains a 'return' statement, the method should return 'any'
         # not 'void' (e.g., getCurrentPath returns this.router.url which is a string).
-        _body_preview = _sanitize_angularjs_callback(m.get("body_src", "") or "")
+        _body_preview = CALLBACK_SANITIZER(m.get("body_src", "") or "")
         _ret_type = "any" if re.search(r'\breturn\b', _body_preview) else "void"
         method_lines.append(f"\n  {mname}({params}): {_ret_type} {{")
 
@@ -499,11 +392,14 @@ def _build_component_ts(
             # No HTTP calls — try to emit sanitized body from captured source
             raw_body = m.get("body_src", "") or ""
             if raw_body.strip():
-                sanitized = _sanitize_angularjs_callback(raw_body)
+                sanitized = CALLBACK_SANITIZER(raw_body)
                 # Indent each line inside the method body
                 body_lines = [f"    {ln}" for ln in sanitized.splitlines()]
                 method_lines.extend(body_lines)
-                print(f"[ControllerToComponent] Emitting sanitized body for {mname}() ({len(body_lines)} lines)")
+                log.debug(
+                    "[ControllerToComponent] Emitting sanitized body for %s() (%s lines)",
+                    mname, len(body_lines),
+                )
             else:
                 method_lines.append(f"    // TODO: migrate from $scope.{mname}")
 
@@ -613,43 +509,35 @@ class ControllerToComponentRule:
         self.out_dir     = Path(out_dir) / "src" / "app"
         self.dry_run     = dry_run
         self._http_calls = []
+        self._templates  = TemplateIndex([])
+        self.cache       = ArtifactCache(
+            out_dir, "ControllerToComponentRule", _GENERATOR_MODULES, enabled=not dry_run,
+        )
 
     def apply(self, analysis, patterns):
-        print("\n========== ControllerToComponentRule.apply() ==========")
+        log.debug("\n========== ControllerToComponentRule.apply() ==========")
         if self.dry_run:
-            print("[ControllerToComponent] DRY RUN — no files will be written")
+            log.info("[ControllerToComponent] DRY RUN — no files will be written")
 
         changes = []
 
         if not self.dry_run:
             self.project.ensure()
 
-        raw_templates = getattr(analysis, "raw_templates", []) or []
-
-        template_html_by_controller: dict[str, str] = {}
-        for t in raw_templates:
-            ctrl     = getattr(t, "controller", None)
-            raw_html = getattr(t, "raw_html", "") or ""
-            if ctrl and raw_html.strip():
-                template_html_by_controller[ctrl] = raw_html
-
-        for t in raw_templates:
-            raw_html = getattr(t, "raw_html", "") or ""
-            if not raw_html.strip():
-                continue
-            for ctrl_match in re.finditer(r'\bng-controller\s*=\s*["\'](\w+)', raw_html):
-                ctrl_name = ctrl_match.group(1)
-                if ctrl_name not in template_html_by_controller:
-                    template_html_by_controller[ctrl_name] = raw_html
+        # Controller → template lookups come from the analysis-time index;
+        # fall back to building one for hand-made AnalysisResults.
+        self._templates = getattr(analysis, "template_index", None) or TemplateIndex(
+            getattr(analysis, "raw_templates", []) or []
+        )
 
         self._http_calls = getattr(analysis, "http_calls", []) or []
 
         controllers = list(iter_controllers(analysis, patterns))
-        print(f"[ControllerToComponent] Controllers detected: {len(controllers)}")
-        print(f"[ControllerToComponent] Template sources available: {list(template_html_by_controller.keys())}")
+        log.info("[ControllerToComponent] Controllers detected: %s", len(controllers))
+        log.info("[ControllerToComponent] Template sources available: %s", self._templates.controllers())
 
         if not controllers:
-            print("[ControllerToComponent]  No controllers matched.")
+            log.info("[ControllerToComponent]  No controllers matched.")
             changes.append(Change(
                 before_id="debug_controller_rule",
                 after_id="debug_controller_rule_ran",
@@ -661,20 +549,19 @@ class ControllerToComponentRule:
         progress = SimpleProgress(len(controllers), "Controllers")
 
         for c in controllers:
-            source_html  = template_html_by_controller.get(c.name)
-            raw_template = next(
-                (t for t in raw_templates if getattr(t, "controller", None) == c.name),
-                None
-            )
-            self._emit_component(c, changes, source_html, raw_template)
+            source       = self._templates.source_for(c.name)
+            raw_template = self._templates.owner_template(c.name)
+            self._emit_component(c, changes, source, raw_template)
             progress.step(c.name)
         
         progress.done()
+        self.cache.save()
+        log.info("[ControllerToComponent] Artifact cache: %s", self.cache.summary())
 
-        print("========== ControllerToComponentRule DONE ==========\n")
+        log.debug("========== ControllerToComponentRule DONE ==========\n")
         return changes
 
-    def _resolve_html_content(self, c, source_html, raw_template) -> tuple[str, str]:
+    def _resolve_html_content(self, c, source, raw_template) -> tuple[str, str]:
         if getattr(c, "template", None):
             return migrate_template(c.template), "inline_template"
 
@@ -699,8 +586,12 @@ class ControllerToComponentRule:
                 )
                 return content, "inline_template"
 
-        if source_html:
-            fragment = extract_controller_template(source_html, c.name)
+        if source is not None:
+            ref = self._templates.fragment_ref(c.name, source)
+            fragment = (
+                migrate_template(ref.fragment.strip())
+                if ref is not None and ref.fragment is not None else None
+            )
             if fragment:
                 content = (
                     f"<!-- Angular template for {class_name} —"
@@ -709,11 +600,11 @@ class ControllerToComponentRule:
                 )
                 return content, "fragment_extracted"
 
-            other_controllers = re.findall(r'\bng-controller\s*=\s*["\'](\w+)', source_html)
+            other_controllers = self._templates.controllers_in(source)
             if not other_controllers or other_controllers == [c.name]:
                 content = (
                     f"<!-- Angular template for {class_name} — migrated from AngularJS -->\n"
-                    + migrate_template(source_html)
+                    + migrate_template(source.raw_html)
                 )
                 return content, "full_file_migrated"
 
@@ -756,7 +647,7 @@ class ControllerToComponentRule:
         content = "\n".join(lines)
         return content, "auto_generated"
 
-    def _emit_component(self, c, changes: list, source_html, raw_template) -> None:
+    def _emit_component(self, c, changes: list, source, raw_template) -> None:
         # Strip "Controller"/"Ctrl" suffix (classic controllers).
         # For camelCase .component() names (e.g. "userProfile", "phoneList"),
         # the replace() calls are no-ops.
@@ -786,16 +677,19 @@ class ControllerToComponentRule:
             class_name = _stripped[0].upper() + _stripped[1:] + "Component"
 
         selector   = f"app-{base}"
-        print(f"[ControllerToComponent DEBUG] _emit_component: c.name={c.name!r} -> base={base!r} class_name={class_name!r} is_component={getattr(c, 'is_component', False)}")
+        log.debug(
+            "[ControllerToComponent DEBUG] _emit_component: c.name=%r -> base=%r class_name=%r is_component=%s",
+            c.name, base, class_name, getattr(c, 'is_component', False),
+        )
         ts_path    = self.out_dir / f"{base}.component.ts"
         html_path  = self.out_dir / f"{base}.component.html"
 
         di_tokens: list[str] = getattr(c, "di", [])
 
         if di_tokens:
-            print(f"[ControllerToComponent] DI for {c.name}: {di_tokens}")
+            log.debug("[ControllerToComponent] DI for %s: %s", c.name, di_tokens)
         else:
-            print(f"[ControllerToComponent] DI for {c.name}: (none detected)")
+            log.debug("[ControllerToComponent] DI for %s: (none detected)", c.name)
 
         scope_properties: list[str] = getattr(c, "scope_writes",  []) or []
         scope_methods:    list[dict] = getattr(c, "scope_methods", []) or []
@@ -814,23 +708,37 @@ class ControllerToComponentRule:
             if getattr(call, "has_catch", False):
                 methods_needing_catch_imports.add(om)
 
-        ts_code = _build_component_ts(
-            base, class_name, selector, di_tokens,
-            scope_properties=scope_properties,
-            scope_methods=scope_methods,
-            init_calls=init_calls_list,
-            http_calls_by_method=http_calls_by_method,
-            methods_needing_catch_imports=methods_needing_catch_imports,
+        # Timer handles become class fields; done up front so a cache hit
+        # leaves scope_writes exactly as a fresh generation would.
+        _add_timer_fields(scope_properties, scope_methods)
+
+        ts_key = f"src/app/{ts_path.name}"
+        ts_fp  = self.cache.fingerprint(
+            ts_key, class_name, selector, di_tokens, scope_properties,
+            scope_methods, init_calls_list, http_calls_by_method,
+            methods_needing_catch_imports,
         )
+        ts_code = self.cache.get(ts_key, ts_fp)
+        if ts_code is None:
+            ts_code = _build_component_ts(
+                base, class_name, selector, di_tokens,
+                scope_properties=scope_properties,
+                scope_methods=scope_methods,
+                init_calls=init_calls_list,
+                http_calls_by_method=http_calls_by_method,
+                methods_needing_catch_imports=methods_needing_catch_imports,
+            )
+            self.cache.put(ts_key, ts_fp, ts_code)
 
         if self.dry_run:
-            print(f"[DRY RUN] Would write: {ts_path}")
-            print(f"[DRY RUN] Preview:\n{ts_code[:400]}")
+            log.info("[DRY RUN] Would write: %s", ts_path)
+            log.info("[DRY RUN] Preview:\n%s", ts_code[:400])
         else:
             ts_path.parent.mkdir(parents=True, exist_ok=True)
             if not ts_path.exists() or ts_path.read_text(encoding="utf-8") != ts_code:
                 ts_path.write_text(ts_code, encoding="utf-8")
-                print(f"[ControllerToComponent] Written: {ts_path}")
+                log.info("[ControllerToComponent] Written: %s", ts_path)
+            record_artifact(ts_path, ts_code, class_name=class_name, selector=selector)
 
         changes.append(Change(
             before_id=c.id,
@@ -839,16 +747,28 @@ class ControllerToComponentRule:
             reason=f"Controller -> Angular Component written to {ts_path}",
         ))
 
-        html_content, method = self._resolve_html_content(c, source_html, raw_template)
-        print(f"[ControllerToComponent] Template for {c.name}: method={method}")
+        html_key = f"src/app/{html_path.name}"
+        html_fp  = self.cache.fingerprint(
+            html_key, c.name, getattr(c, "template", None),
+            getattr(c, "is_component", False), source, raw_template,
+            getattr(c, "scope_methods", []), getattr(c, "scope_writes", []),
+        )
+        cached = self.cache.get(html_key, html_fp)
+        if cached is None:
+            html_content, method = self._resolve_html_content(c, source, raw_template)
+            self.cache.put(html_key, html_fp, [html_content, method])
+        else:
+            html_content, method = cached
+        log.debug("[ControllerToComponent] Template for %s: method=%s", c.name, method)
 
         if self.dry_run:
-            print(f"[DRY RUN] Would write: {html_path}")
-            print(f"[DRY RUN] Preview:\n{html_content[:300]}")
+            log.info("[DRY RUN] Would write: %s", html_path)
+            log.info("[DRY RUN] Preview:\n%s", html_content[:300])
         else:
             if not html_path.exists():
                 html_path.write_text(html_content, encoding="utf-8")
-                print(f"[ControllerToComponent] Template written: {html_path}")
+                record_artifact(html_path, html_content)
+                log.debug("[ControllerToComponent] Template written: %s", html_path)
 
         changes.append(Change(
             before_id=f"{c.id}_html",
@@ -47,7 +47,11 @@ from pathlib import Path
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import record_artifact
 from orchestration.simple_progress import SimpleProgress
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -252,9 +256,9 @@ class DirectiveToComponentRule:
         self.dry_run = dry_run
 
     def apply(self, analysis, patterns):
-        print("\n========== DirectiveToComponentRule.apply() ==========")
+        log.debug("\n========== DirectiveToComponentRule.apply() ==========")
         if self.dry_run:
-            print("[DirectiveToComponent] DRY RUN — no files will be written")
+            log.info("[DirectiveToComponent] DRY RUN — no files will be written")
 
         changes = []
 
@@ -262,11 +266,11 @@ class DirectiveToComponentRule:
             self.project.ensure()
 
         directives = getattr(analysis, "directives", []) or []
-        print(f"[DirectiveToComponent] Directives detected: {len(directives)}")
+        log.info("[DirectiveToComponent] Directives detected: %s", len(directives))
 
         if not directives:
-            print("[DirectiveToComponent] No directives — nothing to do.")
-            print("========== DirectiveToComponentRule DONE ==========\n")
+            log.debug("[DirectiveToComponent] No directives — nothing to do.")
+            log.debug("========== DirectiveToComponentRule DONE ==========\n")
             return changes
 
         seen: set[str] = set()
@@ -285,9 +289,10 @@ class DirectiveToComponentRule:
             is_element  = "E" in restrict
             is_attr_only = restrict == "A" or restrict == "C"
 
-            print(f"[DirectiveToComponent] {name!r}  restrict={restrict!r}  "
-                  f"link={getattr(d,'has_link',False)}  "
-                  f"compile={getattr(d,'has_compile',False)}")
+            log.info(
+                "[DirectiveToComponent] %r  restrict=%r  link=%s  compile=%s",
+                name, restrict, getattr(d,'has_link',False), getattr(d,'has_compile',False),
+            )
 
             if is_element:
                 # Element directive (with or without attribute) → @Component
@@ -296,15 +301,17 @@ class DirectiveToComponentRule:
                 html_path = self.app_dir / f"{stem}.component.html"
 
                 if self.dry_run:
-                    print(f"[DRY RUN] Would write: {ts_path}")
+                    log.info("[DRY RUN] Would write: %s", ts_path)
                 else:
                     self.app_dir.mkdir(parents=True, exist_ok=True)
                     if not ts_path.exists():
                         ts_path.write_text(ts_code, encoding="utf-8")
-                        print(f"[DirectiveToComponent] Written: {ts_path}")
+                        record_artifact(ts_path, ts_code)
+                        log.info("[DirectiveToComponent] Written: %s", ts_path)
                     if not html_path.exists():
                         html_path.write_text(html_code, encoding="utf-8")
-                        print(f"[DirectiveToComponent] Written: {html_path}")
+                        record_artifact(html_path, html_code)
+                        log.info("[DirectiveToComponent] Written: %s", html_path)
 
                 changes.append(Change(
                     before_id=f"directive_{name}",
@@ -319,12 +326,13 @@ class DirectiveToComponentRule:
                 ts_path = self.app_dir / f"{stem}.directive.ts"
 
                 if self.dry_run:
-                    print(f"[DRY RUN] Would write: {ts_path}")
+                    log.info("[DRY RUN] Would write: %s", ts_path)
                 else:
                     self.app_dir.mkdir(parents=True, exist_ok=True)
                     if not ts_path.exists():
                         ts_path.write_text(ts_code, encoding="utf-8")
-                        print(f"[DirectiveToComponent] Written: {ts_path}")
+                        record_artifact(ts_path, ts_code)
+                        log.info("[DirectiveToComponent] Written: %s", ts_path)
 
                 changes.append(Change(
                     before_id=f"directive_{name}",
@@ -337,6 +345,6 @@ class DirectiveToComponentRule:
         
         progress.done()
 
-        print(f"[DirectiveToComponent] {len(changes)} directive(s) migrated.")
-        print("========== DirectiveToComponentRule DONE ==========\n")
+        log.info("[DirectiveToComponent] %s directive(s) migrated.", len(changes))
+        log.debug("========== DirectiveToComponentRule DONE ==========\n")
         return changes
\ No newline at end of file
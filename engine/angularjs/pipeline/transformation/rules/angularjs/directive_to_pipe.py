@@ -36,6 +36,8 @@ Design
 - Does NOT attempt JS → TS translation of the body (too fragile)
 - Inserts original body as a comment so developer can port it manually
 - Skips if file already exists (idempotent)
+- Pipe source is reused from the artifact cache when the filter body and
+  generator code are unchanged since the last run
 """
 
 import re
@@ -44,6 +46,11 @@ from pathlib import Path
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import record_artifact
+from pipeline.transformation.artifact_cache import ArtifactCache
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 def _to_pascal(name: str) -> str:
@@ -118,11 +125,14 @@ class DirectiveToPipeRule:
         self.project = AngularProjectScaffold(out_dir)
         self.app_dir = Path(out_dir) / "src" / "app"
         self.dry_run = dry_run
+        self.cache   = ArtifactCache(
+            out_dir, "DirectiveToPipeRule", (__name__,), enabled=not dry_run,
+        )
 
     def apply(self, analysis, patterns):
-        print("\n========== DirectiveToPipeRule.apply() ==========")
+        log.debug("\n========== DirectiveToPipeRule.apply() ==========")
         if self.dry_run:
-            print("[DirectiveToPipe] DRY RUN — no files will be written")
+            log.info("[DirectiveToPipe] DRY RUN — no files will be written")
 
         changes = []
 
@@ -130,11 +140,11 @@ class DirectiveToPipeRule:
             self.project.ensure()
 
         filters = getattr(analysis, "filters", []) or []
-        print(f"[DirectiveToPipe] Filters detected: {len(filters)}")
+        log.debug("[DirectiveToPipe] Filters detected: %s", len(filters))
 
         if not filters:
-            print("[DirectiveToPipe] No filters found — nothing to do.")
-            print("========== DirectiveToPipeRule DONE ==========\n")
+            log.info("[DirectiveToPipe] No filters found — nothing to do.")
+            log.debug("========== DirectiveToPipeRule DONE ==========\n")
             return changes
 
         seen_names: set[str] = set()
@@ -153,22 +163,28 @@ class DirectiveToPipeRule:
             class_name = _to_pascal(name) + "Pipe"
             ts_path    = self.app_dir / f"{base}.pipe.ts"
 
-            pipe_code = _generate_pipe(
-                pipe_name=name,
-                class_name=class_name,
-                original_body=fn_body,
-            )
+            ts_key    = f"src/app/{ts_path.name}"
+            ts_fp     = self.cache.fingerprint(ts_key, name, class_name, fn_body)
+            pipe_code = self.cache.get(ts_key, ts_fp)
+            if pipe_code is None:
+                pipe_code = _generate_pipe(
+                    pipe_name=name,
+                    class_name=class_name,
+                    original_body=fn_body,
+                )
+                self.cache.put(ts_key, ts_fp, pipe_code)
 
             if self.dry_run:
-                print(f"[DRY RUN] Would write: {ts_path}")
-                print(f"[DRY RUN] Preview:\n{pipe_code[:300]}")
+                log.info("[DRY RUN] Would write: %s", ts_path)
+                log.info("[DRY RUN] Preview:\n%s", pipe_code[:300])
             else:
                 self.app_dir.mkdir(parents=True, exist_ok=True)
                 if not ts_path.exists():
                     ts_path.write_text(pipe_code, encoding="utf-8")
-                    print(f"[DirectiveToPipe] Written: {ts_path}")
+                    record_artifact(ts_path, pipe_code, class_name=class_name)
+                    log.info("[DirectiveToPipe] Written: %s", ts_path)
                 else:
-                    print(f"[DirectiveToPipe] Skipped (exists): {ts_path}")
+                    log.info("[DirectiveToPipe] Skipped (exists): %s", ts_path)
 
             changes.append(Change(
                 before_id=f"filter_{name}",
@@ -177,6 +193,8 @@ class DirectiveToPipeRule:
                 reason=f"AngularJS filter '{name}' → Angular @Pipe stub at {ts_path}",
             ))
 
-        print(f"[DirectiveToPipe] {len(changes)} pipe(s) generated.")
-        print("========== DirectiveToPipeRule DONE ==========\n")
+        self.cache.save()
+        log.info("[DirectiveToPipe] %s pipe(s) generated.", len(changes))
+        log.info("[DirectiveToPipe] Artifact cache: %s", self.cache.summary())
+        log.debug("========== DirectiveToPipeRule DONE ==========\n")
         return changes
\ No newline at end of file
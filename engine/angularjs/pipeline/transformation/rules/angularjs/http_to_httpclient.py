@@ -1,8 +1,15 @@
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import record_artifact
 from pipeline.transformation.helpers import iter_http_calls
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
+
 
 HTTP_CLIENT_IMPORT        = "import { HttpClient } from '@angular/common/http';\n"
 HTTP_CLIENT_MODULE_IMPORT = "import { HttpClientModule } from '@angular/common/http';\n"
@@ -74,6 +81,17 @@ def _infer_prop_name(url) -> str:
     return parts[0] + "".join(p.capitalize() for p in parts[1:])
 
 
+@dataclass
+class _FilePlan:
+    """Everything HttpToHttpClientRule will write into one target file."""
+    target_ts:  Path
+    kind:       str                 # "service" | "component"
+    class_name: str
+    selector:   Optional[str]
+    owner:      Optional[str]
+    ops:        list = field(default_factory=list)   # ("http", method, url, has_catch) | ("q_defer",)
+
+
 class HttpToHttpClientRule:
     def __init__(self, out_dir: str = "out/angular-app", dry_run: bool = False):
         self.project  = AngularProjectScaffold(out_dir)
@@ -81,9 +99,9 @@ class HttpToHttpClientRule:
         self.dry_run  = dry_run
 
     def apply(self, analysis, patterns):
-        print("\n========== HttpToHttpClientRule.apply() ==========")
+        log.debug("\n========== HttpToHttpClientRule.apply() ==========")
         if self.dry_run:
-            print("[HttpToHttpClient] DRY RUN — no files will be written")
+            log.info("[HttpToHttpClient] DRY RUN — no files will be written")
 
         changes = []
 
@@ -92,12 +110,19 @@ class HttpToHttpClientRule:
             self._ensure_httpclient_module()
 
         calls = list(iter_http_calls(analysis, patterns))
-        print(f"[HttpToHttpClient] HTTP calls detected: {len(calls)}")
+        log.info("[HttpToHttpClient] HTTP calls detected: %s", len(calls))
 
+        # Calls are grouped by target file; each file is then read (or
+        # stubbed), patched in memory with all its methods, and written once.
+        plans: dict[Path, _FilePlan] = {}
         for call in calls:
-            self._migrate_call(call, changes)
+            self._migrate_call(call, changes, plans)
 
-        print("========== HttpToHttpClientRule DONE ==========\n")
+        if not self.dry_run:
+            for plan in plans.values():
+                self._write_plan(plan)
+
+        log.debug("========== HttpToHttpClientRule DONE ==========\n")
         return changes
 
     # -----------------------------------------------------------------------
@@ -118,13 +143,14 @@ class HttpToHttpClientRule:
             "imports: [BrowserModule, AppRoutingModule, HttpClientModule]",
         )
         app_module.write_text(text, encoding="utf-8")
-        print("[HttpToHttpClient] HttpClientModule added to AppModule")
+        record_artifact(app_module, text)
+        log.debug("[HttpToHttpClient] HttpClientModule added to AppModule")
 
     # -----------------------------------------------------------------------
     # Per-call migration
     # -----------------------------------------------------------------------
 
-    def _migrate_call(self, call, changes: list):
+    def _migrate_call(self, call, changes: list, plans: dict):
         method    = getattr(call, "method", "get")
         url       = getattr(call, "url", None)
         file_attr = getattr(call, "file", None) or getattr(call, "source_file", "unknown")
@@ -150,7 +176,10 @@ class HttpToHttpClientRule:
                     f"inlined directly by ControllerToComponentRule — no separate fetch method generated"
                 ),
             ))
-            print(f"[HttpToHttpClient] Skipped (already inlined): {owner}.{owner_method}() → {method} {url}")
+            log.info(
+                "[HttpToHttpClient] Skipped (already inlined): %s.%s() → %s %s",
+                owner, owner_method, method, url,
+            )
             return
 
         base, kind = _owner_to_file_base(call)
@@ -171,31 +200,35 @@ class HttpToHttpClientRule:
                     f"no owning controller found; skipped to protect scaffold root component"
                 ),
             ))
-            print(f"[HttpToHttpClient] Skipped (no owner, would corrupt app.component.ts): {method} {url}")
+            log.info(
+                "[HttpToHttpClient] Skipped (no owner, would corrupt app.component.ts): %s %s",
+                method, url,
+            )
             return
 
         if kind == "service":
             target_ts = self.app_dir / f"{base}.service.ts"
             class_name = "".join(w.capitalize() for w in base.split("_")) + "Service"
             selector   = None
-            if not self.dry_run:
-                self._ensure_service_base(target_ts, class_name, owner=owner)
         else:
             target_ts  = self.app_dir / f"{base}.component.ts"
             class_name = base.capitalize() + "Component"
             selector   = f"app-{base}"
-            if not self.dry_run:
-                self._ensure_component_base(target_ts, selector, class_name)
 
-        print(f"[HttpToHttpClient] {'(dry) ' if self.dry_run else ''}Migrating: "
-              f"{owner or file_attr} -> {method} {url} -> {target_ts.name}")
+        log.info(
+            "[HttpToHttpClient] %sMigrating: %s -> %s %s -> %s",
+            '(dry) ' if self.dry_run else '', owner or file_attr, method, url, target_ts.name,
+        )
 
         if not self.dry_run:
+            plan = plans.get(target_ts)
+            if plan is None:
+                plan = plans[target_ts] = _FilePlan(target_ts, kind, class_name, selector, owner)
             if not is_q_defer:
                 if method in ("get", "post", "put", "delete", "patch"):
-                    self._append_http_method(target_ts, method, url, kind, has_catch)
+                    plan.ops.append(("http", method, url, has_catch))
             else:
-                self._append_q_defer_stub(target_ts)
+                plan.ops.append(("q_defer",))
 
         call_id = getattr(call, "id", f"http_{file_attr}_{method}")
 
@@ -221,16 +254,50 @@ class HttpToHttpClientRule:
     # File creation helpers
     # -----------------------------------------------------------------------
 
-    def _ensure_service_base(self, svc_ts: Path, class_name: str, owner=None):
+    def _write_plan(self, plan: "_FilePlan") -> None:
+        """Stub the target if needed, apply every queued method, write once."""
+        if plan.kind == "service":
+            text = self._ensure_service_base(plan.target_ts, plan.class_name, owner=plan.owner)
+        else:
+            text = self._ensure_component_base(plan.target_ts, plan.selector, plan.class_name)
+
+        created = text is not None
+        if not created:
+            if not plan.target_ts.exists():
+                return
+            text = plan.target_ts.read_text(encoding="utf-8")
+        original = text
+
+        for op in plan.ops:
+            if op[0] == "http":
+                _, method, url, has_catch = op
+                text = self._append_http_method(text, method, url, has_catch)
+            else:
+                text = self._append_q_defer_stub(text)
+
+        if created or text != original:
+            plan.target_ts.parent.mkdir(parents=True, exist_ok=True)
+            plan.target_ts.write_text(text, encoding="utf-8")
+            if created:
+                record_artifact(plan.target_ts, text, class_name=plan.class_name,
+                                selector=plan.selector)
+                log.info("[HttpToHttpClient] Created %s stub: %s", plan.kind, plan.target_ts)
+            else:
+                # Patched an existing file: keep the names its writer recorded
+                # (ours are guessed from the owner and may not match the export)
+                record_artifact(plan.target_ts, text)
+
+    def _ensure_service_base(self, svc_ts: Path, class_name: str, owner=None) -> Optional[str]:
+        """Stub source for a missing service file, or None if one exists."""
         if svc_ts.exists():
-            return
+            return None
 
         # If a ServiceToInjectableRule file already exists for this owner, don't
         # create a duplicate stub (e.g. stats.service.ts when statsservice.service.ts exists).
         if owner:
             canonical_ts = self.app_dir / f"{owner.lower().replace(' ', '')}.service.ts"
             if canonical_ts.exists():
-                return
+                return None
 
         stub = (
             f"import {{ Injectable }} from '@angular/core';\n"
@@ -240,13 +307,12 @@ class HttpToHttpClientRule:
             f"  constructor(private http: HttpClient) {{}}\n\n"
             f"}}\n"
         )
-        svc_ts.parent.mkdir(parents=True, exist_ok=True)
-        svc_ts.write_text(stub, encoding="utf-8")
-        print(f"[HttpToHttpClient] Created service stub: {svc_ts}")
+        return stub
 
-    def _ensure_component_base(self, comp_ts: Path, selector: str, class_name: str):
+    def _ensure_component_base(self, comp_ts: Path, selector: str, class_name: str) -> Optional[str]:
+        """Stub source for a missing component file, or None if one exists."""
         if comp_ts.exists():
-            return
+            return None
         stub = (
             f"import {{ Component }} from '@angular/core';\n"
             f"import {{ HttpClient }} from '@angular/common/http';\n\n"
@@ -259,9 +325,7 @@ class HttpToHttpClientRule:
             f"  constructor(private http: HttpClient) {{}}\n"
             f"}}\n"
         )
-        comp_ts.parent.mkdir(parents=True, exist_ok=True)
-        comp_ts.write_text(stub, encoding="utf-8")
-        print(f"[HttpToHttpClient] Created component stub: {comp_ts}")
+        return stub
 
     @staticmethod
     def _inject_into_class(text: str, code: str) -> str:
@@ -270,16 +334,15 @@ class HttpToHttpClientRule:
             return text + "\n" + code
         return text[:idx] + code + "\n" + text[idx:]
 
-    def _append_http_method(self, target_ts: Path, method: str, url, kind: str, has_catch: bool = False):
+    def _append_http_method(self, source: str, method: str, url, has_catch: bool = False) -> str:
         """
         Generate a standalone fetch* method on a SERVICE file only.
         Components no longer get these — their calls are inlined into the
         originating $scope method by ControllerToComponentRule.
-        """
-        if not target_ts.exists():
-            return
 
-        text = target_ts.read_text(encoding="utf-8")
+        Returns the patched source; unchanged when the method already exists.
+        """
+        text = source
 
         if HTTP_CLIENT_IMPORT not in text:
             text = HTTP_CLIENT_IMPORT + text
@@ -306,7 +369,7 @@ class HttpToHttpClientRule:
             fn_name = f"load_{method}"
 
         if fn_name in text:
-            return
+            return source
 
         url_literal = f"'{url}'" if url else "'/'"
 
@@ -317,14 +380,11 @@ class HttpToHttpClientRule:
             f"  }}\n"
         )
 
-        target_ts.write_text(self._inject_into_class(text, method_code), encoding="utf-8")
+        return self._inject_into_class(text, method_code)
 
-    def _append_q_defer_stub(self, target_ts: Path):
-        if not target_ts.exists():
-            return
-        text = target_ts.read_text(encoding="utf-8")
+    def _append_q_defer_stub(self, text: str) -> str:
         if "legacyDeferExample" in text:
-            return
+            return text
         method_code = (
             "\n  // TODO: $q.defer() detected — migrate manually to RxJS Observable\n"
             "  legacyDeferExample(): Promise<any> {\n"
@@ -334,4 +394,4 @@ class HttpToHttpClientRule:
             "    });\n"
             "  }\n"
         )
-        target_ts.write_text(self._inject_into_class(text, method_code), encoding="utf-8")
\ No newline at end of file
+        return self._inject_into_class(text, method_code)
\ No newline at end of file
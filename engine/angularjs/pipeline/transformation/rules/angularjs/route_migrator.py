@@ -22,6 +22,11 @@ import re
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import record_artifact
+from pipeline.transformation.artifact_cache import ArtifactCache
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -134,13 +139,16 @@ class RouteMigratorRule:
         self.out_dir      = Path(out_dir) / "src" / "app"
         self.routing_path = self.out_dir / "app-routing.module.ts"
         self.dry_run      = dry_run
+        self.cache        = ArtifactCache(
+            out_dir, "RouteMigratorRule", (__name__,), enabled=not dry_run,
+        )
 
     # ── Public entry ─────────────────────────────────────────────────────────
 
     def apply(self, analysis, patterns):
-        print("\n========== RouteMigratorRule.apply() ==========")
+        log.debug("\n========== RouteMigratorRule.apply() ==========")
         if self.dry_run:
-            print("[RouteMigrator] DRY RUN — no files will be written")
+            log.info("[RouteMigrator] DRY RUN — no files will be written")
 
         changes = []
         if not self.dry_run:
@@ -157,11 +165,11 @@ class RouteMigratorRule:
                 seen_sigs.add(sig)
                 routes.append(r)
 
-        print(f"[RouteMigrator] Routes detected: {len(routes)} (raw: {len(raw_routes)})")
+        log.debug("[RouteMigrator] Routes detected: %s (raw: %s)", len(routes), len(raw_routes))
 
         if routes:
             router_types = {r.router_type for r in routes}
-            print(f"[RouteMigrator] Router type(s): {router_types}")
+            log.debug("[RouteMigrator] Router type(s): %s", router_types)
             for r in routes:
                 symbol = r.state_name or r.path
                 flags = []
@@ -170,16 +178,29 @@ class RouteMigratorRule:
                 if getattr(r, "redirect_to", None):  flags.append(f"redirectTo={r.redirect_to}")
                 if getattr(r, "on_enter", None):     flags.append("onEnter")
                 if getattr(r, "on_exit", None):      flags.append("onExit")
-                print(f"[RouteMigrator]   {r.router_type:8s}  {symbol:35s}  ctrl={r.controller}  {' '.join(flags)}")
+                log.debug(
+                    "[RouteMigrator]   %-8s  %-35s  ctrl=%s  %s",
+                    r.router_type, symbol, r.controller, ' '.join(flags),
+                )
 
-        routing_ts, extra_files = self._build_routing_module(routes, analysis)
+        # The routing module depends only on the deduplicated route table
+        # (the fallback for an empty table is constant).
+        key    = "src/app/app-routing.module.ts"
+        fp     = self.cache.fingerprint(key, routes)
+        cached = self.cache.get(key, fp)
+        if cached is None:
+            routing_ts, extra_files = self._build_routing_module(routes, analysis)
+            self.cache.put(key, fp, [routing_ts, extra_files])
+        else:
+            routing_ts, extra_files = cached
 
         if self.dry_run:
-            print(f"[DRY RUN] Would write: {self.routing_path}")
-            print(f"[DRY RUN] Content preview:\n{routing_ts[:600]}")
+            log.info("[DRY RUN] Would write: %s", self.routing_path)
+            log.info("[DRY RUN] Content preview:\n%s", routing_ts[:600])
         else:
             self.routing_path.write_text(routing_ts, encoding="utf-8")
-            print(f"[RouteMigrator] Written: {self.routing_path}")
+            record_artifact(self.routing_path, routing_ts)
+            log.info("[RouteMigrator] Written: %s", self.routing_path)
 
         changes.append(Change(
             before_id="routing_module",
@@ -191,10 +212,11 @@ class RouteMigratorRule:
         for fname, content in extra_files.items():
             fpath = self.out_dir / fname
             if self.dry_run:
-                print(f"[DRY RUN] Would write: {fpath}")
+                log.info("[DRY RUN] Would write: %s", fpath)
             else:
                 fpath.write_text(content, encoding="utf-8")
-                print(f"[RouteMigrator] Written: {fpath}")
+                record_artifact(fpath, content)
+                log.info("[RouteMigrator] Written: %s", fpath)
             changes.append(Change(
                 before_id=f"extra_{fname}",
                 after_id=f"generated_{fname}",
@@ -202,7 +224,9 @@ class RouteMigratorRule:
                 reason=f"Generated {fpath}",
             ))
 
-        print("========== RouteMigratorRule DONE ==========\n")
+        self.cache.save()
+        log.info("[RouteMigrator] Artifact cache: %s", self.cache.summary())
+        log.debug("========== RouteMigratorRule DONE ==========\n")
         return changes
 
     # ── Module builder ────────────────────────────────────────────────────────
@@ -435,7 +459,7 @@ export class AppRoutingModule {}
                 f".then(m => m.{module_class})\n"
                 f"{indent}}}"
             )
-            print(f"[RouteMigrator] Lazy route: {own_path} → {module_class}")
+            log.info("[RouteMigrator] Lazy route: %s → %s", own_path, module_class)
             return entry
 
         # ── Regular state ─────────────────────────────────────────────────
@@ -2,21 +2,23 @@ from pathlib import Path
 from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import record_artifact
 from pipeline.transformation.helpers import iter_services
 from pipeline.transformation.di_mapper import resolve_di_tokens
 from collections import defaultdict
+from pipeline.transformation.js_sanitizer import SERVICE_SANITIZER
 from orchestration.simple_progress import SimpleProgress
+from pipeline.transformation.artifact_cache import ArtifactCache
+from pipeline.log import get_logger
 
+log = get_logger(__name__)
 
 
-
-def _sanitize_svc_cb(src):
-    if not src:
-        return src
-    src = src.replace("$scope.", "this.")
-    src = src.replace("res.data", "res")
-    src = src.replace("response.data", "res")
-    return src
+_GENERATOR_MODULES = (
+    __name__,
+    "pipeline.transformation.di_mapper",
+    "pipeline.transformation.js_sanitizer",
+)
 
 
 def _build_service_ts(
@@ -111,16 +113,16 @@ def _build_service_ts(
                 mv       = getattr(call, "method", "get")
                 url      = getattr(call, "url", None)
                 hc       = getattr(call, "has_catch", False)
-                then_src = _sanitize_svc_cb(getattr(call, "then_body_src",    None))
-                cth_src  = _sanitize_svc_cb(getattr(call, "catch_body_src",   None))
-                req_body = _sanitize_svc_cb(getattr(call, "request_body_src", None))
+                then_src = SERVICE_SANITIZER(getattr(call, "then_body_src",    None))
+                cth_src  = SERVICE_SANITIZER(getattr(call, "catch_body_src",   None))
+                req_body = SERVICE_SANITIZER(getattr(call, "request_body_src", None))
                 if url is None:
                     _url_src = getattr(call, 'url_src', None)
                     if _url_src:
                         import re as _re
                         ue = _re.sub(r"'([^']+)'\s*\+\s*(\w+)", r'`\1${\2}`', _url_src)
                         ue = _re.sub(r'(\w+)\s*\+\s*"([^"]+)"', r'`${\1}\2`', ue)
-                        print('[svc DEBUG] dynamic URL: ' + repr(_url_src) + ' -> ' + repr(ue))
+                        log.debug("[svc DEBUG] dynamic URL: %r -> %r", _url_src, ue)
                     else:
                         ue = "'/'"
                 elif url.startswith("'") or url.startswith('"'):
@@ -198,11 +200,14 @@ class ServiceToInjectableRule:
         self.project  = AngularProjectScaffold(out_dir)
         self.out_dir  = Path(out_dir) / "src" / "app"
         self.dry_run  = dry_run
+        self.cache    = ArtifactCache(
+            out_dir, "ServiceToInjectableRule", _GENERATOR_MODULES, enabled=not dry_run,
+        )
 
     def apply(self, analysis, patterns):
-        print("\n========== ServiceToInjectableRule.apply() ==========")
+        log.debug("\n========== ServiceToInjectableRule.apply() ==========")
         if self.dry_run:
-            print("[ServiceToInjectable] DRY RUN — no files will be written")
+            log.info("[ServiceToInjectable] DRY RUN — no files will be written")
 
         changes = []
 
@@ -210,7 +215,7 @@ class ServiceToInjectableRule:
             self.project.ensure()
 
         services = list(iter_services(analysis, patterns))
-        print(f"[ServiceToInjectable] Services detected: {len(services)}")
+        log.info("[ServiceToInjectable] Services detected: %s", len(services))
 
         progress = SimpleProgress(len(services), "Services")
 
@@ -232,20 +237,22 @@ class ServiceToInjectableRule:
             ts_path   = self.out_dir / file_name
 
             if di_tokens:
-                print(f"[ServiceToInjectable] DI for {raw_name}: {di_tokens}")
+                log.debug("[ServiceToInjectable] DI for %s: %s", raw_name, di_tokens)
 
             _svc_methods = [m for m in (getattr(node, "scope_methods", []) or [])
                             if m.get("is_this_method")]
             if _svc_methods:
-                print(f"[ServiceToInjectable] Methods for {raw_name}: "
-                      f"{[m['name'] for m in _svc_methods]}")
+                log.debug(
+                    "[ServiceToInjectable] Methods for %s: %s",
+                    raw_name, [m['name'] for m in _svc_methods],
+                )
             _svc_http: dict = {}
 
             # -------------------------------------------------------
             # $resource fallback (AngularJS resource service)
             # -------------------------------------------------------
             if not _svc_methods and "$resource" in di_tokens:
-                print(f"[ServiceToInjectable] Detected $resource service: {raw_name}")
+                log.debug("[ServiceToInjectable] Detected $resource service: %s", raw_name)
 
                 _svc_methods = [
                     {"name": "getAll", "params": [], "is_this_method": True},
@@ -266,20 +273,28 @@ class ServiceToInjectableRule:
                 _om = getattr(_c, "owner_method", None)
                 if _om and getattr(_c, "owner_controller", None) == raw_name:
                     _svc_http.setdefault(_om, []).append(_c)
-            ts_code = _build_service_ts(
-                class_name, raw_name, di_tokens,
-                scope_methods=_svc_methods,
-                http_calls_by_method=_svc_http,
+            ts_key = f"src/app/{file_name}"
+            ts_fp  = self.cache.fingerprint(
+                ts_key, class_name, raw_name, di_tokens, _svc_methods, _svc_http,
             )
+            ts_code = self.cache.get(ts_key, ts_fp)
+            if ts_code is None:
+                ts_code = _build_service_ts(
+                    class_name, raw_name, di_tokens,
+                    scope_methods=_svc_methods,
+                    http_calls_by_method=_svc_http,
+                )
+                self.cache.put(ts_key, ts_fp, ts_code)
 
             if self.dry_run:
-                print(f"[DRY RUN] Would write: {ts_path}")
-                print(f"[DRY RUN] Content preview:\n{ts_code[:300]}")
+                log.info("[DRY RUN] Would write: %s", ts_path)
+                log.info("[DRY RUN] Content preview:\n%s", ts_code[:300])
             else:
                 if not ts_path.exists() or ts_path.read_text(encoding="utf-8") != ts_code:
                     ts_path.parent.mkdir(parents=True, exist_ok=True)
                     ts_path.write_text(ts_code, encoding="utf-8")
-                    print(f"[ServiceToInjectable] Written: {ts_path}")
+                    log.info("[ServiceToInjectable] Written: %s", ts_path)
+                record_artifact(ts_path, ts_code)
 
             changes.append(Change(
                 before_id=node.id,
@@ -291,6 +306,8 @@ class ServiceToInjectableRule:
             progress.step(node.name)
         
         progress.done()
+        self.cache.save()
+        log.info("[ServiceToInjectable] Artifact cache: %s", self.cache.summary())
 
-        print("========== ServiceToInjectableRule DONE ==========\n")
+        log.debug("========== ServiceToInjectableRule DONE ==========\n")
         return changes
\ No newline at end of file
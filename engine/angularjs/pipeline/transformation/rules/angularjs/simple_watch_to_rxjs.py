@@ -3,8 +3,13 @@ from ir.migration_model.change import Change
 from ir.migration_model.base import ChangeSource
 from pipeline.patterns.roles import SemanticRole
 from pipeline.transformation.angular_project_scaffold import AngularProjectScaffold
+from pipeline.transformation.artifact_manifest import record_artifact
 from pipeline.transformation.helpers import iter_shallow_watches, resolve_owner_class
 import re
+from pipeline.log import get_logger
+
+log = get_logger(__name__)
+
 
 RXJS_IMPORT = "import { BehaviorSubject } from 'rxjs';\n"
 
@@ -35,9 +40,9 @@ class SimpleWatchToRxjsRule:
         self.dry_run  = dry_run
 
     def apply(self, analysis, patterns):
-        print("\n========== SimpleWatchToRxjsRule.apply() ==========")
+        log.debug("\n========== SimpleWatchToRxjsRule.apply() ==========")
         if self.dry_run:
-            print("[SimpleWatchToRxjs] DRY RUN — no files will be written")
+            log.info("[SimpleWatchToRxjs] DRY RUN — no files will be written")
 
         changes = []
 
@@ -48,10 +53,10 @@ class SimpleWatchToRxjsRule:
         injected_files: set = set()
 
         watches = list(iter_shallow_watches(analysis, patterns))
-        print(f"[SimpleWatchToRxjs] Shallow watches detected: {len(watches)}")
+        log.info("[SimpleWatchToRxjs] Shallow watches detected: %s", len(watches))
 
         if not watches:
-            print("[SimpleWatchToRxjs]  No shallow watches matched.")
+            log.debug("[SimpleWatchToRxjs]  No shallow watches matched.")
 
         for node in watches:
             node_id = getattr(node, "id", str(id(node)))
@@ -63,7 +68,7 @@ class SimpleWatchToRxjsRule:
                     owner = resolve_owner_class(analysis, sym_id)
 
             if owner is None:
-                print(f"[SimpleWatchToRxjs]  Cannot resolve owner for watch {node_id}, skipping")
+                log.info("[SimpleWatchToRxjs]  Cannot resolve owner for watch %s, skipping", node_id)
             else:
                 base = owner.name.replace("Controller", "").replace("Ctrl", "")
 
@@ -76,10 +81,13 @@ class SimpleWatchToRxjsRule:
                     if not self.dry_run:
                         self._inject_behavior_subject(component_ts, base)
                     else:
-                        print(f"[DRY RUN] Would inject BehaviorSubject into: {component_ts}")
+                        log.info("[DRY RUN] Would inject BehaviorSubject into: %s", component_ts)
                     injected_files.add(component_ts)
                 else:
-                    print(f"[SimpleWatchToRxjs]  Already injected {component_ts.name}, skipping duplicate")
+                    log.info(
+                        "[SimpleWatchToRxjs]  Already injected %s, skipping duplicate",
+                        component_ts.name,
+                    )
 
             changes.append(Change(
                 before_id=node_id,
@@ -88,12 +96,12 @@ class SimpleWatchToRxjsRule:
                 reason="Shallow $watch → RxJS BehaviorSubject rewrite",
             ))
 
-        print("========== SimpleWatchToRxjsRule DONE ==========\n")
+        log.debug("========== SimpleWatchToRxjsRule DONE ==========\n")
         return changes
 
     def _inject_behavior_subject(self, component_ts: Path, base: str):
         if not component_ts.exists():
-            print(f"[SimpleWatchToRxjs]  Component file not found, skipping: {component_ts}")
+            log.info("[SimpleWatchToRxjs]  Component file not found, skipping: %s", component_ts)
             return
 
         text = component_ts.read_text(encoding="utf-8")
@@ -117,11 +125,12 @@ class SimpleWatchToRxjsRule:
             if brace_idx != -1:
                 text = text[:brace_idx + 1] + f"\n{subject_prop}\n" + text[brace_idx + 1:]
             else:
-                print(f"[SimpleWatchToRxjs]  Could not find class body in {component_ts.name}, appending")
+                log.info("[SimpleWatchToRxjs]  Could not find class body in %s, appending", component_ts.name)
                 text += f"\n// TODO: add to class body:\n// {subject_prop}\n"
 
         component_ts.write_text(text, encoding="utf-8")
-        print(f"[SimpleWatchToRxjs] BehaviorSubject injected into: {component_ts}")
+        record_artifact(component_ts, text)
+        log.info("[SimpleWatchToRxjs] BehaviorSubject injected into: %s", component_ts)
         # Note: controller_to_component.py now also emits destroy$ Subject and
         # takeUntil(this.destroy$) on all subscriptions — BehaviorSubject works
         # alongside this pattern without any additional changes here.
\ No newline at end of file
@@ -56,6 +56,8 @@ Non-deterministic patterns flagged with TODO comments.
 import re
 from typing import Optional
 
+from pipeline.analysis.template_index import find_element_end
+
 
 # ---------------------------------------------------------------------------
 # Attribute rewrite table
@@ -274,6 +276,7 @@ def extract_controller_template(html: str, controller_name: str) -> Optional[str
     Algorithm:
       1. Find the opening tag containing ng-controller="<name>"
       2. Walk forward tracking open/close tags to find the matching close tag
+         (find_element_end, shared with the analysis-time TemplateIndex)
       3. Extract the innerHTML
       4. Run migrate_template() on it
     """
@@ -286,34 +289,12 @@ def extract_controller_template(html: str, controller_name: str) -> Optional[str
     if not m:
         return None
 
-    tag_name    = m.group(1)
-    open_start  = m.start()
     inner_start = m.end()
+    inner_end   = find_element_end(html, m.group(1), inner_start)
+    if inner_end is None:
+        return None  # malformed HTML
 
-    # Walk forward to find the matching closing tag
-    depth   = 1
-    pos     = inner_start
-    open_re  = re.compile(rf'<{tag_name}(?:\s|>)', re.IGNORECASE)
-    close_re = re.compile(rf'</{tag_name}\s*>', re.IGNORECASE)
-
-    while pos < len(html) and depth > 0:
-        next_open  = open_re.search(html, pos)
-        next_close = close_re.search(html, pos)
-
-        if next_close is None:
-            break  # malformed HTML
-
-        if next_open and next_open.start() < next_close.start():
-            depth += 1
-            pos = next_open.end()
-        else:
-            depth -= 1
-            if depth == 0:
-                inner_html = html[inner_start:next_close.start()]
-                return migrate_template(inner_html.strip())
-            pos = next_close.end()
-
-    return None
+    return migrate_template(html[inner_start:inner_end].strip())
 
 
 def migrate_template(html: str) -> str:
@@ -26,6 +26,8 @@ Usage
     from pipeline.validation.analyzers.coverage import CoverageAnalyzer
 
     result = CoverageAnalyzer(project_root).analyze()
+    # CoverageAnalyzer(project_root, index=project_index) lists files from the
+    # run's ProjectIndex instead of walking the tree
     # result.percent          → int  (0-100)
     # result.covered          → int
     # result.stub             → int
@@ -43,7 +45,9 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from pipeline.transformation.project_index import ProjectIndex
 
 
 # ---------------------------------------------------------------------------
@@ -156,10 +160,13 @@ class CoverageAnalyzer:
         The root of the Angular workspace (contains angular.json).
         The analyzer looks inside src/app/ by default, but falls back
         to walking the entire project_root if src/app/ is absent.
+    index : ProjectIndex, optional
+        Index of the generated project; its file list replaces the walk.
     """
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, index: Optional[ProjectIndex] = None):
         self.project_root = Path(project_root)
+        self.index        = index
 
     # ── Public ────────────────────────────────────────────────────────────
 
@@ -185,20 +192,23 @@ class CoverageAnalyzer:
             # Fallback: walk from project root
             src_dir = self.project_root
 
+        ts_files = self._ts_files(src_dir)
+
         # Collect all .spec.ts paths keyed by their stem without .spec
         # e.g.  "user.component.spec.ts"  →  key "user.component"
         spec_map: dict[str, Path] = {}
-        for spec_file in src_dir.rglob("*.spec.ts"):
-            # stem without ".spec" suffix
-            stem = spec_file.name[: -len(".spec.ts")]
-            spec_map[stem] = spec_file
+        for spec_file in ts_files:
+            if spec_file.name.endswith(".spec.ts"):
+                # stem without ".spec" suffix
+                stem = spec_file.name[: -len(".spec.ts")]
+                spec_map[stem] = spec_file
 
         by_type: dict[str, TypeCoverageStats] = {}
         covered_files:   list[str] = []
         stub_files:      list[str] = []
         uncovered_files: list[str] = []
 
-        for source_file in sorted(src_dir.rglob("*.ts")):
+        for source_file in ts_files:
             if source_file.name.endswith(".spec.ts"):
                 continue  # skip spec files themselves
 
@@ -250,6 +260,12 @@ class CoverageAnalyzer:
         self._print_summary(result)
         return result
 
+    def _ts_files(self, src_dir: Path) -> list[Path]:
+        """Every .ts file under src_dir, sorted — one listing for specs and sources."""
+        if self.index is None:
+            return sorted(src_dir.rglob("*.ts"))
+        return [self.index.path_of(f) for f in self.index.files(src_dir, "*.ts", recursive=True)]
+
     def _classify(self, path: Path) -> str | None:
         """Return the Angular entity type or None if not a migratable file."""
         name = path.name
@@ -0,0 +1,324 @@
+"""
+pipeline/validation/change_scope.py
+
+Which generated files changed since the committed output, and which lint
+targets and specs that touches.
+
+Every run regenerates the whole project, but usually only a few files come
+out different from the output committed by the previous run. ChangeScope
+compares the run's ProjectIndex against the committed project (sha256 per
+file, from the stat-first output manifest — orchestration/output_manifest.py)
+and scopes the expensive checks to the difference:
+
+    lint    the changed .ts files — ESLint runs on just those, with --cache
+    tests   the specs of the changed files and of everything that imports them
+
+Dependents come from a dependency graph of the generated sources
+(ir.dependency_model): `import { X } from './x.service'` is an IMPORT edge,
+becoming INJECT when X is a constructor parameter type or inject(X) argument,
+and a component points at its templateUrl / styleUrls files with
+TEMPLATE_BINDING edges. A changed template or stylesheet stands for its
+component. Every file that transitively imports an affected file is affected
+too, whatever it imports (a service, a base class, a helper, a model; through
+barrel re-exports as well), and a spec runs when it is affected.
+
+Validation falls back to the full lint / test run (full_reason says why)
+when the scope cannot be trusted:
+
+    - nothing committed yet, or no index of this run
+    - a file was removed
+    - a changed file is not in the graph (package.json, angular.json,
+      tsconfig, src/index.html, assets, a template no component references)
+    - tsconfig maps import paths ("paths"), which the graph does not resolve
+
+Skipping the unaffected specs (or files) assumes they still pass, so a
+scoped run is only used for a check that passed on the committed output.
+After validation, record() writes which checks passed together with a
+fingerprint of the validated tree to out/.evua_validation_state.json; the
+next run compares that fingerprint with the committed tree.
+
+    scope = ChangeScope.compute(project_root, index, committed_root)
+    LintRunner(project_root).run(files=scope.lint_selection())     # None → all
+    TestRunner(project_root).run(repo_path, specs=scope.spec_selection())
+    ...
+    ChangeScope.record(project_root, index, {"tests": True, "lint": False})
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import posixpath
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from ir.dependency_model.base import DependencyMetadata, DependencyType
+from ir.dependency_model.edge import DependencyEdge
+from ir.dependency_model.graph import DependencyGraph
+from orchestration.output_manifest import MANIFEST_NAME, OutputManifest
+from pipeline.transformation.project_index import ProjectIndex
+
+
+# Sources the graph covers; any other changed file forces a full run
+_SOURCE_SUFFIXES = (".ts", ".html", ".css", ".scss")
+_SKIP_DIRS       = frozenset({"node_modules", "dist", ".angular"})
+
+# import { A, B as C } from './x'   import X, * as ns from './x'   import './x'
+# export { A } from './x'           export * from './x'            (barrels)
+_MODULE_RE      = re.compile(r'\b(import|export)\s+(?:type\s+)?(?:([\w$*\s{},]*?)\s*from\s*)?[\'"]([^\'"]+)[\'"]')
+_IDENT_RE       = re.compile(r'[A-Za-z_$][\w$]*')
+_CONSTRUCTOR_RE = re.compile(r'\bconstructor\s*\(([^)]*)\)')
+_PARAM_TYPE_RE  = re.compile(r':\s*([A-Za-z_$][\w$]*)')
+_INJECT_RE      = re.compile(r'\binject\s*\(\s*([A-Za-z_$][\w$]*)')
+_TEMPLATE_RE    = re.compile(r'\btemplateUrl\s*:\s*[\'"]([^\'"]+)[\'"]')
+_STYLES_RE      = re.compile(r'\bstyleUrls?\s*:\s*(\[[^\]]*\]|[\'"][^\'"]+[\'"])')
+_QUOTED_RE      = re.compile(r'[\'"]([^\'"]+)[\'"]')
+
+_REEXPORT = "re-export"       # DependencyMetadata.notes of barrel edges
+
+_STATE_NAME = ".evua_validation_state.json"     # in out/, next to the tool caches
+
+
+@dataclass
+class ChangeScope:
+    changed:     list[str] = field(default_factory=list)   # new or modified, project-relative
+    removed:     list[str] = field(default_factory=list)
+    affected:    list[str] = field(default_factory=list)   # changed sources + their importers
+    lint_files:  list[str] = field(default_factory=list)
+    specs:       list[str] = field(default_factory=list)
+    full_reason: str = ""                                   # set → run everything
+    baseline:    dict = field(default_factory=dict)         # check → passed on the committed output
+
+    @property
+    def full(self) -> bool:
+        return bool(self.full_reason)
+
+    def spec_selection(self) -> Optional[list[str]]:
+        """Specs to run, or None for the whole suite."""
+        return None if self.full or not self.baseline.get("tests") else self.specs
+
+    def lint_selection(self) -> Optional[list[str]]:
+        """Files to lint, or None for the whole project."""
+        return None if self.full or not self.baseline.get("lint") else self.lint_files
+
+    def summary(self, lint: bool = False) -> str:
+        if self.full:
+            return f"Full lint / test run — {self.full_reason}"
+        parts = [f"{len(self.changed)} changed file(s), {len(self.affected)} affected "
+                 f"with their importers"]
+        for check, selection, unit in (("tests", self.spec_selection(), "spec(s)"),
+                                       ("lint", self.lint_selection(), "file(s)")):
+            if check == "lint" and not lint:
+                continue
+            if selection is None:
+                parts.append(f"{check}: full run (did not pass on the committed output)")
+            else:
+                parts.append(f"{check}: {len(selection)} {unit}")
+        return " — ".join(parts)
+
+    def to_dict(self) -> dict:
+        return {
+            "scoped":     [c for c in ("tests", "lint") if self.baseline.get(c)],
+            "changed":    self.changed[:50],
+            "affected":   self.affected[:50],
+            "lint_files": self.lint_files[:50],
+            "specs":      self.specs[:50],
+        }
+
+    # ── Construction ──────────────────────────────────────────────────────
+
+    @classmethod
+    def compute(cls, project_root, index: Optional[ProjectIndex],
+                committed_root) -> "ChangeScope":
+        """Never raises — any failure means a full run."""
+        try:
+            return cls._compute(Path(project_root), index,
+                                Path(committed_root) if committed_root else None)
+        except Exception as exc:
+            return cls(full_reason=f"change scope failed: {exc}")
+
+    @classmethod
+    def _compute(cls, project_root: Path, index: Optional[ProjectIndex],
+                 committed_root: Optional[Path]) -> "ChangeScope":
+        if index is None or not len(index):
+            return cls(full_reason="no index of the generated project")
+        if committed_root is None or not committed_root.is_dir():
+            return cls(full_reason="no committed output to compare with")
+
+        changed, removed, fingerprint = _diff_against(index, committed_root)
+        scope = cls(changed=changed, removed=removed,
+                    baseline=_load_state(project_root, fingerprint))
+        if removed:
+            scope.full_reason = f"{len(removed)} file(s) removed, e.g. {removed[0]}"
+            return scope
+        if not changed:
+            return scope
+        outside = [p for p in changed if not (p.startswith("src/") and p.endswith(_SOURCE_SUFFIXES))]
+        if outside:
+            scope.full_reason = f"{outside[0]} changed"
+            return scope
+        if _has_path_aliases(project_root):
+            scope.full_reason = "tsconfig maps import paths"
+            return scope
+
+        graph = _source_graph(index, project_root)
+        dependents = defaultdict(set)                   # target → {(source, edge type)}
+        for edge in graph.edges:
+            dependents[edge.target_id].add((edge.source_id, edge.type))
+
+        # Changed templates / styles stand for the component that uses them
+        affected: set[str] = set()
+        for path in changed:
+            if path.endswith(".ts"):
+                affected.add(path)
+                continue
+            owners = {src for src, kind in dependents.get(path, ())
+                      if kind == DependencyType.TEMPLATE_BINDING}
+            if not owners:
+                scope.full_reason = f"{path} is not referenced by any component"
+                return scope
+            affected |= owners
+
+        # ... and everything that imports an affected file, transitively
+        # (INJECT edges are imports too; template bindings point the other way)
+        pending = list(affected)
+        while pending:
+            for src, kind in dependents.get(pending.pop(), ()):
+                if kind != DependencyType.TEMPLATE_BINDING and src not in affected:
+                    affected.add(src)
+                    pending.append(src)
+
+        scope.affected   = sorted(affected)
+        scope.lint_files = [p for p in changed if p.endswith(".ts")]
+        scope.specs      = sorted(
+            e.path for e in index.files("src", "*.spec.ts", recursive=True)
+            if e.path in affected
+        )
+        return scope
+
+    # ── Validation state ──────────────────────────────────────────────────
+
+    @staticmethod
+    def record(project_root, index: Optional[ProjectIndex], passed: dict) -> None:
+        """Remember which checks passed on this (validated) tree, for the next run."""
+        if index is None:
+            return
+        hashes = {e.path: e.sha256 for e in index.files("", "*", recursive=True)}
+        state = {"fingerprint": _fingerprint(hashes), "passed": passed}
+        path = _state_path(Path(project_root))
+        try:
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(state), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────
+
+def _state_path(project_root: Path) -> Path:
+    return project_root.resolve().parent.parent / _STATE_NAME
+
+
+def _fingerprint(hashes: dict[str, str]) -> str:
+    h = hashlib.sha256()
+    for path in sorted(hashes):
+        h.update(f"{path}\0{hashes[path]}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _load_state(project_root: Path, fingerprint: str) -> dict:
+    """Checks that passed on the committed tree — {} unless it is the tree last validated."""
+    try:
+        state = json.loads(_state_path(project_root).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(state, dict) or state.get("fingerprint") != fingerprint:
+        return {}
+    return dict(state.get("passed") or {})
+
+
+def _diff_against(index: ProjectIndex,
+                  committed_root: Path) -> tuple[list[str], list[str], str]:
+    """(new or modified, removed) paths of the indexed project vs committed_root, and
+    the fingerprint of committed_root."""
+    # committed_root is <out>/angular-app/angular-app; PipelineRunner keeps the
+    # stat-first manifest of <out>/angular-app, so unchanged files are not read
+    final_root = committed_root.parent
+    manifest   = OutputManifest.load(final_root.parent / MANIFEST_NAME, final_root)
+    prefix     = committed_root.name + "/"
+    committed: dict[str, str] = {}
+    for rel, digest in manifest.scan().items():
+        if not rel.startswith(prefix):
+            continue
+        rel = rel[len(prefix):]
+        if not _SKIP_DIRS.intersection(rel.split("/")[:-1]):
+            committed[rel] = digest
+
+    changed = [e.path for e in index.files("", "*", recursive=True)
+               if committed.get(e.path) != e.sha256]
+    removed = sorted(p for p in committed if p not in index)
+    return changed, removed, _fingerprint(committed)
+
+
+def _has_path_aliases(project_root: Path) -> bool:
+    for name in ("tsconfig.json", "tsconfig.app.json", "tsconfig.spec.json"):
+        try:
+            text = (project_root / name).read_text(encoding="utf-8")
+        except OSError:
+            continue
+        if re.search(r'"paths"\s*:', text):
+            return True
+    return False
+
+
+def _resolve(importer: str, module: str, index: ProjectIndex) -> Optional[str]:
+    """Project-relative file a relative import refers to, if it was generated."""
+    base = posixpath.normpath(posixpath.join(posixpath.dirname(importer), module))
+    for candidate in (base, base + ".ts", base + "/index.ts"):
+        if candidate in index:
+            return candidate
+    return None
+
+
+def _source_graph(index: ProjectIndex, project_root: Path) -> DependencyGraph:
+    """Dependency graph of the generated TypeScript sources (file → file)."""
+    graph = DependencyGraph()
+    for entry in index.files("src", "*.ts", recursive=True):
+        try:
+            code = (project_root / entry.path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+
+        injected = set(_INJECT_RE.findall(code))
+        for params in _CONSTRUCTOR_RE.findall(code):
+            injected.update(_PARAM_TYPE_RE.findall(params))
+
+        for keyword, clause, module in _MODULE_RE.findall(code):
+            if not module.startswith("."):
+                continue                                # packages are not generated
+            target = _resolve(entry.path, module, index)
+            if target is None:
+                continue                                # not generated — cannot change either
+            if keyword == "export":
+                graph.add_edge(DependencyEdge(source_id=entry.path, target_id=target,
+                                              type=DependencyType.IMPORT,
+                                              metadata=DependencyMetadata(notes=_REEXPORT)))
+                continue
+            kind = (DependencyType.INJECT if set(_IDENT_RE.findall(clause)) & injected
+                    else DependencyType.IMPORT)
+            graph.add_edge(DependencyEdge(source_id=entry.path, target_id=target, type=kind))
+
+        assets = _TEMPLATE_RE.findall(code)
+        for styles in _STYLES_RE.findall(code):
+            assets += _QUOTED_RE.findall(styles)
+        for asset in assets:
+            target = _resolve(entry.path, asset, index)
+            if target is not None:
+                graph.add_edge(DependencyEdge(source_id=entry.path, target_id=target,
+                                              type=DependencyType.TEMPLATE_BINDING))
+    return graph
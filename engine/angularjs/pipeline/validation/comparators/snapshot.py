@@ -1,34 +1,437 @@
+"""
+pipeline/validation/comparators/snapshot.py
+
+Compares before/after snapshots of component state.
+Expects JSON like:
+{
+  "UserComponent": { "users": [...], "query": "" },
+  "AdminComponent": { "isAdmin": true }
+}
+
+Snapshots captured from production apps can be hundreds of MB, so neither
+document is loaded whole. Each file is read in windows of a few MB; values
+that fit in the window are parsed by the C json scanner, larger objects and
+arrays are walked member by member. Every value gets a digest of its
+canonical content (object keys unordered, 1 == 1.0, escapes decoded):
+
+    canonical text ≤ 64 KiB    hash of the text itself
+    larger object / array      hash over the digests of its members
+
+so the digest depends only on the content, never on where a window ended.
+
+The comparator lists the members of both root objects with their digests
+and byte spans, and descends only into members whose digests differ. Member
+tables of the large values walked on the way are kept (up to a budget), so
+a descent re-reads only the byte spans of smaller differing values. Memory
+stays proportional to the read window plus those member tables — a digest
+and a byte span per member, not the parsed values.
+
+Differences are reported with the JSON pointer (RFC 6901) inside the
+component state:
+
+    State mismatch in UserComponent at /users/3/name: 'bob' → 'Bob'
+    State mismatch in UserComponent at /filters: 2 item(s) → 3 item(s)
+    Missing component snapshot after migration: AdminComponent
+
+Components that only exist after migration are not reported.
+"""
+
+import codecs
+import hashlib
 import json
-from pathlib import Path
+import os
+import re
+from array import array
+from json.decoder import scanstring
+from typing import NamedTuple, Optional
 
-class SnapshotComparator:
+
+MAX_DIFFERENCES = 100         # reported per comparison
+_WINDOW         = 1 << 21     # characters kept ahead of the parse position
+_FLAT_LIMIT     = 1 << 16     # canonical text up to this size is hashed as is
+_KEPT_MEMBERS   = 1 << 20     # members of walked values kept per file
+_SHOW_BYTES     = 200         # scalars up to this size are shown in messages
+
+_WS = re.compile(r"[ \t\n\r]*")
+
+_OBJECT, _ARRAY, _STRING, _NULL = map(ord, '{["n')
+
+
+def _parse_float(text: str):
+    value = float(text)
+    return int(value) if value.is_integer() and abs(value) < 2 ** 53 else value   # 1.0 == 1
+
+
+_DECODER = json.JSONDecoder(parse_float=_parse_float)
+_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+# ── Digests ────────────────────────────────────────────────────────────────
+
+def _flat_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _array_digest(items: bytes) -> bytes:
+    return hashlib.blake2b(b"[" + items, digest_size=16).digest()
+
+
+def _object_digest(members: dict[str, bytes]) -> bytes:
+    pairs = sorted(_flat_digest(_ENCODER.encode(k)) + d for k, d in members.items())
+    return hashlib.blake2b(b"{" + b"".join(pairs), digest_size=16).digest()
+
+
+def _digest_of(value, text: Optional[str] = None) -> bytes:
+    """Digest of a parsed value (text: its canonical encoding, if known)."""
+    if text is None:
+        text = _ENCODER.encode(value)
+    if len(text) <= _FLAT_LIMIT or not isinstance(value, (dict, list)):
+        return _flat_digest(text)
+    if isinstance(value, dict):
+        return _object_digest({k: _digest_of(v) for k, v in value.items()})
+    return _array_digest(b"".join(_digest_of(v) for v in value))
+
+
+# ── Values and member tables ───────────────────────────────────────────────
+
+class _Value(NamedTuple):
+    kind:   str                 # first character: { [ " digit - t f n
+    start:  int                 # byte span in the file
+    end:    int
+    text:   Optional[str]       # canonical text, when within _FLAT_LIMIT
+    digest: bytes
+
+
+class _Level:
     """
-    Compares before/after snapshots of component state.
-    Expects JSON like:
-    {
-      "UserComponent": { "users": [...], "query": "" },
-      "AdminComponent": { "isAdmin": true }
-    }
+    A value and, for objects and arrays, the digest, kind and byte span of
+    each member — kept in flat arrays so wide arrays stay compact.
     """
 
-    def compare(self, before_path: str, after_path: str):
-        try:
-            before = json.loads(Path(before_path).read_text(encoding="utf-8"))
-            after = json.loads(Path(after_path).read_text(encoding="utf-8"))
+    def __init__(self, kind: int):
+        self.kind     = kind        # first character of the value, as a code point
+        self.keys: Optional[list[str]] = [] if kind == _OBJECT else None
+        self.digests  = bytearray()
+        self.kinds    = bytearray()
+        self.starts   = array("q")
+        self.ends     = array("q")
+        self._index: Optional[dict[str, int]] = None
+
+    def add(self, key: Optional[str], value: _Value) -> None:
+        if self.keys is not None:
+            self.keys.append(key)
+        self.digests += value.digest
+        self.kinds.append(ord(value.kind))
+        self.starts.append(value.start)
+        self.ends.append(value.end)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def digest(self, i: int) -> bytes:
+        return bytes(self.digests[i * 16:(i + 1) * 16])
+
+    def span(self, i: int) -> tuple[int, int]:
+        return self.starts[i], self.ends[i]
+
+    def index_of(self, key: str) -> Optional[int]:
+        """Member index of key (the last one for duplicate keys, as json.loads)."""
+        if self._index is None:
+            self._index = {k: i for i, k in enumerate(self.keys or [])}
+        return self._index.get(key)
 
-            failures = []
+    def unique_keys(self) -> list[str]:
+        self.index_of("")
+        return list(self._index)
 
-            for component, before_state in before.items():
-                after_state = after.get(component)
-                if after_state is None:
-                    failures.append(f"Missing component snapshot after migration: {component}")
-                    continue
+    def merkle_digest(self) -> bytes:
+        if self.keys is None:
+            return _array_digest(bytes(self.digests))
+        self.index_of("")
+        return _object_digest({k: self.digest(i) for k, i in self._index.items()})
 
-                if before_state != after_state:
-                    failures.append(f"State mismatch in {component}")
+
+# ── Reader ─────────────────────────────────────────────────────────────────
+
+class _Reader:
+    """Values in the byte span [start, end) of a snapshot file."""
+
+    def __init__(self, snapshot: "_Snapshot", start: int, end: int):
+        snapshot.fp.seek(start)
+        self.snapshot = snapshot
+        self.fp       = snapshot.fp
+        self.left     = end - start          # bytes not read yet
+        self.decoder  = codecs.getincrementaldecoder("utf-8")()
+        self.buf      = ""
+        self.pos      = 0
+        self.base     = start                # byte offset of buf[0]
+        self.ascii    = True
+        self._mark    = (0, start)           # (index in buf, byte offset) of a known position
+
+    @property
+    def at_end(self) -> bool:
+        return self.left <= 0
+
+    def offset(self, index: int) -> int:
+        """Byte offset in the file of buf[index]."""
+        if self.ascii:
+            return self.base + index
+        mark, byte = self._mark if self._mark[0] <= index else (0, self.base)
+        byte += len(self.buf[mark:index].encode("utf-8"))
+        self._mark = (index, byte)
+        return byte
+
+    def _fill(self) -> bool:
+        data = self.fp.read(min(_WINDOW, self.left)) if self.left > 0 else b""
+        if not data:
+            self.left = 0
+            return False
+        self.left -= len(data)
+        self.base  = self.offset(self.pos)
+        self.buf   = self.buf[self.pos:] + self.decoder.decode(data, final=self.left <= 0)
+        self.pos   = 0
+        self.ascii = self.buf.isascii()
+        self._mark = (0, self.base)
+        return True
+
+    def _ahead(self) -> None:
+        while len(self.buf) - self.pos < _WINDOW and self._fill():
+            pass
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"{message} at byte {self.offset(self.pos)}")
+
+    def peek(self) -> str:
+        """Next non-whitespace character, '' at the end of the span."""
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def value(self) -> _Value:
+        ch = self.peek()
+        if not ch:
+            raise self._error("unexpected end of JSON")
+        start = self.offset(self.pos)
+        self._ahead()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if self.at_end:
+                    raise self._error("invalid JSON")
+                if ch in "{[":
+                    return self.walk()[0]               # larger than the window
+                if ch != '"' and len(self.buf) - self.pos > 64:
+                    raise self._error("invalid JSON")
+                self._fill()                            # long string: read on
+                continue
+            if len(self.buf) - end < 32 and not self.at_end:
+                self._fill()                            # "1" may be the start of "1.5e3"
+                continue
+            text = _ENCODER.encode(value)
+            self.pos = end
+            if len(text) <= _FLAT_LIMIT:
+                return _Value(ch, start, self.offset(end), text, _flat_digest(text))
+            return _Value(ch, start, self.offset(end), None, _digest_of(value, text))
+
+    def walk(self) -> tuple[_Value, _Level]:
+        """The object or array at the current position, read member by member."""
+        ch = self.peek()
+        if ch not in ("{", "["):
+            raise self._error("expected an object or array")
+        start     = self.offset(self.pos)
+        is_object = ch == "{"
+        close     = "}" if is_object else "]"
+        level     = _Level(ord(ch))
+        texts: Optional[dict] = {}          # canonical member texts while the whole may stay flat
+        size = 1                            # len(canonical text) - 1, once there is a member
+
+        self.pos += 1
+        more = self.peek() != close
+        while more:
+            key = None
+            if is_object:
+                if self.peek() != '"':
+                    raise self._error("expected an object key")
+                key = self._key()
+                if self.peek() != ":":
+                    raise self._error("expected ':'")
+                self.pos += 1
+            member = self.value()
+            level.add(key, member)
+
+            if texts is not None:
+                slot = key if is_object else len(level)
+                text = member.text
+                if text is None:
+                    texts = None
+                else:
+                    if is_object:
+                        text = _ENCODER.encode(key) + ":" + text
+                    if slot in texts:       # duplicate key: the last one wins
+                        size -= len(texts[slot]) + 1
+                    texts[slot] = text
+                    size += len(text) + 1
+                    if size + 1 > _FLAT_LIMIT:
+                        texts = None
+
+            nxt = self.peek()
+            if nxt not in (",", close):
+                raise self._error(f"expected ',' or '{close}'")
+            more = nxt == ","
+            self.pos += 1
+        if not len(level):
+            self.pos += 1
+        end = self.offset(self.pos)
+
+        if texts is not None:
+            body = ",".join(texts[k] for k in (sorted(texts) if is_object else texts))
+            text = f"{{{body}}}" if is_object else f"[{body}]"
+            if len(text) <= _FLAT_LIMIT:
+                return _Value(ch, start, end, text, _flat_digest(text)), level
+        self.snapshot.keep(start, level)
+        return _Value(ch, start, end, None, level.merkle_digest()), level
+
+    def _key(self) -> str:
+        self._ahead()
+        while True:
+            try:
+                key, self.pos = scanstring(self.buf, self.pos + 1)
+                return key
+            except ValueError:
+                if self.at_end:
+                    raise self._error("invalid object key")
+                self._fill()
+
+
+class _Snapshot:
+    """An open snapshot file and the member tables of large values walked in it."""
+
+    def __init__(self, fp):
+        self.fp     = fp
+        self.size   = os.fstat(fp.fileno()).st_size
+        self._kept: dict[int, _Level] = {}
+        self._room  = _KEPT_MEMBERS
+
+    def keep(self, start: int, level: _Level) -> None:
+        if len(level) <= self._room:
+            self._kept[start] = level
+            self._room -= len(level)
+
+    def level(self, start: int = 0, end: Optional[int] = None) -> _Level:
+        """The value at byte span [start, end) with its members' digests and spans."""
+        if start in self._kept:
+            return self._kept[start]
+        reader = _Reader(self, start, self.size if end is None else end)
+        ch = reader.peek()
+        if not ch:
+            raise ValueError(f"no JSON value at byte {start}")
+        if ch not in ("{", "["):
+            return _Level(ord(ch))
+        return reader.walk()[1]
+
+    def describe(self, level: _Level, i: int) -> str:
+        """Short display of a member: the value itself when small."""
+        start, end = level.span(i)
+        kind = level.kinds[i]
+        if kind in (_OBJECT, _ARRAY):
+            return f"{'object' if kind == _OBJECT else 'array'} ({end - start} bytes)"
+        if end - start > _SHOW_BYTES:
+            return f"{'string' if kind == _STRING else 'value'} ({end - start} bytes)"
+        self.fp.seek(start)
+        text = repr(json.loads(self.fp.read(end - start)))
+        return text if len(text) <= 60 else text[:57] + "..."
+
+
+def _pointer_token(key) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+# ── Comparator ─────────────────────────────────────────────────────────────
+
+class SnapshotComparator:
+    def __init__(self, max_differences: int = MAX_DIFFERENCES):
+        self.max_differences = max_differences
+
+    def compare(self, before_path: str, after_path: str):
+        try:
+            with open(before_path, "rb") as bf, open(after_path, "rb") as af:
+                before_snap, after_snap = _Snapshot(bf), _Snapshot(af)
+                before, after = before_snap.level(), after_snap.level()
+                if before.keys is None or after.keys is None:
+                    raise ValueError("a snapshot must be a JSON object of component states")
+
+                failures: list[str] = []
+                for component in before.unique_keys():
+                    i = before.index_of(component)
+                    j = after.index_of(component)
+                    if j is None or after.kinds[j] == _NULL:
+                        failures.append(f"Missing component snapshot after migration: {component}")
+                    elif before.digest(i) != after.digest(j):
+                        self._diff_component(before_snap, after_snap, component,
+                                             before, i, after, j, failures)
+                    if len(failures) >= self.max_differences:
+                        failures.append(f"... further differences not shown "
+                                        f"(limit {self.max_differences})")
+                        break
 
             passed = len(failures) == 0
             return passed, failures
 
         except Exception as e:
             return False, [f"Snapshot comparison failed: {e}"]
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    def _diff_component(self, bs: _Snapshot, as_: _Snapshot, component: str,
+                        before: _Level, i: int, after: _Level, j: int,
+                        failures: list[str]) -> None:
+        """Walk the differing subtrees of one component, depth-first in document order."""
+
+        def report(pointer: str, message: str) -> bool:
+            where = f" at {pointer}" if pointer else ""
+            failures.append(f"State mismatch in {component}{where}: {message}")
+            return len(failures) < self.max_differences
+
+        def member(pointer, b_level, bi, a_level, ai, pending) -> bool:
+            b_kind, a_kind = b_level.kinds[bi], a_level.kinds[ai]
+            if b_kind == a_kind and b_kind in (_OBJECT, _ARRAY):
+                pending.append((b_level.span(bi), a_level.span(ai), pointer))
+                return True
+            return report(pointer, f"{bs.describe(b_level, bi)} → {as_.describe(a_level, ai)}")
+
+        work: list = []
+        if not member("", before, i, after, j, work):
+            return
+        while work:
+            b_span, a_span, pointer = work.pop()
+            b, a = bs.level(*b_span), as_.level(*a_span)
+            pending: list = []
+            if b.keys is not None:
+                for key in b.unique_keys():
+                    bi, ai = b.index_of(key), a.index_of(key)
+                    path = f"{pointer}/{_pointer_token(key)}"
+                    if ai is None:
+                        ok = report(path, f"missing after migration (was {bs.describe(b, bi)})")
+                    elif b.digest(bi) != a.digest(ai):
+                        ok = member(path, b, bi, a, ai, pending)
+                    else:
+                        continue
+                    if not ok:
+                        return
+                for key in a.unique_keys():
+                    if b.index_of(key) is None:
+                        ai = a.index_of(key)
+                        if not report(f"{pointer}/{_pointer_token(key)}",
+                                      f"added after migration ({as_.describe(a, ai)})"):
+                            return
+            else:
+                for n in range(min(len(b), len(a))):
+                    if b.digest(n) != a.digest(n) and not member(f"{pointer}/{n}", b, n, a, n, pending):
+                        return
+                if len(b) != len(a) and not report(pointer, f"{len(b)} item(s) → {len(a)} item(s)"):
+                    return
+            work.extend(reversed(pending))
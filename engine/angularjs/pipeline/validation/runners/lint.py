@@ -7,7 +7,8 @@ ESLint runner for the generated Angular project.
 Performance fixes (this revision)
 -----------------------------------
 - Linter discovery no longer spawns subprocesses.
-  All candidates are checked via filesystem existence / shutil.which only:
+  All candidates are checked via filesystem existence / shutil.which only
+  (pipeline/validation/toolchain.py):
     1. node_modules/.bin/eslint  (local install — fastest, most reliable)
     2. node_modules/.bin/npx     (local npx — avoids global cold-start)
     3. system eslint via shutil.which  (zero-cost PATH lookup)
@@ -21,8 +22,9 @@ Performance fixes (this revision)
   Angular CLI bootstrap and doesn't support --format=json reliably across
   versions. We call ESLint directly instead.
 
-- Discovery result is cached on the instance so repeated calls within one
-  pipeline run cost nothing.
+- Discovery result is shared with the other runners and persisted in
+  out/.evua_tool_cache.json, so repeated runs cost nothing until PATH or
+  node_modules change.
 
 - Hard timeout reduced from 120 s → 60 s. ESLint on a freshly-generated
   Angular project (< 20 files) finishes in under 5 s. 60 s is a generous
@@ -30,18 +32,26 @@ Performance fixes (this revision)
 
 - Falls back gracefully (passed=True, linter_found=False) when ESLint is
   not installed, so missing lint tooling never blocks the pipeline.
+
+Changed files only
+-------------------
+- run(files=[...]) lints just those project-relative files instead of src/
+  (pipeline/validation/change_scope.py picks them); files=[] skips the run.
+- No --cache: ESLint keys its cache by absolute file path, and every run
+  lints a freshly written out/.tmp_<id>/angular-app, so it would never hit.
 """
 
 from __future__ import annotations
 
 import json
-import shutil
 import subprocess
-import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from pipeline.validation.scheduler import tracked_run
+from pipeline.validation.toolchain import Toolchain
+
 
 # ---------------------------------------------------------------------------
 # Data types  (unchanged from previous revision)
@@ -127,30 +137,47 @@ class LintRunner:
     project_root : Path
         Root of the Angular workspace (contains angular.json / package.json).
         Defaults to ``out/angular-app`` when not supplied.
+    cache_root : Path, optional
+        Toolchain cache directory shared by several out/ directories
+        (pipeline/validation/toolchain.py).
     """
 
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(self, project_root: Optional[Path] = None, cache_root: Optional[Path] = None):
         self.project_root = Path(project_root) if project_root else Path("out/angular-app")
-        self._cached_cmd: Optional[list[str]] = None
-        self._discovery_done: bool = False
+        self.cache_root   = cache_root
 
     # ── Public ────────────────────────────────────────────────────────────
 
-    def run(self, project_path: Optional[str] = None) -> LintResult:
-        """Run ESLint and return a LintResult. Never raises."""
+    def run(self, project_path: Optional[str] = None,
+            files: Optional[list[str]] = None) -> LintResult:
+        """
+        Run ESLint and return a LintResult. Never raises.
+        files: project-relative files to lint instead of the whole src/ tree.
+        """
         root = Path(project_path) if project_path else self.project_root
 
-        cmd = self._find_eslint(root)
+        if files is not None and not files:
+            print("  [lint] No changed files — skipping lint check")
+            return LintResult(passed=True)
+
+        # An existing shared node_modules install brings a local ESLint with it
+        toolchain = Toolchain.for_project(root, self.cache_root)
+        toolchain.provision_node_modules(root, install=False)
+        cmd = toolchain.find("eslint", root)
         if cmd is None:
             print("  [lint] ESLint not found — skipping lint check")
             return LintResult(passed=True, linter_found=False)
 
-        src = root / "src"
-        target = str(src) if src.exists() else str(root)
-        full_cmd = cmd + [target, "--format=json", "--max-warnings=0"]
+        if files is not None:
+            targets = list(files)
+            print(f"  [lint] Linting {len(targets)} changed file(s)")
+        else:
+            src = root / "src"
+            targets = [str(src) if src.exists() else str(root)]
+        full_cmd = cmd + targets + ["--format=json", "--max-warnings=0"]
 
         try:
-            result = subprocess.run(
+            result = tracked_run(
                 full_cmd,
                 cwd=str(root),
                 capture_output=True,
@@ -188,8 +215,8 @@ class LintRunner:
         except FileNotFoundError:
             print("  [lint] ESLint binary disappeared after discovery — skipping")
             return LintResult(passed=True, linter_found=False)
-        except subprocess.TimeoutExpired:
-            print(f"  [lint] Lint timed out after {_LINT_TIMEOUT}s — skipping")
+        except subprocess.TimeoutExpired as exc:
+            print(f"  [lint] Lint timed out after {exc.timeout:.0f}s — skipping")
             return LintResult(passed=True, linter_found=True, raw_output="timeout")
         except Exception as exc:
             print(f"  [lint] Unexpected error: {exc}")
@@ -197,45 +224,6 @@ class LintRunner:
 
     # ── Private ───────────────────────────────────────────────────────────
 
-    def _find_eslint(self, root: Path) -> Optional[list[str]]:
-        """
-        Locate ESLint using filesystem checks only — no subprocess spawning.
-        Result is cached so the pipeline pays this cost at most once.
-        """
-        if self._discovery_done:
-            return self._cached_cmd
-
-        self._discovery_done = True
-        is_win = sys.platform == "win32"
-        bin_dir = root / "node_modules" / ".bin"
-
-        # 1. Local node_modules/.bin/eslint — preferred, no PATH dependency
-        eslint_local = bin_dir / ("eslint.cmd" if is_win else "eslint")
-        if eslint_local.exists():
-            self._cached_cmd = [str(eslint_local)]
-            return self._cached_cmd
-
-        # 2. Local node_modules/.bin/npx — avoids global npx cold-start
-        npx_local = bin_dir / ("npx.cmd" if is_win else "npx")
-        if npx_local.exists():
-            self._cached_cmd = [str(npx_local), "eslint"]
-            return self._cached_cmd
-
-        # 3. System eslint on PATH — shutil.which is a pure Python stat(), no fork
-        eslint_global = shutil.which("eslint")
-        if eslint_global:
-            self._cached_cmd = [eslint_global]
-            return self._cached_cmd
-
-        # 4. System npx as last resort
-        npx_global = shutil.which("npx")
-        if npx_global:
-            self._cached_cmd = [npx_global, "eslint"]
-            return self._cached_cmd
-
-        self._cached_cmd = None
-        return None
-
     def _parse_eslint_json(self, raw: str, root: Path) -> list[LintError]:
         """Parse ESLint --format=json output into LintError list."""
         errors: list[LintError] = []
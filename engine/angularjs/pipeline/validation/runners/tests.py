@@ -16,6 +16,12 @@ Changes in this revision
   reflects the real exit code).
 - cli.py call-site change required: unpack a TestResult instead of
   (bool, str).  See migration note at the bottom of this file.
+- run(specs=[...]) runs only those specs of the generated workspace
+  (`ng test --include <spec>` per file) — the specs of changed components
+  and of the files importing them, picked by pipeline/validation/change_scope.py.
+  specs=[] skips the run; None runs the whole suite.
+- ng / npm come from the shared toolchain (pipeline/validation/toolchain.py),
+  which prefers the project's own node_modules/.bin/ng over one on PATH.
 """
 
 from __future__ import annotations
@@ -24,6 +30,10 @@ import re
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
+
+from pipeline.validation.scheduler import tracked_run
+from pipeline.validation.toolchain import Toolchain
 
 
 # ---------------------------------------------------------------------------
@@ -46,6 +56,8 @@ class TestResult:
     # If the runner itself was unavailable
     runner_missing: bool = False
     timed_out:      bool = False
+    # Specs selected for a changed-files-only run (None = whole suite)
+    spec_files:     Optional[list[str]] = None
 
     @property
     def spec_percent(self) -> int:
@@ -59,7 +71,7 @@ class TestResult:
         return f"{self.specs_passed} / {self.specs_total}"
 
     def to_dict(self) -> dict:
-        return {
+        d = {
             "passed":         self.passed,
             "specs_total":    self.specs_total,
             "specs_passed":   self.specs_passed,
@@ -73,6 +85,9 @@ class TestResult:
             "runner_missing": self.runner_missing,
             "timed_out":      self.timed_out,
         }
+        if self.spec_files is not None:
+            d["spec_files"] = self.spec_files[:50]
+        return d
 
 
 # ---------------------------------------------------------------------------
@@ -175,29 +190,49 @@ class TestRunner:
     Runs framework-aware tests against the migrated Angular project.
 
     Priority:
-      1. Generated Angular workspace at out/angular-app  (ng test)
+      1. Generated Angular workspace at project_root     (ng test)
+         — project_root defaults to out/angular-app
       2. Angular workspace at repo_path                  (ng test)
       3. Fallback npm test in repo_path
 
+    Only the generated workspace can run a selection of specs; the other
+    runners always run their whole suite.
+
     Returns a TestResult — never raises.
     """
 
-    def run(self, repo_path: str) -> TestResult:
+    def __init__(self, project_root: Optional[Path] = None, cache_root: Optional[Path] = None):
+        """cache_root: toolchain cache shared by several out/ directories, if any."""
+        self.project_root = Path(project_root) if project_root else Path("out/angular-app")
+        self.cache_root   = cache_root
+
+    def run(self, repo_path: str, specs: Optional[list[str]] = None) -> TestResult:
+        """specs: project-relative spec files to run instead of the whole suite."""
         repo_path   = Path(repo_path)
-        angular_out = Path("out/angular-app")
+        angular_out = self.project_root
+        toolchain   = Toolchain.for_project(angular_out, self.cache_root)
 
         try:
             if (angular_out / "angular.json").exists():
-                cmd = ["ng", "test", "--watch=false", "--browsers=ChromeHeadless"]
+                if specs is not None and not specs:
+                    return TestResult(passed=True, spec_files=[],
+                                      output="No specs affected by the changed files — test run skipped")
+                toolchain.provision_node_modules(angular_out, install=False)
+                ng  = toolchain.find("ng", angular_out) or ["ng"]
+                cmd = ng + ["test", "--watch=false", "--browsers=ChromeHeadless"]
+                for spec in specs or []:
+                    cmd += ["--include", spec]
                 cwd = angular_out
             elif (repo_path / "angular.json").exists():
-                cmd = ["ng", "test", "--watch=false", "--browsers=ChromeHeadless"]
+                ng  = toolchain.find("ng", repo_path) or ["ng"]
+                cmd = ng + ["test", "--watch=false", "--browsers=ChromeHeadless"]
                 cwd = repo_path
             else:
-                cmd = ["npm", "test", "--", "--watch=false"]
+                npm = toolchain.find("npm", repo_path) or ["npm"]
+                cmd = npm + ["test", "--", "--watch=false"]
                 cwd = repo_path
 
-            result = subprocess.run(
+            result = tracked_run(
                 cmd,
                 cwd=str(cwd),
                 capture_output=True,
@@ -209,7 +244,8 @@ class TestRunner:
             output = result.stdout + "\n" + result.stderr
             counts = _parse_test_output(output)
 
-            return TestResult(passed=passed, output=output, **counts)
+            scoped = specs if cwd == angular_out else None
+            return TestResult(passed=passed, output=output, spec_files=scoped, **counts)
 
         except FileNotFoundError as exc:
             msg = f"Test command not found: {exc}"
@@ -11,7 +11,12 @@ produce code that actually compiles?"
 Behaviour
 ---------
 - Discovers tsconfig automatically (tsconfig.app.json > tsconfig.json)
-- Tries `tsc` first, then `npx tsc` as fallback (covers global vs local installs)
+- Runs `tsc` from PATH, else the project's node_modules/.bin/tsc
+- Incremental: keeps tsc's .tsbuildinfo between runs (see "Incremental mode")
+- Tool discovery and node_modules provisioning are shared with the other
+  runners (pipeline/validation/toolchain.py)
+- Long-lived processes (serve / batch) check through a warm worker instead of
+  spawning tsc per project (see tsc_worker.py)
 - Parses TypeScript error output into structured TscError objects
 - Returns a TscResult with pass/fail + categorised error list
 - Never raises — always returns a result, even if tsc is not installed
@@ -24,6 +29,23 @@ Error categories (for report grouping)
   template     — errors in .html files (Angular template compilation)
   other        — everything else
 
+Incremental mode
+----------------
+Every run validates a fresh out/.tmp_<id>/angular-app, so a plain
+`tsc --noEmit` re-checks the whole project each time. With incremental=True
+(the default) tsc runs with --incremental and its build info is kept in a
+stable cache next to the node_modules cache:
+
+    out/.evua_tsc_cache/<key>/tsconfig.tsbuildinfo
+
+keyed by package.json + tsconfig content. Before tsc runs, the cached file
+is copied into the project root; afterwards it is moved back. tsc stores
+paths relative to the build-info file and content hashes per file, and the
+project always sits at the same depth under out/, so the previous run's
+state applies: files whose content (and dependencies) did not change are
+not re-checked. A tsc too old for --incremental with --noEmit (< 4.0) is
+detected from its error and the check is re-run without it.
+
 Usage
 -----
     from pipeline.validation.runners.tsc import TscValidator
@@ -39,13 +61,22 @@ Usage
             print(f"  {err.file}:{err.line}  {err.code}  {err.message}")
 """
 
+import hashlib
+import os
 import re
+import shutil
 import subprocess
-import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+from pipeline.validation.runners.tsc_worker import TscWorker, TscWorkerError, pooled_worker
+from pipeline.validation.scheduler import remaining_time, tracked_run
+from pipeline.validation.toolchain import Toolchain
+
+
+_TSC_TIMEOUT = 120  # seconds — 2 min max, large projects can be slow
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Data types
@@ -98,11 +129,12 @@ class TscError:
 @dataclass
 class TscResult:
     passed:       bool
-    tsc_found:    bool                    # False if tsc / npx not available
+    tsc_found:    bool                    # False if tsc not available
     tsconfig:     Optional[str]           # path used, or None if not found
     errors:       list[TscError] = field(default_factory=list)
     raw_output:   str = ""                # full tsc stdout for debugging
     tsc_command:  str = ""                # which command was used
+    incremental:  bool = False            # True if run with cached build info
 
     @property
     def error_count(self) -> int:
@@ -135,6 +167,7 @@ class TscResult:
             "error_count":  self.error_count,
             "error_summary": self.error_summary,
             "tsc_command":  self.tsc_command,
+            "incremental":  self.incremental,
             "errors_by_category": {
                 cat: [e.to_dict() for e in errs]
                 for cat, errs in self.errors_by_category.items()
@@ -165,8 +198,25 @@ class TscValidator:
         "tsconfig.json",
     ]
 
-    def __init__(self, project_root: Path):
+    # Build info inside the project root while tsc runs (paths in it are
+    # relative to its own location), cached between runs in out/.evua_tsc_cache
+    _BUILDINFO_NAME = ".evua.tsbuildinfo"
+
+    def __init__(self, project_root: Path, incremental: bool = True,
+                 worker: Optional[TscWorker] = None, cache_root: Optional[Path] = None):
+        """
+        incremental: run tsc --incremental with build info cached across runs
+        cache_root:  directory for the build info and node_modules caches
+                     instead of the out/ directory above project_root
+        worker:      checker to use instead of spawning tsc (any process speaking
+                     the tsc_worker protocol; tsc need not be installed then); by
+                     default the per-process pool is used once
+                     tsc_worker.enable_pool() has been called
+        """
         self.project_root = Path(project_root)
+        self.incremental  = incremental
+        self.worker       = worker
+        self.cache_root   = cache_root
 
     # ── Public ────────────────────────────────────────────────────────────
 
@@ -175,9 +225,10 @@ class TscValidator:
         Run tsc --noEmit and return a TscResult.
         Never raises. Always returns a result.
         """
-        # Ensure node_modules exists — run npm install if missing (idempotent).
-        # This is required before tsc can resolve @angular/* imports.
-        self._ensure_npm_install()
+        # node_modules is required before tsc can resolve @angular/* imports:
+        # link the shared install (npm install runs once per package.json)
+        toolchain = Toolchain.for_project(self.project_root, self.cache_root)
+        toolchain.provision_node_modules(self.project_root)
 
         tsconfig = self._find_tsconfig()
         if tsconfig is None:
@@ -188,8 +239,9 @@ class TscValidator:
                 tsconfig=None,
             )
 
-        tsc_cmd = self._find_tsc()
-        if tsc_cmd is None:
+        # An injected worker does the checking itself; tsc is only its fallback
+        tsc_cmd = toolchain.find("tsc", self.project_root)
+        if tsc_cmd is None and self.worker is None:
             print("  [tsc] tsc not found. Install: npm install -g typescript")
             print("  [tsc] Or run:  npm install  inside the generated project")
             print("  [tsc] then:    npx tsc --noEmit")
@@ -199,25 +251,58 @@ class TscValidator:
                 tsconfig=str(tsconfig),
             )
 
-        print(f"  [tsc] Running: {' '.join(tsc_cmd)} --noEmit --project {tsconfig.name}")
+        args = ["--noEmit", "--project", str(tsconfig)]
+        cached_buildinfo = None
+        warm             = False                # previous build info copied in
+        buildinfo        = self.project_root / self._BUILDINFO_NAME
+        if self.incremental:
+            cached_buildinfo = self._buildinfo_cache_path()
+            if cached_buildinfo.exists():
+                shutil.copy2(cached_buildinfo, buildinfo)
+                warm = True
+                print(f"  [tsc] Build info cache hit ({cached_buildinfo.parent.name}) — incremental check")
+            else:
+                print(f"  [tsc] Build info cache miss ({cached_buildinfo.parent.name}) — full check")
+            args += ["--incremental", "--tsBuildInfoFile", str(buildinfo)]
+
+        worker = self._get_worker(tsc_cmd)
+        if worker is not None:
+            print(f"  [tsc] Checking with warm worker (pid {worker.pid}, TypeScript {worker.version or '?'}, "
+                  f"{worker.checks} earlier check(s))")
+        else:
+            print(f"  [tsc] Running: {' '.join(tsc_cmd)} {' '.join(a if a.startswith('--') else Path(a).name for a in args)}")
         print(f"  [tsc] Working dir: {self.project_root}")
 
         try:
-            proc = subprocess.run(
-                tsc_cmd + ["--noEmit", "--project", str(tsconfig)],
-                capture_output=True,
-                text=True,
-                cwd=str(self.project_root),
-                timeout=120,  # 2 min max — large projects can be slow
-            )
-        except subprocess.TimeoutExpired:
-            print("  [tsc] TIMEOUT after 120s")
+            proc = None
+            if worker is not None:
+                try:
+                    proc = worker.check(tsconfig, self.project_root,
+                                        buildinfo if self.incremental else None,
+                                        timeout=remaining_time(_TSC_TIMEOUT))
+                except TscWorkerError as e:
+                    if tsc_cmd is None:
+                        raise
+                    print(f"  [tsc] Worker failed ({str(e).splitlines()[0][:120]}) — running tsc instead")
+            if proc is None:
+                proc = self._run_tsc(tsc_cmd + args)
+            if self.incremental and self._incremental_unsupported(proc):
+                print("  [tsc] This tsc cannot combine --incremental with --noEmit — re-running cold")
+                cached_buildinfo = None
+                warm = False
+                if tsc_cmd is None:
+                    proc = worker.check(tsconfig, self.project_root, None,
+                                        timeout=remaining_time(_TSC_TIMEOUT))
+                else:
+                    proc = self._run_tsc(tsc_cmd + ["--noEmit", "--project", str(tsconfig)])
+        except subprocess.TimeoutExpired as exc:
+            print(f"  [tsc] TIMEOUT after {exc.timeout:.0f}s")
             return TscResult(
                 passed=False,
                 tsc_found=True,
                 tsconfig=str(tsconfig),
                 raw_output="TIMEOUT",
-                tsc_command=" ".join(tsc_cmd),
+                tsc_command=" ".join(tsc_cmd or self.worker.command),
             )
         except Exception as e:
             print(f"  [tsc] ERROR: {e}")
@@ -226,8 +311,19 @@ class TscValidator:
                 tsc_found=True,
                 tsconfig=str(tsconfig),
                 raw_output=str(e),
-                tsc_command=" ".join(tsc_cmd),
+                tsc_command=" ".join(tsc_cmd or self.worker.command),
             )
+        finally:
+            # The workspace is committed as the generated app — keep the build
+            # info out of it, in the cache for the next run
+            if buildinfo.exists():
+                if cached_buildinfo is not None:
+                    cached_buildinfo.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = cached_buildinfo.with_name(f"{cached_buildinfo.name}.{os.getpid()}.tmp")
+                    shutil.move(str(buildinfo), str(tmp))
+                    os.replace(tmp, cached_buildinfo)
+                else:
+                    buildinfo.unlink()
 
         raw = proc.stdout + proc.stderr
         errors = self._parse_errors(raw)
@@ -239,7 +335,8 @@ class TscValidator:
             tsconfig=str(tsconfig),
             errors=errors,
             raw_output=raw,
-            tsc_command=" ".join(tsc_cmd),
+            tsc_command=" ".join(tsc_cmd or self.worker.command),
+            incremental=warm,
         )
 
         # Print summary
@@ -266,6 +363,36 @@ class TscValidator:
 
     # ── Private ───────────────────────────────────────────────────────────
 
+    def _run_tsc(self, cmd: list[str]) -> subprocess.CompletedProcess:
+        return tracked_run(
+            cmd,
+            capture_output=True,
+            text=True,
+            cwd=str(self.project_root),
+            timeout=_TSC_TIMEOUT,
+        )
+
+    def _buildinfo_cache_path(self) -> Path:
+        """
+        out/.evua_tsc_cache/<key>/tsconfig.tsbuildinfo (under cache_root when
+        set) — keyed like the node_modules cache, plus the tsconfig files
+        (compiler options).
+        """
+        h = hashlib.md5()
+        for name in ["package.json", *self._TSCONFIG_CANDIDATES]:
+            p = self.project_root / name
+            if p.exists():
+                h.update(name.encode("utf-8") + b"\0" + p.read_bytes() + b"\0")
+        cache_root = Path(self.cache_root) if self.cache_root else self.project_root.parent.parent
+        cache_root = cache_root / ".evua_tsc_cache"
+        return cache_root / h.hexdigest()[:12] / "tsconfig.tsbuildinfo"
+
+    @staticmethod
+    def _incremental_unsupported(proc: subprocess.CompletedProcess) -> bool:
+        # TS < 4.0: "error TS5053: Option 'noEmit' cannot be specified with option 'incremental'."
+        out = proc.stdout + proc.stderr
+        return proc.returncode != 0 and "TS5053" in out and "incremental" in out
+
     def _find_tsconfig(self) -> Optional[Path]:
         """Return the first tsconfig file found in project_root."""
         for name in self._TSCONFIG_CANDIDATES:
@@ -274,159 +401,29 @@ class TscValidator:
                 return candidate
         return None
 
-    def _ensure_npm_install(self) -> None:
-        """
-        Ensure node_modules is present for tsc to resolve @angular/* imports.
-
-        Strategy: maintain a persistent shared node_modules cache keyed by the
-        hash of package.json. On first run with a given package.json, run
-        npm install once into the cache. On subsequent runs, create a junction
-        (Windows) or symlink (Unix) from <project_root>/node_modules to the
-        cached copy — takes milliseconds instead of 3-5 minutes.
-
-        Cache location: <project_root>/../../.evua_node_cache/<hash>/node_modules
-        (two levels up from the tmp Angular project puts us inside out/)
-        """
-        import hashlib
-        import os
-
-        node_modules = self.project_root / "node_modules"
-        if node_modules.exists():
-            return  # already present (real install or symlink/junction)
-
-        pkg_json = self.project_root / "package.json"
-        if not pkg_json.exists():
-            print("  [tsc] package.json not found — skipping npm install")
-            return
-
-        # ── Compute cache key from package.json content ──────────────────
-        pkg_content = pkg_json.read_bytes()
-        pkg_hash    = hashlib.md5(pkg_content).hexdigest()[:12]
-
-        # Cache root: two dirs up from the Angular project root, so it survives
-        # across tmp-dir rotations.  e.g. out/.evua_node_cache/<hash>/node_modules
-        cache_root   = self.project_root.parent.parent / ".evua_node_cache"
-        cache_nm_dir = cache_root / pkg_hash / "node_modules"
-
-        npm_name = "npm.cmd" if sys.platform == "win32" else "npm"
-
-        # ── If cache miss, install once into a stable location ───────────
-        if not cache_nm_dir.exists():
-            print(f"  [tsc] node_modules cache miss (key={pkg_hash}) — running npm install once")
-            print(f"  [tsc] This takes ~30-60s on first run; subsequent runs will be instant.")
-            install_dir = cache_nm_dir.parent
-            install_dir.mkdir(parents=True, exist_ok=True)
-            # Copy package.json into install dir so npm install works there
-            import shutil
-            shutil.copy2(pkg_json, install_dir / "package.json")
-            try:
-                result = subprocess.run(
-                    [npm_name, "install"],
-                    capture_output=True, text=True,
-                    cwd=str(install_dir),
-                    timeout=360,
-                )
-                if result.returncode == 0:
-                    print(f"  [tsc] npm install completed — cached at {cache_nm_dir}")
-                else:
-                    print(f"  [tsc] npm install failed (rc={result.returncode})")
-                    if result.stderr:
-                        for line in result.stderr.splitlines()[:5]:
-                            print(f"  [tsc]   {line}")
-                    return
-            except FileNotFoundError:
-                print("  [tsc] npm not found — install Node.js from https://nodejs.org")
-                return
-            except subprocess.TimeoutExpired:
-                print("  [tsc] npm install timed out after 6 minutes")
-                return
-        else:
-            print(f"  [tsc] node_modules cache hit (key={pkg_hash}) — linking instantly")
-
-        # ── Link cache into the tmp project dir ──────────────────────────
-        if not cache_nm_dir.exists():
-            print("  [tsc] Cache dir missing after install — falling back to local npm install")
-            self._npm_install_local(npm_name, pkg_json)
-            return
-
-        try:
-            if sys.platform == "win32":
-                # Windows: use directory junction (no admin rights needed, unlike symlinks)
-                import subprocess as _sp
-                _sp.run(
-                    ["cmd", "/c", "mklink", "/J",
-                     str(node_modules), str(cache_nm_dir)],
-                    check=True, capture_output=True,
-                )
-            else:
-                # Unix: symlink
-                node_modules.symlink_to(cache_nm_dir)
-            print(f"  [tsc] Linked node_modules from cache ({cache_nm_dir.parent.name})")
-        except Exception as e:
-            print(f"  [tsc] Could not create junction/symlink ({e}) — falling back to copy")
-            # Last resort: copy (slow but always works)
-            import shutil
-            shutil.copytree(str(cache_nm_dir), str(node_modules))
-
-    def _npm_install_local(self, npm_name: str, pkg_json: Path) -> None:
-        """Fallback: plain npm install in project_root."""
-        print(f"  [tsc] Falling back to local npm install in {self.project_root}")
-        try:
-            result = subprocess.run(
-                [npm_name, "install"],
-                capture_output=True, text=True,
-                cwd=str(self.project_root),
-                timeout=360,
-            )
-            if result.returncode == 0:
-                print("  [tsc] npm install completed successfully")
-            else:
-                print(f"  [tsc] npm install failed (rc={result.returncode})")
-        except FileNotFoundError:
-            print("  [tsc] npm not found — install Node.js from https://nodejs.org")
-        except subprocess.TimeoutExpired:
-            print("  [tsc] npm install timed out")
-
-    def _find_tsc(self) -> Optional[list[str]]:
-        """
-        Return the tsc command as a list, trying:
-          1. tsc (global install)
-          2. npx tsc (local / npx)
-          3. node_modules/.bin/tsc (local without npx)
-        Returns None if nothing works.
-        """
-        # Windows: tsc.cmd
-        tsc_name = "tsc.cmd" if sys.platform == "win32" else "tsc"
-
-        # 1. Global tsc
+    def _get_worker(self, tsc_cmd: list[str]) -> Optional[TscWorker]:
+        if self.worker is not None:
+            return self.worker
+        typescript_js = self._typescript_lib(tsc_cmd)
+        if typescript_js is None:
+            return None
         try:
-            result = subprocess.run(
-                [tsc_name, "--version"],
-                capture_output=True, text=True, timeout=10,
-            )
-            if result.returncode == 0:
-                return [tsc_name]
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-
-        # 2. Local via npx
-        npx_name = "npx.cmd" if sys.platform == "win32" else "npx"
-        try:
-            result = subprocess.run(
-                [npx_name, "tsc", "--version"],
-                capture_output=True, text=True, timeout=15,
-                cwd=str(self.project_root),
-            )
-            if result.returncode == 0:
-                return [npx_name, "tsc"]
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-
-        # 3. node_modules/.bin/tsc
-        local_tsc = self.project_root / "node_modules" / ".bin" / "tsc"
-        if local_tsc.exists():
-            return [str(local_tsc)]
-
+            return pooled_worker(typescript_js)
+        except (TscWorkerError, subprocess.TimeoutExpired) as e:
+            print(f"  [tsc] Could not start a checker worker ({e}) — running tsc per project")
+            return None
+
+    def _typescript_lib(self, tsc_cmd: list[str]) -> Optional[Path]:
+        """typescript/lib/typescript.js of the install behind tsc_cmd, if it can be found."""
+        exe = Path(shutil.which(tsc_cmd[0]) or tsc_cmd[0])
+        candidates = [
+            exe.resolve().parent.parent,                  # …/typescript/bin/tsc
+            exe.parent / "node_modules" / "typescript",   # Windows npm shim
+        ]
+        for pkg in candidates:
+            lib = pkg / "lib" / "typescript.js"
+            if lib.exists():
+                return lib.resolve()
         return None
 
     def _parse_errors(self, output: str) -> list[TscError]:
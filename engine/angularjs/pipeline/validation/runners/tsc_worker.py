@@ -0,0 +1,288 @@
+"""
+pipeline/validation/runners/tsc_worker.py
+
+Long-lived TypeScript checker for processes that validate many generated
+projects back to back (`cli.py serve`, `cli.py batch` workers).
+
+A plain `tsc` run pays Node start-up, loading the compiler and parsing every
+declaration file (lib.*.d.ts, @angular/*, rxjs, ...) before it checks a
+single generated file. TscWorker starts one Node process that loads the
+TypeScript compiler API once and keeps declaration files from the TypeScript
+lib folder and node_modules parsed between checks (re-read when their mtime
+changes). Generated sources are always read fresh.
+
+Protocol — one JSON object per line over the worker's stdin/stdout:
+
+    ← {"ready": true, "version": "5.4.5"}                  (once, at start-up)
+    → {"id": 1, "project": "/abs/tsconfig.app.json", "cwd": "/abs/project",
+       "buildinfo": "/abs/project/.evua.tsbuildinfo"}       (buildinfo may be null)
+    ← {"id": 1, "exit": 2, "output": "src/app/x.ts(3,7): error TS2304: ..."}
+    ← {"id": 1, "error": "..."}                             (the check itself failed)
+
+`output` uses tsc's own format, so TscValidator parses it unchanged. Any
+command that speaks this protocol can stand in for the Node server:
+
+    worker = TscWorker(["python", "fake_tsc_server.py"])
+    TscValidator(project_root, worker=worker).run()
+
+Workers are pooled per TypeScript install and per process once
+enable_pool() has been called; one-shot CLI runs keep spawning tsc, where a
+worker would only add start-up cost.
+"""
+
+import atexit
+import itertools
+import json
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+STARTUP_TIMEOUT = 30      # seconds for Node + the compiler to load
+
+
+class TscWorkerError(Exception):
+    """The worker died, never became ready or sent an unusable reply."""
+
+
+# Node side: loads the compiler from the path given as its first argument.
+_SERVER_JS = r"""
+'use strict';
+const path = require('path');
+const readline = require('readline');
+const ts = require(process.argv[1]);
+
+const libDir = path.dirname(ts.getDefaultLibFilePath({})).replace(/\\/g, '/');
+const MAX_SHARED = 20000;
+const shared = new Map();          // declaration files kept parsed between checks
+
+function isShared(fileName) {
+  return fileName.endsWith('.d.ts') &&
+         (fileName.includes('/node_modules/') || fileName.startsWith(libDir));
+}
+
+function settingsKey(options) {
+  return JSON.stringify([options.target, options.module, options.moduleResolution,
+                         options.jsx, options.strict, options.alwaysStrict,
+                         options.allowJs, options.moduleDetection]);
+}
+
+function makeHost(options, incremental) {
+  const host = incremental ? ts.createIncrementalCompilerHost(options, ts.sys)
+                           : ts.createCompilerHost(options);
+  const getSourceFile = host.getSourceFile.bind(host);
+  const settings = settingsKey(options);
+  host.getSourceFile = (fileName, languageVersion, onError, shouldCreate) => {
+    if (!isShared(fileName)) return getSourceFile(fileName, languageVersion, onError, shouldCreate);
+    const lv = typeof languageVersion === 'object'
+      ? languageVersion.languageVersion + ':' + languageVersion.impliedNodeFormat
+      : String(languageVersion);
+    const key = settings + '\0' + lv + '\0' + fileName;
+    const modified = ts.sys.getModifiedTime ? ts.sys.getModifiedTime(fileName) : undefined;
+    const mtime = modified ? modified.getTime() : 0;
+    const hit = shared.get(key);
+    if (hit && hit.mtime === mtime) return hit.sourceFile;
+    const sourceFile = getSourceFile(fileName, languageVersion, onError, shouldCreate);
+    if (sourceFile) {
+      if (shared.size >= MAX_SHARED) shared.clear();
+      shared.set(key, { mtime, sourceFile });
+    }
+    return sourceFile;
+  };
+  return host;
+}
+
+function check(req) {
+  const cwd = req.cwd;
+  const fmtHost = { getCanonicalFileName: f => f, getCurrentDirectory: () => cwd, getNewLine: () => '\n' };
+  const overrides = { noEmit: true };
+  if (req.buildinfo) { overrides.incremental = true; overrides.tsBuildInfoFile = req.buildinfo; }
+
+  let configError = null;
+  const parsed = ts.getParsedCommandLineOfConfigFile(req.project, overrides, Object.assign({}, ts.sys, {
+    getCurrentDirectory: () => cwd,
+    onUnRecoverableConfigFileDiagnostic: d => { configError = d; },
+  }));
+  if (!parsed) {
+    return { id: req.id, exit: 1,
+             output: configError ? ts.formatDiagnostics([configError], fmtHost) : 'Cannot read ' + req.project + '\n' };
+  }
+
+  const config = {
+    rootNames: parsed.fileNames,
+    options: parsed.options,
+    projectReferences: parsed.projectReferences,
+    configFileParsingDiagnostics: ts.getConfigFileParsingDiagnostics(parsed),
+    host: makeHost(parsed.options, !!req.buildinfo),
+  };
+  const program = req.buildinfo ? ts.createIncrementalProgram(config) : ts.createProgram(config);
+
+  // Same order and short-circuiting as tsc
+  const diags = program.getConfigFileParsingDiagnostics().slice();
+  const n = diags.length;
+  diags.push(...program.getSyntacticDiagnostics());
+  if (diags.length === n) {
+    diags.push(...program.getOptionsDiagnostics(), ...program.getGlobalDiagnostics());
+    if (diags.length === n) diags.push(...program.getSemanticDiagnostics());
+  }
+  if (req.buildinfo) program.emit();       // noEmit: writes only the build info
+
+  const errors = diags.filter(d => d.category === ts.DiagnosticCategory.Error).length;
+  return { id: req.id, exit: errors ? 2 : 0, output: ts.formatDiagnostics(diags, fmtHost) };
+}
+
+const rl = readline.createInterface({ input: process.stdin });
+rl.on('line', line => {
+  let req;
+  try { req = JSON.parse(line); } catch (e) { return; }
+  let res;
+  try { res = check(req); } catch (e) { res = { id: req.id, error: String((e && e.stack) || e) }; }
+  process.stdout.write(JSON.stringify(res) + '\n');
+});
+rl.on('close', () => process.exit(0));
+process.stdout.write(JSON.stringify({ ready: true, version: ts.version }) + '\n');
+"""
+
+
+class TscWorker:
+    """One checker process; check() calls are serialised."""
+
+    def __init__(self, command: list[str], startup_timeout: float = STARTUP_TIMEOUT):
+        self.command = list(command)
+        self.version = ""
+        self.checks  = 0
+        self._ids    = itertools.count(1)
+        self._lock   = threading.Lock()
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        try:
+            self._proc = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, encoding="utf-8", errors="replace", bufsize=1,
+            )
+        except OSError as e:
+            raise TscWorkerError(f"Cannot start checker: {e}")
+        threading.Thread(target=self._pump, daemon=True).start()
+
+        try:
+            ready = self._read(startup_timeout)
+        except (TscWorkerError, subprocess.TimeoutExpired):
+            self._proc.kill()
+            raise
+        if not ready.get("ready"):
+            self.close()
+            raise TscWorkerError(f"Checker did not start: {ready}")
+        self.version = ready.get("version", "")
+
+    @classmethod
+    def for_typescript(cls, typescript_js: Path, node: str = "node") -> "TscWorker":
+        """The bundled Node server on the compiler at typescript_js (…/typescript/lib/typescript.js)."""
+        return cls([node, "-e", _SERVER_JS, str(typescript_js)])
+
+    @property
+    def pid(self) -> int:
+        return self._proc.pid
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def check(self, project: Path, cwd: Path, buildinfo: Optional[Path] = None,
+              timeout: float = 120) -> subprocess.CompletedProcess:
+        """
+        Check one project. Returns a CompletedProcess shaped like a tsc run
+        (returncode, stdout = diagnostics). Raises subprocess.TimeoutExpired
+        (the worker is killed) or TscWorkerError.
+        """
+        with self._lock:
+            if not self.alive:
+                raise TscWorkerError("Checker process has exited")
+            req_id = next(self._ids)
+            request = {"id": req_id, "project": str(project), "cwd": str(cwd),
+                       "buildinfo": str(buildinfo) if buildinfo else None}
+            try:
+                self._proc.stdin.write(json.dumps(request) + "\n")
+                self._proc.stdin.flush()
+            except OSError as e:
+                raise TscWorkerError(f"Checker process is gone: {e}")
+            try:
+                reply = self._read(timeout)
+            except subprocess.TimeoutExpired:
+                self.close()                # a wedged checker is not reused
+                raise
+            if reply.get("id") != req_id:
+                self.close()
+                raise TscWorkerError(f"Unexpected reply from checker: {reply}")
+            if "error" in reply:
+                raise TscWorkerError(reply["error"])
+            self.checks += 1
+            return subprocess.CompletedProcess(
+                self.command, int(reply.get("exit", 1)), reply.get("output", ""), "",
+            )
+
+    def close(self) -> None:
+        if self.alive:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    def _pump(self) -> None:
+        for line in self._proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)               # EOF
+
+    def _read(self, timeout: float) -> dict:
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            raise subprocess.TimeoutExpired(self.command, timeout)
+        if line is None:
+            try:
+                rc = self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                rc = None
+            raise TscWorkerError(f"Checker exited (rc={rc})")
+        try:
+            return json.loads(line)
+        except ValueError:
+            raise TscWorkerError(f"Bad line from checker: {line[:200]!r}")
+
+
+# ── Per-process pool ───────────────────────────────────────────────────────
+
+_pool: dict[str, TscWorker] = {}
+_pool_enabled = False
+
+
+def enable_pool() -> None:
+    """Keep one warm worker per TypeScript install for the rest of this process."""
+    global _pool_enabled
+    if not _pool_enabled:
+        _pool_enabled = True
+        atexit.register(shutdown_pool)
+
+
+def pooled_worker(typescript_js: Path) -> Optional[TscWorker]:
+    """The warm worker for typescript_js, started on first use; None when pooling is off."""
+    if not _pool_enabled:
+        return None
+    key = str(Path(typescript_js).resolve())
+    worker = _pool.get(key)
+    if worker is None or not worker.alive:
+        node = "node.exe" if sys.platform == "win32" else "node"
+        worker = TscWorker.for_typescript(Path(key), node=node)
+        _pool[key] = worker
+    return worker
+
+
+def shutdown_pool() -> None:
+    for worker in _pool.values():
+        worker.close()
+    _pool.clear()
@@ -0,0 +1,262 @@
+"""
+pipeline/validation/scheduler.py
+
+Runs the validation checks — tests, snapshot comparison, coverage, tsc and
+(optionally) lint — concurrently under one overall deadline.
+
+Each check is a plain blocking callable (the existing runners), started in
+its own daemon thread; an asyncio loop waits for all of them until the
+deadline. Checks still running then are cancelled: every child process they
+started through tracked_run() is killed together with its own children
+(ng test → karma → Chrome), and they are reported as timed out.
+A thread stuck outside a subprocess is abandoned — daemon threads never hold
+up interpreter exit.
+
+Subprocesses started through tracked_run() inside a check also get their
+timeout capped at the time left before the deadline, so a slow test run
+cannot outlive the phase.
+
+Console output of each check is buffered per thread and printed in check
+order once the phase is over, so concurrent checks never interleave lines.
+
+    scheduler = ValidationScheduler(deadline=240)
+    scheduler.add("tests",    lambda: TestRunner().run(str(repo_path)))
+    scheduler.add("coverage", lambda: CoverageAnalyzer(out_dir).analyze())
+    outcomes = scheduler.run()                  # name → CheckOutcome
+    outcomes["tests"].result                    # None if it timed out / raised
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+DEFAULT_DEADLINE = 240     # seconds for the whole validation phase
+CANCEL_GRACE     = 5       # seconds for cancelled checks to unwind
+
+
+@dataclass
+class CheckOutcome:
+    name:      str
+    result:    Any                   # the check's return value, None if it did not finish
+    seconds:   float
+    timed_out: bool = False
+    reason:    str = ""              # why result is None
+
+
+# ── Cancellation ───────────────────────────────────────────────────────────
+
+class _CancelScope:
+    """Deadline and child processes of one running check."""
+
+    def __init__(self, deadline_at: float):
+        self.deadline_at = deadline_at
+        self.cancelled   = threading.Event()
+        self._procs: set[subprocess.Popen] = set()
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline_at - time.monotonic())
+
+    def register(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._procs.add(proc)
+        if self.cancelled.is_set():
+            _kill(proc)
+
+    def unregister(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._procs.discard(proc)
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+        with self._lock:
+            for proc in self._procs:
+                _kill(proc)
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    """Kill proc and everything it started (its own process group on POSIX)."""
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except OSError:
+        pass
+
+
+_local = threading.local()
+
+
+def remaining_time(default: float) -> float:
+    """Seconds left for the current check (default outside the scheduler)."""
+    scope = getattr(_local, "scope", None)
+    return default if scope is None else min(default, scope.remaining())
+
+
+def tracked_run(cmd, *, timeout: Optional[float] = None, capture_output: bool = False,
+                **popen_kwargs) -> subprocess.CompletedProcess:
+    """
+    subprocess.run() for validation runners. Inside a scheduled check the
+    child is killed when the check is cancelled, and the timeout is capped
+    at the time left before the deadline; elsewhere it is subprocess.run().
+    """
+    scope = getattr(_local, "scope", None)
+    if scope is None:
+        return subprocess.run(cmd, timeout=timeout, capture_output=capture_output, **popen_kwargs)
+    if scope.cancelled.is_set():
+        raise subprocess.TimeoutExpired(cmd, 0)
+
+    timeout = scope.remaining() if timeout is None else min(timeout, scope.remaining())
+    if capture_output:
+        popen_kwargs["stdout"] = subprocess.PIPE
+        popen_kwargs["stderr"] = subprocess.PIPE
+    if os.name == "posix":
+        popen_kwargs["start_new_session"] = True    # one group to kill on cancel
+    with subprocess.Popen(cmd, **popen_kwargs) as proc:
+        scope.register(proc)
+        try:
+            stdout, stderr = proc.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill(proc)                 # grandchildren would keep the pipes open
+            proc.communicate()
+            raise
+        finally:
+            scope.unregister(proc)
+        if scope.cancelled.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
+
+# ── Output routing ─────────────────────────────────────────────────────────
+
+class _OutputRouter:
+    """sys.stdout stand-in: check threads write to their own buffer."""
+
+    def __init__(self, original):
+        self.original = original
+        self._buffers:   dict[str, list[str]] = {}
+        self._by_thread: dict[int, list[str]] = {}
+
+    def attach(self, name: str) -> None:
+        self._by_thread[threading.get_ident()] = self._buffers.setdefault(name, [])
+
+    def detach(self) -> None:
+        self._by_thread.pop(threading.get_ident(), None)
+
+    def output(self, name: str) -> str:
+        return "".join(self._buffers.get(name, []))
+
+    def write(self, text: str) -> int:
+        buf = self._by_thread.get(threading.get_ident())
+        if buf is None:
+            return self.original.write(text)
+        buf.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        self.original.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.original, name)
+
+
+# ── Scheduler ──────────────────────────────────────────────────────────────
+
+class ValidationScheduler:
+    def __init__(self, deadline: float = DEFAULT_DEADLINE):
+        self.deadline = deadline
+        self._checks: list[tuple[str, Callable[[], Any]]] = []
+
+    def add(self, name: str, fn: Callable[[], Any]) -> None:
+        self._checks.append((name, fn))
+
+    @property
+    def names(self) -> list[str]:
+        return [name for name, _ in self._checks]
+
+    def run(self) -> dict[str, CheckOutcome]:
+        """Run every check concurrently; returns outcomes in the order added."""
+        if not self._checks:
+            return {}
+        router = _OutputRouter(sys.stdout)
+        scopes: dict[str, _CancelScope] = {}
+        sys.stdout = router
+        try:
+            outcomes = asyncio.run(self._run_all(router, scopes))
+        except BaseException:
+            for scope in scopes.values():       # Ctrl-C: children are in their own sessions
+                scope.cancel()
+            raise
+        finally:
+            sys.stdout = router.original
+        for name in self.names:
+            sys.stdout.write(router.output(name))
+        return outcomes
+
+    async def _run_all(self, router: _OutputRouter,
+                       scopes: dict[str, "_CancelScope"]) -> dict[str, CheckOutcome]:
+        loop        = asyncio.get_running_loop()
+        deadline_at = time.monotonic() + self.deadline
+        started     = time.perf_counter()
+        futures: dict[str, asyncio.Future] = {}
+
+        for name, fn in self._checks:
+            futures[name] = loop.create_future()
+            scopes[name]  = _CancelScope(deadline_at)
+            threading.Thread(
+                target=_check_thread,
+                args=(name, fn, scopes[name], router, loop, futures[name]),
+                name=f"evua-validate-{name}",
+                daemon=True,
+            ).start()
+
+        _, pending = await asyncio.wait(futures.values(), timeout=self.deadline)
+        if pending:
+            for name, fut in futures.items():
+                if fut in pending:
+                    scopes[name].cancel()
+            await asyncio.wait(pending, timeout=CANCEL_GRACE)
+
+        outcomes = {}
+        for name, fut in futures.items():
+            if fut.done() and not scopes[name].cancelled.is_set():
+                result, seconds, error = fut.result()
+                outcomes[name] = CheckOutcome(name, None if error else result, seconds,
+                                              reason=error or "")
+            else:
+                outcomes[name] = CheckOutcome(
+                    name, None, round(time.perf_counter() - started, 3), timed_out=True,
+                    reason=f"did not finish within the {self.deadline:g}s validation deadline",
+                )
+        return outcomes
+
+
+def _check_thread(name, fn, scope, router, loop, fut) -> None:
+    _local.scope = scope
+    router.attach(name)
+    start = time.perf_counter()
+    try:
+        result, error = fn(), None
+    except BaseException as exc:            # runners should not raise; record it if one does
+        result, error = None, f"{type(exc).__name__}: {exc}"
+    finally:
+        router.detach()
+        _local.scope = None
+    outcome = (result, round(time.perf_counter() - start, 3), error)
+    try:
+        loop.call_soon_threadsafe(_resolve, fut, outcome)
+    except RuntimeError:
+        pass                                # phase already over (loop closed)
+
+
+def _resolve(fut: asyncio.Future, outcome) -> None:
+    if not fut.done():
+        fut.set_result(outcome)
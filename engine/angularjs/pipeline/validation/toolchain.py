@@ -0,0 +1,298 @@
+"""
+pipeline/validation/toolchain.py
+
+Node toolchain shared by the validation runners: which tsc / eslint / ng /
+npm to run, and the node_modules every generated project needs.
+
+One Toolchain serves all projects under the same out/ directory (the
+workspaces out/.tmp_<id>/angular-app and the committed output alike), or
+under several, when they are given one cache_root (a batch shares one
+across its repositories, so npm install runs once per package.json):
+
+    toolchain = Toolchain.for_project(project_root)
+    toolchain = Toolchain.for_project(project_root, cache_root="batch/.cache")
+    toolchain.provision_node_modules(project_root)      # link the shared install
+    tsc_cmd   = toolchain.find("tsc", project_root)     # ["/usr/bin/tsc"] or None
+
+Discovery
+---------
+Only filesystem checks — node_modules/.bin of the project and shutil.which()
+on PATH, in the order _CANDIDATES lists them; no `--version` probes. Answers
+are kept in-process and in out/.evua_tool_cache.json, keyed by tool + PATH +
+the resolved node_modules, so a changed PATH or a different install is a
+fresh lookup. A cached command is reused while its executable still exists;
+"not found" is re-checked after _NOT_FOUND_TTL seconds.
+
+node_modules
+------------
+npm install runs once per package.json into out/.evua_node_cache/<key>/
+(staged in a temporary directory and renamed into place, so an interrupted
+install never looks like a cache hit). Projects get that install by:
+
+    1. a symlink (a junction on Windows)
+    2. a hardlink farm — directories recreated, files hard-linked, symlinks
+       such as node_modules/.bin/* recreated as they are
+
+never by copying. When neither works, the project is left without
+node_modules and the runner reports what it can.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+_WIN = sys.platform == "win32"
+
+# tool → where to look, in preference order:
+#   (place, executable, arguments)   place = "local" (node_modules/.bin) | "path"
+_CANDIDATES = {
+    "tsc": [
+        ("path",  "tsc", ()),
+        ("local", "tsc", ()),
+    ],
+    "eslint": [
+        ("local", "eslint", ()),
+        ("local", "npx",    ("eslint",)),
+        ("path",  "eslint", ()),
+        ("path",  "npx",    ("eslint",)),
+    ],
+    "ng": [
+        ("local", "ng", ()),
+        ("path",  "ng", ()),
+    ],
+    "npm": [
+        ("path", "npm", ()),
+    ],
+}
+
+_TOOL_CACHE_NAME = ".evua_tool_cache.json"
+_NODE_CACHE_NAME = ".evua_node_cache"
+_NOT_FOUND_TTL   = 600          # seconds before "not found" is looked up again
+_NPM_TIMEOUT     = 360
+
+
+class Toolchain:
+    _instances: dict[str, "Toolchain"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, cache_root):
+        """cache_root: the out/ directory holding the tool and node_modules caches."""
+        self.cache_root = Path(cache_root)
+        self._memo: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._install_locks: dict[str, threading.Lock] = {}
+
+    @classmethod
+    def for_project(cls, project_root, cache_root=None) -> "Toolchain":
+        """
+        The toolchain of the out/ directory two levels above project_root, or
+        of cache_root when one is given.
+        """
+        if cache_root is None:
+            cache_root = os.path.dirname(os.path.dirname(os.path.abspath(str(project_root))))
+        else:
+            cache_root = os.path.abspath(str(cache_root))
+        with cls._instances_lock:
+            toolchain = cls._instances.get(cache_root)
+            if toolchain is None:
+                toolchain = cls._instances[cache_root] = cls(cache_root)
+            return toolchain
+
+    # ── Discovery ─────────────────────────────────────────────────────────
+
+    def find(self, tool: str, project_root) -> Optional[list[str]]:
+        """Command for tool (see _CANDIDATES) as seen from project_root, or None."""
+        node_modules = Path(project_root) / "node_modules"
+        modules_key  = str(node_modules.resolve()) if node_modules.exists() else ""
+        key = hashlib.md5(
+            "\0".join((tool, os.environ.get("PATH", ""), modules_key)).encode("utf-8")
+        ).hexdigest()[:12]
+
+        with self._lock:
+            entry = self._memo.get(key)
+            if entry is None:
+                entry = self._load_cache().get(key)
+            if entry is not None and self._entry_valid(entry):
+                self._memo[key] = entry
+                return entry["cmd"]
+
+            cmd   = self._discover(tool, node_modules)
+            entry = {"tool": tool, "cmd": cmd, "checked": time.time()}
+            self._memo[key] = entry
+            self._store_cache(key, entry)
+            return cmd
+
+    @staticmethod
+    def _discover(tool: str, node_modules: Path) -> Optional[list[str]]:
+        bin_dir = node_modules / ".bin"
+        for place, exe, args in _CANDIDATES[tool]:
+            name = f"{exe}.cmd" if _WIN else exe
+            if place == "local":
+                candidate = bin_dir / name
+                # resolved, so the command outlives the workspace it was found in
+                found = str(candidate.resolve()) if candidate.exists() else None
+            else:
+                found = shutil.which(name)
+            if found:
+                return [found, *args]
+        return None
+
+    @staticmethod
+    def _entry_valid(entry: dict) -> bool:
+        cmd = entry.get("cmd")
+        if not cmd:
+            return time.time() - entry.get("checked", 0) < _NOT_FOUND_TTL
+        return Path(cmd[0]).exists()
+
+    def _load_cache(self) -> dict:
+        try:
+            cache = json.loads((self.cache_root / _TOOL_CACHE_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def _store_cache(self, key: str, entry: dict) -> None:
+        cache_file = self.cache_root / _TOOL_CACHE_NAME
+        try:
+            cache = self._load_cache()
+            cache[key] = entry
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass                                # cache is an optimisation only
+
+    # ── node_modules ──────────────────────────────────────────────────────
+
+    def provision_node_modules(self, project_root, install: bool = True) -> bool:
+        """
+        Give project_root a node_modules linked to the shared install for its
+        package.json. install=False only links an install that already exists.
+        Returns whether the project has node_modules afterwards.
+        """
+        project_root = Path(project_root)
+        node_modules = project_root / "node_modules"
+        if node_modules.exists():
+            return True                         # real install or an earlier link
+        if node_modules.is_symlink():
+            node_modules.unlink()               # its cache entry was removed
+
+        pkg_json = project_root / "package.json"
+        if not pkg_json.exists():
+            if install:
+                print("  [toolchain] package.json not found — skipping npm install")
+            return False
+
+        key    = hashlib.md5(pkg_json.read_bytes()).hexdigest()[:12]
+        cached = self.cache_root / _NODE_CACHE_NAME / key / "node_modules"
+
+        with self._install_lock(key):
+            if cached.exists():
+                print(f"  [toolchain] node_modules cache hit (key={key}) — linking")
+            elif not install or not self._install(key, pkg_json):
+                return False
+
+        if not cached.exists():
+            return False                        # package.json without dependencies
+        return self._link(cached, node_modules)
+
+    def _install_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._install_locks.setdefault(key, threading.Lock())
+
+    def _install(self, key: str, pkg_json: Path) -> bool:
+        """npm install into a staging directory, then rename it to <cache>/<key>."""
+        npm = self.find("npm", pkg_json.parent)
+        if npm is None:
+            print("  [toolchain] npm not found — install Node.js from https://nodejs.org")
+            return False
+
+        print(f"  [toolchain] node_modules cache miss (key={key}) — running npm install once")
+        print("  [toolchain] This takes ~30-60s on first run; subsequent runs will be instant.")
+        target  = self.cache_root / _NODE_CACHE_NAME / key
+        staging = target.with_name(f"{key}.tmp-{os.getpid()}-{threading.get_ident()}")
+        try:
+            staging.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(pkg_json, staging / "package.json")
+            result = subprocess.run(
+                [*npm, "install"],
+                capture_output=True, text=True,
+                cwd=str(staging),
+                timeout=_NPM_TIMEOUT,
+            )
+            if result.returncode != 0:
+                print(f"  [toolchain] npm install failed (rc={result.returncode})")
+                for line in result.stderr.splitlines()[:5]:
+                    print(f"  [toolchain]   {line}")
+                return False
+            try:
+                os.replace(staging, target)
+            except OSError:
+                if not target.exists():         # another process finished first otherwise
+                    raise
+            print(f"  [toolchain] npm install completed — cached at {target / 'node_modules'}")
+            return True
+        except FileNotFoundError:
+            print("  [toolchain] npm not found — install Node.js from https://nodejs.org")
+            return False
+        except subprocess.TimeoutExpired:
+            print(f"  [toolchain] npm install timed out after {_NPM_TIMEOUT // 60} minutes")
+            return False
+        except OSError as e:
+            print(f"  [toolchain] Could not cache node_modules ({e})")
+            return False
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    @staticmethod
+    def _link(cached: Path, node_modules: Path) -> bool:
+        try:
+            if _WIN:
+                # directory junction: no admin rights needed, unlike symlinks
+                subprocess.run(
+                    ["cmd", "/c", "mklink", "/J", str(node_modules), str(cached)],
+                    check=True, capture_output=True,
+                )
+            else:
+                node_modules.symlink_to(cached, target_is_directory=True)
+            print(f"  [toolchain] Linked node_modules from cache ({cached.parent.name})")
+            return True
+        except (OSError, subprocess.CalledProcessError) as e:
+            reason = e
+        try:
+            _hardlink_farm(cached, node_modules)
+            print(f"  [toolchain] Hard-linked node_modules from cache ({cached.parent.name})")
+            return True
+        except OSError as e:
+            shutil.rmtree(node_modules, ignore_errors=True)
+            print(f"  [toolchain] Could not link node_modules ({reason}; {e}) — "
+                  f"run npm install in {node_modules.parent}")
+            return False
+
+
+def _hardlink_farm(src: Path, dst: Path) -> None:
+    """Mirror src at dst: directories created, files hard-linked, symlinks recreated."""
+    for dirpath, dirnames, filenames in os.walk(src):
+        here = Path(dirpath)
+        into = dst / here.relative_to(src)
+        into.mkdir(exist_ok=True)
+        for name in list(dirnames):
+            if (here / name).is_symlink():      # not descended into by os.walk
+                dirnames.remove(name)
+                filenames.append(name)
+        for name in filenames:
+            source = here / name
+            if source.is_symlink():
+                os.symlink(os.readlink(source), into / name,
+                           target_is_directory=source.is_dir())
+            else:
+                os.link(source, into / name)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import sqlite3
 from pathlib import Path
 
 import click
@@ -10,6 +11,7 @@ from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
 from .config import load_config
 from .pipeline.orchestrator import CLIOrchestrator
 from .report_generator import write_report
+from .report_store import store_path_for, write_report_store
 from .rule_engine.live_rules import fetch_live_rules
 
 console = Console()
@@ -20,6 +22,15 @@ def _configure_logging(verbose: bool) -> None:
     logging.basicConfig(level=level, format="%(levelname)s %(name)s: %(message)s")
 
 
+def _write_store(report, out: str, scan_path: str) -> None:
+    # The SQLite copy only serves the backend's paginated queries; the
+    # report file is already written, so a failure here is not fatal.
+    try:
+        write_report_store(report, store_path_for(out), project=Path(scan_path).name)
+    except (sqlite3.Error, OSError) as e:
+        console.print(f"[yellow]Report store not written:[/yellow] {e}")
+
+
 @click.group()
 @click.option("--config", "config_path", default=None, help="Path to .evua.yml")
 @click.option("--verbose", is_flag=True, help="Enable verbose logging")
@@ -69,6 +80,7 @@ def migrate(ctx: click.Context, source_version: str, target_version: str, scan_p
             progress.update(task, completed=100)
 
     out = write_report(report, output_path, fmt)
+    _write_store(report, out, scan_path)
     console.print(f"[green]Migration complete[/green] job_id={job_id} report={out}")
 
     failed = report.ai_handoff_summary.get("failed", 0)
@@ -96,6 +108,7 @@ def analyze(ctx: click.Context, scan_path: str, target_version: str, source_vers
         do_migrate=False,
     )
     out = write_report(report, output_path, "json")
+    _write_store(report, out, scan_path)
     console.print(f"[cyan]Analysis complete[/cyan] job_id={job_id} report={out}")
 
     if report.summary.manual_review_items > 0:
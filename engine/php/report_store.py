@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from .report_generator import ReportModel, default_timestamp
+
+# Indexed SQLite copy of a migration report, written next to the JSON report
+# (analyze-report.json -> analyze-report.sqlite). The backend serves paginated,
+# filtered queries from it instead of loading the whole report.
+#
+# Same tables as engine/angularjs/pipeline/reporting/sqlite_store.py — keep the
+# two SCHEMA definitions in sync.
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE files (
+    id           INTEGER PRIMARY KEY,
+    path         TEXT NOT NULL UNIQUE,
+    risk_level   TEXT,
+    risk_score   REAL,
+    change_count INTEGER DEFAULT 0,
+    manual_count INTEGER DEFAULT 0,
+    risky_count  INTEGER DEFAULT 0
+);
+CREATE TABLE changes (
+    id             INTEGER PRIMARY KEY,
+    change_id      TEXT,
+    file_id        INTEGER REFERENCES files(id),
+    name           TEXT,
+    kind           TEXT,
+    line           INTEGER,
+    before_id      TEXT,
+    after_id       TEXT,
+    reason         TEXT,
+    generated_file TEXT,
+    automatable    INTEGER
+);
+CREATE TABLE risk (
+    change_id INTEGER PRIMARY KEY REFERENCES changes(id),
+    level     TEXT NOT NULL,
+    score     REAL,
+    reason    TEXT,
+    rule      TEXT
+);
+CREATE TABLE ai_items (
+    id           INTEGER PRIMARY KEY,
+    item_id      TEXT,
+    file_id      INTEGER REFERENCES files(id),
+    description  TEXT,
+    concern      TEXT,
+    code_snippet TEXT,
+    response     TEXT
+);
+CREATE TABLE validation_errors (
+    id      INTEGER PRIMARY KEY,
+    source  TEXT,
+    file    TEXT,
+    line    INTEGER,
+    col     INTEGER,
+    code    TEXT,
+    message TEXT
+);
+CREATE INDEX idx_changes_file  ON changes(file_id);
+CREATE INDEX idx_changes_name  ON changes(name);
+CREATE INDEX idx_risk_level    ON risk(level);
+CREATE INDEX idx_files_risk    ON files(risk_score DESC);
+CREATE INDEX idx_ai_items_file ON ai_items(file_id);
+CREATE INDEX idx_verr_source   ON validation_errors(source);
+"""
+
+LEVEL_SCORE = {"SAFE": 0.0, "RISKY": 0.5, "MANUAL": 1.0}
+
+
+def _change_level(change: dict[str, Any]) -> str:
+    # Auto-fixable rule matches are safe; everything else needs a human.
+    return "SAFE" if change.get("automatable") else "MANUAL"
+
+
+def store_path_for(report_path: str | Path) -> Path:
+    return Path(report_path).with_suffix(".sqlite")
+
+
+def write_report_store(report: ReportModel, path: str | Path, project: str = "") -> str:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    if tmp.exists():
+        tmp.unlink()
+
+    db = sqlite3.connect(tmp)
+    try:
+        db.executescript(SCHEMA)
+
+        for f in report.files:
+            changes = f.get("changes", [])
+            levels = [_change_level(c) for c in changes]
+            manual = levels.count("MANUAL")
+            cur = db.execute(
+                "INSERT INTO files (path, risk_level, risk_score, change_count, manual_count, risky_count) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (f["path"], "MANUAL" if manual else "SAFE", f.get("risk_score"), len(changes), manual, 0),
+            )
+            file_id = cur.lastrowid
+
+            for idx, (change, level) in enumerate(zip(changes, levels), start=1):
+                cur = db.execute(
+                    "INSERT INTO changes (change_id, file_id, name, kind, line, before_id, "
+                    "after_id, reason, generated_file, automatable) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        f"{file_id}:{idx}",
+                        file_id,
+                        Path(f["path"]).name,
+                        change.get("type"),
+                        change.get("line"),
+                        change.get("old_code"),
+                        change.get("suggested_new_code"),
+                        change.get("reason"),
+                        None,
+                        int(bool(change.get("automatable"))),
+                    ),
+                )
+                db.execute(
+                    "INSERT INTO risk (change_id, level, score, reason, rule) VALUES (?, ?, ?, ?, ?)",
+                    (cur.lastrowid, level, LEVEL_SCORE[level], change.get("reason"), change.get("type")),
+                )
+
+            db.executemany(
+                "INSERT INTO ai_items (item_id, file_id, description, concern, code_snippet, response) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        item.get("id"),
+                        file_id,
+                        item.get("description"),
+                        item.get("concern"),
+                        item.get("code_snippet"),
+                        json.dumps(item.get("gemini_response")) if item.get("gemini_response") is not None else None,
+                    )
+                    for item in f.get("ai_handoff", {}).get("items", [])
+                ],
+            )
+
+        meta = {
+            "engine": "php",
+            "project": project,
+            "schema_version": str(SCHEMA_VERSION),
+            "created_at": default_timestamp(),
+            "summary": json.dumps(
+                {
+                    "metadata": report.metadata.model_dump(),
+                    "summary": report.summary.model_dump(),
+                    "changes_by_category": report.changes_by_category,
+                    "ai_handoff_summary": report.ai_handoff_summary,
+                }
+            ),
+        }
+        db.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", meta.items())
+        db.commit()
+    finally:
+        db.close()
+
+    os.replace(tmp, path)
+    return str(path)